@@ -6,6 +6,7 @@ CREATE TABLE IF NOT EXISTS workers (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     name TEXT NOT NULL,          -- Verschlüsselt gespeichert
     email TEXT NOT NULL UNIQUE,  -- Verschlüsselt gespeichert
+    email_bidx TEXT,             -- Blind-Index (HMAC) für Email-Suche
     team TEXT NOT NULL,
     active INTEGER DEFAULT 1,    -- Boolean: 1=aktiv, 0=inaktiv
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
@@ -15,7 +16,7 @@ CREATE TABLE IF NOT EXISTS workers (
 CREATE TABLE IF NOT EXISTS time_entries (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     worker_id INTEGER NOT NULL,
-    date DATE NOT NULL,
+    date DATE NOT NULL,          -- Normalisiert: YYYY-MM-DD
     duration_minutes INTEGER NOT NULL,
     description TEXT NOT NULL,
     project TEXT,
@@ -36,6 +37,58 @@ CREATE TABLE IF NOT EXISTS capacities (
     FOREIGN KEY (worker_id) REFERENCES workers(id) ON DELETE CASCADE
 );
 
+-- Tabelle: Data Keys (mit RSA gewrappter AES-Key für Envelope-Verschlüsselung)
+CREATE TABLE IF NOT EXISTS data_keys (
+    id INTEGER PRIMARY KEY,
+    wrapped_key TEXT NOT NULL,   -- Base64(RSA-OAEP(AES-Key))
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Tabelle: Daily Worker Hours (Rollup: Minuten pro Worker und Tag)
+-- Wird per Trigger mit time_entries synchron gehalten
+CREATE TABLE IF NOT EXISTS daily_worker_hours (
+    worker_id INTEGER NOT NULL,
+    day TEXT NOT NULL,           -- YYYY-MM-DD
+    minutes INTEGER NOT NULL DEFAULT 0,
+    entry_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (worker_id, day)
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_time_entries_rollup_insert
+AFTER INSERT ON time_entries
+BEGIN
+    INSERT INTO daily_worker_hours (worker_id, day, minutes, entry_count)
+    VALUES (NEW.worker_id, DATE(NEW.date), NEW.duration_minutes, 1)
+    ON CONFLICT (worker_id, day) DO UPDATE SET
+        minutes = minutes + excluded.minutes,
+        entry_count = entry_count + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_time_entries_rollup_delete
+AFTER DELETE ON time_entries
+BEGIN
+    UPDATE daily_worker_hours
+    SET minutes = minutes - OLD.duration_minutes, entry_count = entry_count - 1
+    WHERE worker_id = OLD.worker_id AND day = DATE(OLD.date);
+    DELETE FROM daily_worker_hours
+    WHERE worker_id = OLD.worker_id AND day = DATE(OLD.date) AND entry_count <= 0;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_time_entries_rollup_update
+AFTER UPDATE OF worker_id, date, duration_minutes ON time_entries
+BEGIN
+    UPDATE daily_worker_hours
+    SET minutes = minutes - OLD.duration_minutes, entry_count = entry_count - 1
+    WHERE worker_id = OLD.worker_id AND day = DATE(OLD.date);
+    DELETE FROM daily_worker_hours
+    WHERE worker_id = OLD.worker_id AND day = DATE(OLD.date) AND entry_count <= 0;
+    INSERT INTO daily_worker_hours (worker_id, day, minutes, entry_count)
+    VALUES (NEW.worker_id, DATE(NEW.date), NEW.duration_minutes, 1)
+    ON CONFLICT (worker_id, day) DO UPDATE SET
+        minutes = minutes + excluded.minutes,
+        entry_count = entry_count + 1;
+END;
+
 -- Indizes für Performance
 CREATE INDEX IF NOT EXISTS idx_time_entries_worker 
 ON time_entries(worker_id, date);
@@ -46,9 +99,22 @@ ON time_entries(date);
 CREATE INDEX IF NOT EXISTS idx_capacities_worker 
 ON capacities(worker_id, start_date, end_date);
 
+CREATE INDEX IF NOT EXISTS idx_capacities_end_date 
+ON capacities(end_date);
+
+CREATE INDEX IF NOT EXISTS idx_daily_worker_hours_day 
+ON daily_worker_hours(day);
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_workers_email_bidx 
+ON workers(email_bidx);
+
 -- Schema-Version für Migrations
+-- Version 1 = Basis-Schema, weitere Schritte in src/services/migrations.py
+-- Dieses Skript entspricht dem Stand nach allen Migrationen
 CREATE TABLE IF NOT EXISTS schema_version (
     version INTEGER PRIMARY KEY,
+    description TEXT,
+    duration_ms REAL,            -- Laufzeit der Migration
     applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
@@ -4,6 +4,7 @@ Verwendet absolute Imports statt relativer Imports
 """
 import sys
 import os
+import multiprocessing
 
 # Füge src zum Python-Path hinzu
 if getattr(sys, 'frozen', False):
@@ -20,4 +21,6 @@ sys.path.insert(0, application_path)
 from src.main import main
 
 if __name__ == '__main__':
+    # Nötig für Prozess-Pool (CryptoService.decrypt_many) im PyInstaller-Build
+    multiprocessing.freeze_support()
     sys.exit(main())
@@ -0,0 +1,81 @@
+"""
+Benchmark Script - Analytics über mehrere Jahre und das ganze Team: NumPy- vs. Python-Kernels
+"""
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+
+from src.services.analytics_service import AnalyticsService
+from src.services.analytics_kernels import HAS_NUMPY
+from src.models.time_entry_batch import TimeEntryBatch
+from src.models.capacity import Capacity
+
+
+def _data(entries: int, workers: int, years: int):
+    """Erzeugt zufälligen Batch und monatliche Capacities pro Worker"""
+    rng = random.Random(1)
+    first_day = datetime(2020, 1, 1)
+    days = 365 * years
+    
+    batch = TimeEntryBatch()
+    batch.extend(
+        (i + 1, rng.randrange(1, workers + 1), first_day.toordinal() + rng.randrange(days),
+         rng.randrange(15, 540), f"Projekt {rng.randrange(50)}")
+        for i in range(entries)
+    )
+    
+    capacities = [
+        Capacity(
+            worker_id=worker_id,
+            start_date=first_day + timedelta(days=30 * month),
+            end_date=first_day + timedelta(days=30 * month + 29),
+            planned_hours=160.0
+        )
+        for worker_id in range(1, workers + 1)
+        for month in range(days // 30)
+    ]
+    
+    return batch, capacities, first_day, first_day + timedelta(days=days - 1)
+
+
+def _run(label: str, analytics: AnalyticsService, batch, capacities, start, end, repeat: int) -> None:
+    """Misst alle Auswertungen einer Kernel-Variante"""
+    timings = {}
+    for name, call in [
+        ("Tage", lambda: analytics.calculate_daily_breakdown(batch, start, end)),
+        ("Worker", lambda: analytics.calculate_worker_totals(batch)),
+        ("Projekte", lambda: analytics.calculate_project_totals(batch)),
+        ("Statistik", lambda: analytics.get_statistics_summary(batch)),
+        ("Auslastung", lambda: analytics.calculate_utilization(batch, capacities, start, end)),
+        ("Plan/Tag", lambda: analytics.calculate_daily_capacity(capacities, start, end))
+    ]:
+        started = time.perf_counter()
+        for _ in range(repeat):
+            call()
+        timings[name] = (time.perf_counter() - started) / repeat * 1000
+    
+    print(f"  {label:<7} " + " | ".join(f"{name} {ms:7.1f} ms" for name, ms in timings.items()))
+
+
+def main():
+    """Führt Benchmark aus"""
+    parser = argparse.ArgumentParser(description="Benchmark für Analytics-Kernels")
+    parser.add_argument("--entries", type=int, default=1_000_000, help="Anzahl Einträge im Batch")
+    parser.add_argument("--workers", type=int, default=50, help="Anzahl Worker")
+    parser.add_argument("--years", type=int, default=5, help="Zeitraum in Jahren")
+    parser.add_argument("--repeat", type=int, default=3, help="Wiederholungen pro Messung")
+    args = parser.parse_args()
+    
+    batch, capacities, start, end = _data(args.entries, args.workers, args.years)
+    print(f"{args.entries} Einträge, {args.workers} Worker, {len(capacities)} Capacities, {args.years} Jahre:")
+    
+    _run("python", AnalyticsService(None, use_numpy=False), batch, capacities, start, end, args.repeat)
+    if HAS_NUMPY:
+        _run("numpy", AnalyticsService(None, use_numpy=True), batch, capacities, start, end, args.repeat)
+    else:
+        print("  numpy   nicht installiert")
+
+
+if __name__ == "__main__":
+    main()
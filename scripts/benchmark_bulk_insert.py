@@ -0,0 +1,94 @@
+"""
+Benchmark Script - Zeilen pro Sekunde: create pro Zeile vs. create_many (execBatch)
+"""
+import sys
+import argparse
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from PySide6.QtCore import QCoreApplication
+
+from src.services.database_service import DatabaseService
+from src.repositories.time_entry_repository import TimeEntryRepository
+from src.models.time_entry import TimeEntry
+
+
+def _entries(worker_id: int, count: int):
+    """Erzeugt count TimeEntries über ~4 Jahre verteilt"""
+    first_day = datetime(2020, 1, 1)
+    return [
+        TimeEntry(
+            worker_id=worker_id,
+            date=first_day + timedelta(days=i % 1500),
+            duration_minutes=60,
+            description=f"Eintrag {i}",
+            project="Projekt"
+        )
+        for i in range(count)
+    ]
+
+
+def _run(size: int, temp_dir: Path, profile: str, chunk_size: int, single_limit: int) -> None:
+    """Misst create_many für size Einträge, create pro Zeile bis single_limit"""
+    db_service = DatabaseService(str(temp_dir / f"benchmark_{size}.db"), profile=profile)
+    db_service.connection_name = f"benchmark_{size}"
+    db_service.initialize()
+    
+    # Ein Worker für die Foreign Keys
+    worker_id = db_service.execute_query(
+        "INSERT INTO workers (name, email, team) VALUES ('x', 'x', 'Team')"
+    ).lastInsertId()
+    
+    repo = TimeEntryRepository(db_service)
+    entries = _entries(worker_id, size)
+    
+    single = "      -"
+    if size <= single_limit:
+        # TimeEntryRepository.create committet jede Zeile einzeln
+        start = time.perf_counter()
+        for entry in entries:
+            repo.create(entry)
+        single = f"{size / (time.perf_counter() - start):7.0f}"
+        db_service.execute_query("DELETE FROM time_entries")
+    
+    start = time.perf_counter()
+    repo.create_many(entries, chunk_size=chunk_size)
+    batch = size / (time.perf_counter() - start)
+    
+    print(f"  {size:>9} Einträge: create {single} Zeilen/s | create_many {batch:9.0f} Zeilen/s")
+    
+    db_service.close()
+
+
+def main():
+    """Führt Benchmark aus"""
+    parser = argparse.ArgumentParser(description="Benchmark für Batch-Inserts")
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000],
+        help="Anzahl TimeEntries pro Durchlauf"
+    )
+    parser.add_argument(
+        "--profile", default="bulk-import",
+        help="PRAGMA-Profil oder \"default\" für SQLite-Defaults"
+    )
+    parser.add_argument("--chunk-size", type=int, default=50, help="Zeilen pro execBatch")
+    parser.add_argument(
+        "--single-limit", type=int, default=10_000,
+        help="create pro Zeile nur bis zu dieser Größe messen"
+    )
+    args = parser.parse_args()
+    
+    # Qt SQL requires QCoreApplication
+    app = QCoreApplication(sys.argv)
+    
+    profile = None if args.profile == "default" else args.profile
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        print(f"Profil {args.profile}, Chunk-Größe {args.chunk_size}:")
+        for size in args.sizes:
+            _run(size, Path(temp_dir), profile, args.chunk_size, args.single_limit)
+
+
+if __name__ == "__main__":
+    main()
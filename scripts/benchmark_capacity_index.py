@@ -0,0 +1,98 @@
+"""
+Benchmark Script - Anteilige Plan-Stunden: SQL-Aggregation vs. CapacityIndex (Intervallbaum)
+"""
+import sys
+import argparse
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from PySide6.QtCore import QCoreApplication
+
+from src.services.database_service import DatabaseService
+from src.repositories.capacity_repository import CapacityRepository
+from src.models.capacity import Capacity
+
+# Bisherige Aggregation über idx_capacities_end_date
+_SQL_HOURS = """
+    SELECT worker_id, SUM(
+        planned_hours
+        * (julianday(MIN(DATE(end_date), DATE(?))) - julianday(MAX(DATE(start_date), DATE(?))) + 1)
+        / (julianday(DATE(end_date)) - julianday(DATE(start_date)) + 1)
+    )
+    FROM capacities
+    WHERE end_date >= ? AND start_date <= ? AND end_date >= start_date
+    GROUP BY +worker_id
+"""
+
+
+def main():
+    """Führt Benchmark aus"""
+    parser = argparse.ArgumentParser(description="Benchmark für den CapacityIndex")
+    parser.add_argument("--workers", type=int, default=50, help="Anzahl Worker")
+    parser.add_argument("--capacities", type=int, default=500, help="Capacities pro Worker")
+    parser.add_argument("--queries", type=int, default=200, help="Anzahl Abfragen (30 Tage)")
+    args = parser.parse_args()
+    
+    # Qt SQL requires QCoreApplication
+    app = QCoreApplication(sys.argv)
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_service = DatabaseService(str(Path(temp_dir) / "benchmark.db"))
+        db_service.connection_name = "benchmark_capacity_index"
+        db_service.initialize()
+        
+        for i in range(args.workers):
+            db_service.execute_query(
+                "INSERT INTO workers (name, email, team) VALUES (?, ?, 'Team')", [f"w{i}", f"w{i}"]
+            )
+        
+        rng = random.Random(1)
+        first_day = datetime(2015, 1, 1)
+        repo = CapacityRepository(db_service)
+        repo.create_many([
+            Capacity(
+                worker_id=worker_id,
+                start_date=first_day + timedelta(days=start),
+                end_date=first_day + timedelta(days=start + rng.randrange(1, 60)),
+                planned_hours=rng.uniform(8, 200)
+            )
+            for worker_id in range(1, args.workers + 1)
+            for start in (rng.randrange(0, 3650) for _ in range(args.capacities))
+        ])
+        
+        ranges = [
+            (first_day + timedelta(days=offset), first_day + timedelta(days=offset + 30))
+            for offset in (rng.randrange(0, 3600) for _ in range(args.queries))
+        ]
+        
+        start = time.perf_counter()
+        for range_start, range_end in ranges:
+            with db_service.statement(_SQL_HOURS, [
+                range_end.isoformat(), range_start.isoformat(),
+                range_start.isoformat(), range_end.isoformat()
+            ]) as query:
+                while query.next():
+                    pass
+        sql_ms = (time.perf_counter() - start) / len(ranges) * 1000
+        
+        start = time.perf_counter()
+        repo.index.clear()
+        repo.load_index()
+        load_ms = (time.perf_counter() - start) * 1000
+        
+        start = time.perf_counter()
+        for range_start, range_end in ranges:
+            repo.sum_overlapping_hours_by_worker(range_start, range_end)
+        index_ms = (time.perf_counter() - start) / len(ranges) * 1000
+        
+        print(f"{args.workers} Worker x {args.capacities} Capacities, {len(ranges)} Abfragen über 30 Tage:")
+        print(f"  SQL-Aggregation  {sql_ms:8.2f} ms/Abfrage")
+        print(f"  CapacityIndex    {index_ms:8.2f} ms/Abfrage (einmaliges Laden {load_ms:.0f} ms)")
+        
+        db_service.close()
+
+
+if __name__ == "__main__":
+    main()
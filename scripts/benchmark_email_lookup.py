@@ -0,0 +1,70 @@
+"""
+Benchmark Script - Email-Lookup über Blind-Index vs. Entschlüsselung aller Worker
+"""
+import sys
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from PySide6.QtCore import QCoreApplication
+
+from src.services.database_service import DatabaseService
+from src.services.crypto_service import CryptoService
+from src.repositories.worker_repository import WorkerRepository
+from src.models.worker import Worker
+
+
+def _measure(func, repetitions: int) -> float:
+    """Gibt durchschnittliche Laufzeit in Millisekunden zurück"""
+    start = time.perf_counter()
+    for _ in range(repetitions):
+        func()
+    return (time.perf_counter() - start) / repetitions * 1000
+
+
+def main():
+    """Führt Benchmark aus"""
+    parser = argparse.ArgumentParser(description="Benchmark für Email-Lookup")
+    parser.add_argument("--workers", type=int, default=10_000, help="Anzahl Worker")
+    parser.add_argument("--repetitions", type=int, default=200, help="Wiederholungen pro Lookup")
+    args = parser.parse_args()
+    
+    # Qt SQL requires QCoreApplication
+    app = QCoreApplication(sys.argv)
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_service = DatabaseService(str(Path(temp_dir) / "benchmark.db"))
+        db_service.initialize()
+        
+        crypto_service = CryptoService(key_directory=Path(temp_dir) / "keys")
+        crypto_service.initialize_keys()
+        crypto_service.initialize_data_key(db_service)
+        
+        repo = WorkerRepository(db_service, crypto_service)
+        
+        print(f"Erstelle {args.workers} Worker...")
+        with repo.unit_of_work():
+            for i in range(args.workers):
+                repo.create(Worker(name=f"Worker {i}", email=f"worker{i}@example.com", team="Team"))
+        
+        target = f"worker{args.workers // 2}@example.com"
+        
+        def scan_lookup():
+            # Bisheriger Fallback: alle Worker entschlüsseln und vergleichen
+            return next((w for w in repo.find_all() if w.email == target), None)
+        
+        indexed_ms = _measure(lambda: repo.find_by_email(target), args.repetitions)
+        exists_ms = _measure(lambda: repo.email_exists(target), args.repetitions)
+        scan_ms = _measure(scan_lookup, 3)
+        
+        print(f"\nEmail-Lookup bei {args.workers} Workern:")
+        print(f"  - Volle Entschlüsselung:   {scan_ms:10.3f} ms")
+        print(f"  - find_by_email (Index):   {indexed_ms:10.3f} ms")
+        print(f"  - email_exists (Index):    {exists_ms:10.3f} ms")
+        print(f"  - Faktor:                  {scan_ms / indexed_ms:10.0f}x")
+        
+        db_service.close()
+
+
+if __name__ == "__main__":
+    main()
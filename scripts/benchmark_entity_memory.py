@@ -0,0 +1,76 @@
+"""
+Benchmark Script - Speicherbedarf pro Eintrag: TimeEntry-Objekte vs. Tuples vs. TimeEntryBatch
+"""
+import sys
+import argparse
+import gc
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+from PySide6.QtCore import QCoreApplication
+
+from src.services.database_service import DatabaseService
+from src.repositories.time_entry_repository import TimeEntryRepository
+from src.models.time_entry import TimeEntry
+
+
+def _measure(label: str, entries: int, load) -> None:
+    """Misst gehaltenen Speicher (tracemalloc) und Ladezeit einer Variante"""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = load()
+    seconds = time.perf_counter() - start
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    print(f"  {label:<22} {retained / entries:7.1f} B/Eintrag "
+          f"({retained * 1_000_000 / entries / 2**20:7.1f} MB pro 1M, Peak {peak / 2**20:7.1f} MB) "
+          f"| {entries / seconds:9.0f} Zeilen/s")
+    del result
+
+
+def main():
+    """Führt Benchmark aus"""
+    parser = argparse.ArgumentParser(description="Benchmark für Speicherbedarf großer Ergebnismengen")
+    parser.add_argument("--entries", type=int, default=1_000_000, help="Anzahl TimeEntries")
+    parser.add_argument("--projects", type=int, default=20, help="Anzahl verschiedener Projekte")
+    args = parser.parse_args()
+    
+    # Qt SQL requires QCoreApplication
+    app = QCoreApplication(sys.argv)
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_service = DatabaseService(str(Path(temp_dir) / "benchmark.db"), profile="bulk-import")
+        db_service.connection_name = "benchmark_memory"
+        db_service.initialize()
+        
+        worker_id = db_service.execute_query(
+            "INSERT INTO workers (name, email, team) VALUES ('x', 'x', 'Team')"
+        ).lastInsertId()
+        
+        repo = TimeEntryRepository(db_service)
+        first_day = datetime(2020, 1, 1)
+        repo.create_many([
+            TimeEntry(
+                worker_id=worker_id,
+                date=first_day + timedelta(days=i % 1500),
+                duration_minutes=30 + i % 480,
+                description=f"Eintrag {i}",
+                project=f"Projekt {i % args.projects}"
+            )
+            for i in range(args.entries)
+        ])
+        
+        print(f"{args.entries} Einträge, {args.projects} Projekte (gehaltener Speicher nach dem Laden):")
+        _measure("TimeEntry-Objekte", args.entries, lambda: repo.find_by_date_range("2020-01-01", "2030-01-01"))
+        _measure("Row-Tuples", args.entries, lambda: list(repo.iter_by_date_range("2020-01-01", "2030-01-01", rows=True)))
+        _measure("TimeEntryBatch", args.entries, lambda: repo.load_batch("2020-01-01", "2030-01-01"))
+        
+        db_service.close()
+
+
+if __name__ == "__main__":
+    main()
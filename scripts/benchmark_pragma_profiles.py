@@ -0,0 +1,76 @@
+"""
+Benchmark Script - SQLite-Verbindungsprofile: Insert- und Range-Query-Durchsatz
+"""
+import sys
+import argparse
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from PySide6.QtCore import QCoreApplication
+
+from src.services.database_service import DatabaseService, PRAGMA_PROFILES
+from src.repositories.time_entry_repository import TimeEntryRepository
+from src.models.time_entry import TimeEntry
+
+
+def _run(profile, temp_dir: Path, entries: int, queries: int) -> None:
+    """Misst Inserts (Autocommit pro Zeile) und Bereichsabfragen für ein Profil"""
+    label = profile or "default"
+    db_service = DatabaseService(str(temp_dir / f"benchmark_{label}.db"), profile=profile)
+    db_service.connection_name = f"benchmark_{label}"
+    db_service.initialize()
+    
+    # Ein Worker für die Foreign Keys
+    worker_id = db_service.execute_query(
+        "INSERT INTO workers (name, email, team) VALUES ('x', 'x', 'Team')"
+    ).lastInsertId()
+    
+    repo = TimeEntryRepository(db_service)
+    first_day = datetime(2020, 1, 1)
+    
+    # TimeEntryRepository.create committet jede Zeile einzeln
+    start = time.perf_counter()
+    for i in range(entries):
+        repo.create(TimeEntry(
+            worker_id=worker_id,
+            date=first_day + timedelta(days=i % 1500),
+            duration_minutes=60,
+            description=f"Eintrag {i}"
+        ))
+    insert_seconds = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    for i in range(queries):
+        range_start = first_day + timedelta(days=(i * 37) % 1470)
+        repo.find_by_date_range(
+            range_start.strftime("%Y-%m-%d"),
+            (range_start + timedelta(days=30)).strftime("%Y-%m-%d")
+        )
+    query_seconds = time.perf_counter() - start
+    
+    print(f"  {label:<12} Inserts {entries / insert_seconds:9.0f}/s | "
+          f"Range-Queries {queries / query_seconds:8.1f}/s")
+    print(f"  {'':<12} {db_service.format_pragma_report()}")
+    
+    db_service.close()
+
+
+def main():
+    """Führt Benchmark aus"""
+    parser = argparse.ArgumentParser(description="Benchmark für PRAGMA-Profile")
+    parser.add_argument("--entries", type=int, default=5_000, help="Anzahl Inserts")
+    parser.add_argument("--queries", type=int, default=200, help="Anzahl Range-Queries (30 Tage)")
+    args = parser.parse_args()
+    
+    # Qt SQL requires QCoreApplication
+    app = QCoreApplication(sys.argv)
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        print(f"{args.entries} Inserts, {args.queries} Range-Queries pro Profil:")
+        for profile in [None] + list(PRAGMA_PROFILES):
+            _run(profile, Path(temp_dir), args.entries, args.queries)
+
+
+if __name__ == "__main__":
+    main()
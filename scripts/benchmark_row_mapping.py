@@ -0,0 +1,96 @@
+"""
+Benchmark Script - Gemappte TimeEntry-Zeilen pro Sekunde: Zugriff per Name vs. projiziert per Index
+"""
+import sys
+import argparse
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from PySide6.QtCore import QCoreApplication
+
+from src.services.database_service import DatabaseService
+from src.repositories.time_entry_repository import TimeEntryRepository
+from src.models.time_entry import TimeEntry
+
+
+def _map_by_name(query) -> TimeEntry:
+    """Bisheriges Mapping: value() per Spaltenname, alle Zeitstempel sofort geparst"""
+    return TimeEntry(
+        id=query.value("id"),
+        worker_id=query.value("worker_id"),
+        date=datetime.fromisoformat(query.value("date")),
+        duration_minutes=query.value("duration_minutes"),
+        description=query.value("description"),
+        project=query.value("project"),
+        created_at=datetime.fromisoformat(query.value("created_at")),
+        updated_at=datetime.fromisoformat(query.value("updated_at"))
+    )
+
+
+def _measure(label: str, rows: int, run) -> None:
+    """Führt run() aus und gibt Zeilen pro Sekunde aus"""
+    start = time.perf_counter()
+    mapped = run()
+    seconds = time.perf_counter() - start
+    assert mapped == rows
+    print(f"  {label:<34} {rows / seconds:10.0f} Zeilen/s")
+
+
+def main():
+    """Führt Benchmark aus"""
+    parser = argparse.ArgumentParser(description="Benchmark für Row-Mapping")
+    parser.add_argument("--entries", type=int, default=200_000, help="Anzahl TimeEntries")
+    args = parser.parse_args()
+    
+    # Qt SQL requires QCoreApplication
+    app = QCoreApplication(sys.argv)
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_service = DatabaseService(str(Path(temp_dir) / "benchmark.db"), profile="bulk-import")
+        db_service.connection_name = "benchmark_row_mapping"
+        db_service.initialize()
+        
+        worker_id = db_service.execute_query(
+            "INSERT INTO workers (name, email, team) VALUES ('x', 'x', 'Team')"
+        ).lastInsertId()
+        
+        repo = TimeEntryRepository(db_service)
+        first_day = datetime(2020, 1, 1)
+        repo.create_many([
+            TimeEntry(
+                worker_id=worker_id,
+                date=first_day + timedelta(days=i % 1500),
+                duration_minutes=60,
+                description=f"Eintrag {i}",
+                project="Projekt"
+            )
+            for i in range(args.entries)
+        ])
+        
+        range_args = ("2000-01-01", "2100-01-01")
+        
+        def select_star_by_name():
+            query = db_service.execute_query(
+                "SELECT * FROM time_entries WHERE date >= ? AND date <= ? ORDER BY date DESC",
+                list(range_args),
+                forward_only=True
+            )
+            count = 0
+            while query.next():
+                _map_by_name(query)
+                count += 1
+            return count
+        
+        print(f"{args.entries} TimeEntries:")
+        _measure("vorher: SELECT *, value(name)", args.entries, select_star_by_name)
+        _measure("projiziert, indexOf, lazy", args.entries,
+                 lambda: sum(1 for _ in repo.iter_by_date_range(*range_args)))
+        _measure("Row-Tuples", args.entries,
+                 lambda: sum(1 for _ in repo.iter_by_date_range(*range_args, rows=True)))
+        
+        db_service.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Benchmark Script - Tabellensuche: Einzelprüfung pro Tastendruck vs. SearchIndex
+"""
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+
+from src.models.time_entry import TimeEntry
+from src.utils.search_index import SearchIndex, HAS_NUMPY
+
+WORDS = ["alpha", "backend", "meeting", "review", "urlaub", "frontend", "bugfix", "planung", "kunde", "doku"]
+
+
+def _filter_by_loop(entries, worker_names, search_text):
+    """Bisheriger Filter: strftime und lower() für jedes Feld jedes Eintrags"""
+    search_text = search_text.lower()
+    result = []
+    for entry in entries:
+        date_str = entry.date.strftime("%d.%m.%Y")
+        worker_name = worker_names.get(entry.worker_id, f"ID:{entry.worker_id}")
+        project = entry.project or ""
+        description = entry.description or ""
+        if (search_text in date_str.lower() or
+                search_text in worker_name.lower() or
+                search_text in project.lower() or
+                search_text in description.lower()):
+            result.append(entry)
+    return result
+
+
+def main():
+    """Führt Benchmark aus"""
+    parser = argparse.ArgumentParser(description="Benchmark für den SearchIndex der Zeiterfassung")
+    parser.add_argument("--entries", type=int, default=200_000, help="Anzahl Einträge")
+    parser.add_argument("--workers", type=int, default=50, help="Anzahl Worker")
+    args = parser.parse_args()
+    
+    rng = random.Random(1)
+    first_day = datetime(2022, 1, 1)
+    worker_names = {worker_id: f"Worker {worker_id}" for worker_id in range(1, args.workers + 1)}
+    entries = [
+        TimeEntry(
+            id=i + 1,
+            worker_id=rng.randint(1, args.workers),
+            date=first_day + timedelta(days=rng.randrange(1000)),
+            duration_minutes=rng.randrange(15, 480),
+            description=" ".join(rng.choice(WORDS) for _ in range(4)) + f" #{i}",
+            project=f"{rng.choice(WORDS).title()} - {rng.choice(WORDS)}"
+        )
+        for i in range(args.entries)
+    ]
+    entries.sort(key=lambda e: e.date, reverse=True)
+    
+    # Tippen eines Suchbegriffs, danach Löschen und ein neuer Begriff
+    keystrokes = ["r", "re", "rev", "revi", "revie", "review", "w", "wo", "wor", "worker 1", "1", "12.", "12.05"]
+    
+    start = time.perf_counter()
+    for text in keystrokes:
+        _filter_by_loop(entries, worker_names, text)
+    loop_ms = (time.perf_counter() - start) / len(keystrokes) * 1000
+    
+    index = SearchIndex(
+        lambda e: (
+            e.date.strftime("%d.%m.%Y"),
+            worker_names.get(e.worker_id, f"ID:{e.worker_id}"),
+            e.project or "",
+            e.description or ""
+        ),
+        key=lambda e: e.date,
+        reverse=True
+    )
+    start = time.perf_counter()
+    index.build(entries)
+    build_ms = (time.perf_counter() - start) * 1000
+    
+    timings = []
+    for text in keystrokes:
+        start = time.perf_counter()
+        result = index.query(text)
+        timings.append((time.perf_counter() - start) * 1000)
+        assert [e.id for e in result] == [e.id for e in _filter_by_loop(entries, worker_names, text)]
+    
+    start = time.perf_counter()
+    entry = TimeEntry(id=args.entries + 1, worker_id=1, date=first_day, duration_minutes=60, description="neu")
+    index.add(entry)
+    index.update(TimeEntry(id=entry.id, worker_id=1, date=first_day, duration_minutes=60, description="geändert"))
+    index.remove(entry.id)
+    change_ms = (time.perf_counter() - start) * 1000
+    
+    print(f"{args.entries} Einträge, {len(keystrokes)} Tastendrücke (NumPy: {HAS_NUMPY}):")
+    print(f"  Einzelprüfung  {loop_ms:8.1f} ms/Tastendruck")
+    print(f"  SearchIndex    {sum(timings) / len(timings):8.1f} ms/Tastendruck "
+          f"(max {max(timings):.1f} ms, Aufbau {build_ms:.0f} ms)")
+    print(f"  add + update + remove  {change_ms:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark Script - Kalter WorkerRepository.find_all: sequentiell vs. Prozess-Pool
+"""
+import sys
+import os
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from PySide6.QtCore import QCoreApplication
+
+from src.services.database_service import DatabaseService
+from src.services.crypto_service import CryptoService
+from src.repositories.worker_repository import WorkerRepository
+from src.models.worker import Worker
+
+
+def _cold_find_all(repo: WorkerRepository, threshold: int) -> float:
+    """Misst find_all mit leerem Cache, gibt Sekunden zurück"""
+    repo.cache.clear()
+    repo.BULK_DECRYPT_THRESHOLD = threshold
+    start = time.perf_counter()
+    repo.find_all()
+    return time.perf_counter() - start
+
+
+def _run(size: int, temp_dir: Path, crypto_service: CryptoService) -> None:
+    """Erstellt Datenbank mit size Workern (Legacy-Format) und misst find_all"""
+    db_service = DatabaseService(str(temp_dir / f"benchmark_{size}.db"))
+    db_service.connection_name = f"benchmark_{size}"
+    db_service.initialize()
+    
+    repo = WorkerRepository(db_service, crypto_service)
+    with repo.unit_of_work():
+        for i in range(size):
+            repo.create(Worker(name=f"Worker {i}", email=f"worker{i}@example.com", team="Team"))
+    
+    sequential = _cold_find_all(repo, threshold=sys.maxsize)
+    parallel = _cold_find_all(repo, threshold=0)
+    
+    # Vergleich: nach Migration ins Envelope-Format (nur AES pro Feld)
+    envelope_crypto = CryptoService(key_directory=crypto_service.key_directory)
+    envelope_crypto.initialize_keys()
+    envelope_crypto.initialize_data_key(db_service)
+    envelope_repo = WorkerRepository(db_service, envelope_crypto)
+    envelope_repo.migrate_to_envelope_encryption()
+    envelope = _cold_find_all(envelope_repo, threshold=0)
+    
+    print(f"  {size:>6} Worker: sequentiell {sequential:8.2f} s | "
+          f"Prozess-Pool {parallel:8.2f} s | Faktor {sequential / parallel:5.2f}x | "
+          f"Envelope {envelope:6.3f} s")
+    
+    db_service.close()
+
+
+def main():
+    """Führt Benchmark aus"""
+    parser = argparse.ArgumentParser(description="Benchmark für kalten find_all")
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1_000, 5_000, 20_000],
+        help="Anzahl Worker pro Durchlauf"
+    )
+    args = parser.parse_args()
+    
+    # Qt SQL requires QCoreApplication
+    app = QCoreApplication(sys.argv)
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        crypto_service = CryptoService(key_directory=Path(temp_dir) / "keys")
+        crypto_service.initialize_keys()
+        
+        print(f"Kalter find_all mit Legacy-Ciphertexts (RSA pro Feld), {os.cpu_count()} CPUs:")
+        for size in args.sizes:
+            _run(size, Path(temp_dir), crypto_service)
+
+
+if __name__ == "__main__":
+    main()
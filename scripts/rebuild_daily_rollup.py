@@ -0,0 +1,32 @@
+"""
+Wartungs-Script - Baut den Rollup daily_worker_hours neu auf
+"""
+import sys
+import argparse
+from PySide6.QtCore import QCoreApplication
+
+from src.services.database_service import DatabaseService
+
+
+def main():
+    """Führt Rebuild aus"""
+    parser = argparse.ArgumentParser(description="Rollup daily_worker_hours neu aufbauen")
+    parser.add_argument("--database", help="Pfad zur Datenbank (default: ~/.capacity_planner/data.db)")
+    args = parser.parse_args()
+    
+    # Qt SQL requires QCoreApplication
+    app = QCoreApplication(sys.argv)
+    
+    db_service = DatabaseService(args.database)
+    db_service.initialize()
+    
+    print(f"Baue daily_worker_hours neu auf ({db_service.get_db_path()})...")
+    worker_days = db_service.rebuild_daily_worker_hours()
+    
+    print(f"\n✓ Rollup neu aufgebaut: {worker_days} Worker-Tage")
+    
+    db_service.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -37,6 +37,10 @@ setup(
         "python-dateutil>=2.8.2",
     ],
     extras_require={
+        # Vektorisierte Analytics-Kernels (ohne NumPy: reines Python)
+        "fast": [
+            "numpy>=1.24.0",
+        ],
         "dev": [
             "pytest>=7.4.0",
             "pytest-cov>=4.1.0",
@@ -8,6 +8,7 @@ from src.views.login_dialog import LoginDialog
 from src.services.session_service import SessionService
 from src.services.database_service import DatabaseService
 from src.services.crypto_service import CryptoService
+from src.repositories.worker_repository import WorkerRepository
 
 
 def main():
@@ -19,11 +20,21 @@ def main():
     # EINE zentrale Datenbank-Verbindung für die gesamte App
     db_service = DatabaseService()
     db_service.initialize()
+    print(db_service.format_pragma_report())
+    for result in db_service.applied_migrations:
+        if result.message:
+            print(f"Migration {result.version}: {result.message}")
     
     # EINE zentrale Crypto-Service-Instanz
     crypto_service = CryptoService()
     crypto_service.initialize_keys()
     
+    # Envelope-Modus: ein Data-Key pro Datenbank statt RSA pro Feld
+    crypto_service.initialize_data_key(db_service)
+    worker_repository = WorkerRepository(db_service, crypto_service)
+    worker_repository.migrate_to_envelope_encryption()
+    worker_repository.backfill_email_blind_index()
+    
     # Session-Service initialisieren
     session_service = SessionService()
     
@@ -2,12 +2,65 @@
 TimeEntry Model
 Repräsentiert eine einzelne Arbeitszeiterfassung
 """
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+class LazyTimestamp:
+    """
+    Zeitstempel-Attribut, das ISO-Strings erst beim Zugriff parst
+    
+    Repositories übergeben den Rohwert aus der Datenbank; Listenansichten,
+    die den Zeitstempel nie lesen, sparen so das Parsen. None steht für
+    "jetzt". Gespeichert wird im Slot des Dataclass-Felds (siehe
+    lazy_timestamps).
+    """
+    
+    def __init__(self, slot):
+        """
+        Args:
+            slot: Member-Descriptor des Slots, der den Wert hält
+        """
+        self._slot = slot
+    
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        
+        value = self._slot.__get__(instance, owner)
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value)
+            self._slot.__set__(instance, value)
+        return value
+    
+    def __set__(self, instance, value):
+        self._slot.__set__(instance, datetime.now() if value is None else value)
+    
+    def raw(self, instance):
+        """Gespeicherter Wert ohne Parsen (ISO-String oder datetime)"""
+        return self._slot.__get__(instance, type(instance))
+
+
+def lazy_timestamps(*names: str):
+    """
+    Klassen-Decorator: legt LazyTimestamp über die Slots der genannten Felder
+    
+    Muss über @dataclass(slots=True) stehen - erst dann existieren die Slots.
+    
+    Args:
+        names: Feldnamen der Zeitstempel
+    """
+    def decorate(cls):
+        for name in names:
+            setattr(cls, name, LazyTimestamp(cls.__dict__[name]))
+        return cls
+    
+    return decorate
+
+
+@lazy_timestamps("created_at", "updated_at")
+@dataclass(slots=True)
 class TimeEntry:
     """
     Arbeitszeit-Eintrag für einen Knowledge Worker
@@ -19,8 +72,8 @@ class TimeEntry:
         duration_minutes: Dauer in Minuten
         description: Beschreibung der Tätigkeit
         project: Optional: Projektzuordnung
-        created_at: Zeitstempel der Erstellung
-        updated_at: Zeitstempel der letzten Änderung
+        created_at: Zeitstempel der Erstellung (lazy geparst, siehe LazyTimestamp)
+        updated_at: Zeitstempel der letzten Änderung (lazy geparst)
     """
     worker_id: int
     date: datetime
@@ -28,8 +81,8 @@ class TimeEntry:
     description: str
     id: Optional[int] = None
     project: Optional[str] = None
-    created_at: datetime = field(default_factory=datetime.now)
-    updated_at: datetime = field(default_factory=datetime.now)
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
     
     def duration_hours(self) -> float:
         """Gibt die Dauer in Stunden zurück"""
@@ -0,0 +1,183 @@
+"""
+TimeEntryBatch Model
+Spaltenorientierte Ablage großer Mengen von Zeiterfassungen
+"""
+from array import array
+from datetime import date, datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from .time_entry import TimeEntry
+
+
+class TimeEntryBatch:
+    """
+    Zeiterfassungen als typisierte Spalten statt als Objekte
+    
+    Pro Eintrag werden nur Zahlen gehalten (Tag als Ordinalzahl, Minuten,
+    Worker-ID als int32, ID als int64); Projektnamen werden einmal
+    interniert und per Code referenziert. Beschreibungen und Zeitstempel
+    fehlen bewusst - für Auswertungen und Exporte über große Zeiträume.
+    
+    Attributes:
+        ids: Eintrags-IDs (int64)
+        worker_ids: Worker-IDs (int32)
+        days: Tage als date.toordinal() (int32)
+        minutes: Dauer in Minuten (int32)
+        project_codes: Index in projects (int32), 0 = kein Projekt
+        projects: Internierte Projektnamen, projects[0] ist None
+    
+    Beispiel:
+        >>> batch = repo.load_batch(start, end)
+        >>> batch.minutes_by_worker()
+        {1: 4800, 2: 3120}
+    """
+    
+    __slots__ = ("ids", "worker_ids", "days", "minutes", "project_codes", "projects", "_project_index")
+    
+    def __init__(self):
+        """Initialisiert leeren Batch"""
+        self.ids = array("q")
+        self.worker_ids = array("i")
+        self.days = array("i")
+        self.minutes = array("i")
+        self.project_codes = array("i")
+        self.projects: List[Optional[str]] = [None]
+        self._project_index: Dict[Optional[str], int] = {None: 0}
+    
+    @classmethod
+    def from_entries(cls, entries: Iterable[TimeEntry]) -> "TimeEntryBatch":
+        """
+        Erstellt Batch aus TimeEntry-Objekten
+        
+        Args:
+            entries: TimeEntries (id None wird als 0 abgelegt)
+        
+        Returns:
+            Neuer TimeEntryBatch
+        """
+        batch = cls()
+        batch.extend(
+            (entry.id or 0, entry.worker_id, entry.date.toordinal(), entry.duration_minutes, entry.project)
+            for entry in entries
+        )
+        return batch
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    def project_code(self, project: Optional[str]) -> int:
+        """
+        Liefert Code eines Projekts und interniert es bei Bedarf
+        
+        Args:
+            project: Projektname, None oder "" für "kein Projekt"
+        
+        Returns:
+            Index in projects
+        """
+        # QSQLITE liefert NULL-Texte als ""
+        project = project or None
+        code = self._project_index.get(project)
+        if code is None:
+            code = len(self.projects)
+            self.projects.append(project)
+            self._project_index[project] = code
+        return code
+    
+    def append(self, entry_id: int, worker_id: int, day: int, minutes: int, project: Optional[str]):
+        """
+        Hängt einen Eintrag an
+        
+        Args:
+            entry_id: ID des Eintrags
+            worker_id: Worker-ID
+            day: Tag als date.toordinal()
+            minutes: Dauer in Minuten
+            project: Projektname oder None
+        """
+        self.ids.append(entry_id)
+        self.worker_ids.append(worker_id)
+        self.days.append(day)
+        self.minutes.append(minutes)
+        self.project_codes.append(self.project_code(project))
+    
+    def extend(self, rows: Iterable[Tuple[int, int, int, int, Optional[str]]]):
+        """
+        Hängt Zeilen (entry_id, worker_id, day, minutes, project) an
+        
+        Args:
+            rows: Zeilen wie bei append, z.B. direkt vom Forward-Only-Cursor
+        """
+        append = self.append
+        for row in rows:
+            append(*row)
+    
+    def total_minutes(self) -> int:
+        """Summe aller Minuten"""
+        return sum(self.minutes)
+    
+    def minutes_by_worker(self) -> Dict[int, int]:
+        """
+        Summiert Minuten pro Worker
+        
+        Returns:
+            Dict worker_id -> Minuten
+        """
+        totals: Dict[int, int] = {}
+        get = totals.get
+        for worker_id, minutes in zip(self.worker_ids, self.minutes):
+            totals[worker_id] = get(worker_id, 0) + minutes
+        return totals
+    
+    def minutes_by_day(self) -> Dict[int, int]:
+        """
+        Summiert Minuten pro Tag
+        
+        Returns:
+            Dict Tag (date.toordinal()) -> Minuten
+        """
+        totals: Dict[int, int] = {}
+        get = totals.get
+        for day, minutes in zip(self.days, self.minutes):
+            totals[day] = get(day, 0) + minutes
+        return totals
+    
+    def minutes_by_project(self) -> Dict[Optional[str], int]:
+        """
+        Summiert Minuten pro Projekt
+        
+        Returns:
+            Dict Projektname (None = ohne Projekt) -> Minuten
+        """
+        totals = [0] * len(self.projects)
+        for code, minutes in zip(self.project_codes, self.minutes):
+            totals[code] += minutes
+        return {self.projects[code]: total for code, total in enumerate(totals) if total}
+    
+    def rows(self) -> Iterator[Tuple[int, int, date, int, Optional[str]]]:
+        """
+        Liefert Export-Zeilen (id, worker_id, Datum, Minuten, Projekt)
+        
+        Datum und Projekt werden erst hier erzeugt; geeignet für
+        csv.writer.writerows ohne Zwischenliste.
+        
+        Yields:
+            Tuple pro Eintrag in Einfügereihenfolge
+        """
+        from_ordinal = date.fromordinal
+        projects = self.projects
+        for entry_id, worker_id, day, minutes, code in zip(
+            self.ids, self.worker_ids, self.days, self.minutes, self.project_codes
+        ):
+            yield entry_id, worker_id, from_ordinal(day), minutes, projects[code]
+    
+    @staticmethod
+    def day_number(value: datetime) -> int:
+        """Tag eines Datums als Ordinalzahl (Format von days)"""
+        return value.toordinal()
+    
+    def nbytes(self) -> int:
+        """Speicher der Spalten in Bytes (ohne Projektnamen)"""
+        return sum(
+            column.itemsize * len(column)
+            for column in (self.ids, self.worker_ids, self.days, self.minutes, self.project_codes)
+        )
@@ -2,7 +2,7 @@
 Base Repository
 Gemeinsame Funktionalität für alle Repositories
 """
-from typing import Optional, List, TypeVar, Generic
+from typing import Any, Callable, ContextManager, Iterator, Optional, List, Tuple, Iterable, TypeVar, Generic
 from PySide6.QtSql import QSqlQuery
 from ..services.database_service import DatabaseService
 
@@ -16,6 +16,14 @@ class BaseRepository(Generic[T]):
     Implementiert Repository Pattern für Datenzugriff
     """
     
+    # Maximale Platzhalter in IN-Listen (SQLite-Limit älterer Versionen: 999)
+    MAX_IN_PARAMS = 500
+    
+    # Standard-Chunkgröße für create_many (Zeilen pro execBatch). QSQLITE
+    # emuliert execBatch zeilenweise, der Aufwand wächst mit der Listenlänge
+    # überproportional - kleine Chunks sind deutlich schneller als große.
+    BULK_CHUNK_SIZE = 50
+    
     def __init__(self, db_service: DatabaseService):
         """
         Initialisiert Repository
@@ -25,27 +33,166 @@ class BaseRepository(Generic[T]):
         """
         self.db_service = db_service
     
-    def _execute_query(self, query_text: str, params: Optional[list] = None) -> QSqlQuery:
+    def _statement(
+        self,
+        query_text: str,
+        params: Optional[list] = None
+    ) -> ContextManager[QSqlQuery]:
         """
-        Führt Query aus (Wrapper für db_service)
+        Führt Query mit gecachtem Statement aus (Wrapper für db_service.statement)
         
         Args:
             query_text: SQL-Statement
             params: Parameter für Prepared Statement
             
         Returns:
-            QSqlQuery-Objekt
+            Context Manager, liefert das ausgeführte QSqlQuery (nur im Block gültig)
         """
-        return self.db_service.execute_query(query_text, params)
+        return self.db_service.statement(query_text, params=params)
     
-    def begin_transaction(self) -> bool:
-        """Startet Transaktion"""
-        return self.db_service.db.transaction()
+    def _execute(self, query_text: str, params: Optional[list] = None) -> int:
+        """
+        Führt schreibendes Statement aus (UPDATE/DELETE)
+        
+        Args:
+            query_text: SQL-Statement
+            params: Parameter für Prepared Statement
+            
+        Returns:
+            Anzahl betroffener Zeilen
+        """
+        with self._statement(query_text, params) as query:
+            return query.numRowsAffected()
+    
+    def _iter_query(
+        self,
+        query_text: str,
+        params: Optional[list],
+        make_mapper: Callable[[QSqlQuery], Callable[[QSqlQuery], Any]]
+    ) -> Iterator[Any]:
+        """
+        Liefert gemappte Zeilen direkt vom Forward-Only-Cursor
+        
+        Es wird nie mehr als eine Zeile materialisiert. Das Statement
+        wird beim Erschöpfen oder Schließen des Generators beendet und
+        an den Statement-Cache zurückgegeben.
+        
+        Args:
+            query_text: SELECT-Statement
+            params: Parameter für Prepared Statement
+            make_mapper: Erzeugt nach Ausführung einmalig den Mapper
+                QSqlQuery -> Entity oder Tuple (z.B. mit aufgelösten Spaltenindizes)
+            
+        Yields:
+            Ergebnis des Mappers pro Zeile
+        """
+        with self.db_service.statement(query_text, params=params, forward_only=True) as query:
+            mapper = make_mapper(query)
+            while query.next():
+                yield mapper(query)
     
-    def commit_transaction(self) -> bool:
-        """Commitet Transaktion"""
-        return self.db_service.db.commit()
+    @staticmethod
+    def _column_indexes(query: QSqlQuery, columns: Iterable[str]) -> List[int]:
+        """
+        Löst Spaltennamen einmal pro Query in Positionen auf
+        
+        query.value(int) spart gegenüber query.value(str) die
+        Namenssuche pro Feld und Zeile.
+        
+        Args:
+            query: Ausgeführte QSqlQuery
+            columns: Spaltennamen
+            
+        Returns:
+            Indizes in Reihenfolge von columns
+        """
+        columns = list(columns)
+        record = query.record()
+        indexes = [record.indexOf(column) for column in columns]
+        if -1 in indexes:
+            missing = [column for column, index in zip(columns, indexes) if index == -1]
+            raise RuntimeError(f"Spalten nicht im Ergebnis: {', '.join(missing)}")
+        return indexes
     
-    def rollback_transaction(self) -> bool:
-        """Rollt Transaktion zurück"""
-        return self.db_service.db.rollback()
+    @staticmethod
+    def _day_number_sql(column: str) -> str:
+        """
+        SQL-Ausdruck: Tag einer Datumsspalte als date.toordinal()
+        
+        julianday('0001-01-01') = 1721425.5 entspricht Ordinalzahl 1;
+        eine Uhrzeit wird abgeschnitten.
+        
+        Args:
+            column: Spalte mit ISO-Datum oder -Zeitstempel
+            
+        Returns:
+            SQL-Ausdruck
+        """
+        return f"CAST(julianday({column}) - 1721424.5 AS INTEGER)"
+    
+    def _insert_many(self, query_text: str, rows: List[list], chunk_size: int) -> List[int]:
+        """
+        Fügt Zeilen chunkweise per execBatch in einer Transaktion ein
+        
+        Läuft als unit_of_work - bei Fehlern wird alles zurückgerollt,
+        innerhalb eines äußeren Blocks nur dieser Teil (Savepoint).
+        
+        Args:
+            query_text: INSERT-Statement mit Platzhaltern
+            rows: Parameterlisten, eine pro Zeile
+            chunk_size: Zeilen pro execBatch-Aufruf
+        
+        Returns:
+            Generierte IDs in Reihenfolge von rows
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size muss mindestens 1 sein")
+        
+        if not rows:
+            return []
+        
+        ids = []
+        with self.unit_of_work():
+            for offset in range(0, len(rows), chunk_size):
+                chunk = rows[offset:offset + chunk_size]
+                last_id = self.db_service.execute_batch(query_text, [list(column) for column in zip(*chunk)])
+                # Innerhalb der Schreibtransaktion vergibt AUTOINCREMENT fortlaufende IDs
+                ids.extend(range(last_id - len(chunk) + 1, last_id + 1))
+        
+        return ids
+    
+    def _in_filter(self, column: str, values: Optional[Iterable[int]]) -> Tuple[str, list]:
+        """
+        Baut optionalen "AND column IN (...)"-Filter
+        
+        Bei None oder mehr als MAX_IN_PARAMS Werten wird kein Filter
+        erzeugt - der Aufrufer filtert das Ergebnis dann selbst.
+        
+        Args:
+            column: Spaltenname
+            values: Erlaubte Werte oder None
+            
+        Returns:
+            Tuple (SQL-Fragment, Parameter)
+        """
+        if values is None:
+            return "", []
+        
+        values = list(values)
+        if not values or len(values) > self.MAX_IN_PARAMS:
+            return "", []
+        
+        placeholders = ", ".join("?" for _ in values)
+        return f" AND {column} IN ({placeholders})", values
+    
+    def unit_of_work(self):
+        """
+        Gemeinsame Transaktionsklammer aller Repositories (siehe DatabaseService.unit_of_work)
+        
+        Einzige Transaktions-API der Repositories: nur so zählt
+        DatabaseService.in_transaction offene Transaktionen mit.
+        
+        Returns:
+            Context Manager
+        """
+        return self.db_service.unit_of_work()
@@ -0,0 +1,250 @@
+"""
+Capacity Index
+In-Memory-Intervallindex für Überlappungsabfragen auf Kapazitäten
+"""
+from typing import Dict, Iterable, List, Optional, Tuple
+from weakref import WeakKeyDictionary
+from ..utils.interval_tree import IntervalTree
+
+
+class CapacityIndex:
+    """
+    Intervallbaum pro Worker über alle Capacities einer Datenbank
+    
+    Strategie:
+    - Einmaliges Laden aller Capacities (id, Worker, Tage, Stunden) füllt den Index
+    - create/update/delete im CapacityRepository aktualisieren ihn direkt (Write-Through),
+      WorkerRepository.delete entfernt die per ON DELETE CASCADE gelöschten Capacities
+    - Der Baum eines Workers wird nach Änderungen beim nächsten Lesen neu gebaut
+    - Nach einem Rollback wird der Index verworfen und neu geladen
+    - Ein Index pro DatabaseService-Instanz, geteilt von allen Repositories
+    
+    Tage sind Ordinalzahlen (date.toordinal()), Grenzen inklusive.
+    
+    Beispiel:
+        >>> index = CapacityIndex.for_database(db_service)
+        >>> index.planned_hours(worker_id, first_day, last_day)
+    """
+    
+    _instances: "WeakKeyDictionary[object, CapacityIndex]" = WeakKeyDictionary()
+    
+    def __init__(self):
+        """Initialisiert leeren, noch nicht geladenen Index"""
+        # worker_id -> capacity_id -> (start_day, end_day, planned_hours)
+        self._capacities: Dict[int, Dict[int, Tuple[int, int, float]]] = {}
+        self._owners: Dict[int, int] = {}
+        self._trees: Dict[int, IntervalTree] = {}
+        self._loaded = False
+    
+    @classmethod
+    def for_database(cls, db_service) -> "CapacityIndex":
+        """
+        Gibt den Index für eine Datenbankverbindung zurück
+        
+        Args:
+            db_service: DatabaseService-Instanz
+        
+        Returns:
+            Geteilte CapacityIndex-Instanz
+        """
+        index = cls._instances.get(db_service)
+        if index is None:
+            index = cls()
+            cls._instances[db_service] = index
+            db_service.add_rollback_listener(index.clear)
+        return index
+    
+    @property
+    def is_loaded(self) -> bool:
+        """True wenn alle Capacities der Datenbank im Index liegen"""
+        return self._loaded
+    
+    def fill(self, rows: Iterable[Tuple[int, int, int, int, float]]) -> None:
+        """
+        Füllt Index mit dem Ergebnis eines vollständigen Loads
+        
+        Args:
+            rows: Tupel (capacity_id, worker_id, start_day, end_day, planned_hours)
+        """
+        self._capacities = {}
+        self._owners = {}
+        self._trees = {}
+        for capacity_id, worker_id, start_day, end_day, hours in rows:
+            self._capacities.setdefault(worker_id, {})[capacity_id] = (start_day, end_day, hours)
+            self._owners[capacity_id] = worker_id
+        self._loaded = True
+    
+    def put(self, capacity_id: int, worker_id: int, start_day: int, end_day: int, hours: float) -> None:
+        """
+        Legt Capacity im Index ab bzw. aktualisiert sie (auch bei Worker-Wechsel)
+        
+        Args:
+            capacity_id: ID der Capacity
+            worker_id: Worker-ID
+            start_day: Erster Tag
+            end_day: Letzter Tag
+            hours: planned_hours
+        """
+        if not self._loaded:
+            return
+        
+        self.remove(capacity_id)
+        self._capacities.setdefault(worker_id, {})[capacity_id] = (start_day, end_day, hours)
+        self._owners[capacity_id] = worker_id
+        self._trees.pop(worker_id, None)
+    
+    def remove(self, capacity_id: int) -> None:
+        """
+        Entfernt Capacity aus dem Index
+        
+        Args:
+            capacity_id: ID der Capacity
+        """
+        worker_id = self._owners.pop(capacity_id, None)
+        if worker_id is None:
+            return
+        
+        capacities = self._capacities[worker_id]
+        del capacities[capacity_id]
+        if not capacities:
+            del self._capacities[worker_id]
+        self._trees.pop(worker_id, None)
+    
+    def remove_worker(self, worker_id: int) -> None:
+        """
+        Entfernt alle Capacities eines Workers (z.B. nach ON DELETE CASCADE)
+        
+        Args:
+            worker_id: ID des Workers
+        """
+        for capacity_id in self._capacities.pop(worker_id, {}):
+            del self._owners[capacity_id]
+        self._trees.pop(worker_id, None)
+    
+    def clear(self) -> None:
+        """Verwirft den Index (z.B. nach Rollback oder externen Änderungen)"""
+        self._capacities = {}
+        self._owners = {}
+        self._trees = {}
+        self._loaded = False
+    
+    def get(self, capacity_id: int) -> Optional[Tuple[int, int, int, float]]:
+        """
+        Liefert eine Capacity aus dem Index
+        
+        Args:
+            capacity_id: ID der Capacity
+        
+        Returns:
+            Tupel (worker_id, start_day, end_day, planned_hours) oder None
+        """
+        worker_id = self._owners.get(capacity_id)
+        if worker_id is None:
+            return None
+        return (worker_id,) + self._capacities[worker_id][capacity_id]
+    
+    def overlapping(self, worker_id: int, first_day: int, last_day: int) -> List[Tuple[int, int, int, float]]:
+        """
+        Findet Capacities eines Workers, die [first_day, last_day] schneiden
+        
+        Args:
+            worker_id: Worker-ID
+            first_day: Erster Tag (inklusive)
+            last_day: Letzter Tag (inklusive)
+        
+        Returns:
+            Liste von (capacity_id, start_day, end_day, planned_hours)
+        """
+        tree = self._tree(worker_id)
+        if tree is None:
+            return []
+        return [
+            (capacity_id, start_day, end_day, hours)
+            for start_day, end_day, (capacity_id, hours) in tree.overlapping(first_day, last_day)
+        ]
+    
+    def overlapping_ids(
+        self,
+        first_day: int,
+        last_day: int,
+        worker_ids: Optional[Iterable[int]] = None
+    ) -> List[int]:
+        """
+        IDs aller Capacities, die [first_day, last_day] schneiden
+        
+        Args:
+            first_day: Erster Tag (inklusive)
+            last_day: Letzter Tag (inklusive)
+            worker_ids: Optional: nur diese Worker
+        
+        Returns:
+            Capacity-IDs
+        """
+        workers = self._capacities if worker_ids is None else worker_ids
+        return [
+            capacity_id
+            for worker_id in workers
+            for capacity_id, _, _, _ in self.overlapping(worker_id, first_day, last_day)
+        ]
+    
+    def planned_hours(self, worker_id: int, first_day: int, last_day: int) -> Optional[float]:
+        """
+        Anteilige Plan-Stunden eines Workers im Bereich
+        
+        Jede Capacity zählt mit planned_hours * Überlappungstage / Capacity-Tage.
+        
+        Args:
+            worker_id: Worker-ID
+            first_day: Erster Tag (inklusive)
+            last_day: Letzter Tag (inklusive)
+        
+        Returns:
+            Summe der Stunden oder None, wenn keine Capacity überlappt
+        """
+        matches = self.overlapping(worker_id, first_day, last_day)
+        if not matches:
+            return None
+        
+        return sum(
+            hours * (min(end_day, last_day) - max(start_day, first_day) + 1) / (end_day - start_day + 1)
+            for _, start_day, end_day, hours in matches
+        )
+    
+    def planned_hours_by_worker(
+        self,
+        first_day: int,
+        last_day: int,
+        worker_ids: Optional[Iterable[int]] = None
+    ) -> Dict[int, float]:
+        """
+        Anteilige Plan-Stunden pro Worker im Bereich
+        
+        Args:
+            first_day: Erster Tag (inklusive)
+            last_day: Letzter Tag (inklusive)
+            worker_ids: Optional: nur diese Worker
+        
+        Returns:
+            Dict worker_id -> Stunden (nur Worker mit überlappenden Capacities)
+        """
+        workers = list(self._capacities) if worker_ids is None else worker_ids
+        totals = {}
+        for worker_id in workers:
+            hours = self.planned_hours(worker_id, first_day, last_day)
+            if hours is not None:
+                totals[worker_id] = hours
+        return totals
+    
+    def _tree(self, worker_id: int) -> Optional[IntervalTree]:
+        """Intervallbaum eines Workers (lazy nach Änderungen neu gebaut)"""
+        tree = self._trees.get(worker_id)
+        if tree is None:
+            capacities = self._capacities.get(worker_id)
+            if not capacities:
+                return None
+            tree = IntervalTree(
+                (start_day, end_day, (capacity_id, hours))
+                for capacity_id, (start_day, end_day, hours) in capacities.items()
+            )
+            self._trees[worker_id] = tree
+        return tree
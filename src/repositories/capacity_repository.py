@@ -2,10 +2,11 @@
 Capacity Repository
 Datenzugriff für Kapazitätsplanung
 """
-from typing import List, Optional
-from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+from datetime import date, datetime
 from ..models.capacity import Capacity
 from .base_repository import BaseRepository
+from .capacity_index import CapacityIndex
 
 
 class CapacityRepository(BaseRepository[Capacity]):
@@ -13,8 +14,31 @@ class CapacityRepository(BaseRepository[Capacity]):
     Repository für Capacity-Operationen
     
     CRUD-Operationen für Kapazitätsplanung
+    
+    Überlappungsabfragen (Datumsfilter, anteilige Plan-Stunden) laufen
+    über den prozessweiten CapacityIndex (Intervallbaum pro Worker),
+    den create/update/delete direkt aktualisieren.
+    """
+    
+    # Projektion für Capacity-Objekte (statt SELECT *)
+    ENTITY_COLUMNS = ("id", "worker_id", "start_date", "end_date", "planned_hours", "notes", "created_at")
+    
+    _INSERT_SQL = """
+        INSERT INTO capacities 
+        (worker_id, start_date, end_date, planned_hours, notes, created_at)
+        VALUES (?, ?, ?, ?, ?, ?)
     """
     
+    def __init__(self, db_service):
+        """
+        Initialisiert Repository
+        
+        Args:
+            db_service: Datenbankservice-Instanz
+        """
+        super().__init__(db_service)
+        self.index = CapacityIndex.for_database(db_service)
+    
     def create(self, capacity: Capacity) -> int:
         """
         Erstellt neue Kapazitätsplanung
@@ -25,22 +49,27 @@ class CapacityRepository(BaseRepository[Capacity]):
         Returns:
             ID der erstellten Capacity
         """
-        query_text = """
-            INSERT INTO capacities 
-            (worker_id, start_date, end_date, planned_hours, notes, created_at)
-            VALUES (?, ?, ?, ?, ?, ?)
+        with self._statement(self._INSERT_SQL, self._insert_params(capacity)) as query:
+            capacity_id = query.lastInsertId()
+        self._index_put(capacity_id, capacity)
+        return capacity_id
+    
+    def create_many(self, capacities: List[Capacity], chunk_size: Optional[int] = None) -> List[int]:
         """
-        params = [
-            capacity.worker_id,
-            capacity.start_date.isoformat(),
-            capacity.end_date.isoformat(),
-            capacity.planned_hours,
-            capacity.notes,
-            capacity.created_at.isoformat()
-        ]
+        Erstellt viele Kapazitätsplanungen in einer Transaktion (execBatch)
         
-        query = self._execute_query(query_text, params)
-        return query.lastInsertId()
+        Args:
+            capacities: Capacity-Objekte
+            chunk_size: Zeilen pro Batch (default: BULK_CHUNK_SIZE)
+            
+        Returns:
+            IDs der erstellten Capacities in Eingabereihenfolge
+        """
+        rows = [self._insert_params(capacity) for capacity in capacities]
+        ids = self._insert_many(self._INSERT_SQL, rows, chunk_size or self.BULK_CHUNK_SIZE)
+        for capacity_id, capacity in zip(ids, capacities):
+            self._index_put(capacity_id, capacity)
+        return ids
     
     def find_by_id(self, capacity_id: int) -> Optional[Capacity]:
         """
@@ -52,11 +81,10 @@ class CapacityRepository(BaseRepository[Capacity]):
         Returns:
             Capacity oder None
         """
-        query_text = "SELECT * FROM capacities WHERE id = ?"
-        query = self._execute_query(query_text, [capacity_id])
-        
-        if query.next():
-            return self._map_to_entity(query)
+        query_text = f"SELECT {self._select_columns()} FROM capacities WHERE id = ?"
+        with self._statement(query_text, [capacity_id]) as query:
+            if query.next():
+                return self._map_to_entity(query)
         return None
     
     def find_by_worker(
@@ -70,30 +98,22 @@ class CapacityRepository(BaseRepository[Capacity]):
         
         Args:
             worker_id: Worker-ID
-            start_date: Optionaler Start-Filter
+            start_date: Optionaler Start-Filter (tagesgenaue Überlappung, über CapacityIndex)
             end_date: Optionaler End-Filter
             
         Returns:
             Liste von Capacity-Objekten
         """
-        query_text = "SELECT * FROM capacities WHERE worker_id = ?"
-        params = [worker_id]
-        
-        if start_date:
-            query_text += " AND end_date >= ?"
-            params.append(start_date.isoformat())
-        
-        if end_date:
-            query_text += " AND start_date <= ?"
-            params.append(end_date.isoformat())
-        
-        query_text += " ORDER BY start_date DESC"
-        
-        query = self._execute_query(query_text, params)
+        if start_date or end_date:
+            ids = self.load_index().overlapping_ids(*self._day_range(start_date, end_date), [worker_id])
+            return self._find_by_ids(ids)
         
+        query_text = f"SELECT {self._select_columns()} FROM capacities WHERE worker_id = ? ORDER BY start_date DESC"
         capacities = []
-        while query.next():
-            capacities.append(self._map_to_entity(query))
+        with self._statement(query_text, [worker_id]) as query:
+            map_row = self._entity_mapper(query)
+            while query.next():
+                capacities.append(map_row(query))
         
         return capacities
     
@@ -106,32 +126,78 @@ class CapacityRepository(BaseRepository[Capacity]):
         Findet alle Capacities in einem Datumsbereich
         
         Args:
-            start_date: Optionaler Start-Filter
+            start_date: Optionaler Start-Filter (tagesgenaue Überlappung, über CapacityIndex)
             end_date: Optionaler End-Filter
             
         Returns:
             Liste von Capacity-Objekten
         """
-        query_text = "SELECT * FROM capacities WHERE 1=1"
-        params = []
+        if start_date or end_date:
+            ids = self.load_index().overlapping_ids(*self._day_range(start_date, end_date))
+            return self._find_by_ids(ids)
         
-        if start_date:
-            query_text += " AND end_date >= ?"
-            params.append(start_date.isoformat())
+        query_text = f"SELECT {self._select_columns()} FROM capacities ORDER BY start_date DESC"
+        capacities = []
+        with self._statement(query_text) as query:
+            map_row = self._entity_mapper(query)
+            while query.next():
+                capacities.append(map_row(query))
         
-        if end_date:
-            query_text += " AND start_date <= ?"
-            params.append(end_date.isoformat())
+        return capacities
+    
+    def sum_overlapping_hours_by_worker(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        worker_ids: Optional[List[int]] = None
+    ) -> Dict[int, float]:
+        """
+        Summiert anteilige Plan-Stunden im Zeitraum pro Worker
         
-        query_text += " ORDER BY start_date DESC"
+        Jede Capacity zählt nur mit dem Anteil ihrer Tage, der im
+        Zeitraum liegt (planned_hours * Überlappungstage / Capacity-Tage).
+        Beantwortet aus dem CapacityIndex in O(log n + k) pro Worker.
         
-        query = self._execute_query(query_text, params)
+        Args:
+            start_date: Start des Zeitraums
+            end_date: Ende des Zeitraums
+            worker_ids: Optional: nur diese Worker
+            
+        Returns:
+            Dict worker_id -> anteilige planned_hours
+        """
+        return self.load_index().planned_hours_by_worker(
+            start_date.toordinal(), end_date.toordinal(), worker_ids
+        )
+    
+    def load_index(self) -> CapacityIndex:
+        """
+        Liefert den CapacityIndex und lädt ihn bei Bedarf (ein Full Scan)
         
-        capacities = []
-        while query.next():
-            capacities.append(self._map_to_entity(query))
+        Returns:
+            Geladener CapacityIndex
+        """
+        if not self.index.is_loaded:
+            query_text = f"""
+                SELECT id, worker_id, {self._day_number_sql("start_date")} AS start_day,
+                       {self._day_number_sql("end_date")} AS end_day, planned_hours
+                FROM capacities
+            """
+            
+            def make_mapper(query):
+                i_id, i_worker, i_start, i_end, i_hours = self._column_indexes(
+                    query, ("id", "worker_id", "start_day", "end_day", "planned_hours")
+                )
+                
+                def map_row(q):
+                    value = q.value
+                    return value(i_id), value(i_worker), value(i_start), value(i_end), float(value(i_hours))
+                
+                return map_row
+            
+            self.index.fill(self._iter_query(query_text, None, make_mapper))
         
-        return capacities
+        return self.index
     
     def update(self, capacity: Capacity) -> bool:
         """
@@ -158,8 +224,10 @@ class CapacityRepository(BaseRepository[Capacity]):
             capacity.id
         ]
         
-        query = self._execute_query(query_text, params)
-        return query.numRowsAffected() > 0
+        if self._execute(query_text, params) > 0:
+            self._index_put(capacity.id, capacity)
+            return True
+        return False
     
     def delete(self, capacity_id: int) -> bool:
         """
@@ -172,17 +240,97 @@ class CapacityRepository(BaseRepository[Capacity]):
             True bei Erfolg
         """
         query_text = "DELETE FROM capacities WHERE id = ?"
-        query = self._execute_query(query_text, [capacity_id])
-        return query.numRowsAffected() > 0
+        if self._execute(query_text, [capacity_id]) > 0:
+            self.index.remove(capacity_id)
+            return True
+        return False
+    
+    def _insert_params(self, capacity: Capacity) -> list:
+        """Parameter für _INSERT_SQL"""
+        return [
+            capacity.worker_id,
+            capacity.start_date.isoformat(),
+            capacity.end_date.isoformat(),
+            capacity.planned_hours,
+            capacity.notes,
+            capacity.created_at.isoformat()
+        ]
+    
+    def _find_by_ids(self, ids: List[int]) -> List[Capacity]:
+        """
+        Lädt Capacities per ID (chunkweise), sortiert nach start_date absteigend
+        
+        Args:
+            ids: Capacity-IDs, z.B. aus dem CapacityIndex
+            
+        Returns:
+            Liste von Capacity-Objekten
+        """
+        capacities = []
+        for offset in range(0, len(ids), self.MAX_IN_PARAMS):
+            chunk = ids[offset:offset + self.MAX_IN_PARAMS]
+            placeholders = ", ".join("?" for _ in chunk)
+            with self._statement(
+                f"SELECT {self._select_columns()} FROM capacities WHERE id IN ({placeholders})", chunk
+            ) as query:
+                map_row = self._entity_mapper(query)
+                while query.next():
+                    capacities.append(map_row(query))
+        
+        capacities.sort(key=lambda capacity: capacity.start_date, reverse=True)
+        return capacities
+    
+    def _index_put(self, capacity_id: int, capacity: Capacity) -> None:
+        """Write-Through einer gespeicherten Capacity in den CapacityIndex"""
+        self.index.put(
+            capacity_id,
+            capacity.worker_id,
+            capacity.start_date.toordinal(),
+            capacity.end_date.toordinal(),
+            capacity.planned_hours
+        )
+    
+    @staticmethod
+    def _day_range(start_date: Optional[datetime], end_date: Optional[datetime]) -> Tuple[int, int]:
+        """Optionale Datumsfilter als inklusiver Tagesbereich für den Index"""
+        return (
+            start_date.toordinal() if start_date else 1,
+            end_date.toordinal() if end_date else date.max.toordinal()
+        )
+    
+    def _select_columns(self) -> str:
+        """Spaltenliste für SELECT"""
+        return ", ".join(self.ENTITY_COLUMNS)
+    
+    def _entity_mapper(self, query) -> Callable:
+        """
+        Erzeugt Mapper QSqlQuery -> Capacity mit einmal aufgelösten Spaltenindizes
+        
+        Args:
+            query: Ausgeführte QSqlQuery mit ENTITY_COLUMNS
+            
+        Returns:
+            Funktion, die die aktuelle Zeile mappt
+        """
+        i_id, i_worker, i_start, i_end, i_hours, i_notes, i_created = (
+            self._column_indexes(query, self.ENTITY_COLUMNS)
+        )
+        parse = datetime.fromisoformat
+        
+        def map_row(q) -> Capacity:
+            value = q.value
+            return Capacity(
+                id=value(i_id),
+                worker_id=value(i_worker),
+                start_date=parse(value(i_start)),
+                end_date=parse(value(i_end)),
+                planned_hours=value(i_hours),
+                notes=value(i_notes),
+                created_at=parse(value(i_created))
+            )
+        
+        return map_row
     
     def _map_to_entity(self, query) -> Capacity:
         """Mappt QSqlQuery-Result zu Capacity"""
-        return Capacity(
-            id=query.value("id"),
-            worker_id=query.value("worker_id"),
-            start_date=datetime.fromisoformat(query.value("start_date")),
-            end_date=datetime.fromisoformat(query.value("end_date")),
-            planned_hours=query.value("planned_hours"),
-            notes=query.value("notes"),
-            created_at=datetime.fromisoformat(query.value("created_at"))
-        )
+        return self._entity_mapper(query)(query)
@@ -2,9 +2,14 @@
 Time Entry Repository
 Datenzugriff für Zeiterfassungen
 """
-from typing import List, Optional
+import re
+from contextlib import closing
+from itertools import islice
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
 from datetime import datetime
 from ..models.time_entry import TimeEntry
+from ..models.time_entry_batch import TimeEntryBatch
+from ..services.migrations import ensure_time_entries_fts
 from .base_repository import BaseRepository
 
 
@@ -13,6 +18,21 @@ class TimeEntryRepository(BaseRepository[TimeEntry]):
     Repository für TimeEntry-Operationen
     
     CRUD-Operationen für Zeiterfassungen
+    
+    Die Spalte date wird normalisiert als YYYY-MM-DD gespeichert, damit
+    Bereichsfilter einfache Vergleiche auf idx_time_entries_date bleiben.
+    """
+    
+    # Spalten der Row-Tuples von iter_by_* (date als YYYY-MM-DD-String)
+    ROW_COLUMNS = ("id", "worker_id", "date", "duration_minutes", "description", "project")
+    
+    # Projektion für TimeEntry-Objekte (statt SELECT *)
+    ENTITY_COLUMNS = ROW_COLUMNS + ("created_at", "updated_at")
+    
+    _INSERT_SQL = """
+        INSERT INTO time_entries 
+        (worker_id, date, duration_minutes, description, project, created_at, updated_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
     """
     
     def create(self, entry: TimeEntry) -> int:
@@ -25,29 +45,24 @@ class TimeEntryRepository(BaseRepository[TimeEntry]):
         Returns:
             ID der erstellten Zeiterfassung
         """
-        query_text = """
-            INSERT INTO time_entries 
-            (worker_id, date, duration_minutes, description, project, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
+        # Eigenständig sofort committet, innerhalb einer unit_of_work als Savepoint
+        with self.unit_of_work():
+            with self._statement(self._INSERT_SQL, self._insert_params(entry)) as query:
+                return query.lastInsertId()
+    
+    def create_many(self, entries: List[TimeEntry], chunk_size: Optional[int] = None) -> List[int]:
         """
-        params = [
-            entry.worker_id,
-            entry.date.isoformat(),
-            entry.duration_minutes,
-            entry.description,
-            entry.project,
-            entry.created_at.isoformat(),
-            entry.updated_at.isoformat()
-        ]
+        Erstellt viele Zeiterfassungen in einer Transaktion (execBatch)
         
-        query = self._execute_query(query_text, params)
-        entry_id = query.lastInsertId()
-        
-        # Explizites Commit für sofortige Verfügbarkeit
-        if self.db_service.db:
-            self.db_service.db.commit()
-        
-        return entry_id
+        Args:
+            entries: TimeEntry-Objekte
+            chunk_size: Zeilen pro Batch (default: BULK_CHUNK_SIZE)
+            
+        Returns:
+            IDs der erstellten Zeiterfassungen in Eingabereihenfolge
+        """
+        rows = [self._insert_params(entry) for entry in entries]
+        return self._insert_many(self._INSERT_SQL, rows, chunk_size or self.BULK_CHUNK_SIZE)
     
     def find_by_id(self, entry_id: int) -> Optional[TimeEntry]:
         """
@@ -59,11 +74,10 @@ class TimeEntryRepository(BaseRepository[TimeEntry]):
         Returns:
             TimeEntry oder None
         """
-        query_text = "SELECT * FROM time_entries WHERE id = ?"
-        query = self._execute_query(query_text, [entry_id])
-        
-        if query.next():
-            return self._map_to_entity(query)
+        query_text = f"SELECT {self._select_columns(False)} FROM time_entries WHERE id = ?"
+        with self._statement(query_text, [entry_id]) as query:
+            if query.next():
+                return self._map_to_entity(query)
         return None
     
     def find_by_worker(
@@ -83,58 +97,354 @@ class TimeEntryRepository(BaseRepository[TimeEntry]):
         Returns:
             Liste von TimeEntry-Objekten
         """
-        query_text = "SELECT * FROM time_entries WHERE worker_id = ?"
+        return list(self.iter_by_worker(worker_id, start_date, end_date))
+    
+    def find_by_date_range(
+        self,
+        start_date: str,
+        end_date: str
+    ) -> List[TimeEntry]:
+        """
+        Findet alle Zeiterfassungen in einem Datumsbereich
+        
+        Args:
+            start_date: Start-Datum (YYYY-MM-DD)
+            end_date: End-Datum (YYYY-MM-DD)
+            
+        Returns:
+            Liste von TimeEntry-Objekten
+        """
+        return list(self.iter_by_date_range(start_date, end_date))
+    
+    def iter_by_worker(
+        self,
+        worker_id: int,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        rows: bool = False
+    ) -> Iterator[Union[TimeEntry, tuple]]:
+        """
+        Streamt die Zeiterfassungen eines Workers (konstanter Speicher)
+        
+        Args:
+            worker_id: Worker-ID
+            start_date: Optionaler Start-Filter
+            end_date: Optionaler End-Filter
+            rows: Tuples (siehe ROW_COLUMNS) statt TimeEntry-Objekten liefern
+            
+        Yields:
+            TimeEntry oder Tuple, sortiert nach Datum absteigend
+        """
+        query_text = f"SELECT {self._select_columns(rows)} FROM time_entries WHERE worker_id = ?"
         params = [worker_id]
         
         if start_date:
             query_text += " AND date >= ?"
-            params.append(start_date.isoformat())
+            params.append(self._to_day(start_date))
         
         if end_date:
             query_text += " AND date <= ?"
-            params.append(end_date.isoformat())
+            params.append(self._to_day(end_date))
         
         query_text += " ORDER BY date DESC"
         
-        query = self._execute_query(query_text, params)
+        return self._iter_query(query_text, params, self._row_mapper(rows))
+    
+    def iter_by_date_range(
+        self,
+        start_date: str,
+        end_date: str,
+        rows: bool = False
+    ) -> Iterator[Union[TimeEntry, tuple]]:
+        """
+        Streamt alle Zeiterfassungen eines Datumsbereichs (konstanter Speicher)
         
-        entries = []
-        while query.next():
-            entries.append(self._map_to_entity(query))
+        Für Exporte und Auswertungen über große Zeiträume: es wird immer
+        nur die aktuelle Zeile gehalten. Der Generator sollte vollständig
+        durchlaufen oder geschlossen werden, damit das Statement endet.
         
-        return entries
+        Args:
+            start_date: Start-Datum (YYYY-MM-DD)
+            end_date: End-Datum (YYYY-MM-DD)
+            rows: Tuples (siehe ROW_COLUMNS) statt TimeEntry-Objekten liefern
+            
+        Yields:
+            TimeEntry oder Tuple, sortiert nach Datum absteigend
+        """
+        query_text = f"""
+            SELECT {self._select_columns(rows)} FROM time_entries 
+            WHERE date >= ? AND date <= ?
+            ORDER BY date DESC
+        """
+        
+        return self._iter_query(query_text, [start_date, end_date], self._row_mapper(rows))
     
-    def find_by_date_range(
+    def load_batch(
         self,
         start_date: str,
-        end_date: str
-    ) -> List[TimeEntry]:
+        end_date: str,
+        worker_ids: Optional[List[int]] = None
+    ) -> TimeEntryBatch:
         """
-        Findet alle Zeiterfassungen in einem Datumsbereich
+        Lädt einen Datumsbereich spaltenweise als TimeEntryBatch
+        
+        Der Tag wird per julianday bereits in SQLite in date.toordinal()
+        umgerechnet; Beschreibungen und Zeitstempel werden nicht gelesen.
         
         Args:
             start_date: Start-Datum (YYYY-MM-DD)
             end_date: End-Datum (YYYY-MM-DD)
+            worker_ids: Optional: nur diese Worker
             
         Returns:
-            Liste von TimeEntry-Objekten
+            TimeEntryBatch, sortiert nach Datum aufsteigend
         """
-        query_text = """
-            SELECT * FROM time_entries 
-            WHERE DATE(date) >= ? AND DATE(date) <= ?
-            ORDER BY date DESC
+        query_text = f"""
+            SELECT id, worker_id, {self._day_number_sql("date")} AS day, duration_minutes, project
+            FROM time_entries 
+            WHERE date >= ? AND date <= ?
         """
         params = [start_date, end_date]
         
-        query = self._execute_query(query_text, params)
+        worker_filter, worker_params = self._in_filter("worker_id", worker_ids)
+        query_text += worker_filter + " ORDER BY date"
+        params.extend(worker_params)
+        
+        def make_mapper(query):
+            i_id, i_worker, i_day, i_duration, i_project = self._column_indexes(
+                query, ("id", "worker_id", "day", "duration_minutes", "project")
+            )
+            
+            def map_row(q):
+                value = q.value
+                return value(i_id), value(i_worker), value(i_day), value(i_duration), value(i_project)
+            
+            return map_row
+        
+        rows = self._iter_query(query_text, params, make_mapper)
+        if worker_ids is not None and not worker_filter:
+            allowed = set(worker_ids)
+            rows = (row for row in rows if row[1] in allowed)
+        
+        batch = TimeEntryBatch()
+        batch.extend(rows)
+        return batch
+    
+    def count_by_date_range(self, start_date: str, end_date: str) -> int:
+        """
+        Zählt Zeiterfassungen in einem Datumsbereich (nur Index, keine Zeilen)
+        
+        Args:
+            start_date: Start-Datum (YYYY-MM-DD)
+            end_date: End-Datum (YYYY-MM-DD)
+            
+        Returns:
+            Anzahl Zeiterfassungen
+        """
+        query_text = "SELECT COUNT(*) FROM time_entries WHERE date >= ? AND date <= ?"
+        with self._statement(query_text, [start_date, end_date]) as query:
+            return query.value(0) if query.next() else 0
+    
+    def find_page_by_date_range(
+        self,
+        start_date: str,
+        end_date: str,
+        limit: int,
+        after: Optional[Tuple[str, int]] = None
+    ) -> List[TimeEntry]:
+        """
+        Lädt eine Seite von Zeiterfassungen per Keyset-Pagination
+        
+        Sortierung: date DESC, id DESC. Statt OFFSET wird ab dem Cursor
+        des letzten Eintrags der Vorseite gelesen - jede Seite kostet
+        damit gleich viel, unabhängig von Seitennummer und Bereichsgröße.
+        
+        Args:
+            start_date: Start-Datum (YYYY-MM-DD)
+            end_date: End-Datum (YYYY-MM-DD)
+            limit: Maximale Anzahl Einträge
+            after: Cursor (date, id) des letzten Eintrags der Vorseite, None für Seite 1
+            
+        Returns:
+            Liste von TimeEntry-Objekten
+        """
+        query_text = f"SELECT {self._select_columns(False)} FROM time_entries WHERE date >= ? AND date <= ?"
+        
+        if after is None:
+            params = [start_date, end_date]
+        else:
+            # Cursor-Datum als obere Indexgrenze, sonst liest SQLite ab end_date
+            # alle Einträge bis zum Cursor erneut
+            after_date, after_id = after
+            query_text += " AND (date < ? OR id < ?)"
+            params = [start_date, min(end_date, after_date), after_date, after_id]
+        
+        query_text += " ORDER BY date DESC, id DESC LIMIT ?"
+        params.append(limit)
         
         entries = []
-        while query.next():
-            entry = self._map_to_entity(query)
-            entries.append(entry)
+        with self._statement(query_text, params) as query:
+            map_row = self._entity_mapper(query)
+            while query.next():
+                entries.append(map_row(query))
         
         return entries
     
+    @classmethod
+    def page_cursor(cls, entry: TimeEntry) -> Tuple[str, int]:
+        """
+        Cursor für find_page_by_date_range aus dem letzten Eintrag einer Seite
+        
+        Args:
+            entry: Letzter Eintrag der aktuellen Seite
+            
+        Returns:
+            Tuple (date als YYYY-MM-DD, id)
+        """
+        return cls._to_day(entry.date), entry.id
+    
+    def supports_search(self) -> bool:
+        """
+        True wenn der FTS5-Index für search() existiert
+        
+        Fehlt der Index (Migration 8 lief mit einer SQLite-Version ohne
+        FTS5), wird er hier angelegt, sobald FTS5 verfügbar ist.
+        """
+        with self._statement(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'time_entries_fts'"
+        ) as query:
+            if query.next():
+                return True
+        
+        with self.unit_of_work():
+            return ensure_time_entries_fts(self.db_service)
+    
+    def search(
+        self,
+        text: str,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        worker_ids: Optional[List[int]] = None,
+        limit: Optional[int] = None
+    ) -> List[TimeEntry]:
+        """
+        Volltextsuche über Beschreibung und Projekt (FTS5), nach Relevanz sortiert
+        
+        Jedes Wort des Suchtexts muss als Wortanfang vorkommen
+        ("rev meet" findet "Code-Review im Meeting"); Groß-/Kleinschreibung
+        und Akzente werden ignoriert. Bei gleicher Relevanz (bm25) kommen
+        neuere Einträge zuerst.
+        
+        Args:
+            text: Suchtext
+            start_date: Optionaler Start-Filter (YYYY-MM-DD)
+            end_date: Optionaler End-Filter (YYYY-MM-DD)
+            worker_ids: Optional: nur diese Worker
+            limit: Maximale Anzahl Treffer (None: alle)
+            
+        Returns:
+            Liste von TimeEntry-Objekten, beste Treffer zuerst
+        """
+        match = self._fts_query(text)
+        if not match:
+            return []
+        
+        columns = ", ".join(f"e.{column}" for column in self.ENTITY_COLUMNS)
+        query_text = f"""
+            SELECT {columns} FROM time_entries_fts
+            JOIN time_entries e ON e.id = time_entries_fts.rowid
+            WHERE time_entries_fts MATCH ?
+        """
+        params = [match]
+        
+        if start_date:
+            query_text += " AND e.date >= ?"
+            params.append(start_date)
+        
+        if end_date:
+            query_text += " AND e.date <= ?"
+            params.append(end_date)
+        
+        worker_filter, worker_params = self._in_filter("e.worker_id", worker_ids)
+        query_text += worker_filter
+        params.extend(worker_params)
+        
+        allowed = set(worker_ids) if worker_ids is not None and not worker_filter else None
+        query_text += " ORDER BY rank, e.date DESC, e.id DESC"
+        if limit is not None and allowed is None:
+            query_text += " LIMIT ?"
+            params.append(limit)
+        
+        rows = self._iter_query(query_text, params, self._entity_mapper)
+        with closing(rows):
+            entries = rows
+            if allowed is not None:
+                entries = (entry for entry in rows if entry.worker_id in allowed)
+            return list(islice(entries, limit))
+    
+    @staticmethod
+    def _fts_query(text: str) -> str:
+        """
+        FTS5-MATCH-Ausdruck: jedes Wort als Präfix, alle Wörter erforderlich
+        
+        Nur Wortzeichen werden übernommen, Operatoren und Anführungszeichen
+        aus der Eingabe haben daher keine FTS5-Bedeutung.
+        
+        Args:
+            text: Suchtext
+            
+        Returns:
+            MATCH-Ausdruck oder "" ohne Suchwörter
+        """
+        return " ".join(f'"{word}"*' for word in re.findall(r"\w+", text.lower()))
+    
+    def sum_minutes_by_worker(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        worker_ids: Optional[List[int]] = None
+    ) -> Dict[int, int]:
+        """
+        Summiert erfasste Minuten pro Worker (eine gruppierte Abfrage)
+        
+        Liest aus dem Rollup daily_worker_hours (eine Zeile pro Worker-Tag,
+        per Trigger aktuell gehalten) statt alle Zeiterfassungen zu scannen.
+        Die Filter arbeiten tagesgenau.
+        
+        Args:
+            start_date: Optionaler Start-Filter
+            end_date: Optionaler End-Filter
+            worker_ids: Optional: nur diese Worker
+            
+        Returns:
+            Dict worker_id -> Summe duration_minutes
+        """
+        query_text = "SELECT worker_id, SUM(minutes) FROM daily_worker_hours WHERE 1=1"
+        params = []
+        
+        if start_date:
+            query_text += " AND day >= ?"
+            params.append(self._to_day(start_date))
+        
+        if end_date:
+            query_text += " AND day <= ?"
+            params.append(self._to_day(end_date))
+        
+        worker_filter, worker_params = self._in_filter("worker_id", worker_ids)
+        query_text += worker_filter + " GROUP BY worker_id"
+        params.extend(worker_params)
+        
+        totals = {}
+        with self._statement(query_text, params) as query:
+            while query.next():
+                totals[query.value(0)] = query.value(1) or 0
+        
+        if worker_ids is not None:
+            allowed = set(worker_ids)
+            totals = {worker_id: minutes for worker_id, minutes in totals.items() if worker_id in allowed}
+        
+        return totals
+    
     def update(self, entry: TimeEntry) -> bool:
         """
         Aktualisiert Zeiterfassung
@@ -153,7 +463,7 @@ class TimeEntryRepository(BaseRepository[TimeEntry]):
         """
         params = [
             entry.worker_id,
-            entry.date.isoformat(),
+            self._to_day(entry.date),
             entry.duration_minutes,
             entry.description,
             entry.project,
@@ -161,8 +471,24 @@ class TimeEntryRepository(BaseRepository[TimeEntry]):
             entry.id
         ]
         
-        query = self._execute_query(query_text, params)
-        return query.numRowsAffected() > 0
+        return self._execute(query_text, params) > 0
+    
+    def update_durations(self, durations: Dict[int, int]) -> None:
+        """
+        Setzt die Dauer mehrerer Zeiterfassungen in einer Transaktion (execBatch)
+        
+        Args:
+            durations: Dict entry_id -> duration_minutes
+        """
+        if not durations:
+            return
+        
+        updated_at = datetime.now().isoformat()
+        with self.unit_of_work():
+            self.db_service.execute_batch(
+                "UPDATE time_entries SET duration_minutes = ?, updated_at = ? WHERE id = ?",
+                [list(durations.values()), [updated_at] * len(durations), list(durations)]
+            )
     
     def delete(self, entry_id: int) -> bool:
         """
@@ -175,18 +501,84 @@ class TimeEntryRepository(BaseRepository[TimeEntry]):
             True bei Erfolg
         """
         query_text = "DELETE FROM time_entries WHERE id = ?"
-        query = self._execute_query(query_text, [entry_id])
-        return query.numRowsAffected() > 0
+        return self._execute(query_text, [entry_id]) > 0
+    
+    def _insert_params(self, entry: TimeEntry) -> list:
+        """Parameter für _INSERT_SQL"""
+        return [
+            entry.worker_id,
+            self._to_day(entry.date),
+            entry.duration_minutes,
+            entry.description,
+            entry.project,
+            entry.created_at.isoformat(),
+            entry.updated_at.isoformat()
+        ]
+    
+    def _select_columns(self, rows: bool) -> str:
+        """Spaltenliste für SELECT (Tuples: nur ROW_COLUMNS)"""
+        return ", ".join(self.ROW_COLUMNS if rows else self.ENTITY_COLUMNS)
+    
+    def _row_mapper(self, rows: bool) -> Callable:
+        """Mapper-Fabrik für _iter_query: Tuple in ROW_COLUMNS-Reihenfolge oder TimeEntry"""
+        if not rows:
+            return self._entity_mapper
+        
+        def make_tuple_mapper(query):
+            i_id, i_worker, i_date, i_duration, i_description, i_project = (
+                self._column_indexes(query, self.ROW_COLUMNS)
+            )
+            
+            def map_row(q):
+                value = q.value
+                return (
+                    value(i_id), value(i_worker), value(i_date),
+                    value(i_duration), value(i_description), value(i_project)
+                )
+            
+            return map_row
+        
+        return make_tuple_mapper
+    
+    @staticmethod
+    def _to_day(value: datetime) -> str:
+        """Normalisiert Datum auf das gespeicherte Format YYYY-MM-DD"""
+        return value.date().isoformat()
+    
+    def _entity_mapper(self, query) -> Callable:
+        """
+        Erzeugt Mapper QSqlQuery -> TimeEntry für ein ausgeführtes Query
+        
+        Spaltenindizes werden einmal aufgelöst. created_at/updated_at
+        bleiben ISO-Strings, bis sie gelesen werden (LazyTimestamp).
+        
+        Args:
+            query: Ausgeführte QSqlQuery mit ENTITY_COLUMNS
+            
+        Returns:
+            Funktion, die die aktuelle Zeile mappt
+        """
+        (
+            i_id, i_worker, i_date, i_duration,
+            i_description, i_project, i_created, i_updated
+        ) = self._column_indexes(query, self.ENTITY_COLUMNS)
+        parse_date = datetime.fromisoformat
+        
+        def map_row(q) -> TimeEntry:
+            value = q.value
+            return TimeEntry(
+                id=value(i_id),
+                worker_id=value(i_worker),
+                date=parse_date(value(i_date)),
+                duration_minutes=value(i_duration),
+                description=value(i_description),
+                project=value(i_project),
+                created_at=value(i_created),
+                updated_at=value(i_updated)
+            )
+        
+        return map_row
     
     def _map_to_entity(self, query) -> TimeEntry:
         """Mappt QSqlQuery-Result zu TimeEntry"""
-        return TimeEntry(
-            id=query.value("id"),
-            worker_id=query.value("worker_id"),
-            date=datetime.fromisoformat(query.value("date")),
-            duration_minutes=query.value("duration_minutes"),
-            description=query.value("description"),
-            project=query.value("project"),
-            created_at=datetime.fromisoformat(query.value("created_at")),
-            updated_at=datetime.fromisoformat(query.value("updated_at"))
-        )
+        return self._entity_mapper(query)(query)
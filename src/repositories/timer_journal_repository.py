@@ -0,0 +1,98 @@
+"""
+Timer Journal Repository
+Append-only Journal der Start-/Stopp-Ereignisse laufender Timer
+"""
+from typing import List, Tuple
+from datetime import datetime
+from .base_repository import BaseRepository
+
+
+# Ereignis: (journal_id, entry_id, event, at, seconds)
+JournalEvent = Tuple[int, int, str, datetime, int]
+
+
+class TimerJournalRepository(BaseRepository[JournalEvent]):
+    """
+    Repository für die Tabelle timer_journal
+    
+    Jedes Starten und Stoppen eines Timers wird als eine Zeile angehängt
+    (ein INSERT, keine Lese-Zugriffe). Beim Programmstart spielt der
+    TimerService das Journal ab und stellt laufende Timer sowie noch
+    nicht gespeicherte Dauern wieder her.
+    
+    seconds ist beim Start der bereits erfasste Stand, beim Stopp die
+    Gesamtdauer. Nach dem Übertragen in time_entries werden die
+    Ereignisse bis zum Stopp entfernt (clear_until), damit das Journal
+    klein bleibt.
+    """
+    
+    EVENT_START = "start"
+    EVENT_STOP = "stop"
+    
+    def append(self, entry_id: int, event: str, at: datetime, seconds: int) -> int:
+        """
+        Hängt ein Ereignis an
+        
+        Args:
+            entry_id: ID des TimeEntry
+            event: EVENT_START oder EVENT_STOP
+            at: Zeitpunkt des Ereignisses
+            seconds: Erfasste Sekunden (Start: Stand beim Start, Stopp: Gesamt)
+        
+        Returns:
+            ID der Journal-Zeile
+        """
+        # Sofort dauerhaft, damit ein Absturz kein Ereignis verliert
+        # (innerhalb einer unit_of_work mit deren Commit)
+        with self.unit_of_work(), self._statement(
+            "INSERT INTO timer_journal (entry_id, event, at, seconds) VALUES (?, ?, ?, ?)",
+            [entry_id, event, at.isoformat(), seconds]
+        ) as query:
+            return query.lastInsertId()
+    
+    def load(self) -> List[JournalEvent]:
+        """
+        Lädt alle Ereignisse in Schreibreihenfolge
+        
+        Returns:
+            Liste von (journal_id, entry_id, event, at, seconds)
+        """
+        events = []
+        with self._statement(
+            "SELECT id, entry_id, event, at, seconds FROM timer_journal ORDER BY id"
+        ) as query:
+            while query.next():
+                events.append((
+                    query.value(0),
+                    query.value(1),
+                    query.value(2),
+                    datetime.fromisoformat(query.value(3)),
+                    query.value(4)
+                ))
+        return events
+    
+    def clear_until(self, marks: List[Tuple[int, int]]) -> None:
+        """
+        Entfernt Ereignisse bis einschließlich einer Journal-ID pro Eintrag
+        
+        Spätere Ereignisse (z.B. ein erneuter Start) bleiben erhalten.
+        
+        Args:
+            marks: Liste von (entry_id, journal_id)
+        """
+        if not marks:
+            return
+        entry_ids, journal_ids = zip(*marks)
+        self.db_service.execute_batch(
+            "DELETE FROM timer_journal WHERE entry_id = ? AND id <= ?",
+            [list(entry_ids), list(journal_ids)]
+        )
+    
+    def clear(self, entry_id: int) -> None:
+        """
+        Entfernt alle Ereignisse eines Eintrags
+        
+        Args:
+            entry_id: ID des TimeEntry
+        """
+        self._execute("DELETE FROM timer_journal WHERE entry_id = ?", [entry_id])
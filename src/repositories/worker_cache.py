@@ -0,0 +1,159 @@
+"""
+Worker Cache
+Prozessweiter Cache für entschlüsselte Worker-Identitäten
+"""
+from dataclasses import replace
+from typing import Dict, List, Optional
+from weakref import WeakKeyDictionary
+from ..models.worker import Worker
+
+
+class WorkerCache:
+    """
+    Cache id -> Worker vor dem WorkerRepository
+    
+    Strategie:
+    - Einmaliges Bulk-Entschlüsseln aller Worker (find_all) füllt den Cache
+    - create/update/delete aktualisieren den Cache direkt (Write-Through)
+    - Wiederholte find_by_id-Aufrufe werden zu Dictionary-Lookups
+    - Nach einem Rollback wird der Cache verworfen und neu geladen
+    - Ein Cache pro DatabaseService-Instanz, geteilt von allen Repositories
+    
+    Herausgegeben werden immer Kopien, damit Änderungen an Worker-Objekten
+    in Views den Cache nicht unbemerkt verändern.
+    
+    Beispiel:
+        >>> cache = WorkerCache.for_database(db_service)
+        >>> cache.get(1)
+        >>> cache.stats()
+    """
+    
+    _instances: "WeakKeyDictionary[object, WorkerCache]" = WeakKeyDictionary()
+    
+    def __init__(self):
+        """Initialisiert leeren Cache"""
+        self._workers: Dict[int, Worker] = {}
+        self._complete = False
+        self.hits = 0
+        self.misses = 0
+    
+    @classmethod
+    def for_database(cls, db_service) -> "WorkerCache":
+        """
+        Gibt den Cache für eine Datenbankverbindung zurück
+        
+        Args:
+            db_service: DatabaseService-Instanz
+        
+        Returns:
+            Geteilte WorkerCache-Instanz
+        """
+        cache = cls._instances.get(db_service)
+        if cache is None:
+            cache = cls()
+            cls._instances[db_service] = cache
+            db_service.add_rollback_listener(cache.clear)
+        return cache
+    
+    @property
+    def is_complete(self) -> bool:
+        """True wenn alle Worker der Datenbank im Cache liegen"""
+        return self._complete
+    
+    def get(self, worker_id: int) -> Optional[Worker]:
+        """
+        Holt Worker aus dem Cache (zählt Hit/Miss)
+        
+        Args:
+            worker_id: ID des Workers
+        
+        Returns:
+            Kopie des Workers oder None
+        """
+        worker = self._workers.get(worker_id)
+        if worker is None:
+            self.misses += 1
+            return None
+        
+        self.hits += 1
+        return replace(worker)
+    
+    def peek(self, worker_id: int) -> Optional[Worker]:
+        """
+        Holt gecachten Worker ohne Kopie und ohne Hit/Miss zu zählen
+        
+        Args:
+            worker_id: ID des Workers
+        
+        Returns:
+            Gecachter Worker oder None (nicht verändern!)
+        """
+        return self._workers.get(worker_id)
+    
+    def all(self, active_only: bool = False) -> List[Worker]:
+        """
+        Gibt alle gecachten Worker sortiert nach Name zurück
+        
+        Args:
+            active_only: Nur aktive Worker
+        
+        Returns:
+            Liste von Worker-Kopien
+        """
+        self.hits += 1
+        workers = [
+            replace(worker) for worker in self._workers.values()
+            if worker.active or not active_only
+        ]
+        workers.sort(key=lambda w: w.name.lower())
+        return workers
+    
+    def put(self, worker: Worker) -> None:
+        """
+        Legt Worker im Cache ab bzw. aktualisiert ihn
+        
+        Args:
+            worker: Worker mit ID
+        """
+        if worker.id is None:
+            return
+        self._workers[worker.id] = replace(worker)
+    
+    def fill(self, workers: List[Worker]) -> None:
+        """
+        Füllt Cache mit dem Ergebnis eines vollständigen Bulk-Loads
+        
+        Args:
+            workers: Alle Worker der Datenbank
+        """
+        self._workers = {worker.id: replace(worker) for worker in workers}
+        self._complete = True
+    
+    def remove(self, worker_id: int) -> None:
+        """
+        Entfernt Worker aus dem Cache
+        
+        Args:
+            worker_id: ID des Workers
+        """
+        self._workers.pop(worker_id, None)
+    
+    def clear(self) -> None:
+        """Leert den Cache (z.B. nach externen Änderungen)"""
+        self._workers.clear()
+        self._complete = False
+    
+    def stats(self) -> Dict[str, float]:
+        """
+        Gibt Cache-Statistik zurück
+        
+        Returns:
+            Dict mit size, hits, misses, hit_rate
+        """
+        total = self.hits + self.misses
+        return {
+            "size": len(self._workers),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total > 0 else 0.0
+        }
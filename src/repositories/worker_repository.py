@@ -2,10 +2,13 @@
 Worker Repository
 Datenzugriff für Worker-Verwaltung mit Verschlüsselung
 """
+from dataclasses import replace
 from typing import List, Optional
 from datetime import datetime
 from ..models.worker import Worker
 from .base_repository import BaseRepository
+from .worker_cache import WorkerCache
+from .capacity_index import CapacityIndex
 from ..services.crypto_service import CryptoService
 
 
@@ -16,9 +19,24 @@ class WorkerRepository(BaseRepository[Worker]):
     Besonderheit: Name und Email werden verschlüsselt gespeichert
     für Datenschutz-Compliance
     
+    Entschlüsselte Worker werden im prozessweiten WorkerCache gehalten,
+    Schreiboperationen aktualisieren den Cache direkt.
+    
     CRUD-Operationen für Worker-Verwaltung
     """
     
+    # Ab dieser Zeilenanzahl entschlüsselt find_all per decrypt_many
+    BULK_DECRYPT_THRESHOLD = 200
+    
+    # Projektion für Worker-Objekte (statt SELECT *, ohne email_bidx)
+    ENTITY_COLUMNS = ("id", "name", "email", "team", "active", "created_at")
+    
+    _INSERT_SQL = """
+        INSERT INTO workers 
+        (name, email, team, active, created_at, email_bidx)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """
+    
     def __init__(self, db_service, crypto_service: CryptoService):
         """
         Initialisiert WorkerRepository
@@ -29,6 +47,7 @@ class WorkerRepository(BaseRepository[Worker]):
         """
         super().__init__(db_service)
         self.crypto_service = crypto_service
+        self.cache = WorkerCache.for_database(db_service)
     
     def create(self, worker: Worker) -> int:
         """
@@ -40,25 +59,30 @@ class WorkerRepository(BaseRepository[Worker]):
         Returns:
             ID des erstellten Workers
         """
-        # Sensible Daten verschlüsseln
-        encrypted_name = self.crypto_service.encrypt(worker.name)
-        encrypted_email = self.crypto_service.encrypt(worker.email)
+        with self._statement(self._INSERT_SQL, params=self._insert_params(worker)) as query:
+            worker_id = query.lastInsertId()
         
-        query_text = """
-            INSERT INTO workers 
-            (name, email, team, active, created_at)
-            VALUES (?, ?, ?, ?, ?)
+        self.cache.put(replace(worker, id=worker_id))
+        return worker_id
+    
+    def create_many(self, workers: List[Worker], chunk_size: Optional[int] = None) -> List[int]:
         """
-        params = [
-            encrypted_name,
-            encrypted_email,
-            worker.team,
-            1 if worker.active else 0,
-            worker.created_at.isoformat()
-        ]
+        Erstellt viele Worker in einer Transaktion (execBatch, mit Verschlüsselung)
+        
+        Args:
+            workers: Worker-Objekte
+            chunk_size: Zeilen pro Batch (default: BULK_CHUNK_SIZE)
+            
+        Returns:
+            IDs der erstellten Worker in Eingabereihenfolge
+        """
+        rows = [self._insert_params(worker) for worker in workers]
+        worker_ids = self._insert_many(self._INSERT_SQL, rows, chunk_size or self.BULK_CHUNK_SIZE)
+        
+        for worker, worker_id in zip(workers, worker_ids):
+            self.cache.put(replace(worker, id=worker_id))
         
-        query = self._execute_query(query_text, params=params)
-        return query.lastInsertId()
+        return worker_ids
     
     def find_by_id(self, worker_id: int) -> Optional[Worker]:
         """
@@ -70,12 +94,22 @@ class WorkerRepository(BaseRepository[Worker]):
         Returns:
             Worker oder None
         """
-        query_text = "SELECT * FROM workers WHERE id = ?"
-        query = self._execute_query(query_text, params=[worker_id])
+        cached = self.cache.get(worker_id)
+        if cached is not None:
+            return cached
         
-        if query.next():
-            return self._map_to_entity(query)
-        return None
+        # Vollständig geladener Cache: unbekannte ID existiert nicht
+        if self.cache.is_complete:
+            return None
+        
+        query_text = f"SELECT {self._select_columns()} FROM workers WHERE id = ?"
+        with self._statement(query_text, params=[worker_id]) as query:
+            if not query.next():
+                return None
+            worker = self._map_to_entity(query)
+        
+        self.cache.put(worker)
+        return worker
     
     def find_all(self, active_only: bool = False) -> List[Worker]:
         """
@@ -85,27 +119,33 @@ class WorkerRepository(BaseRepository[Worker]):
             active_only: Nur aktive Worker zurückgeben
             
         Returns:
-            Liste von Worker-Objekten
+            Liste von Worker-Objekten (sortiert nach Name)
         """
-        query_text = "SELECT * FROM workers"
+        if self.cache.is_complete:
+            return self.cache.all(active_only)
+        
+        query_text = f"SELECT {self._select_columns()} FROM workers"
         params = []
         
         if active_only:
             query_text += " WHERE active = 1"
         
-        query_text += " ORDER BY name ASC"
+        with self._statement(query_text, params=params if params else None) as query:
+            workers = self._map_all_to_entities(query)
         
-        query = self._execute_query(query_text, params=params if params else None)
-        
-        workers = []
-        while query.next():
-            workers.append(self._map_to_entity(query))
+        if active_only:
+            for worker in workers:
+                self.cache.put(worker)
+        else:
+            self.cache.fill(workers)
         
+        # Sortierung im Klartext (Ciphertexts sind nicht sortierbar)
+        workers.sort(key=lambda w: w.name.lower())
         return workers
     
     def find_by_email(self, email: str) -> Optional[Worker]:
         """
-        Findet Worker per Email (mit Verschlüsselung für Suche)
+        Findet Worker per Email (über Blind-Index, ohne Entschlüsselung)
         
         Args:
             email: Email-Adresse (Klartext)
@@ -113,15 +153,42 @@ class WorkerRepository(BaseRepository[Worker]):
         Returns:
             Worker oder None
         """
-        # Email verschlüsseln für Suche
-        encrypted_email = self.crypto_service.encrypt(email)
+        # Blind-Index statt Ciphertext-Vergleich (Ciphertexts sind randomisiert)
+        email_bidx = self.crypto_service.blind_index(email)
         
-        query_text = "SELECT * FROM workers WHERE email = ?"
-        query = self._execute_query(query_text, params=[encrypted_email])
+        query_text = f"SELECT {self._select_columns()} FROM workers WHERE email_bidx = ?"
+        with self._statement(query_text, params=[email_bidx]) as query:
+            indexes = self._column_indexes(query, self.ENTITY_COLUMNS)
+            if not query.next():
+                return None
+            cached = self.cache.get(query.value(indexes[0]))
+            if cached is not None:
+                return cached
+            worker = self._map_to_entity(query, indexes)
         
-        if query.next():
-            return self._map_to_entity(query)
-        return None
+        self.cache.put(worker)
+        return worker
+    
+    def email_exists(self, email: str, exclude_id: Optional[int] = None) -> bool:
+        """
+        Prüft ob Email bereits vergeben ist (indizierte Abfrage, ohne Entschlüsselung)
+        
+        Args:
+            email: Email-Adresse (Klartext)
+            exclude_id: Optional: Worker-ID, die ignoriert wird (für Updates)
+            
+        Returns:
+            True wenn ein anderer Worker die Email verwendet
+        """
+        query_text = "SELECT id FROM workers WHERE email_bidx = ?"
+        params = [self.crypto_service.blind_index(email)]
+        
+        if exclude_id is not None:
+            query_text += " AND id != ?"
+            params.append(exclude_id)
+        
+        with self._statement(query_text, params=params) as query:
+            return bool(query.next())
     
     def update(self, worker: Worker) -> bool:
         """
@@ -139,7 +206,7 @@ class WorkerRepository(BaseRepository[Worker]):
         
         query_text = """
             UPDATE workers
-            SET name = ?, email = ?, team = ?, active = ?
+            SET name = ?, email = ?, team = ?, active = ?, email_bidx = ?
             WHERE id = ?
         """
         params = [
@@ -147,11 +214,21 @@ class WorkerRepository(BaseRepository[Worker]):
             encrypted_email,
             worker.team,
             1 if worker.active else 0,
+            self.crypto_service.blind_index(worker.email),
             worker.id
         ]
         
-        query = self._execute_query(query_text, params=params)
-        return query.numRowsAffected() > 0
+        success = self._execute(query_text, params=params) > 0
+        
+        if success:
+            # created_at wird beim Update nicht geschrieben -> gecachten Wert behalten
+            previous = self.cache.peek(worker.id)
+            if previous is not None:
+                self.cache.put(replace(worker, created_at=previous.created_at))
+            else:
+                self.cache.put(worker)
+        
+        return success
     
     def delete(self, worker_id: int) -> bool:
         """
@@ -164,31 +241,173 @@ class WorkerRepository(BaseRepository[Worker]):
             True bei Erfolg
         """
         query_text = "DELETE FROM workers WHERE id = ?"
-        query = self._execute_query(query_text, params=[worker_id])
-        return query.numRowsAffected() > 0
+        success = self._execute(query_text, params=[worker_id]) > 0
+        
+        if success:
+            self.cache.remove(worker_id)
+            # ON DELETE CASCADE hat auch die Capacities des Workers gelöscht
+            CapacityIndex.for_database(self.db_service).remove_worker(worker_id)
+        
+        return success
+    
+    def migrate_to_envelope_encryption(self) -> int:
+        """
+        Verschlüsselt Legacy-Worker-Daten im Envelope-Format neu
+        
+        Einmalige Migration: alle Zeilen ohne Versions-Header werden in
+        einer einzigen Transaktion entschlüsselt und mit dem Data-Key
+        neu verschlüsselt. Bei Fehlern wird komplett zurückgerollt.
+        
+        Returns:
+            Anzahl migrierter Worker
+        """
+        if not self.crypto_service.has_data_key():
+            raise RuntimeError("Data-Key nicht geladen. Rufe initialize_data_key() auf.")
+        
+        prefix = self.crypto_service.ENVELOPE_PREFIX
+        rows = []
+        with self._statement(
+            "SELECT id, name, email FROM workers WHERE name NOT LIKE ? OR email NOT LIKE ?",
+            params=[f"{prefix}%", f"{prefix}%"]
+        ) as query:
+            while query.next():
+                rows.append((query.value(0), query.value(1), query.value(2)))
+        
+        if not rows:
+            return 0
+        
+        with self.unit_of_work():
+            for worker_id, encrypted_name, encrypted_email in rows:
+                name = self.crypto_service.decrypt(encrypted_name)
+                email = self.crypto_service.decrypt(encrypted_email)
+                self._execute(
+                    "UPDATE workers SET name = ?, email = ? WHERE id = ?",
+                    params=[
+                        self.crypto_service.encrypt(name),
+                        self.crypto_service.encrypt(email),
+                        worker_id
+                    ]
+                )
+        
+        return len(rows)
     
-    def _map_to_entity(self, query) -> Worker:
+    def backfill_email_blind_index(self) -> int:
+        """
+        Berechnet fehlende Blind-Indizes für bestehende Worker
+        
+        Alle Zeilen ohne email_bidx werden in einer Transaktion
+        entschlüsselt und mit Blind-Index versehen.
+        
+        Returns:
+            Anzahl aktualisierter Worker
         """
-        Mappt QSqlQuery-Result zu Worker (mit Entschlüsselung)
+        rows = []
+        with self._statement("SELECT id, email FROM workers WHERE email_bidx IS NULL") as query:
+            while query.next():
+                rows.append((query.value(0), query.value(1)))
+        
+        if not rows:
+            return 0
+        
+        with self.unit_of_work():
+            for worker_id, encrypted_email in rows:
+                email = self.crypto_service.decrypt(encrypted_email)
+                self._execute(
+                    "UPDATE workers SET email_bidx = ? WHERE id = ?",
+                    params=[self.crypto_service.blind_index(email), worker_id]
+                )
+        
+        return len(rows)
+    
+    def _select_columns(self) -> str:
+        """Spaltenliste für SELECT"""
+        return ", ".join(self.ENTITY_COLUMNS)
+    
+    def _insert_params(self, worker: Worker) -> list:
+        """Parameter für _INSERT_SQL (Name und Email verschlüsselt)"""
+        return [
+            self.crypto_service.encrypt(worker.name),
+            self.crypto_service.encrypt(worker.email),
+            worker.team,
+            1 if worker.active else 0,
+            worker.created_at.isoformat(),
+            self.crypto_service.blind_index(worker.email)
+        ]
+    
+    def _map_all_to_entities(self, query) -> List[Worker]:
+        """
+        Mappt alle Zeilen eines QSqlQuery-Results zu Workern
+        
+        Ab BULK_DECRYPT_THRESHOLD Zeilen werden alle Namen und Emails
+        gesammelt über CryptoService.decrypt_many entschlüsselt.
         
         Args:
             query: QSqlQuery mit Daten
             
         Returns:
-            Worker-Objekt mit entschlüsselten Daten
+            Liste von Worker-Objekten mit entschlüsselten Daten
         """
-        # Sensible Daten entschlüsseln
-        encrypted_name = query.value("name")
-        encrypted_email = query.value("email")
+        indexes = self._column_indexes(query, self.ENTITY_COLUMNS)
+        
+        rows = []
+        while query.next():
+            rows.append(self._read_row(query, indexes))
         
-        decrypted_name = self.crypto_service.decrypt(encrypted_name)
-        decrypted_email = self.crypto_service.decrypt(encrypted_email)
+        if len(rows) < self.BULK_DECRYPT_THRESHOLD:
+            return [
+                self._map_row(
+                    row,
+                    self.crypto_service.decrypt(row[1]),
+                    self.crypto_service.decrypt(row[2])
+                )
+                for row in rows
+            ]
         
+        # Namen und Emails verschränkt: [name_0, email_0, name_1, email_1, ...]
+        ciphertexts = [value for row in rows for value in (row[1], row[2])]
+        plaintexts = self.crypto_service.decrypt_many(ciphertexts)
+        
+        return [
+            self._map_row(row, plaintexts[2 * i], plaintexts[2 * i + 1])
+            for i, row in enumerate(rows)
+        ]
+    
+    def _map_row(self, row: tuple, name: str, email: str) -> Worker:
+        """Erstellt Worker aus gelesener Zeile und entschlüsselten Feldern"""
+        worker_id, _, _, team, active, created_at = row
         return Worker(
-            id=query.value("id"),
-            name=decrypted_name,
-            email=decrypted_email,
-            team=query.value("team"),
-            active=bool(query.value("active")),
-            created_at=datetime.fromisoformat(query.value("created_at"))
+            id=worker_id,
+            name=name,
+            email=email,
+            team=team,
+            active=bool(active),
+            created_at=datetime.fromisoformat(created_at)
+        )
+    
+    @staticmethod
+    def _read_row(query, indexes: List[int]) -> tuple:
+        """Liest die aktuelle Zeile positionsweise in ENTITY_COLUMNS-Reihenfolge"""
+        value = query.value
+        return tuple(value(index) for index in indexes)
+    
+    def _map_to_entity(self, query, indexes: Optional[List[int]] = None) -> Worker:
+        """
+        Mappt die aktuelle Zeile eines QSqlQuery-Results zu Worker (mit Entschlüsselung)
+        
+        Args:
+            query: QSqlQuery mit ENTITY_COLUMNS, auf einer Zeile positioniert
+            indexes: Bereits aufgelöste Spaltenindizes (sonst per _column_indexes)
+            
+        Returns:
+            Worker-Objekt mit entschlüsselten Daten
+        """
+        if indexes is None:
+            indexes = self._column_indexes(query, self.ENTITY_COLUMNS)
+        row = self._read_row(query, indexes)
+        
+        # Sensible Daten entschlüsseln
+        return self._map_row(
+            row,
+            self.crypto_service.decrypt(row[1]),
+            self.crypto_service.decrypt(row[2])
         )
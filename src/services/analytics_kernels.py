@@ -0,0 +1,269 @@
+"""
+Analytics Kernels
+Vektorisierte Auswertungen über Spalten (Tage, Minuten, IDs)
+
+Alle Kernels arbeiten auf Sequenzen gleicher Länge - typischerweise den
+Arrays eines TimeEntryBatch - und auf Tagen als date.toordinal().
+NumpyKernels nutzt NumPy (optional), PythonKernels ist der Fallback mit
+identischen Ergebnissen.
+"""
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - abhängig von der Installation
+    np = None
+
+HAS_NUMPY = np is not None
+
+
+class PythonKernels:
+    """Reine Python-Implementierung der Analytics-Kernels"""
+    
+    name = "python"
+    
+    @staticmethod
+    def daily_minutes(
+        days: Sequence[int],
+        minutes: Sequence[int],
+        first_day: int,
+        last_day: int
+    ) -> List[int]:
+        """
+        Summiert Minuten pro Tag im Bereich
+        
+        Args:
+            days: Tag pro Eintrag (Ordinalzahl)
+            minutes: Minuten pro Eintrag
+            first_day: Erster Tag (inklusive)
+            last_day: Letzter Tag (inklusive)
+        
+        Returns:
+            Minuten pro Tag, Index 0 = first_day (leer, wenn last_day < first_day)
+        """
+        count = last_day - first_day + 1
+        if count <= 0:
+            return []
+        
+        totals = [0] * count
+        for day, value in zip(days, minutes):
+            offset = day - first_day
+            if 0 <= offset < count:
+                totals[offset] += value
+        return totals
+    
+    @staticmethod
+    def totals_by_key(keys: Sequence[int], values: Sequence) -> Dict[int, float]:
+        """
+        Summiert Werte pro Schlüssel (z.B. Worker-ID oder Projekt-Code)
+        
+        Args:
+            keys: Schlüssel pro Eintrag
+            values: Werte pro Eintrag
+        
+        Returns:
+            Dict Schlüssel -> Summe
+        """
+        totals = {}
+        get = totals.get
+        for key, value in zip(keys, values):
+            totals[key] = get(key, 0) + value
+        return totals
+    
+    @staticmethod
+    def minute_stats(minutes: Sequence[int]) -> Tuple[int, int, int, int]:
+        """
+        Anzahl, Summe, Minimum und Maximum
+        
+        Args:
+            minutes: Minuten pro Eintrag
+        
+        Returns:
+            Tuple (count, total, min, max), bei leerer Eingabe nur Nullen
+        """
+        if not len(minutes):
+            return 0, 0, 0, 0
+        return len(minutes), sum(minutes), min(minutes), max(minutes)
+    
+    @staticmethod
+    def prorated_hours(
+        starts: Sequence[int],
+        ends: Sequence[int],
+        hours: Sequence[float],
+        first_day: int,
+        last_day: int
+    ) -> List[float]:
+        """
+        Anteilige Plan-Stunden pro Capacity im Bereich
+        
+        hours * Überlappungstage / Capacity-Tage, tagesgenau wie
+        CapacityRepository.sum_overlapping_hours_by_worker.
+        
+        Args:
+            starts: Erster Tag pro Capacity
+            ends: Letzter Tag pro Capacity
+            hours: planned_hours pro Capacity
+            first_day: Erster Tag des Bereichs
+            last_day: Letzter Tag des Bereichs
+        
+        Returns:
+            Anteilige Stunden pro Capacity (0.0 ohne Überlappung)
+        """
+        result = []
+        for start, end, planned in zip(starts, ends, hours):
+            overlap = min(end, last_day) - max(start, first_day) + 1
+            span = end - start + 1
+            result.append(planned * overlap / span if overlap > 0 and span > 0 else 0.0)
+        return result
+    
+    @staticmethod
+    def daily_capacity_hours(
+        starts: Sequence[int],
+        ends: Sequence[int],
+        hours: Sequence[float],
+        first_day: int,
+        last_day: int
+    ) -> List[float]:
+        """
+        Verteilt Plan-Stunden gleichmäßig auf die Tage jeder Capacity
+        
+        Args:
+            starts: Erster Tag pro Capacity
+            ends: Letzter Tag pro Capacity
+            hours: planned_hours pro Capacity
+            first_day: Erster Tag des Bereichs
+            last_day: Letzter Tag des Bereichs
+        
+        Returns:
+            Plan-Stunden pro Tag, Index 0 = first_day
+        """
+        count = last_day - first_day + 1
+        if count <= 0:
+            return []
+        
+        # Differenzen-Array: +Stunden/Tag am ersten, - nach dem letzten Tag
+        diff = [0.0] * (count + 1)
+        for start, end, planned in zip(starts, ends, hours):
+            low = max(start, first_day)
+            high = min(end, last_day)
+            if low > high or end < start:
+                continue
+            per_day = planned / (end - start + 1)
+            diff[low - first_day] += per_day
+            diff[high - first_day + 1] -= per_day
+        
+        totals = []
+        running = 0.0
+        for value in diff[:count]:
+            running += value
+            totals.append(running)
+        return totals
+
+
+class NumpyKernels:
+    """NumPy-Implementierung der Analytics-Kernels (bincount / add.at auf Tages-Offsets)"""
+    
+    name = "numpy"
+    
+    @staticmethod
+    def daily_minutes(days, minutes, first_day: int, last_day: int) -> List[int]:
+        """Siehe PythonKernels.daily_minutes"""
+        count = last_day - first_day + 1
+        if count <= 0:
+            return []
+        
+        offsets = np.asarray(days, dtype=np.int64) - first_day
+        mask = (offsets >= 0) & (offsets < count)
+        totals = np.bincount(
+            offsets[mask],
+            weights=np.asarray(minutes, dtype=np.float64)[mask],
+            minlength=count
+        )
+        return totals.astype(np.int64).tolist()
+    
+    @staticmethod
+    def totals_by_key(keys, values) -> Dict[int, float]:
+        """Siehe PythonKernels.totals_by_key"""
+        values = np.asarray(values)
+        if not len(values):
+            return {}
+        
+        keys = np.asarray(keys, dtype=np.int64)
+        weights = values.astype(np.float64)
+        if keys.min() >= 0 and keys.max() < 4 * len(keys) + 1024:
+            # Dichte Schlüssel (IDs, Projekt-Codes): direkt indizieren statt sortieren
+            unique_keys = np.flatnonzero(np.bincount(keys))
+            totals = np.bincount(keys, weights=weights)[unique_keys]
+        else:
+            unique_keys, inverse = np.unique(keys, return_inverse=True)
+            totals = np.bincount(inverse, weights=weights)
+        if values.dtype.kind in "iu":
+            totals = totals.astype(np.int64)
+        return dict(zip(unique_keys.tolist(), totals.tolist()))
+    
+    @staticmethod
+    def minute_stats(minutes) -> Tuple[int, int, int, int]:
+        """Siehe PythonKernels.minute_stats"""
+        minutes = np.asarray(minutes, dtype=np.int64)
+        if not len(minutes):
+            return 0, 0, 0, 0
+        return len(minutes), int(minutes.sum()), int(minutes.min()), int(minutes.max())
+    
+    @staticmethod
+    def prorated_hours(starts, ends, hours, first_day: int, last_day: int) -> List[float]:
+        """Siehe PythonKernels.prorated_hours"""
+        starts = np.asarray(starts, dtype=np.int64)
+        ends = np.asarray(ends, dtype=np.int64)
+        hours = np.asarray(hours, dtype=np.float64)
+        
+        overlap = np.minimum(ends, last_day) - np.maximum(starts, first_day) + 1
+        span = ends - starts + 1
+        valid = (overlap > 0) & (span > 0)
+        
+        result = np.zeros(len(hours))
+        result[valid] = hours[valid] * overlap[valid] / span[valid]
+        return result.tolist()
+    
+    @staticmethod
+    def daily_capacity_hours(starts, ends, hours, first_day: int, last_day: int) -> List[float]:
+        """Siehe PythonKernels.daily_capacity_hours"""
+        count = last_day - first_day + 1
+        if count <= 0:
+            return []
+        
+        starts = np.asarray(starts, dtype=np.int64)
+        ends = np.asarray(ends, dtype=np.int64)
+        hours = np.asarray(hours, dtype=np.float64)
+        
+        low = np.maximum(starts, first_day)
+        high = np.minimum(ends, last_day)
+        valid = (low <= high) & (ends >= starts)
+        per_day = hours[valid] / (ends[valid] - starts[valid] + 1)
+        
+        diff = np.zeros(count + 1)
+        np.add.at(diff, low[valid] - first_day, per_day)
+        np.add.at(diff, high[valid] - first_day + 1, -per_day)
+        return np.cumsum(diff[:count]).tolist()
+
+
+def get_kernels(use_numpy: Optional[bool] = None):
+    """
+    Wählt die Kernel-Implementierung
+    
+    Args:
+        use_numpy: True/False erzwingt eine Implementierung,
+            None nutzt NumPy, falls installiert
+    
+    Returns:
+        NumpyKernels oder PythonKernels
+    
+    Raises:
+        RuntimeError: use_numpy=True, aber NumPy ist nicht installiert
+    """
+    if use_numpy is None:
+        use_numpy = HAS_NUMPY
+    
+    if use_numpy and not HAS_NUMPY:
+        raise RuntimeError("NumPy ist nicht installiert. Bitte 'pip install numpy' ausführen.")
+    
+    return NumpyKernels if use_numpy else PythonKernels
@@ -2,10 +2,12 @@
 Analytics Service
 Berechnung von Auslastungen und Reports
 """
-from datetime import datetime, timedelta
-from typing import List, Dict, Tuple
+from datetime import date, datetime, time
+from typing import List, Dict, Tuple, Optional, Union
 from ..models.time_entry import TimeEntry
+from ..models.time_entry_batch import TimeEntryBatch
 from ..models.capacity import Capacity
+from .analytics_kernels import get_kernels
 from .database_service import DatabaseService
 
 
@@ -14,60 +16,108 @@ class AnalyticsService:
     Service für Auslastungsberechnungen und Analytics
     
     Funktionen:
-    - Auslastungsberechnung (Ist vs. Plan)
+    - Auslastungsberechnung (Ist vs. Plan), teamweit per SQL-Aggregation
     - Trendanalysen
     - Report-Generierung
     
+    Die Auswertungen über Einträge akzeptieren TimeEntry-Listen oder einen
+    TimeEntryBatch und rechnen über die Spalten-Kernels (NumPy, falls
+    installiert, sonst reines Python - siehe analytics_kernels).
+    
     Beispiel:
         >>> analytics = AnalyticsService(db_service)
         >>> utilization = analytics.calculate_worker_utilization(1, start, end)
+        >>> team = analytics.calculate_team_utilization(start, end)
     """
     
-    def __init__(self, db_service: DatabaseService):
+    def __init__(self, db_service: DatabaseService, use_numpy: Optional[bool] = None):
         """
         Initialisiert AnalyticsService
         
         Args:
             db_service: DatabaseService-Instanz
+            use_numpy: Kernel-Auswahl (None: NumPy, falls installiert)
         """
         self._db_service = db_service
+        self._kernels = get_kernels(use_numpy)
     
-    def calculate_worker_utilization(
+    def calculate_team_utilization(
         self,
-        worker_id: int,
         start_date: datetime,
-        end_date: datetime
-    ) -> Dict[str, float]:
+        end_date: datetime,
+        worker_ids: Optional[List[int]] = None
+    ) -> Dict[int, Tuple[float, float]]:
         """
-        Berechnet Auslastung für einen Worker im Zeitraum
+        Berechnet Ist- und Plan-Stunden für alle Worker im Zeitraum
+        
+        Zwei gruppierte Abfragen (SUM über time_entries und capacities)
+        statt TimeEntry-/Capacity-Objekte pro Worker zu laden. Plan-Stunden
+        werden wie in calculate_utilization anteilig nach Überlappung gezählt.
         
         Args:
-            worker_id: ID des Workers
             start_date: Startdatum
             end_date: Enddatum
+            worker_ids: Optional: nur diese Worker (fehlende erhalten (0.0, 0.0))
             
         Returns:
-            Dict mit hours_worked, hours_planned, utilization_percent
+            Dict worker_id -> (hours_worked, hours_planned)
         """
         from ..repositories.time_entry_repository import TimeEntryRepository
         from ..repositories.capacity_repository import CapacityRepository
         
+        if worker_ids is not None and not worker_ids:
+            return {}
+        
         entry_repo = TimeEntryRepository(self._db_service)
         capacity_repo = CapacityRepository(self._db_service)
         
-        # Lade TimeEntries für Worker
-        time_entries = entry_repo.find_by_worker(worker_id, start_date, end_date)
+        minutes_worked = entry_repo.sum_minutes_by_worker(start_date, end_date, worker_ids)
+        hours_planned = capacity_repo.sum_overlapping_hours_by_worker(start_date, end_date, worker_ids)
         
-        # Lade Capacities für Worker
-        capacities = capacity_repo.find_by_worker(worker_id, start_date, end_date)
+        if worker_ids is None:
+            worker_ids = set(minutes_worked) | set(hours_planned)
         
-        # Summiere gearbeitete Stunden
-        hours_worked = sum(entry.duration_hours() for entry in time_entries)
+        return {
+            worker_id: (
+                minutes_worked.get(worker_id, 0) / 60.0,
+                hours_planned.get(worker_id, 0.0)
+            )
+            for worker_id in worker_ids
+        }
+    
+    def calculate_worker_utilization(
+        self,
+        worker_id: int,
+        start_date: datetime,
+        end_date: datetime
+    ) -> Dict[str, float]:
+        """
+        Berechnet Auslastung für einen Worker im Zeitraum
         
-        # Summiere geplante Stunden
-        hours_planned = sum(cap.planned_hours for cap in capacities)
+        Args:
+            worker_id: ID des Workers
+            start_date: Startdatum
+            end_date: Enddatum
+            
+        Returns:
+            Dict mit hours_worked, hours_planned, utilization_percent
+        """
+        team = self.calculate_team_utilization(start_date, end_date, [worker_id])
+        hours_worked, hours_planned = team[worker_id]
+        return self.build_utilization(hours_worked, hours_planned)
+    
+    @staticmethod
+    def build_utilization(hours_worked: float, hours_planned: float) -> Dict[str, float]:
+        """
+        Erstellt Auslastungs-Dict aus Ist- und Plan-Stunden
         
-        # Berechne Auslastung
+        Args:
+            hours_worked: Gearbeitete Stunden
+            hours_planned: Geplante Stunden
+            
+        Returns:
+            Dict mit hours_worked, hours_planned, utilization_percent
+        """
         utilization_percent = (hours_worked / hours_planned * 100) if hours_planned > 0 else 0.0
         
         return {
@@ -78,7 +128,7 @@ class AnalyticsService:
     
     def calculate_utilization(
         self,
-        time_entries: List[TimeEntry],
+        time_entries: Union[List[TimeEntry], TimeEntryBatch],
         capacities: List[Capacity],
         start_date: datetime,
         end_date: datetime
@@ -86,8 +136,11 @@ class AnalyticsService:
         """
         Berechnet Auslastung für einen Zeitraum
         
+        Plan-Stunden zählen tagesgenau anteilig nach Überlappung (wie
+        CapacityRepository.sum_overlapping_hours_by_worker).
+        
         Args:
-            time_entries: Erfasste Arbeitszeiten
+            time_entries: Erfasste Arbeitszeiten (Liste oder TimeEntryBatch)
             capacities: Geplante Kapazitäten
             start_date: Start des Zeitraums
             end_date: Ende des Zeitraums
@@ -95,18 +148,19 @@ class AnalyticsService:
         Returns:
             Dict mit Keys: actual_hours, planned_hours, utilization_percent
         """
-        # Ist-Stunden summieren
+        batch = self._as_batch(time_entries)
+        
+        # Ist-Stunden summieren - Einträge liegen auf Mitternacht,
+        # ein Start mit Uhrzeit schließt seinen Tag aus
+        first_day = start_date.toordinal() + (start_date.time() != time.min)
         actual_hours = sum(
-            entry.duration_hours()
-            for entry in time_entries
-            if start_date <= entry.date <= end_date
-        )
+            self._kernels.daily_minutes(batch.days, batch.minutes, first_day, end_date.toordinal())
+        ) / 60.0
         
         # Plan-Stunden summieren (nur überlappende Zeiträume)
-        planned_hours = sum(
-            self._get_overlapping_hours(cap, start_date, end_date)
-            for cap in capacities
-        )
+        planned_hours = sum(self._kernels.prorated_hours(
+            *self._capacity_columns(capacities), start_date.toordinal(), end_date.toordinal()
+        ))
         
         # Auslastung berechnen
         utilization_percent = (actual_hours / planned_hours * 100) if planned_hours > 0 else 0.0
@@ -118,63 +172,99 @@ class AnalyticsService:
             "difference_hours": actual_hours - planned_hours
         }
     
-    def _get_overlapping_hours(
+    def calculate_daily_breakdown(
         self,
-        capacity: Capacity,
+        time_entries: Union[List[TimeEntry], TimeEntryBatch],
         start_date: datetime,
         end_date: datetime
-    ) -> float:
-        """Berechnet überlappende Stunden zwischen Capacity und Zeitraum"""
-        # Überlappende Tage finden
-        overlap_start = max(capacity.start_date, start_date)
-        overlap_end = min(capacity.end_date, end_date)
-        
-        if overlap_start > overlap_end:
-            return 0.0
+    ) -> List[Tuple[date, float]]:
+        """
+        Erstellt tägliche Breakdown von Arbeitszeiten
         
-        # Anteil der Capacity berechnen
-        capacity_days = capacity.days_count()
-        overlap_days = (overlap_end - overlap_start).days + 1
+        Returns:
+            Liste von (Datum, Stunden) Tuples, ein Eintrag pro Tag im Zeitraum
+        """
+        batch = self._as_batch(time_entries)
+        first_day = start_date.toordinal()
+        daily_minutes = self._kernels.daily_minutes(
+            batch.days, batch.minutes, first_day, end_date.toordinal()
+        )
         
-        return capacity.planned_hours * (overlap_days / capacity_days)
+        return [
+            (date.fromordinal(first_day + offset), minutes / 60.0)
+            for offset, minutes in enumerate(daily_minutes)
+        ]
     
-    def calculate_daily_breakdown(
+    def calculate_daily_capacity(
         self,
-        time_entries: List[TimeEntry],
+        capacities: List[Capacity],
         start_date: datetime,
         end_date: datetime
-    ) -> List[Tuple[datetime, float]]:
+    ) -> List[Tuple[date, float]]:
         """
-        Erstellt tägliche Breakdown von Arbeitszeiten
+        Verteilt Plan-Stunden gleichmäßig auf die Tage im Zeitraum
         
+        Args:
+            capacities: Geplante Kapazitäten
+            start_date: Start des Zeitraums
+            end_date: Ende des Zeitraums
+            
         Returns:
-            Liste von (Datum, Stunden) Tuples
+            Liste von (Datum, Plan-Stunden) Tuples, ein Eintrag pro Tag
         """
-        daily_hours: Dict[datetime, float] = {}
+        first_day = start_date.toordinal()
+        daily_hours = self._kernels.daily_capacity_hours(
+            *self._capacity_columns(capacities), first_day, end_date.toordinal()
+        )
         
-        # Alle Tage im Zeitraum mit 0 initialisieren
-        current_date = start_date
-        while current_date <= end_date:
-            daily_hours[current_date.date()] = 0.0
-            current_date += timedelta(days=1)
+        return [
+            (date.fromordinal(first_day + offset), hours)
+            for offset, hours in enumerate(daily_hours)
+        ]
+    
+    def calculate_worker_totals(
+        self,
+        time_entries: Union[List[TimeEntry], TimeEntryBatch]
+    ) -> Dict[int, float]:
+        """
+        Summiert Stunden pro Worker
         
-        # Stunden summieren
-        for entry in time_entries:
-            entry_date = entry.date.date()
-            if start_date.date() <= entry_date <= end_date.date():
-                daily_hours[entry_date] = daily_hours.get(entry_date, 0.0) + entry.duration_hours()
+        Returns:
+            Dict worker_id -> Stunden
+        """
+        batch = self._as_batch(time_entries)
+        totals = self._kernels.totals_by_key(batch.worker_ids, batch.minutes)
+        return {worker_id: minutes / 60.0 for worker_id, minutes in totals.items()}
+    
+    def calculate_project_totals(
+        self,
+        time_entries: Union[List[TimeEntry], TimeEntryBatch]
+    ) -> Dict[Optional[str], float]:
+        """
+        Summiert Stunden pro Projekt
         
-        # Als sortierte Liste zurückgeben
-        return sorted(daily_hours.items())
+        Returns:
+            Dict Projektname (None = ohne Projekt) -> Stunden
+        """
+        batch = self._as_batch(time_entries)
+        totals = self._kernels.totals_by_key(batch.project_codes, batch.minutes)
+        return {batch.projects[code]: minutes / 60.0 for code, minutes in totals.items()}
     
-    def get_statistics_summary(self, time_entries: List[TimeEntry]) -> Dict[str, float]:
+    def get_statistics_summary(
+        self,
+        time_entries: Union[List[TimeEntry], TimeEntryBatch]
+    ) -> Dict[str, float]:
         """
         Erstellt Statistik-Zusammenfassung
         
         Returns:
             Dict mit total_hours, avg_hours_per_day, min_hours, max_hours
         """
-        if not time_entries:
+        count, total, minimum, maximum = self._kernels.minute_stats(
+            self._as_batch(time_entries).minutes
+        )
+        
+        if not count:
             return {
                 "total_hours": 0.0,
                 "avg_hours_per_day": 0.0,
@@ -183,12 +273,26 @@ class AnalyticsService:
                 "entry_count": 0
             }
         
-        hours = [entry.duration_hours() for entry in time_entries]
-        
         return {
-            "total_hours": sum(hours),
-            "avg_hours_per_day": sum(hours) / len(hours),
-            "min_hours": min(hours),
-            "max_hours": max(hours),
-            "entry_count": len(time_entries)
+            "total_hours": total / 60.0,
+            "avg_hours_per_day": total / 60.0 / count,
+            "min_hours": minimum / 60.0,
+            "max_hours": maximum / 60.0,
+            "entry_count": count
         }
+    
+    @staticmethod
+    def _as_batch(time_entries: Union[List[TimeEntry], TimeEntryBatch]) -> TimeEntryBatch:
+        """Liefert Einträge als TimeEntryBatch (Listen werden umgewandelt)"""
+        if isinstance(time_entries, TimeEntryBatch):
+            return time_entries
+        return TimeEntryBatch.from_entries(time_entries)
+    
+    @staticmethod
+    def _capacity_columns(capacities: List[Capacity]) -> Tuple[List[int], List[int], List[float]]:
+        """Capacities als Spalten (Starttag, Endtag, planned_hours) für die Kernels"""
+        return (
+            [capacity.start_date.toordinal() for capacity in capacities],
+            [capacity.end_date.toordinal() for capacity in capacities],
+            [capacity.planned_hours for capacity in capacities]
+        )
@@ -5,10 +5,35 @@ Verschlüsselung sensibler Daten mit RSA/AES
 from Crypto.PublicKey import RSA
 from Crypto.Cipher import AES, PKCS1_OAEP
 from Crypto.Random import get_random_bytes
+from Crypto.Hash import HMAC, SHA256
 import base64
-from typing import Tuple, Optional
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple, Optional, TYPE_CHECKING
 from pathlib import Path
 
+if TYPE_CHECKING:
+    from .database_service import DatabaseService
+
+
+# Privater Schlüssel im Worker-Prozess (gesetzt durch _init_decrypt_worker)
+_worker_crypto: Optional["CryptoService"] = None
+
+
+def _init_decrypt_worker(private_key_pem: bytes) -> None:
+    """Initialisiert Worker-Prozess für parallele Entschlüsselung"""
+    global _worker_crypto
+    _worker_crypto = CryptoService.__new__(CryptoService)
+    _worker_crypto.private_key = RSA.import_key(private_key_pem)
+    _worker_crypto.public_key = _worker_crypto.private_key.publickey()
+    _worker_crypto._data_key = None
+    _worker_crypto._blind_index_key = None
+
+
+def _decrypt_chunk(ciphertexts: List[str]) -> List[str]:
+    """Entschlüsselt einen Block Legacy-Ciphertexts im Worker-Prozess"""
+    return [_worker_crypto.decrypt(ciphertext) for ciphertext in ciphertexts]
+
 
 class CryptoService:
     """
@@ -25,6 +50,13 @@ class CryptoService:
     4. Daten mit AES verschlüsseln
     5. Speichern: encrypted_aes_key + encrypted_data
     
+    Envelope-Modus (nach initialize_data_key()):
+    - Ein AES-Data-Key pro Datenbank, einmalig mit RSA gewrappt
+      und in der Tabelle data_keys gespeichert
+    - Felder werden nur noch mit AES-GCM verschlüsselt (kein RSA pro Feld)
+    - Ciphertext mit Versions-Header "v2:", Legacy-Blobs (ohne Header)
+      bleiben weiterhin entschlüsselbar
+    
     Beispiel:
         >>> crypto = CryptoService()
         >>> crypto.initialize_keys()
@@ -35,6 +67,18 @@ class CryptoService:
     RSA_KEY_SIZE = 2048
     AES_KEY_SIZE = 32  # 256 bit
     
+    # Versions-Header für Envelope-Ciphertexts (":" kommt in Base64 nicht vor)
+    ENVELOPE_PREFIX = "v2:"
+    GCM_NONCE_SIZE = 12
+    GCM_TAG_SIZE = 16
+    
+    # Kontext für die Ableitung des Blind-Index-Keys aus dem RSA-Key
+    BLIND_INDEX_CONTEXT = b"capacity-planner/blind-index/v1"
+    
+    # Ab dieser Anzahl Legacy-Ciphertexts (RSA) lohnt sich ein Prozess-Pool
+    PARALLEL_DECRYPT_THRESHOLD = 200
+    PARALLEL_DECRYPT_CHUNK_SIZE = 100
+    
     def __init__(self, key_directory: Optional[Path] = None):
         """
         Initialisiert den Crypto Service
@@ -47,6 +91,8 @@ class CryptoService:
         
         self.private_key: Optional[RSA.RsaKey] = None
         self.public_key: Optional[RSA.RsaKey] = None
+        self._data_key: Optional[bytes] = None
+        self._blind_index_key: Optional[bytes] = None
     
     def initialize_keys(self, force_new: bool = False) -> None:
         """
@@ -68,6 +114,7 @@ class CryptoService:
         key = RSA.generate(self.RSA_KEY_SIZE)
         self.private_key = key
         self.public_key = key.publickey()
+        self._blind_index_key = None
         
         # Speichern
         with open(private_path, 'wb') as f:
@@ -83,6 +130,8 @@ class CryptoService:
         
         with open(public_path, 'rb') as f:
             self.public_key = RSA.import_key(f.read())
+        
+        self._blind_index_key = None
     
     def encrypt(self, plaintext: str) -> str:
         """
@@ -93,10 +142,14 @@ class CryptoService:
             
         Returns:
             Base64-kodierter String: encrypted_aes_key + nonce + tag + ciphertext
+            (im Envelope-Modus: "v2:" + Base64(nonce + tag + ciphertext))
         """
         if not self.public_key:
             raise RuntimeError("Keys nicht initialisiert. Rufe initialize_keys() auf.")
         
+        if self._data_key is not None:
+            return self._encrypt_envelope(plaintext)
+        
         # AES-Key generieren
         aes_key = get_random_bytes(self.AES_KEY_SIZE)
         
@@ -116,6 +169,10 @@ class CryptoService:
         """
         Entschlüsselt verschlüsselte Daten
         
+        Erkennt das Format am Versions-Header: Envelope-Ciphertexts ("v2:")
+        werden nur mit dem Data-Key entschlüsselt, Legacy-Blobs weiterhin
+        mit RSA + AES.
+        
         Args:
             encrypted_data: Base64-kodierter verschlüsselter String
             
@@ -125,6 +182,9 @@ class CryptoService:
         if not self.private_key:
             raise RuntimeError("Keys nicht initialisiert. Rufe initialize_keys() auf.")
         
+        if self.is_envelope_ciphertext(encrypted_data):
+            return self._decrypt_envelope(encrypted_data)
+        
         # Base64 dekodieren
         combined = base64.b64decode(encrypted_data)
         
@@ -144,3 +204,216 @@ class CryptoService:
         plaintext = aes_cipher.decrypt_and_verify(ciphertext, tag)
         
         return plaintext.decode('utf-8')
+    
+    def decrypt_many(
+        self,
+        encrypted_values: List[str],
+        parallel: Optional[bool] = None,
+        max_workers: Optional[int] = None
+    ) -> List[str]:
+        """
+        Entschlüsselt viele Werte auf einmal (Batch-API)
+        
+        Envelope-Ciphertexts (nur AES) werden direkt entschlüsselt.
+        Legacy-Ciphertexts benötigen je eine RSA-Operation und werden ab
+        PARALLEL_DECRYPT_THRESHOLD auf einen Prozess-Pool verteilt, da
+        pycryptodome bei RSA den GIL kaum freigibt.
+        
+        Args:
+            encrypted_values: Verschlüsselte Strings
+            parallel: True/False erzwingt den Modus, None = automatisch
+            max_workers: Anzahl Prozesse (Standard: CPU-Anzahl)
+            
+        Returns:
+            Klartexte in derselben Reihenfolge
+        """
+        if not self.private_key:
+            raise RuntimeError("Keys nicht initialisiert. Rufe initialize_keys() auf.")
+        
+        results: List[Optional[str]] = [None] * len(encrypted_values)
+        legacy_positions = []
+        
+        for position, encrypted in enumerate(encrypted_values):
+            if self.is_envelope_ciphertext(encrypted):
+                results[position] = self._decrypt_envelope(encrypted)
+            else:
+                legacy_positions.append(position)
+        
+        if parallel is None:
+            parallel = (
+                len(legacy_positions) >= self.PARALLEL_DECRYPT_THRESHOLD
+                and (os.cpu_count() or 1) > 1
+            )
+        
+        legacy_values = [encrypted_values[position] for position in legacy_positions]
+        if parallel and legacy_values:
+            decrypted = self._decrypt_parallel(legacy_values, max_workers)
+        else:
+            decrypted = [self.decrypt(encrypted) for encrypted in legacy_values]
+        
+        for position, plaintext in zip(legacy_positions, decrypted):
+            results[position] = plaintext
+        
+        return results
+    
+    def _decrypt_parallel(self, encrypted_values: List[str], max_workers: Optional[int]) -> List[str]:
+        """Verteilt Legacy-Ciphertexts in Blöcken auf einen Prozess-Pool"""
+        chunk_size = self.PARALLEL_DECRYPT_CHUNK_SIZE
+        chunks = [
+            encrypted_values[i:i + chunk_size]
+            for i in range(0, len(encrypted_values), chunk_size)
+        ]
+        
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_decrypt_worker,
+            initargs=(self.private_key.export_key(),)
+        ) as executor:
+            decrypted = []
+            for chunk_result in executor.map(_decrypt_chunk, chunks):
+                decrypted.extend(chunk_result)
+        
+        return decrypted
+    
+    def blind_index(self, value: str) -> str:
+        """
+        Berechnet deterministischen Blind-Index (HMAC-SHA256) für Suchfelder
+        
+        Ermöglicht Gleichheitssuche auf verschlüsselten Spalten ohne
+        Entschlüsselung. Der Wert wird vorher normalisiert (trim, lowercase).
+        
+        Args:
+            value: Klartext (z.B. Email-Adresse)
+            
+        Returns:
+            Hex-kodierter HMAC
+        """
+        if not self.private_key:
+            raise RuntimeError("Keys nicht initialisiert. Rufe initialize_keys() auf.")
+        
+        if self._blind_index_key is None:
+            # Key-Ableitung aus dem privaten Schlüssel (nur einmal pro Instanz)
+            key_material = SHA256.new(self.private_key.export_key(format='DER')).digest()
+            self._blind_index_key = HMAC.new(
+                key_material, self.BLIND_INDEX_CONTEXT, digestmod=SHA256
+            ).digest()
+        
+        normalized = value.strip().lower().encode('utf-8')
+        return HMAC.new(self._blind_index_key, normalized, digestmod=SHA256).hexdigest()
+    
+    # ===== Envelope-Modus (Data-Key pro Datenbank) =====
+    
+    def initialize_data_key(self, db_service: "DatabaseService") -> None:
+        """
+        Lädt oder erzeugt den Data-Key der Datenbank und aktiviert Envelope-Modus
+        
+        Der Data-Key wird mit dem RSA-Public-Key gewrappt in der Tabelle
+        data_keys gespeichert. Pro Sitzung ist nur eine einzige
+        RSA-Operation nötig. Ein neuer Key wird erst aktiviert, wenn er
+        committet ist - sonst würden Daten mit einem Key verschlüsselt,
+        den die Datenbank nicht kennt.
+        
+        Args:
+            db_service: DatabaseService mit initialisiertem Schema
+            
+        Raises:
+            RuntimeError: Wenn der Data-Key nicht gespeichert werden konnte
+        """
+        with db_service.unit_of_work():
+            with db_service.statement("SELECT wrapped_key FROM data_keys WHERE id = 1") as query:
+                wrapped_key = query.value(0) if query.next() else None
+            
+            if wrapped_key is not None:
+                data_key = self._unwrap_data_key(wrapped_key)
+            else:
+                data_key, wrapped_key = self._new_data_key()
+                with db_service.statement(
+                    "INSERT INTO data_keys (id, wrapped_key) VALUES (1, ?)",
+                    [wrapped_key]
+                ) as query:
+                    if query.numRowsAffected() != 1:
+                        raise RuntimeError("Data-Key konnte nicht gespeichert werden")
+        
+        self._data_key = data_key
+    
+    def generate_data_key(self) -> str:
+        """
+        Erzeugt neuen Data-Key und aktiviert Envelope-Modus
+        
+        Returns:
+            Base64-kodierter, mit RSA gewrappter Data-Key
+        """
+        data_key, wrapped_key = self._new_data_key()
+        self._data_key = data_key
+        return wrapped_key
+    
+    def load_data_key(self, wrapped_key: str) -> None:
+        """
+        Entpackt gewrappten Data-Key und aktiviert Envelope-Modus
+        
+        Args:
+            wrapped_key: Base64-kodierter, mit RSA gewrappter Data-Key
+        """
+        self._data_key = self._unwrap_data_key(wrapped_key)
+    
+    def _new_data_key(self) -> Tuple[bytes, str]:
+        """Erzeugt Data-Key und gewrappte Form, ohne ihn zu aktivieren"""
+        if not self.public_key:
+            raise RuntimeError("Keys nicht initialisiert. Rufe initialize_keys() auf.")
+        
+        data_key = get_random_bytes(self.AES_KEY_SIZE)
+        rsa_cipher = PKCS1_OAEP.new(self.public_key)
+        wrapped_key = base64.b64encode(rsa_cipher.encrypt(data_key)).decode('utf-8')
+        return data_key, wrapped_key
+    
+    def _unwrap_data_key(self, wrapped_key: str) -> bytes:
+        """Entpackt gewrappten Data-Key, ohne ihn zu aktivieren"""
+        if not self.private_key:
+            raise RuntimeError("Keys nicht initialisiert. Rufe initialize_keys() auf.")
+        
+        rsa_cipher = PKCS1_OAEP.new(self.private_key)
+        return rsa_cipher.decrypt(base64.b64decode(wrapped_key))
+    
+    def has_data_key(self) -> bool:
+        """
+        Prüft ob Envelope-Modus aktiv ist
+        
+        Returns:
+            True wenn ein Data-Key geladen ist
+        """
+        return self._data_key is not None
+    
+    def is_envelope_ciphertext(self, encrypted_data: str) -> bool:
+        """
+        Prüft ob Ciphertext im Envelope-Format vorliegt
+        
+        Args:
+            encrypted_data: Verschlüsselter String
+            
+        Returns:
+            True bei Versions-Header "v2:"
+        """
+        return encrypted_data.startswith(self.ENVELOPE_PREFIX)
+    
+    def _encrypt_envelope(self, plaintext: str) -> str:
+        """Verschlüsselt Text nur mit AES-GCM und dem Data-Key"""
+        aes_cipher = AES.new(self._data_key, AES.MODE_GCM, nonce=get_random_bytes(self.GCM_NONCE_SIZE))
+        ciphertext, tag = aes_cipher.encrypt_and_digest(plaintext.encode('utf-8'))
+        
+        combined = aes_cipher.nonce + tag + ciphertext
+        return self.ENVELOPE_PREFIX + base64.b64encode(combined).decode('utf-8')
+    
+    def _decrypt_envelope(self, encrypted_data: str) -> str:
+        """Entschlüsselt Envelope-Ciphertext mit dem Data-Key"""
+        if self._data_key is None:
+            raise RuntimeError("Data-Key nicht geladen. Rufe initialize_data_key() auf.")
+        
+        combined = base64.b64decode(encrypted_data[len(self.ENVELOPE_PREFIX):])
+        nonce = combined[:self.GCM_NONCE_SIZE]
+        tag = combined[self.GCM_NONCE_SIZE:self.GCM_NONCE_SIZE + self.GCM_TAG_SIZE]
+        ciphertext = combined[self.GCM_NONCE_SIZE + self.GCM_TAG_SIZE:]
+        
+        aes_cipher = AES.new(self._data_key, AES.MODE_GCM, nonce=nonce)
+        plaintext = aes_cipher.decrypt_and_verify(ciphertext, tag)
+        
+        return plaintext.decode('utf-8')
@@ -2,9 +2,43 @@
 Database Service
 Qt SQL Connection Management und Schema-Migration
 """
+from collections import OrderedDict
+from contextlib import contextmanager
 from PySide6.QtSql import QSqlDatabase, QSqlQuery
 from pathlib import Path
-from typing import Optional
+from time import perf_counter
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from .migrations import MIGRATIONS, Migration, MigrationResult
+
+
+# SQLite-Verbindungsprofile (PRAGMA -> Wert), angewendet beim Öffnen
+PRAGMA_PROFILES: Dict[str, Dict[str, object]] = {
+    # Interaktive Nutzung: WAL, sichere aber günstige Commits, 64 MB Cache
+    "desktop": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -65536,
+        "mmap_size": 268435456,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    },
+    # Massenimport: kein fsync pro Commit, großer Cache und mmap
+    "bulk-import": {
+        "journal_mode": "WAL",
+        "synchronous": "OFF",
+        "cache_size": -262144,
+        "mmap_size": 1073741824,
+        "temp_store": "MEMORY",
+        "busy_timeout": 30000,
+    },
+}
+
+DEFAULT_PRAGMA_PROFILE = "desktop"
+
+# Unabhängig vom Profil: das Schema (ON DELETE CASCADE) setzt Foreign Keys voraus
+SCHEMA_PRAGMAS: Dict[str, object] = {
+    "foreign_keys": "ON",
+}
 
 
 class DatabaseService:
@@ -12,23 +46,38 @@ class DatabaseService:
     Verwaltet SQLite-Datenbankverbindung via Qt SQL
     
     Funktionen:
-    - Connection Management
-    - Schema-Migration
-    - Transaction Handling
+    - Connection Management mit PRAGMA-Profilen ("desktop", "bulk-import"),
+      Foreign Keys sind unabhängig vom Profil immer aktiv
+    - Versionierte Schema-Migrationen (siehe migrations.py)
+    - Transaction Handling (Unit of Work, verschachtelt über Savepoints)
+    - Rollup daily_worker_hours (Minuten pro Worker und Tag)
+    - LRU-Cache für Prepared Statements (Checkout/Rückgabe über statement())
     
     Beispiel:
         >>> db = DatabaseService("capacity_planner.db")
         >>> db.initialize()
-        >>> db.execute_query("SELECT * FROM workers")
+        >>> with db.statement("SELECT * FROM workers") as query:
+        ...     while query.next(): ...
     """
     
-    def __init__(self, database_path: Optional[str] = None):
+    # Maximale Anzahl gecachter Prepared Statements
+    STATEMENT_CACHE_SIZE = 64
+    
+    def __init__(
+        self,
+        database_path: Optional[str] = None,
+        profile: Optional[str] = DEFAULT_PRAGMA_PROFILE
+    ):
         """
         Initialisiert Database Service
         
         Args:
             database_path: Pfad zur SQLite-Datei (default: ~/.capacity_planner/data.db)
+            profile: Name aus PRAGMA_PROFILES oder None für SQLite-Defaults
         """
+        if profile is not None and profile not in PRAGMA_PROFILES:
+            raise ValueError(f"Unbekanntes PRAGMA-Profil: {profile}")
+        
         if database_path is None:
             data_dir = Path.home() / ".capacity_planner"
             data_dir.mkdir(parents=True, exist_ok=True)
@@ -37,6 +86,14 @@ class DatabaseService:
         self.database_path = database_path
         self.connection_name = "capacity_planner_main"
         self.db: Optional[QSqlDatabase] = None
+        self.profile = profile
+        self.applied_migrations: List[MigrationResult] = []
+        
+        self._statement_cache: "OrderedDict[Tuple[str, bool], QSqlQuery]" = OrderedDict()
+        self.statement_hits = 0
+        self.statement_misses = 0
+        self._transaction_depth = 0
+        self._rollback_listeners: List[Callable[[], None]] = []
     
     def initialize(self) -> bool:
         """
@@ -52,13 +109,69 @@ class DatabaseService:
         if not self.db.open():
             raise RuntimeError(f"Konnte Datenbank nicht öffnen: {self.db.lastError().text()}")
         
-        # Schema erstellen/migrieren
+        for pragma, value in SCHEMA_PRAGMAS.items():
+            self._set_pragma(pragma, value)
+        if self.profile is not None:
+            self.apply_profile(self.profile)
+        
+        # Basis-Schema erstellen, danach ausstehende Migrationen anwenden
         self._create_schema()
+        self.applied_migrations = self._run_migrations()
         
         return True
     
+    def apply_profile(self, profile: str) -> None:
+        """
+        Setzt die PRAGMAs eines Verbindungsprofils
+        
+        Kann auch zur Laufzeit gewechselt werden (z.B. "bulk-import" für
+        einen Import, danach zurück auf "desktop"), aber nicht innerhalb
+        einer offenen Transaktion. Profile betreffen nur die Performance,
+        SCHEMA_PRAGMAS (Foreign Keys) bleiben unverändert.
+        
+        Args:
+            profile: Name aus PRAGMA_PROFILES
+        """
+        if profile not in PRAGMA_PROFILES:
+            raise ValueError(f"Unbekanntes PRAGMA-Profil: {profile}")
+        
+        for pragma, value in PRAGMA_PROFILES[profile].items():
+            self._set_pragma(pragma, value)
+        
+        self.profile = profile
+    
+    def _set_pragma(self, pragma: str, value: object) -> None:
+        """Setzt ein PRAGMA auf der Verbindung"""
+        query = QSqlQuery(self.db)
+        if not query.exec(f"PRAGMA {pragma} = {value}"):
+            raise RuntimeError(f"PRAGMA {pragma} fehlgeschlagen: {query.lastError().text()}")
+    
+    def get_pragma_report(self) -> Dict[str, object]:
+        """
+        Liest die effektiven Werte aller Profil- und Schema-PRAGMAs
+        
+        Returns:
+            Dict PRAGMA -> aktueller Wert der Verbindung
+        """
+        report = {}
+        for pragma in [*PRAGMA_PROFILES[DEFAULT_PRAGMA_PROFILE], *SCHEMA_PRAGMAS]:
+            query = QSqlQuery(self.db)
+            query.exec(f"PRAGMA {pragma}")
+            report[pragma] = query.value(0) if query.next() else None
+        return report
+    
+    def format_pragma_report(self) -> str:
+        """
+        Formatiert den PRAGMA-Report für die Startausgabe
+        
+        Returns:
+            Einzeiliger Report, z.B. "SQLite [desktop]: journal_mode=wal, ..."
+        """
+        values = ", ".join(f"{key}={value}" for key, value in self.get_pragma_report().items())
+        return f"SQLite [{self.profile or 'default'}]: {values}"
+    
     def _create_schema(self) -> None:
-        """Erstellt Datenbank-Schema"""
+        """Erstellt Basis-Schema (Version 1) und Versionstabelle"""
         queries = [
             """
             CREATE TABLE IF NOT EXISTS workers (
@@ -102,6 +215,14 @@ class DatabaseService:
             """
             CREATE INDEX IF NOT EXISTS idx_capacities_worker 
             ON capacities(worker_id, start_date, end_date)
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS schema_version (
+                version INTEGER PRIMARY KEY,
+                description TEXT,
+                duration_ms REAL,
+                applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
             """
         ]
         
@@ -109,38 +230,369 @@ class DatabaseService:
             query = QSqlQuery(self.db)
             if not query.exec(query_text):
                 raise RuntimeError(f"Schema-Erstellung fehlgeschlagen: {query.lastError().text()}")
+        
+        # schema_version aus schema.sql kannte nur version/applied_at
+        for column, column_type in (("description", "TEXT"), ("duration_ms", "REAL")):
+            if not self._column_exists("schema_version", column):
+                self.execute_query(f"ALTER TABLE schema_version ADD COLUMN {column} {column_type}")
+    
+    def get_schema_version(self) -> int:
+        """
+        Gibt die aktuell angewendete Schema-Version zurück
+        
+        Returns:
+            Höchste Version aus schema_version (1 = Basis-Schema)
+        """
+        with self.statement("SELECT MAX(version) FROM schema_version") as query:
+            if query.next() and query.value(0):
+                return int(query.value(0))
+        return 1
+    
+    def _run_migrations(self, migrations: Optional[List[Migration]] = None) -> List[MigrationResult]:
+        """
+        Wendet alle ausstehenden Migrationen in Versionsreihenfolge an
+        
+        Jeder Schritt läuft in einer eigenen Transaktion und wird mit
+        Laufzeit in schema_version eingetragen. Hinweise der Schritte
+        (z.B. verschobene verwaiste Zeilen) stehen in MigrationResult.message. Schlägt ein Schritt fehl,
+        wird er zurückgerollt und die Initialisierung abgebrochen;
+        bereits angewendete Schritte bleiben erhalten.
+        
+        Args:
+            migrations: Optional eigene Migrationsliste (default: MIGRATIONS)
+            
+        Returns:
+            Liste der in diesem Lauf angewendeten Schritte
+        """
+        if migrations is None:
+            migrations = MIGRATIONS
+        
+        current_version = self.get_schema_version()
+        results = []
+        
+        for migration in sorted(migrations, key=lambda m: m.version):
+            if migration.version <= current_version:
+                continue
+            
+            start = perf_counter()
+            self.db.transaction()
+            try:
+                message = migration.apply(self)
+                duration_ms = (perf_counter() - start) * 1000
+                self.execute_query(
+                    "INSERT INTO schema_version (version, description, duration_ms) VALUES (?, ?, ?)",
+                    [migration.version, migration.description, duration_ms]
+                )
+                if not self.db.commit():
+                    raise RuntimeError(self.db.lastError().text())
+            except Exception as e:
+                self.db.rollback()
+                raise RuntimeError(
+                    f"Migration {migration.version} ({migration.description}) fehlgeschlagen: {e}"
+                ) from e
+            
+            current_version = migration.version
+            results.append(
+                MigrationResult(migration.version, migration.description, duration_ms, message)
+            )
+        
+        return results
+    
+    @property
+    def in_transaction(self) -> bool:
+        """True innerhalb eines unit_of_work()-Blocks"""
+        return self._transaction_depth > 0
+    
+    def add_rollback_listener(self, callback: Callable[[], None]) -> None:
+        """
+        Registriert Callback, der nach jedem Rollback eines unit_of_work läuft
+        
+        Für In-Memory-Strukturen mit Write-Through (z.B. CapacityIndex),
+        die nach einem Rollback nicht mehr zur Datenbank passen.
+        
+        Args:
+            callback: Funktion ohne Argumente
+        """
+        if callback not in self._rollback_listeners:
+            self._rollback_listeners.append(callback)
+    
+    @contextmanager
+    def unit_of_work(self) -> Iterator[None]:
+        """
+        Transaktionsklammer für mehrere Schreiboperationen
+        
+        Der äußerste Block öffnet die Transaktion und committet beim
+        Verlassen genau einmal. Verschachtelte Blöcke laufen als Savepoint
+        und können einzeln zurückgerollt werden, ohne den äußeren Block
+        abzubrechen. Bei einer Exception wird die jeweilige Ebene
+        zurückgerollt und die Exception weitergereicht.
+        
+        Beispiel:
+            >>> with db.unit_of_work():
+            ...     entry_repo.update(entry)
+            ...     capacity_repo.create(capacity)
+        """
+        depth = self._transaction_depth
+        savepoint = f"uow_{depth}"
+        
+        if depth == 0:
+            if not self.db.transaction():
+                raise RuntimeError(f"Transaktion fehlgeschlagen: {self.db.lastError().text()}")
+        else:
+            self.execute_query(f"SAVEPOINT {savepoint}")
+        
+        self._transaction_depth += 1
+        try:
+            yield
+        except BaseException:
+            self._transaction_depth -= 1
+            if depth == 0:
+                self.db.rollback()
+            else:
+                self.execute_query(f"ROLLBACK TO {savepoint}")
+                self.execute_query(f"RELEASE {savepoint}")
+            for callback in self._rollback_listeners:
+                callback()
+            raise
+        
+        self._transaction_depth -= 1
+        if depth > 0:
+            self.execute_query(f"RELEASE {savepoint}")
+        elif not self.db.commit():
+            error = self.db.lastError().text()
+            self.db.rollback()
+            for callback in self._rollback_listeners:
+                callback()
+            raise RuntimeError(f"Commit fehlgeschlagen: {error}")
     
-    def execute_query(self, query_text: str, params: Optional[list] = None) -> QSqlQuery:
+    def rebuild_daily_worker_hours(self) -> int:
         """
-        Führt SQL-Query aus
+        Baut den Rollup daily_worker_hours komplett aus time_entries neu auf
+        
+        Für Reparaturen nach Änderungen an time_entries ohne Trigger
+        (z.B. Import mit externem Tool).
+        
+        Returns:
+            Anzahl Worker-Tage im Rollup
+        """
+        with self.unit_of_work():
+            self._fill_daily_worker_hours()
+        
+        with self.statement("SELECT COUNT(*) FROM daily_worker_hours") as query:
+            return query.value(0) if query.next() else 0
+    
+    def _fill_daily_worker_hours(self) -> None:
+        """Befüllt daily_worker_hours aus time_entries (ohne eigene Transaktion)"""
+        self.execute_query("DELETE FROM daily_worker_hours")
+        self.execute_query("""
+            INSERT INTO daily_worker_hours (worker_id, day, minutes, entry_count)
+            SELECT worker_id, DATE(date), SUM(duration_minutes), COUNT(*)
+            FROM time_entries
+            GROUP BY worker_id, DATE(date)
+        """)
+    
+    def _column_exists(self, table: str, column: str) -> bool:
+        """
+        Prüft ob Spalte in Tabelle existiert
+        
+        Args:
+            table: Tabellenname
+            column: Spaltenname
+            
+        Returns:
+            True wenn Spalte vorhanden
+        """
+        query = QSqlQuery(self.db)
+        query.exec(f"PRAGMA table_info({table})")
+        while query.next():
+            if query.value(1) == column:
+                return True
+        return False
+    
+    def execute_query(
+        self,
+        query_text: str,
+        params: Optional[list] = None,
+        forward_only: bool = False
+    ) -> QSqlQuery:
+        """
+        Führt SQL-Query mit eigenem, nicht gecachtem Statement aus
+        
+        Für DDL, PRAGMAs und einmalige Statements. Das Ergebnis gehört
+        dem Aufrufer; wiederholt ausgeführtes SQL läuft über statement().
         
         Args:
             query_text: SQL-Statement
             params: Parameter für Prepared Statement
+            forward_only: Nur vorwärts lesen - Qt puffert gelesene Zeilen
+                dann nicht (konstanter Speicher bei großen Ergebnissen)
             
         Returns:
             QSqlQuery-Objekt mit Ergebnissen
         """
         query = QSqlQuery(self.db)
+        query.setForwardOnly(forward_only)
         query.prepare(query_text)
+        self._exec(query, params)
+        return query
+    
+    @contextmanager
+    def statement(
+        self,
+        query_text: str,
+        params: Optional[list] = None,
+        forward_only: bool = False
+    ) -> Iterator[QSqlQuery]:
+        """
+        Führt SQL-Query mit einem Prepared Statement aus dem Cache aus
+        
+        Das Statement wird für die Dauer des with-Blocks aus dem Cache
+        genommen (Checkout) und gehört nur diesem Aufrufer; ein
+        verschachtelter Block mit demselben SQL erhält ein eigenes.
+        Beim Verlassen wird es mit finish() beendet - ein nicht zu Ende
+        gelesenes SELECT hält danach keine Lesesperre mehr - und an den
+        Cache zurückgegeben. Das Ergebnis ist nur im Block gültig.
+        
+        Beispiel:
+            >>> with db.statement("SELECT name FROM workers WHERE id = ?", [1]) as query:
+            ...     name = query.value(0) if query.next() else None
+        
+        Args:
+            query_text: SQL-Statement
+            params: Parameter für Prepared Statement
+            forward_only: Nur vorwärts lesen (eigener Cache-Eintrag)
+        
+        Yields:
+            Ausgeführtes QSqlQuery-Objekt
+        """
+        # Forward-Only muss vor prepare() gesetzt sein -> eigener Cache-Eintrag
+        key = (query_text, forward_only)
+        query = self._checkout(key)
+        try:
+            self._exec(query, params)
+            yield query
+        finally:
+            self._checkin(key, query)
+    
+    def execute_batch(self, query_text: str, columns: List[list]) -> Optional[int]:
+        """
+        Führt Statement einmal pro Zeile aus (QSqlQuery.execBatch)
+        
+        Jede Parameter-Spalte wird als Liste gebunden, SQLite parst das
+        Statement nur einmal. Die Transaktion verwaltet der Aufrufer.
         
+        Args:
+            query_text: SQL-Statement mit Platzhaltern
+            columns: Eine Werteliste pro Platzhalter (alle gleich lang)
+        
+        Returns:
+            lastInsertId nach der letzten Zeile (bei INSERT)
+        """
+        key = (query_text, False)
+        query = self._checkout(key)
+        try:
+            for index, values in enumerate(columns):
+                query.bindValue(index, values)
+            
+            if not query.execBatch():
+                raise RuntimeError(f"Batch fehlgeschlagen: {query.lastError().text()}")
+            
+            return query.lastInsertId()
+        finally:
+            self._checkin(key, query)
+    
+    @staticmethod
+    def _exec(query: QSqlQuery, params: Optional[list]) -> None:
+        """Bindet Parameter und führt das Statement aus"""
         if params:
-            for param in params:
-                query.addBindValue(param)
+            for index, param in enumerate(params):
+                query.bindValue(index, param)
         
         if not query.exec():
             raise RuntimeError(f"Query fehlgeschlagen: {query.lastError().text()}")
+    
+    def _checkout(self, key: Tuple[str, bool]) -> QSqlQuery:
+        """
+        Nimmt ein freies Prepared Statement aus dem LRU-Cache oder erstellt es
+        
+        Der Cache enthält nur zurückgegebene Statements; ein
+        ausgeliehenes ist bis zu _checkin für alle anderen unsichtbar.
+        
+        Args:
+            key: (SQL-Statement, forward_only)
+            
+        Returns:
+            Vorbereitetes QSqlQuery-Objekt
+        """
+        query = self._statement_cache.pop(key, None)
+        if query is not None:
+            self.statement_hits += 1
+            return query
         
+        self.statement_misses += 1
+        query_text, forward_only = key
+        query = QSqlQuery(self.db)
+        query.setForwardOnly(forward_only)
+        query.prepare(query_text)
         return query
     
+    def _checkin(self, key: Tuple[str, bool], query: QSqlQuery) -> None:
+        """
+        Beendet ein ausgeliehenes Statement und legt es zurück in den Cache
+        
+        Ist bereits ein freies Statement für dasselbe SQL vorhanden
+        (verschachtelte Nutzung) oder die Verbindung geschlossen, wird
+        es verworfen. Über STATEMENT_CACHE_SIZE fällt das am längsten
+        unbenutzte Statement heraus.
+        
+        Args:
+            key: (SQL-Statement, forward_only)
+            query: Statement aus _checkout
+        """
+        query.finish()
+        if self.db is None or key in self._statement_cache:
+            query.clear()
+            return
+        
+        self._statement_cache[key] = query
+        if len(self._statement_cache) > self.STATEMENT_CACHE_SIZE:
+            _, evicted = self._statement_cache.popitem(last=False)
+            evicted.clear()
+    
+    def statement_cache_stats(self) -> Dict[str, float]:
+        """
+        Gibt Statistik des Statement-Caches zurück
+        
+        Returns:
+            Dict mit size (freie Statements), hits, misses, hit_rate
+        """
+        total = self.statement_hits + self.statement_misses
+        return {
+            "size": len(self._statement_cache),
+            "hits": self.statement_hits,
+            "misses": self.statement_misses,
+            "hit_rate": self.statement_hits / total if total > 0 else 0.0
+        }
+    
+    def _clear_statement_cache(self) -> None:
+        """Finalisiert alle gecachten Statements"""
+        for query in self._statement_cache.values():
+            query.finish()
+            query.clear()
+        self._statement_cache.clear()
+    
     def close(self) -> None:
         """
         Schließt Datenbankverbindung
         
+        Gecachte Prepared Statements werden vorher finalisiert.
+        
         Hinweis: Qt's removeDatabase() wird NICHT aufgerufen, da dies
         eine Warnung erzeugt, wenn noch QSqlQuery-Objekte existieren.
         Qt räumt Verbindungen automatisch beim Application-Exit auf.
         """
+        self._clear_statement_cache()
+        
         if self.db and self.db.isOpen():
             self.db.close()
             
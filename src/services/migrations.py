@@ -0,0 +1,348 @@
+"""
+Schema-Migrationen
+Geordnete, versionierte Änderungen am Datenbank-Schema
+"""
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+
+@dataclass(frozen=True)
+class Migration:
+    """
+    Einzelner Migrationsschritt
+    
+    Attributes:
+        version: Zielversion nach dem Schritt (aufsteigend, lückenlos)
+        description: Kurzbeschreibung für schema_version
+        apply: Funktion, die den Schritt auf einem DatabaseService ausführt
+            und optional einen Hinweis für den Anwender zurückgibt
+    
+    apply läuft innerhalb der Transaktion des Runners und darf selbst
+    keine Transaktion öffnen. Schritte sollten idempotent sein
+    (IF NOT EXISTS, Spaltenprüfung), da Installationen vor Einführung
+    der Versionierung Teile des Schemas bereits besitzen können.
+    """
+    version: int
+    description: str
+    apply: Callable[[object], Optional[str]]
+
+
+@dataclass(frozen=True)
+class MigrationResult:
+    """Ergebnis eines angewendeten Migrationsschritts (message: Hinweis des Schritts)"""
+    version: int
+    description: str
+    duration_ms: float
+    message: Optional[str] = None
+
+
+# Verwaiste Zeilen (worker_id ohne Worker) werden hierhin verschoben statt gelöscht
+ORPHANED_TABLES = {
+    "time_entries": "orphaned_time_entries",
+    "capacities": "orphaned_capacities",
+}
+
+
+def _create_data_keys(db_service) -> None:
+    """Tabelle für den gewrappten AES-Data-Key (Envelope-Verschlüsselung)"""
+    db_service.execute_query("""
+        CREATE TABLE IF NOT EXISTS data_keys (
+            id INTEGER PRIMARY KEY,
+            wrapped_key TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+
+def _add_email_blind_index(db_service) -> None:
+    """Spalte und Unique-Index für den Email-Blind-Index"""
+    if not db_service._column_exists("workers", "email_bidx"):
+        db_service.execute_query("ALTER TABLE workers ADD COLUMN email_bidx TEXT")
+    
+    db_service.execute_query(
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_workers_email_bidx ON workers(email_bidx)"
+    )
+
+
+def _create_rollup_triggers(db_service) -> None:
+    """Trigger, die daily_worker_hours mit time_entries synchron halten"""
+    db_service.execute_query("""
+        CREATE TRIGGER IF NOT EXISTS trg_time_entries_rollup_insert
+        AFTER INSERT ON time_entries
+        BEGIN
+            INSERT INTO daily_worker_hours (worker_id, day, minutes, entry_count)
+            VALUES (NEW.worker_id, DATE(NEW.date), NEW.duration_minutes, 1)
+            ON CONFLICT (worker_id, day) DO UPDATE SET
+                minutes = minutes + excluded.minutes,
+                entry_count = entry_count + 1;
+        END
+    """)
+    db_service.execute_query("""
+        CREATE TRIGGER IF NOT EXISTS trg_time_entries_rollup_delete
+        AFTER DELETE ON time_entries
+        BEGIN
+            UPDATE daily_worker_hours
+            SET minutes = minutes - OLD.duration_minutes, entry_count = entry_count - 1
+            WHERE worker_id = OLD.worker_id AND day = DATE(OLD.date);
+            DELETE FROM daily_worker_hours
+            WHERE worker_id = OLD.worker_id AND day = DATE(OLD.date) AND entry_count <= 0;
+        END
+    """)
+    db_service.execute_query("""
+        CREATE TRIGGER IF NOT EXISTS trg_time_entries_rollup_update
+        AFTER UPDATE OF worker_id, date, duration_minutes ON time_entries
+        BEGIN
+            UPDATE daily_worker_hours
+            SET minutes = minutes - OLD.duration_minutes, entry_count = entry_count - 1
+            WHERE worker_id = OLD.worker_id AND day = DATE(OLD.date);
+            DELETE FROM daily_worker_hours
+            WHERE worker_id = OLD.worker_id AND day = DATE(OLD.date) AND entry_count <= 0;
+            INSERT INTO daily_worker_hours (worker_id, day, minutes, entry_count)
+            VALUES (NEW.worker_id, DATE(NEW.date), NEW.duration_minutes, 1)
+            ON CONFLICT (worker_id, day) DO UPDATE SET
+                minutes = minutes + excluded.minutes,
+                entry_count = entry_count + 1;
+        END
+    """)
+
+
+def _create_daily_worker_hours(db_service) -> None:
+    """Rollup daily_worker_hours mit Triggern und initialer Befüllung"""
+    db_service.execute_query("""
+        CREATE TABLE IF NOT EXISTS daily_worker_hours (
+            worker_id INTEGER NOT NULL,
+            day TEXT NOT NULL,
+            minutes INTEGER NOT NULL DEFAULT 0,
+            entry_count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (worker_id, day)
+        )
+    """)
+    db_service.execute_query(
+        "CREATE INDEX IF NOT EXISTS idx_daily_worker_hours_day ON daily_worker_hours(day)"
+    )
+    
+    _create_rollup_triggers(db_service)
+    
+    db_service._fill_daily_worker_hours()
+
+
+def _normalize_time_entry_dates(db_service) -> None:
+    """time_entries.date auf YYYY-MM-DD normalisieren, Datums-Indizes anlegen"""
+    # Ältere Versionen speicherten time_entries.date als ISO-Timestamp
+    db_service.execute_query(
+        "UPDATE time_entries SET date = DATE(date) WHERE date != DATE(date)"
+    )
+    db_service.execute_query(
+        "CREATE INDEX IF NOT EXISTS idx_time_entries_date ON time_entries(date)"
+    )
+    db_service.execute_query(
+        "CREATE INDEX IF NOT EXISTS idx_capacities_end_date ON capacities(end_date)"
+    )
+
+
+def _move_orphaned_rows(db_service, table: str) -> int:
+    """
+    Verschiebt Zeilen ohne existierenden Worker in die orphaned_*-Tabelle
+    
+    Args:
+        db_service: DatabaseService
+        table: time_entries oder capacities
+    
+    Returns:
+        Anzahl verschobener Zeilen
+    """
+    orphan_filter = f"FROM {table} WHERE worker_id NOT IN (SELECT id FROM workers)"
+    with db_service.statement(f"SELECT COUNT(*) {orphan_filter}") as query:
+        count = query.value(0) if query.next() else 0
+    if not count:
+        return 0
+    
+    orphaned_table = ORPHANED_TABLES[table]
+    db_service.execute_query(
+        f"CREATE TABLE IF NOT EXISTS {orphaned_table} AS SELECT * FROM {table} WHERE 0"
+    )
+    db_service.execute_query(f"INSERT INTO {orphaned_table} SELECT * {orphan_filter}")
+    db_service.execute_query(f"DELETE {orphan_filter}")
+    return count
+
+
+def _add_cascade_delete(db_service) -> Optional[str]:
+    """
+    time_entries und capacities mit ON DELETE CASCADE neu aufbauen
+    
+    SQLite kann Foreign Keys nicht per ALTER TABLE ändern, daher:
+    neue Tabelle anlegen, Daten kopieren, alte Tabelle ersetzen,
+    Indizes und Trigger neu erstellen. Verwaiste Zeilen (Worker bereits
+    gelöscht) verletzen den Foreign Key und werden vorher unverändert
+    nach orphaned_time_entries bzw. orphaned_capacities verschoben.
+    """
+    moved = {table: _move_orphaned_rows(db_service, table) for table in ORPHANED_TABLES}
+    
+    db_service.execute_query("""
+        CREATE TABLE time_entries_new (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            worker_id INTEGER NOT NULL,
+            date DATE NOT NULL,
+            duration_minutes INTEGER NOT NULL,
+            description TEXT NOT NULL,
+            project TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (worker_id) REFERENCES workers(id) ON DELETE CASCADE
+        )
+    """)
+    db_service.execute_query("""
+        INSERT INTO time_entries_new
+            (id, worker_id, date, duration_minutes, description, project, created_at, updated_at)
+        SELECT id, worker_id, date, duration_minutes, description, project, created_at, updated_at
+        FROM time_entries
+    """)
+    db_service.execute_query("DROP TABLE time_entries")
+    db_service.execute_query("ALTER TABLE time_entries_new RENAME TO time_entries")
+    
+    db_service.execute_query("""
+        CREATE TABLE capacities_new (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            worker_id INTEGER NOT NULL,
+            start_date DATE NOT NULL,
+            end_date DATE NOT NULL,
+            planned_hours REAL NOT NULL,
+            notes TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (worker_id) REFERENCES workers(id) ON DELETE CASCADE
+        )
+    """)
+    db_service.execute_query("""
+        INSERT INTO capacities_new
+            (id, worker_id, start_date, end_date, planned_hours, notes, created_at)
+        SELECT id, worker_id, start_date, end_date, planned_hours, notes, created_at
+        FROM capacities
+    """)
+    db_service.execute_query("DROP TABLE capacities")
+    db_service.execute_query("ALTER TABLE capacities_new RENAME TO capacities")
+    
+    # DROP TABLE entfernt auch Indizes und Trigger
+    for index_sql in (
+        "CREATE INDEX IF NOT EXISTS idx_time_entries_worker ON time_entries(worker_id, date)",
+        "CREATE INDEX IF NOT EXISTS idx_time_entries_date ON time_entries(date)",
+        "CREATE INDEX IF NOT EXISTS idx_capacities_worker ON capacities(worker_id, start_date, end_date)",
+        "CREATE INDEX IF NOT EXISTS idx_capacities_end_date ON capacities(end_date)",
+    ):
+        db_service.execute_query(index_sql)
+    
+    _create_rollup_triggers(db_service)
+    db_service._fill_daily_worker_hours()
+    
+    if not any(moved.values()):
+        return None
+    return ", ".join(
+        f"{count} verwaiste Zeilen aus {table} nach {ORPHANED_TABLES[table]} verschoben"
+        for table, count in moved.items() if count
+    )
+
+
+def _create_timer_journal(db_service) -> None:
+    """Append-only Journal für Timer-Ereignisse (Wiederherstellung nach Absturz)"""
+    db_service.execute_query("""
+        CREATE TABLE IF NOT EXISTS timer_journal (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            entry_id INTEGER NOT NULL,
+            event TEXT NOT NULL CHECK (event IN ('start', 'stop')),
+            at TIMESTAMP NOT NULL,
+            seconds INTEGER NOT NULL,
+            FOREIGN KEY (entry_id) REFERENCES time_entries(id) ON DELETE CASCADE
+        )
+    """)
+    db_service.execute_query(
+        "CREATE INDEX IF NOT EXISTS idx_timer_journal_entry ON timer_journal(entry_id, id)"
+    )
+
+
+def _has_fts5(db_service) -> bool:
+    """True wenn die SQLite-Version mit FTS5 gebaut ist"""
+    with db_service.statement("SELECT sqlite_compileoption_used('ENABLE_FTS5')") as query:
+        return bool(query.next() and query.value(0))
+
+
+def _create_time_entries_fts(db_service) -> Optional[str]:
+    """
+    Migrationsschritt für den Volltextindex (siehe ensure_time_entries_fts)
+    
+    Ohne FTS5 wird die Version trotzdem eingetragen; der Index wird dann
+    von TimeEntryRepository.supports_search nachträglich angelegt, sobald
+    die SQLite-Version FTS5 unterstützt.
+    """
+    if not ensure_time_entries_fts(db_service):
+        return "SQLite ohne FTS5: Volltextsuche nicht verfügbar, Suche lädt den Zeitraum in den Speicher"
+    return None
+
+
+def ensure_time_entries_fts(db_service) -> bool:
+    """
+    Legt den FTS5-Volltextindex über time_entries.description und project an
+    
+    External-Content-Tabelle: der Index speichert nur Tokens, die Texte
+    bleiben in time_entries. Trigger halten ihn synchron, 'rebuild'
+    indiziert bestehende Einträge. prefix='2 3' legt Präfix-Indizes für
+    kurze Präfix-Suchen (z.B. "re*") an. Idempotent; die Transaktion
+    verwaltet der Aufrufer.
+    
+    Args:
+        db_service: DatabaseService-Instanz
+        
+    Returns:
+        False wenn die SQLite-Version kein FTS5 unterstützt
+    """
+    if not _has_fts5(db_service):
+        return False
+    
+    db_service.execute_query("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS time_entries_fts USING fts5(
+            description,
+            project,
+            content='time_entries',
+            content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2',
+            prefix='2 3'
+        )
+    """)
+    db_service.execute_query("""
+        CREATE TRIGGER IF NOT EXISTS trg_time_entries_fts_insert
+        AFTER INSERT ON time_entries
+        BEGIN
+            INSERT INTO time_entries_fts (rowid, description, project)
+            VALUES (NEW.id, NEW.description, NEW.project);
+        END
+    """)
+    db_service.execute_query("""
+        CREATE TRIGGER IF NOT EXISTS trg_time_entries_fts_delete
+        AFTER DELETE ON time_entries
+        BEGIN
+            INSERT INTO time_entries_fts (time_entries_fts, rowid, description, project)
+            VALUES ('delete', OLD.id, OLD.description, OLD.project);
+        END
+    """)
+    db_service.execute_query("""
+        CREATE TRIGGER IF NOT EXISTS trg_time_entries_fts_update
+        AFTER UPDATE OF description, project ON time_entries
+        BEGIN
+            INSERT INTO time_entries_fts (time_entries_fts, rowid, description, project)
+            VALUES ('delete', OLD.id, OLD.description, OLD.project);
+            INSERT INTO time_entries_fts (rowid, description, project)
+            VALUES (NEW.id, NEW.description, NEW.project);
+        END
+    """)
+    db_service.execute_query("INSERT INTO time_entries_fts (time_entries_fts) VALUES ('rebuild')")
+    return True
+
+
+# Basis-Schema (Version 1) legt DatabaseService._create_schema an
+MIGRATIONS: List[Migration] = [
+    Migration(2, "data_keys für Envelope-Verschlüsselung", _create_data_keys),
+    Migration(3, "Email-Blind-Index für workers", _add_email_blind_index),
+    Migration(4, "Rollup daily_worker_hours", _create_daily_worker_hours),
+    Migration(5, "time_entries.date normalisieren und indizieren", _normalize_time_entry_dates),
+    Migration(6, "ON DELETE CASCADE für time_entries und capacities", _add_cascade_delete),
+    Migration(7, "Timer-Journal", _create_timer_journal),
+    Migration(8, "FTS5-Volltextindex für time_entries", _create_time_entries_fts),
+]
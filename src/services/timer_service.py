@@ -0,0 +1,273 @@
+"""
+Timer Service
+Zentrale Verwaltung laufender Zeiterfassungs-Timer mit gemeinsamem Takt
+"""
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from PySide6.QtCore import QObject, QTimer, Qt, Signal
+
+
+class TimerService(QObject):
+    """
+    Hält den Zustand aller laufenden Timer, unabhängig von Widgets
+    
+    Timer sind nach Entry-ID geschlüsselt. Tabellen-Refresh, Blättern
+    oder Tab-Wechsel verwerfen nur die Darstellung; der Timer läuft im
+    Service weiter und wird von der nächsten Ansicht wieder angezeigt.
+    
+    Ein einziger QTimer liefert den Takt für alle Anzeigen (ticked) und
+    läuft nur, solange mindestens ein Timer aktiv ist. Die Anzeigen
+    entscheiden selbst, welche sichtbaren Zellen sie neu zeichnen.
+    
+    Mit angehängtem Journal (attach_journal) wird jedes Starten und
+    Stoppen sofort in timer_journal geschrieben und beim nächsten
+    Programmstart abgespielt: laufende Timer laufen weiter, gestoppte
+    Dauern gehen auch nach einem Absturz nicht verloren. Die Dauern
+    gestoppter Timer schreibt flush() gebündelt in einer Transaktion
+    nach time_entries (spätestens FLUSH_DELAY_MS nach dem ersten Stopp).
+    
+    Ohne Journal bleibt das Speichern beim Aufrufer: stop() liefert die
+    Gesamt-Sekunden, der Aufrufer schreibt sie in den TimeEntry.
+    
+    Signals:
+        ticked: Gemeinsamer Sekundentakt, solange ein Timer läuft
+        timer_changed: Timer wurde gestartet oder gestoppt (entry_id)
+    
+    Beispiel:
+        >>> timers = TimerService.shared()
+        >>> timers.start(entry.id, entry.duration_minutes * 60)
+        >>> minutes = timers.stop(entry.id) // 60
+    """
+    
+    ticked = Signal()
+    timer_changed = Signal(int)
+    
+    TICK_INTERVAL_MS = 1000
+    
+    # Sammelzeitraum für gestoppte Dauern vor dem Schreiben nach time_entries
+    FLUSH_DELAY_MS = 5000
+    
+    _shared: Optional["TimerService"] = None
+    
+    def __init__(self, parent: Optional[QObject] = None):
+        """
+        Initialisiert TimerService ohne laufende Timer
+        
+        Args:
+            parent: Optional parent QObject
+        """
+        super().__init__(parent)
+        # entry_id -> (Startzeit, Sekunden beim Start)
+        self._running: Dict[int, Tuple[datetime, int]] = {}
+        
+        self._tick = QTimer(self)
+        self._tick.setInterval(self.TICK_INTERVAL_MS)
+        # Präziser Takt, damit jede Anzeige pro Tick eine Sekunde weiterspringt
+        self._tick.setTimerType(Qt.PreciseTimer)
+        self._tick.timeout.connect(self.ticked)
+        
+        self._journal = None
+        self._time_entry_repository = None
+        # entry_id -> (Minuten, Journal-ID des Stopps) noch nicht gespeicherter Dauern
+        self._pending: Dict[int, Tuple[int, int]] = {}
+        
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_DELAY_MS)
+        self._flush_timer.timeout.connect(self.flush)
+    
+    @classmethod
+    def shared(cls) -> "TimerService":
+        """
+        Gemeinsame Instanz für die gesamte Anwendung
+        
+        Returns:
+            TimerService (wird beim ersten Aufruf erzeugt)
+        """
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+    
+    def attach_journal(self, journal, time_entry_repository) -> List[int]:
+        """
+        Hängt das Timer-Journal an und spielt es ab
+        
+        Das jeweils letzte Ereignis pro Eintrag entscheidet: ein Start
+        stellt den laufenden Timer mit ursprünglicher Startzeit wieder
+        her, ein Stopp ohne späteren Start wird zum Speichern vorgemerkt.
+        
+        Args:
+            journal: TimerJournalRepository
+            time_entry_repository: Ziel für flush()
+        
+        Returns:
+            IDs der wiederhergestellten laufenden Timer
+        """
+        self._journal = journal
+        self._time_entry_repository = time_entry_repository
+        
+        running: Dict[int, Tuple[datetime, int]] = {}
+        for journal_id, entry_id, event, at, seconds in journal.load():
+            if event == journal.EVENT_START:
+                running[entry_id] = (at, seconds)
+            else:
+                running.pop(entry_id, None)
+                self._pending[entry_id] = (seconds // 60, journal_id)
+        
+        changed = set(running) | set(self._running)
+        self._running = running
+        if running:
+            self._tick.start()
+        else:
+            self._tick.stop()
+        for entry_id in changed:
+            self.timer_changed.emit(entry_id)
+        
+        if self._pending:
+            self._flush_timer.start()
+        return list(running)
+    
+    def has_journal(self) -> bool:
+        """True wenn gestoppte Dauern über Journal und flush() gespeichert werden"""
+        return self._journal is not None
+    
+    def pending_minutes(self, entry_id: int) -> Optional[int]:
+        """Gestoppte, noch nicht nach time_entries geschriebene Dauer oder None"""
+        pending = self._pending.get(entry_id)
+        return pending[0] if pending else None
+    
+    def flush(self) -> int:
+        """
+        Schreibt alle vorgemerkten Dauern in einer Transaktion nach time_entries
+        
+        Die zugehörigen Journal-Ereignisse werden in derselben Transaktion
+        entfernt. Schlägt das Schreiben fehl, bleiben die Dauern vorgemerkt
+        und werden nach FLUSH_DELAY_MS erneut versucht.
+        
+        Returns:
+            Anzahl geschriebener Einträge
+        """
+        self._flush_timer.stop()
+        if not self._pending or self._journal is None:
+            return 0
+        
+        pending = self._pending
+        self._pending = {}
+        try:
+            with self._journal.unit_of_work():
+                self._time_entry_repository.update_durations(
+                    {entry_id: minutes for entry_id, (minutes, _) in pending.items()}
+                )
+                self._journal.clear_until(
+                    [(entry_id, journal_id) for entry_id, (_, journal_id) in pending.items()]
+                )
+        except Exception:
+            # Neuere Stopps derselben Einträge haben Vorrang
+            pending.update(self._pending)
+            self._pending = pending
+            self._flush_timer.start()
+            raise
+        return len(pending)
+    
+    def is_running(self, entry_id: int) -> bool:
+        """True wenn der Timer des Eintrags läuft"""
+        return entry_id in self._running
+    
+    def running_ids(self) -> List[int]:
+        """IDs aller Einträge mit laufendem Timer"""
+        return list(self._running)
+    
+    def started_at(self, entry_id: int) -> Optional[datetime]:
+        """Startzeit eines laufenden Timers oder None"""
+        running = self._running.get(entry_id)
+        return running[0] if running else None
+    
+    def seconds(self, entry_id: int) -> Optional[int]:
+        """
+        Aktuelle Gesamt-Sekunden eines laufenden Timers
+        
+        Args:
+            entry_id: ID des Eintrags
+        
+        Returns:
+            Sekunden inkl. Stand beim Start oder None, wenn kein Timer läuft
+        """
+        running = self._running.get(entry_id)
+        if running is None:
+            return None
+        start_time, base_seconds = running
+        return base_seconds + int((datetime.now() - start_time).total_seconds())
+    
+    def start(self, entry_id: int, base_seconds: int = 0) -> bool:
+        """
+        Startet Timer eines Eintrags
+        
+        Eine gestoppte, noch nicht gespeicherte Dauer (pending_minutes)
+        ist neuer als der Stand in time_entries und ersetzt base_seconds.
+        
+        Args:
+            entry_id: ID des Eintrags
+            base_seconds: Bereits erfasste Sekunden (Stand in time_entries)
+        
+        Returns:
+            True wenn gestartet, False wenn der Timer bereits lief
+        """
+        if entry_id in self._running:
+            return False
+        pending_minutes = self.pending_minutes(entry_id)
+        if pending_minutes is not None:
+            base_seconds = pending_minutes * 60
+        start_time = datetime.now()
+        if self._journal is not None:
+            self._journal.append(entry_id, self._journal.EVENT_START, start_time, base_seconds)
+        self._running[entry_id] = (start_time, base_seconds)
+        if not self._tick.isActive():
+            self._tick.start()
+        self.timer_changed.emit(entry_id)
+        return True
+    
+    def stop(self, entry_id: int) -> Optional[int]:
+        """
+        Stoppt Timer eines Eintrags
+        
+        Args:
+            entry_id: ID des Eintrags
+        
+        Returns:
+            Gesamt-Sekunden oder None, wenn kein Timer lief
+        """
+        seconds = self.seconds(entry_id)
+        if seconds is None:
+            return None
+        
+        if self._journal is not None:
+            journal_id = self._journal.append(
+                entry_id, self._journal.EVENT_STOP, datetime.now(), seconds
+            )
+            self._pending[entry_id] = (seconds // 60, journal_id)
+            # Erster Stopp öffnet das Sammelfenster, weitere schließen sich an
+            if not self._flush_timer.isActive():
+                self._flush_timer.start()
+        
+        self._remove(entry_id)
+        return seconds
+    
+    def discard(self, entry_id: int) -> None:
+        """
+        Verwirft Timer eines Eintrags ohne Ergebnis (z.B. nach Löschen)
+        
+        Args:
+            entry_id: ID des Eintrags
+        """
+        self._pending.pop(entry_id, None)
+        if self._journal is not None:
+            self._journal.clear(entry_id)
+        self._remove(entry_id)
+    
+    def _remove(self, entry_id: int) -> None:
+        """Entfernt laufenden Timer und hält den Takt an, wenn keiner mehr läuft"""
+        if self._running.pop(entry_id, None) is None:
+            return
+        if not self._running:
+            self._tick.stop()
+        self.timer_changed.emit(entry_id)
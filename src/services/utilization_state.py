@@ -0,0 +1,190 @@
+"""
+Utilization State
+Inkrementell gepflegte Auslastung pro Worker für einen festen Zeitraum
+"""
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from ..models.time_entry import TimeEntry
+from .analytics_service import AnalyticsService
+
+
+class UtilizationState:
+    """
+    Laufende Ist-/Plan-Summen pro Worker und für den gesamten Zeitraum
+    
+    Wird einmal aus calculate_team_utilization geladen und danach nur
+    noch mit Deltas einzelner Schreibvorgänge fortgeschrieben:
+    - apply_entry: alter/neuer Zustand eines TimeEntry (Anlegen, Ändern, Löschen)
+    - apply_capacity: Capacity aus dem CapacityIndex neu einrechnen
+    
+    Jede Änderung betrifft höchstens zwei Worker; deren Zeilen und die
+    Gesamtsummen (geplant, gearbeitet, Summe der Auslastungsprozente)
+    werden in O(1) bzw. O(log n) über den Intervallbaum angepasst.
+    
+    Tage sind Ordinalzahlen (date.toordinal()), Grenzen inklusive.
+    
+    Beispiel:
+        >>> state = UtilizationState(start, end, capacity_repository.load_index())
+        >>> state.load(analytics.calculate_team_utilization(start, end, worker_ids))
+        >>> state.apply_entry(None, new_entry)
+        [3]
+    """
+    
+    def __init__(self, start_date: datetime, end_date: datetime, capacity_index=None):
+        """
+        Initialisiert leeren Zustand
+        
+        Args:
+            start_date: Erster Tag des Zeitraums
+            end_date: Letzter Tag des Zeitraums
+            capacity_index: Geladener CapacityIndex (für apply_capacity)
+        """
+        self.first_day = start_date.toordinal()
+        self.last_day = end_date.toordinal()
+        self._capacity_index = capacity_index
+        self._minutes: Dict[int, int] = {}
+        self._planned: Dict[int, float] = {}
+        self._rows: Dict[int, Dict[str, float]] = {}
+        # capacity_id -> worker_id aller Capacities, die in den Zeitraum fallen
+        self._capacity_workers: Dict[int, int] = {}
+        self._total_minutes = 0
+        self._total_planned = 0.0
+        self._utilization_sum = 0.0
+    
+    def load(self, team: Dict[int, Tuple[float, float]]) -> None:
+        """
+        Übernimmt Ergebnis einer vollständigen Berechnung
+        
+        Args:
+            team: Dict worker_id -> (hours_worked, hours_planned)
+        """
+        self._minutes = {}
+        self._planned = {}
+        self._rows = {}
+        self._capacity_workers = {}
+        self._total_minutes = 0
+        self._total_planned = 0.0
+        self._utilization_sum = 0.0
+        
+        for worker_id, (hours_worked, hours_planned) in team.items():
+            self._minutes[worker_id] = round(hours_worked * 60)
+            self._planned[worker_id] = hours_planned
+            self._total_minutes += self._minutes[worker_id]
+            self._total_planned += hours_planned
+            self._store_row(worker_id)
+            
+            if self._capacity_index is not None:
+                for capacity_id, _, _, _ in self._capacity_index.overlapping(
+                    worker_id, self.first_day, self.last_day
+                ):
+                    self._capacity_workers[capacity_id] = worker_id
+    
+    def __contains__(self, worker_id: int) -> bool:
+        return worker_id in self._rows
+    
+    def __len__(self) -> int:
+        return len(self._rows)
+    
+    def row(self, worker_id: int) -> Dict[str, float]:
+        """
+        Auslastung eines Workers
+        
+        Args:
+            worker_id: Worker-ID
+        
+        Returns:
+            Dict mit hours_worked, hours_planned, utilization_percent
+        """
+        return self._rows[worker_id]
+    
+    def rows(self) -> Dict[int, Dict[str, float]]:
+        """Auslastung aller Worker (worker_id -> Dict wie row)"""
+        return dict(self._rows)
+    
+    def totals(self) -> Tuple[float, float, float]:
+        """
+        Gesamtsummen des Zeitraums
+        
+        Returns:
+            Tupel (hours_planned, hours_worked, durchschnittliche Auslastung in %)
+        """
+        average = self._utilization_sum / len(self._rows) if self._rows else 0.0
+        return self._total_planned, self._total_minutes / 60.0, average
+    
+    def apply_entry(self, old: Optional[TimeEntry], new: Optional[TimeEntry]) -> List[int]:
+        """
+        Schreibt Änderung eines TimeEntry fort
+        
+        Args:
+            old: Zustand vor der Änderung (None beim Anlegen)
+            new: Zustand nach der Änderung (None beim Löschen)
+        
+        Returns:
+            IDs der Worker, deren Zeile sich geändert hat
+        """
+        deltas: Dict[int, int] = {}
+        for entry, sign in ((old, -1), (new, 1)):
+            if entry is None or entry.worker_id not in self._rows:
+                continue
+            if self.first_day <= entry.date.toordinal() <= self.last_day:
+                deltas[entry.worker_id] = deltas.get(entry.worker_id, 0) + sign * entry.duration_minutes
+        
+        changed = []
+        for worker_id, delta in deltas.items():
+            if delta:
+                self._minutes[worker_id] += delta
+                self._total_minutes += delta
+                self._store_row(worker_id)
+                changed.append(worker_id)
+        return changed
+    
+    def apply_capacity(self, capacity_id: int) -> List[int]:
+        """
+        Rechnet eine angelegte, geänderte oder gelöschte Capacity neu ein
+        
+        Der CapacityIndex muss den Schreibvorgang bereits enthalten
+        (Write-Through im CapacityRepository). Betroffen sind der
+        bisherige und der neue Worker der Capacity.
+        
+        Args:
+            capacity_id: ID der Capacity
+        
+        Returns:
+            IDs der Worker, deren Zeile sich geändert hat
+        """
+        if self._capacity_index is None:
+            return []
+        
+        affected = []
+        previous = self._capacity_workers.pop(capacity_id, None)
+        if previous is not None:
+            affected.append(previous)
+        
+        capacity = self._capacity_index.get(capacity_id)
+        if capacity is not None:
+            worker_id, start_day, end_day, _ = capacity
+            if start_day <= self.last_day and end_day >= self.first_day and start_day <= end_day:
+                self._capacity_workers[capacity_id] = worker_id
+                if worker_id not in affected:
+                    affected.append(worker_id)
+        
+        changed = []
+        for worker_id in affected:
+            if worker_id not in self._rows:
+                continue
+            hours = self._capacity_index.planned_hours(worker_id, self.first_day, self.last_day) or 0.0
+            self._total_planned += hours - self._planned[worker_id]
+            self._planned[worker_id] = hours
+            self._store_row(worker_id)
+            changed.append(worker_id)
+        return changed
+    
+    def _store_row(self, worker_id: int) -> None:
+        """Baut Zeile eines Workers neu und pflegt die Summe der Auslastungen"""
+        previous = self._rows.get(worker_id)
+        if previous is not None:
+            self._utilization_sum -= previous["utilization_percent"]
+        
+        row = AnalyticsService.build_utilization(self._minutes[worker_id] / 60.0, self._planned[worker_id])
+        self._rows[worker_id] = row
+        self._utilization_sum += row["utilization_percent"]
@@ -0,0 +1,122 @@
+"""
+Interval Tree
+Zentrierter Intervallbaum für Überlappungsabfragen auf geschlossenen Intervallen
+"""
+from typing import Generic, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+
+
+class _Node:
+    """Knoten: alle Intervalle, die center enthalten, doppelt sortiert"""
+    
+    __slots__ = ("center", "by_start", "by_end", "left", "right")
+    
+    def __init__(self, center, by_start, by_end, left, right):
+        self.center = center
+        self.by_start = by_start
+        self.by_end = by_end
+        self.left = left
+        self.right = right
+
+
+class IntervalTree(Generic[T]):
+    """
+    Statischer Intervallbaum über Tupeln (start, end, value)
+    
+    Jeder Knoten hält die Intervalle, die seinen Mittelpunkt enthalten,
+    einmal nach Start aufsteigend und einmal nach Ende absteigend
+    sortiert. Eine Abfrage [a, b] läuft einen Pfad der Tiefe O(log n)
+    ab und liest pro Knoten nur Treffer - insgesamt O(log n + k).
+    
+    Änderungen erfordern einen Neuaufbau (O(n log n)); Aufrufer mit
+    Schreibzugriffen bauen den Baum lazy beim nächsten Lesen neu.
+    
+    Beispiel:
+        >>> tree = IntervalTree([(1, 5, "a"), (4, 9, "b")])
+        >>> sorted(value for _, _, value in tree.overlapping(5, 6))
+        ['a', 'b']
+    """
+    
+    __slots__ = ("_root", "_size")
+    
+    def __init__(self, intervals: Iterable[Tuple[int, int, T]] = ()):
+        """
+        Baut Baum auf
+        
+        Args:
+            intervals: Tupel (start, end, value), Grenzen inklusive;
+                Intervalle mit end < start werden ignoriert
+        """
+        items = [interval for interval in intervals if interval[0] <= interval[1]]
+        self._size = len(items)
+        self._root = self._build(items)
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    @classmethod
+    def _build(cls, items: List[Tuple[int, int, T]]) -> Optional[_Node]:
+        """Baut Teilbaum um den Median aller Endpunkte"""
+        if not items:
+            return None
+        
+        endpoints = sorted([interval[0] for interval in items] + [interval[1] for interval in items])
+        center = endpoints[len(endpoints) // 2]
+        
+        left, right, middle = [], [], []
+        for interval in items:
+            if interval[1] < center:
+                left.append(interval)
+            elif interval[0] > center:
+                right.append(interval)
+            else:
+                middle.append(interval)
+        
+        return _Node(
+            center,
+            sorted(middle, key=lambda interval: interval[0]),
+            sorted(middle, key=lambda interval: interval[1], reverse=True),
+            cls._build(left),
+            cls._build(right)
+        )
+    
+    def overlapping(self, start: int, end: int) -> Iterator[Tuple[int, int, T]]:
+        """
+        Liefert alle Intervalle, die [start, end] schneiden
+        
+        Args:
+            start: Beginn des Abfragebereichs (inklusive)
+            end: Ende des Abfragebereichs (inklusive)
+        
+        Yields:
+            Tupel (start, end, value) in unbestimmter Reihenfolge
+        """
+        if start > end:
+            return
+        
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            
+            if end < node.center:
+                # Alle Intervalle enden nach end - Treffer, solange sie vor end beginnen
+                for interval in node.by_start:
+                    if interval[0] > end:
+                        break
+                    yield interval
+                stack.append(node.left)
+            elif start > node.center:
+                # Alle Intervalle beginnen vor start - Treffer, solange sie nach start enden
+                for interval in node.by_end:
+                    if interval[1] < start:
+                        break
+                    yield interval
+                stack.append(node.right)
+            else:
+                # Mittelpunkt liegt im Bereich: jedes Intervall des Knotens trifft
+                yield from node.by_start
+                stack.append(node.left)
+                stack.append(node.right)
@@ -0,0 +1,336 @@
+"""
+Search Index
+Vorberechnete Suchschlüssel für die Teilstring-Suche in Tabellen
+"""
+from array import array
+from bisect import bisect_right
+from itertools import compress
+from operator import or_
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - abhängig von der Installation
+    np = None
+
+HAS_NUMPY = np is not None
+
+
+class _FieldValues:
+    """
+    Verschiedene Werte eines Suchfelds mit Code pro Wert
+    
+    Die Werte liegen zusätzlich als ein zusammenhängender String vor,
+    getrennt durch ein Steuerzeichen, das in Suchtexten nicht vorkommt.
+    str.find läuft so einmal in C über alle Werte, statt jeden Wert
+    einzeln zu prüfen. Neue Werte werden einzeln geprüft, bis es mehr
+    als MAX_TAIL sind und der String neu aufgebaut wird.
+    """
+    
+    SEPARATOR = "\x1f"
+    MAX_TAIL = 1024
+    
+    def __init__(self):
+        self.values: List[str] = [""]
+        self.codes: Dict[str, int] = {"": 0}
+        self._joined = ""
+        self._starts: List[int] = []
+        self._joined_count = 0
+    
+    def __len__(self) -> int:
+        return len(self.values)
+    
+    def code(self, text: str) -> int:
+        """Code eines Werts (neue Werte werden angehängt)"""
+        code = self.codes.get(text)
+        if code is None:
+            code = len(self.values)
+            self.codes[text] = code
+            self.values.append(text)
+        return code
+    
+    def matching(self, text: str, candidates: Optional[List[int]] = None) -> List[int]:
+        """
+        Codes aller Werte, die den Text enthalten
+        
+        Args:
+            text: Kleingeschriebener Suchtext
+            candidates: Nur diese Codes prüfen (Verfeinerung einer vorherigen Suche)
+        
+        Returns:
+            Liste der passenden Codes
+        """
+        values = self.values
+        if candidates is not None:
+            return [code for code in candidates if text in values[code]]
+        
+        if len(values) - self._joined_count > self.MAX_TAIL:
+            self.join()
+        
+        matches = self._find_joined(text)
+        if matches is None:
+            # Viele Treffer: Einzelprüfung ist billiger als find + bisect pro Treffer
+            matches = [code for code in range(self._joined_count) if text in values[code]]
+        matches.extend(
+            code for code in range(self._joined_count, len(values)) if text in values[code]
+        )
+        return matches
+    
+    def join(self) -> None:
+        """Baut den zusammenhängenden String aus allen Werten neu auf"""
+        self._joined_count = len(self.values)
+        self._joined = self.SEPARATOR.join(self.values)
+        self._starts = []
+        offset = 0
+        for value in self.values:
+            self._starts.append(offset)
+            offset += len(value) + 1
+    
+    def _find_joined(self, text: str) -> Optional[List[int]]:
+        """Treffer im zusammenhängenden String oder None bei sehr vielen Treffern"""
+        joined, starts, count = self._joined, self._starts, self._joined_count
+        if joined.count(text) > count // 32 + 16:
+            return None
+        
+        matches = []
+        position = joined.find(text)
+        while position != -1:
+            code = bisect_right(starts, position) - 1
+            matches.append(code)
+            if code + 1 >= count:
+                break
+            # Weitere Treffer im selben Wert überspringen
+            position = joined.find(text, starts[code + 1])
+        return matches
+
+
+class SearchIndex:
+    """
+    Teilstring-Suche über feste Textfelder vieler Einträge
+    
+    Die Suchfelder jedes Eintrags werden einmal kleingeschrieben berechnet
+    (fields). Pro Feld wird jeder verschiedene Wert nur einmal gespeichert
+    und durchsucht - Datum, Worker und Projekt wiederholen sich stark -
+    und die Treffer über eine Code-Spalte (ein int pro Eintrag und Feld)
+    auf die Einträge übertragen, mit NumPy als Array-Lookup.
+    
+    Verlängert ein Suchtext den vorherigen (Tippen), werden nur die zuvor
+    passenden und seither neuen Werte erneut geprüft.
+    
+    add/update/remove arbeiten inkrementell (Binärsuche für die Position,
+    keine Neuberechnung anderer Einträge). Werte, die kein Eintrag mehr
+    nutzt, bleiben bis zum nächsten build() in den Wertelisten.
+    
+    Beispiel:
+        >>> index = SearchIndex(lambda e: (e.project or "", e.description), key=lambda e: e.date)
+        >>> index.build(entries)
+        >>> index.query("meeting")
+    """
+    
+    def __init__(
+        self,
+        fields: Callable[[Any], Sequence[str]],
+        key: Optional[Callable[[Any], Any]] = None,
+        reverse: bool = False
+    ):
+        """
+        Initialisiert leeren Index
+        
+        Args:
+            fields: Liefert die durchsuchbaren Texte eines Eintrags
+            key: Sortierschlüssel der Ergebnisreihenfolge (None: Einfügereihenfolge)
+            reverse: Absteigend nach key sortieren
+        """
+        self._fields = fields
+        self._key = key
+        self._reverse = reverse
+        self.build([])
+    
+    def build(self, entries: Sequence) -> None:
+        """
+        Baut den Index komplett neu auf
+        
+        Args:
+            entries: Einträge mit id (werden nach key sortiert, falls angegeben)
+        """
+        self._entries: List = list(entries)
+        if self._key is not None:
+            self._entries.sort(key=self._key, reverse=self._reverse)
+        
+        self._ids = array("q", [entry.id for entry in self._entries])
+        self._values: List[_FieldValues] = []
+        self._codes: List[array] = []
+        self._last_text: Optional[str] = None
+        self._last_matches: List[List[int]] = []
+        self._last_value_counts: List[int] = []
+        
+        for entry in self._entries:
+            for field, code in enumerate(self._entry_codes(entry)):
+                self._codes[field].append(code)
+        for values in self._values:
+            values.join()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def __contains__(self, entry_id: int) -> bool:
+        return self._position(entry_id) is not None
+    
+    def entries(self) -> List:
+        """Alle Einträge in Ergebnisreihenfolge"""
+        return list(self._entries)
+    
+    def add(self, entry) -> None:
+        """
+        Fügt einen Eintrag an seiner Sortierposition ein
+        
+        Args:
+            entry: Neuer Eintrag (mit id)
+        """
+        position = self._insert_position(entry)
+        codes = self._entry_codes(entry)
+        self._entries.insert(position, entry)
+        self._ids.insert(position, entry.id)
+        for field, code in enumerate(codes):
+            self._codes[field].insert(position, code)
+    
+    def update(self, entry) -> None:
+        """
+        Ersetzt einen Eintrag (gleiche id) und berechnet nur dessen Felder neu
+        
+        Args:
+            entry: Geänderter Eintrag (unbekannte Einträge werden eingefügt)
+        """
+        position = self._position(entry.id)
+        if position is None:
+            self.add(entry)
+            return
+        
+        if self._key is not None and self._key(entry) != self._key(self._entries[position]):
+            self.remove(entry.id)
+            self.add(entry)
+            return
+        
+        self._entries[position] = entry
+        for field, code in enumerate(self._entry_codes(entry)):
+            self._codes[field][position] = code
+    
+    def remove(self, entry_id: int) -> None:
+        """
+        Entfernt einen Eintrag
+        
+        Args:
+            entry_id: ID des Eintrags
+        """
+        position = self._position(entry_id)
+        if position is None:
+            return
+        del self._entries[position]
+        del self._ids[position]
+        for codes in self._codes:
+            del codes[position]
+    
+    def query(self, text: str) -> List:
+        """
+        Sucht Einträge, bei denen ein Feld den Text enthält (ohne Groß-/Kleinschreibung)
+        
+        Args:
+            text: Suchtext
+        
+        Returns:
+            Passende Einträge in Ergebnisreihenfolge (alle bei leerem Text)
+        """
+        text = text.lower()
+        if not text:
+            self._last_text = None
+            return self.entries()
+        
+        refining = self._last_text is not None and self._last_text in text
+        matches = []
+        for field, values in enumerate(self._values):
+            candidates = None
+            if refining and field < len(self._last_matches):
+                # Verfeinerung: nur bisherige Treffer und seither neue Werte prüfen
+                candidates = self._last_matches[field] + list(
+                    range(self._last_value_counts[field], len(values))
+                )
+            matches.append(values.matching(text, candidates))
+        
+        self._last_text = text
+        self._last_matches = matches
+        self._last_value_counts = [len(values) for values in self._values]
+        
+        if not any(matches):
+            return []
+        if HAS_NUMPY:
+            return self._collect_numpy(matches)
+        return self._collect_python(matches)
+    
+    # ===== Hilfsmethoden =====
+    
+    def _entry_codes(self, entry) -> List[int]:
+        """Codes der kleingeschriebenen Suchfelder eines Eintrags"""
+        texts = [text.lower() for text in self._fields(entry)]
+        
+        while len(self._values) < len(texts):
+            # Neues Feld: bereits gespeicherte Zeilen bekommen den Leerwert (Code 0)
+            rows = len(self._codes[0]) if self._codes else 0
+            self._values.append(_FieldValues())
+            self._codes.append(array("i", bytes(rows * array("i").itemsize)))
+        
+        return [values.code(text) for values, text in zip(self._values, texts)]
+    
+    def _position(self, entry_id: int) -> Optional[int]:
+        """Position eines Eintrags (lineare Suche in C über die ID-Spalte)"""
+        if HAS_NUMPY:
+            positions = np.flatnonzero(np.frombuffer(self._ids, dtype=np.int64) == entry_id)
+            return int(positions[0]) if len(positions) else None
+        try:
+            return self._ids.index(entry_id)
+        except ValueError:
+            return None
+    
+    def _insert_position(self, entry) -> int:
+        """Position hinter allen Einträgen mit gleichem oder vorrangigem Schlüssel"""
+        if self._key is None:
+            return len(self._entries)
+        
+        key = self._key(entry)
+        low, high = 0, len(self._entries)
+        while low < high:
+            middle = (low + high) // 2
+            other = self._key(self._entries[middle])
+            if (other >= key) if self._reverse else (other <= key):
+                low = middle + 1
+            else:
+                high = middle
+        return low
+    
+    def _collect_numpy(self, matches: List[List[int]]) -> List:
+        """Einträge mit mindestens einem passenden Feld (NumPy-Lookup)"""
+        hits = np.zeros(len(self._entries), dtype=bool)
+        for values, codes, matched in zip(self._values, self._codes, matches):
+            if not matched:
+                continue
+            lookup = np.zeros(len(values), dtype=bool)
+            lookup[matched] = True
+            hits |= lookup[np.frombuffer(codes, dtype=np.intc)]
+        
+        positions = np.flatnonzero(hits)
+        if len(positions) * 8 < len(hits):
+            entries = self._entries
+            return [entries[position] for position in positions.tolist()]
+        return list(compress(self._entries, hits.tolist()))
+    
+    def _collect_python(self, matches: List[List[int]]) -> List:
+        """Einträge mit mindestens einem passenden Feld (reines Python)"""
+        hits = None
+        for values, codes, matched in zip(self._values, self._codes, matches):
+            if not matched:
+                continue
+            lookup = bytearray(len(values))
+            for code in matched:
+                lookup[code] = 1
+            field_hits = map(lookup.__getitem__, codes)
+            hits = field_hits if hits is None else map(or_, hits, field_hits)
+        return list(compress(self._entries, hits))
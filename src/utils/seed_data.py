@@ -180,18 +180,16 @@ def seed_database(db_service, crypto_service):
     }
     
     # Create Workers
-    for worker in get_sample_workers():
-        worker_id = worker_repo.create(worker)
-        created_ids["workers"].append(worker_id)
-        
-        # Create TimeEntries for this worker
-        for entry in get_sample_time_entries(worker_id):
-            entry_id = entry_repo.create(entry)
-            created_ids["time_entries"].append(entry_id)
-        
-        # Create Capacities for this worker
-        for capacity in get_sample_capacities(worker_id):
-            capacity_id = capacity_repo.create(capacity)
-            created_ids["capacities"].append(capacity_id)
+    created_ids["workers"] = worker_repo.create_many(get_sample_workers())
+    
+    # TimeEntries und Capacities gesammelt als Batch einfügen
+    entries = []
+    capacities = []
+    for worker_id in created_ids["workers"]:
+        entries.extend(get_sample_time_entries(worker_id))
+        capacities.extend(get_sample_capacities(worker_id))
+    
+    created_ids["time_entries"] = entry_repo.create_many(entries)
+    created_ids["capacities"] = capacity_repo.create_many(capacities)
     
     return created_ids
@@ -95,7 +95,7 @@ class WorkerViewModel(QObject):
             True wenn erfolgreich, False bei Fehler
         """
         # Validation
-        validation_error = self._validate_worker(name, email)
+        validation_error = self._validate_worker(name, email, worker_id)
         if validation_error:
             self.validation_failed.emit(validation_error)
             return False
@@ -183,13 +183,19 @@ class WorkerViewModel(QObject):
             self.error_occurred.emit(f"Fehler beim Suchen: {str(e)}")
             return None
     
-    def _validate_worker(self, name: str, email: str) -> Optional[str]:
+    def _validate_worker(
+        self,
+        name: str,
+        email: str,
+        worker_id: Optional[int] = None
+    ) -> Optional[str]:
         """
         Validiert Worker-Daten
         
         Args:
             name: Name des Workers
             email: E-Mail-Adresse
+            worker_id: ID des Workers bei Updates (wird bei Duplikat-Prüfung ignoriert)
             
         Returns:
             Fehlermeldung oder None wenn valide
@@ -210,4 +216,8 @@ class WorkerViewModel(QObject):
         if "@" not in email or "." not in email.split("@")[-1]:
             return "Ungültige E-Mail-Adresse"
         
+        # Duplikat-Prüfung über Blind-Index (eine indizierte Abfrage)
+        if self._repository.email_exists(email, exclude_id=worker_id):
+            return "E-Mail-Adresse wird bereits verwendet"
+        
         return None
@@ -11,13 +11,15 @@ from PySide6.QtWidgets import (
     QComboBox
 )
 from PySide6.QtCore import Qt, QDate, Signal
-from PySide6.QtGui import QFont, QColor
+from PySide6.QtGui import QFont, QColor, QBrush
 
 from ..services.analytics_service import AnalyticsService
+from ..services.utilization_state import UtilizationState
 from ..repositories.worker_repository import WorkerRepository
 from ..repositories.time_entry_repository import TimeEntryRepository
 from ..repositories.capacity_repository import CapacityRepository
 from ..models.worker import Worker
+from ..models.time_entry import TimeEntry
 from .utilization_chart_widget import UtilizationChartWidget
 from .worker_detail_dialog import WorkerDetailDialog
 from .date_range_widget import DateRangeWidget
@@ -33,6 +35,8 @@ class AnalyticsWidget(QWidget):
         - Zeitraum-basierte Filterung
         - Farbkodierung für Auslastungsstatus
         - Export-Funktionalität (CSV)
+        - Inkrementelle Aktualisierung einzelner Zeilen nach Schreibvorgängen
+          (on_entry_created, on_entry_changed, on_capacity_changed)
     """
     
     data_refreshed = Signal()
@@ -51,6 +55,9 @@ class AnalyticsWidget(QWidget):
         self._capacity_repository = capacity_repository
         self._workers: List[Worker] = []
         self._utilization_data: Dict[int, Dict] = {}
+        self._utilization_state: Optional[UtilizationState] = None
+        self._name_items: Dict[int, QTableWidgetItem] = {}
+        self._chart_stale = False
         
         self._setup_ui()
         self._load_initial_data()
@@ -177,6 +184,7 @@ class AnalyticsWidget(QWidget):
         # Tab 2: Chart
         self._chart_widget = UtilizationChartWidget()
         self._content_tabs.addTab(self._chart_widget, "📈 Diagramm")
+        self._content_tabs.currentChanged.connect(self._on_tab_changed)
         
         layout.addWidget(self._content_tabs)
         
@@ -264,24 +272,20 @@ class AnalyticsWidget(QWidget):
         self._status_label.setStyleSheet("color: blue;")
         
         try:
-            # Zeitraum ermitteln
-            start_date = self._start_date_filter.date().toPython()
-            end_date = self._end_date_filter.date().toPython()
-            
-            start_datetime = datetime(start_date.year, start_date.month, start_date.day)
-            end_datetime = datetime(end_date.year, end_date.month, end_date.day, 23, 59, 59)
+            # Auslastung aller Worker in einem Aufruf berechnen
+            utilization_data = self._load_utilization(self._workers)
             
             # Filter anwenden
-            filtered_workers = self._apply_filters()
+            filtered_workers = self._apply_filters(utilization_data)
             
-            # Auslastung für jeden Worker berechnen
-            self._utilization_data = {}
-            for worker in filtered_workers:
-                utilization = self._analytics_service.calculate_worker_utilization(
-                    worker.id, start_datetime, end_datetime
-                )
-                if utilization:
-                    self._utilization_data[worker.id] = utilization
+            self._utilization_data = {
+                worker.id: utilization_data[worker.id]
+                for worker in filtered_workers
+                if worker.id in utilization_data
+            }
+            
+            # Laufende Summen für inkrementelle Updates
+            self._utilization_state = self._build_state(self._utilization_data)
             
             # UI aktualisieren
             self._update_statistics()
@@ -345,7 +349,6 @@ class AnalyticsWidget(QWidget):
         if not self._utilization_data:
             return
         
-        total_workers = len(self._workers)
         total_planned = sum(data['hours_planned'] for data in self._utilization_data.values())
         total_worked = sum(data['hours_worked'] for data in self._utilization_data.values())
         
@@ -358,6 +361,19 @@ class AnalyticsWidget(QWidget):
         else:
             avg_utilization = 0.0
         
+        self._show_statistics(total_planned, total_worked, avg_utilization)
+    
+    def _show_statistics(self, total_planned: float, total_worked: float, avg_utilization: float):
+        """
+        Schreibt Summen in die Statistik-Übersicht
+        
+        Args:
+            total_planned: Geplante Stunden aller angezeigten Worker
+            total_worked: Gearbeitete Stunden aller angezeigten Worker
+            avg_utilization: Durchschnittliche Auslastung in %
+        """
+        total_workers = len(self._workers)
+        
         # Labels aktualisieren
         self._total_workers_label.setText(str(total_workers))
         self._total_planned_label.setText(f"{total_planned:.1f} h")
@@ -382,6 +398,7 @@ class AnalyticsWidget(QWidget):
     def _update_table(self):
         """Aktualisiert Team-Tabelle und Chart"""
         self._team_table.setRowCount(0)
+        self._name_items = {}
         
         for worker in self._workers:
             if worker.id not in self._utilization_data:
@@ -394,43 +411,21 @@ class AnalyticsWidget(QWidget):
             # Worker Name
             name_item = QTableWidgetItem(worker.name)
             self._team_table.setItem(row, 0, name_item)
+            self._name_items[worker.id] = name_item
             
             # Team
             team_item = QTableWidgetItem(worker.team or "-")
             self._team_table.setItem(row, 1, team_item)
             
-            # Geplante Stunden
-            planned_item = QTableWidgetItem(f"{data['hours_planned']:.1f}")
-            planned_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            self._team_table.setItem(row, 2, planned_item)
-            
-            # Gearbeitete Stunden
-            worked_item = QTableWidgetItem(f"{data['hours_worked']:.1f}")
-            worked_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            self._team_table.setItem(row, 3, worked_item)
-            
-            # Differenz
-            diff = data['hours_worked'] - data['hours_planned']
-            diff_item = QTableWidgetItem(f"{diff:+.1f}")
-            diff_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            if diff < 0:
-                diff_item.setForeground(QColor("orange"))
-            elif diff > 0:
-                diff_item.setForeground(QColor("blue"))
-            self._team_table.setItem(row, 4, diff_item)
-            
-            # Auslastung Prozent
-            util_percent = data['utilization_percent']
-            util_item = QTableWidgetItem(f"{util_percent:.1f}%")
-            util_item.setTextAlignment(Qt.AlignCenter)
-            self._team_table.setItem(row, 5, util_item)
-            
-            # Status
-            status_item = self._get_status_item(util_percent)
-            self._team_table.setItem(row, 6, status_item)
+            # Geplant, Gearbeitet, Differenz, Auslastung, Status
+            value_items = [QTableWidgetItem() for _ in range(5)]
+            self._fill_value_items(value_items, data)
+            for column, value_item in enumerate(value_items, start=2):
+                self._team_table.setItem(row, column, value_item)
         
         # Chart aktualisieren
         self._chart_widget.update_chart(self._workers, self._utilization_data)
+        self._chart_stale = False
         
         # Suche re-applizieren wenn aktiv
         search_text = self._search_widget.get_search_text()
@@ -443,8 +438,36 @@ class AnalyticsWidget(QWidget):
                 self._team_table.rowCount()
             )
     
-    def _apply_filters(self) -> List[Worker]:
-        """Wendet aktuelle Filter auf Worker-Liste an"""
+    def _load_utilization(self, workers: List[Worker]) -> Dict[int, Dict]:
+        """
+        Berechnet Auslastung für Worker im gewählten Zeitraum
+        
+        Args:
+            workers: Worker, für die Daten geladen werden
+            
+        Returns:
+            Dict worker_id -> Dict mit hours_worked, hours_planned, utilization_percent
+        """
+        start_date = self._start_date_filter.date().toPython()
+        end_date = self._end_date_filter.date().toPython()
+        start_datetime = datetime(start_date.year, start_date.month, start_date.day)
+        end_datetime = datetime(end_date.year, end_date.month, end_date.day, 23, 59, 59)
+        
+        team = self._analytics_service.calculate_team_utilization(
+            start_datetime, end_datetime, [w.id for w in workers]
+        )
+        return {
+            worker_id: AnalyticsService.build_utilization(hours_worked, hours_planned)
+            for worker_id, (hours_worked, hours_planned) in team.items()
+        }
+    
+    def _apply_filters(self, utilization_data: Optional[Dict[int, Dict]] = None) -> List[Worker]:
+        """
+        Wendet aktuelle Filter auf Worker-Liste an
+        
+        Args:
+            utilization_data: Optional bereits berechnete Auslastung (für Status-Filter)
+        """
         filtered = list(self._workers)
         
         # Team-Filter
@@ -455,19 +478,13 @@ class AnalyticsWidget(QWidget):
         # Status-Filter (benötigt Utilization-Daten)
         status_filter = self._status_filter.currentData()
         if status_filter:
-            # Temporär alle Utilization-Daten berechnen für Filterung
-            temp_data = {}
-            start_date = self._start_date_filter.date().toPython()
-            end_date = self._end_date_filter.date().toPython()
-            start_datetime = datetime(start_date.year, start_date.month, start_date.day)
-            end_datetime = datetime(end_date.year, end_date.month, end_date.day, 23, 59, 59)
-            
-            for worker in filtered:
-                utilization = self._analytics_service.calculate_worker_utilization(
-                    worker.id, start_datetime, end_datetime
-                )
-                if utilization:
-                    temp_data[worker.id] = utilization['utilization_percent']
+            if utilization_data is None:
+                utilization_data = self._load_utilization(filtered)
+            
+            temp_data = {
+                worker_id: data['utilization_percent']
+                for worker_id, data in utilization_data.items()
+            }
             
             # Nach Status filtern
             if status_filter == "under":
@@ -481,21 +498,186 @@ class AnalyticsWidget(QWidget):
     
     def _get_status_item(self, utilization: float) -> QTableWidgetItem:
         """Erstellt Status-Item mit Farbkodierung"""
+        item = QTableWidgetItem()
+        self._set_status(item, utilization)
+        return item
+    
+    def _set_status(self, item: QTableWidgetItem, utilization: float):
+        """Setzt Text und Farbkodierung eines Status-Items"""
         if utilization < 80:
-            item = QTableWidgetItem("⚠️ Unter")
+            item.setText("⚠️ Unter")
             item.setForeground(QColor("orange"))
             item.setBackground(QColor(255, 165, 0, 50))
         elif utilization <= 110:
-            item = QTableWidgetItem("✓ Optimal")
+            item.setText("✓ Optimal")
             item.setForeground(QColor("green"))
             item.setBackground(QColor(0, 255, 0, 50))
         else:
-            item = QTableWidgetItem("❗ Über")
+            item.setText("❗ Über")
             item.setForeground(QColor("red"))
             item.setBackground(QColor(255, 0, 0, 50))
         
         item.setTextAlignment(Qt.AlignCenter)
-        return item
+    
+    def _fill_value_items(self, items: List[QTableWidgetItem], data: Dict):
+        """
+        Füllt die Wert-Spalten einer Zeile (neu angelegt oder bestehend)
+        
+        Args:
+            items: Items der Spalten Geplant, Gearbeitet, Differenz, Auslastung, Status
+            data: Dict mit hours_worked, hours_planned, utilization_percent
+        """
+        planned_item, worked_item, diff_item, util_item, status_item = items
+        
+        # Geplante Stunden
+        planned_item.setText(f"{data['hours_planned']:.1f}")
+        planned_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+        
+        # Gearbeitete Stunden
+        worked_item.setText(f"{data['hours_worked']:.1f}")
+        worked_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+        
+        # Differenz
+        diff = data['hours_worked'] - data['hours_planned']
+        diff_item.setText(f"{diff:+.1f}")
+        diff_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+        if diff < 0:
+            diff_item.setForeground(QColor("orange"))
+        elif diff > 0:
+            diff_item.setForeground(QColor("blue"))
+        else:
+            diff_item.setForeground(QBrush())
+        
+        # Auslastung Prozent
+        util_percent = data['utilization_percent']
+        util_item.setText(f"{util_percent:.1f}%")
+        util_item.setTextAlignment(Qt.AlignCenter)
+        
+        # Status
+        self._set_status(status_item, util_percent)
+    
+    def _build_state(self, utilization_data: Dict[int, Dict]) -> Optional[UtilizationState]:
+        """
+        Baut laufende Summen für die angezeigten Worker auf
+        
+        Args:
+            utilization_data: Dict worker_id -> Dict mit hours_worked, hours_planned
+            
+        Returns:
+            UtilizationState oder None, wenn der CapacityIndex nicht verfügbar ist
+        """
+        start_date = self._start_date_filter.date().toPython()
+        end_date = self._end_date_filter.date().toPython()
+        
+        try:
+            capacity_index = self._capacity_repository.load_index()
+            state = UtilizationState(start_date, end_date, capacity_index)
+            state.load({
+                worker_id: (data['hours_worked'], data['hours_planned'])
+                for worker_id, data in utilization_data.items()
+            })
+        except Exception:
+            # Ohne Zustand fallen Einzel-Updates auf _refresh_data zurück
+            return None
+        return state
+    
+    def on_entry_created(self, entry_id: int):
+        """
+        Slot für TimeEntryViewModel.entry_created
+        
+        Args:
+            entry_id: ID des neuen Eintrags
+        """
+        if self._utilization_state is None:
+            self._refresh_data()
+            return
+        
+        entry = self._time_entry_repository.find_by_id(entry_id)
+        if entry is not None:
+            self.on_entry_changed(None, entry)
+    
+    def on_entry_changed(self, old_entry: Optional[TimeEntry], new_entry: Optional[TimeEntry]):
+        """
+        Slot für geänderte oder gelöschte Einträge (TimeEntryWidget.entry_changed)
+        
+        Args:
+            old_entry: Zustand vor der Änderung (None beim Anlegen)
+            new_entry: Zustand nach der Änderung (None beim Löschen)
+        """
+        if self._utilization_state is None:
+            self._refresh_data()
+            return
+        
+        self._apply_changes(self._utilization_state.apply_entry(old_entry, new_entry))
+    
+    def on_capacity_changed(self, capacity_id: int):
+        """
+        Slot für CapacityViewModel.capacity_created/updated/deleted
+        
+        Args:
+            capacity_id: ID der Capacity
+        """
+        if self._utilization_state is None:
+            self._refresh_data()
+            return
+        
+        self._apply_changes(self._utilization_state.apply_capacity(capacity_id))
+    
+    def _apply_changes(self, worker_ids: List[int]):
+        """
+        Übernimmt geänderte Worker in Tabelle und Statistik ohne Neuberechnung
+        
+        Args:
+            worker_ids: Worker, deren Auslastung sich geändert hat
+        """
+        if not worker_ids:
+            return
+        
+        # Status-Filter: Worker könnte aus der Auswahl fallen
+        status_filter = self._status_filter.currentData()
+        if status_filter:
+            for worker_id in worker_ids:
+                utilization = self._utilization_state.row(worker_id)['utilization_percent']
+                if self._status_of(utilization) != status_filter:
+                    self._refresh_data()
+                    return
+        
+        for worker_id in worker_ids:
+            data = self._utilization_state.row(worker_id)
+            self._utilization_data[worker_id] = data
+            
+            name_item = self._name_items.get(worker_id)
+            if name_item is None:
+                continue
+            
+            # Items vorab holen: bei aktiver Sortierung kann die Zeile wandern
+            row = name_item.row()
+            items = [self._team_table.item(row, column) for column in range(2, 7)]
+            if all(items):
+                self._fill_value_items(items, data)
+        
+        self._show_statistics(*self._utilization_state.totals())
+        
+        # Chart nur neu zeichnen, wenn sichtbar
+        if self._content_tabs.currentWidget() is self._chart_widget:
+            self._chart_widget.update_chart(self._workers, self._utilization_data)
+        else:
+            self._chart_stale = True
+    
+    def _on_tab_changed(self, index: int):
+        """Zeichnet Chart nach inkrementellen Updates beim Anzeigen neu"""
+        if self._chart_stale and self._content_tabs.widget(index) is self._chart_widget:
+            self._chart_widget.update_chart(self._workers, self._utilization_data)
+            self._chart_stale = False
+    
+    @staticmethod
+    def _status_of(utilization: float) -> str:
+        """Status-Schlüssel des Status-Filters für eine Auslastung"""
+        if utilization < 80:
+            return "under"
+        if utilization <= 110:
+            return "optimal"
+        return "over"
     
     def _on_filter_changed(self):
         """Handler für Filter-Änderungen"""
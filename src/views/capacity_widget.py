@@ -377,15 +377,15 @@ class CapacityWidget(QWidget):
             db_service = self._viewmodel._analytics_service._db_service
             entry_repo = TimeEntryRepository(db_service)
             
-            # Hole TimeEntries für diese spezifische Capacity
-            time_entries = entry_repo.find_by_worker(
-                capacity.worker_id,
+            # Gearbeitete Minuten im Capacity-Zeitraum aus dem Tages-Rollup
+            minutes_worked = entry_repo.sum_minutes_by_worker(
                 capacity.start_date,
-                capacity.end_date
+                capacity.end_date,
+                [capacity.worker_id]
             )
             
             # Berechne gearbeitete Stunden
-            hours_worked = sum(entry.duration_hours() for entry in time_entries)
+            hours_worked = minutes_worked.get(capacity.worker_id, 0) / 60
             
             # Verwende die geplanten Stunden dieser spezifischen Capacity
             hours_planned = capacity.planned_hours
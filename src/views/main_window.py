@@ -25,9 +25,11 @@ from ..services.database_service import DatabaseService
 from ..services.crypto_service import CryptoService
 from ..services.analytics_service import AnalyticsService
 from ..services.session_service import SessionService
+from ..services.timer_service import TimerService
 from ..repositories.time_entry_repository import TimeEntryRepository
 from ..repositories.worker_repository import WorkerRepository
 from ..repositories.capacity_repository import CapacityRepository
+from ..repositories.timer_journal_repository import TimerJournalRepository
 
 
 class MainWindow(QMainWindow):
@@ -91,6 +93,13 @@ class MainWindow(QMainWindow):
         self.worker_repository = WorkerRepository(self.db_service, self.crypto_service)
         self.capacity_repository = CapacityRepository(self.db_service)
         
+        # Timer: gemeinsamer Zustand, laufende Timer aus dem Journal wiederherstellen
+        self.timer_service = TimerService.shared()
+        self.timer_service.attach_journal(
+            TimerJournalRepository(self.db_service),
+            self.time_entry_repository
+        )
+        
         # ViewModels
         self.time_entry_viewmodel = TimeEntryViewModel(
             self.time_parser_service,
@@ -124,7 +133,8 @@ class MainWindow(QMainWindow):
         # Tab 1: Zeiterfassung (mit echtem Widget)
         self.time_entry_widget = TimeEntryWidget(
             self.time_entry_viewmodel,
-            self.time_entry_repository
+            self.time_entry_repository,
+            timer_service=self.timer_service
         )
         self.time_entry_widget.entry_saved.connect(self._on_entry_saved)
         
@@ -160,6 +170,13 @@ class MainWindow(QMainWindow):
             self.capacity_repository
         )
         self.tab_widget.addTab(self.analytics_widget, "Analytics")
+        
+        # Einzelne Schreibvorgänge inkrementell in Analytics übernehmen
+        self.time_entry_viewmodel.entry_created.connect(self.analytics_widget.on_entry_created)
+        self.time_entry_widget.entry_changed.connect(self.analytics_widget.on_entry_changed)
+        self.capacity_viewmodel.capacity_created.connect(self.analytics_widget.on_capacity_changed)
+        self.capacity_viewmodel.capacity_updated.connect(self.analytics_widget.on_capacity_changed)
+        self.capacity_viewmodel.capacity_deleted.connect(self.analytics_widget.on_capacity_changed)
     
     def _setup_menu(self):
         """Erstellt Menu Bar"""
@@ -574,6 +591,10 @@ class MainWindow(QMainWindow):
     
     def closeEvent(self, event):
         """Cleanup beim Schließen"""
+        # Gestoppte Timer-Dauern schreiben; laufende Timer bleiben im Journal
+        if hasattr(self, 'timer_service'):
+            self.timer_service.flush()
+        
         # Repository-Referenzen löschen (wichtig für sauberes DB-Close)
         if hasattr(self, 'worker_repository'):
             del self.worker_repository
@@ -13,6 +13,7 @@ class TablePaginationWidget(QWidget):
     - Vorherige/Nächste Seite Navigation
     - Seitenanzeige (z.B. "Seite 2 von 10")
     - Einstellbare Einträge pro Seite
+    - Optional "Alle" (ALL_PAGE_SIZE): eine Seite, die Tabelle lädt selbst nach
     - Signal-Emission bei Änderungen
 
     Signals:
@@ -29,16 +30,24 @@ class TablePaginationWidget(QWidget):
     page_changed = Signal(int)
     page_size_changed = Signal(int)
 
-    def __init__(self, default_page_size: int = 25):
+    # Seitengröße für "Alle" (keine Pagination)
+    ALL_PAGE_SIZE = 0
+    ALL_TEXT = "Alle"
+
+    def __init__(self, default_page_size: int = 25, allow_all: bool = False):
         """
         Initialisiert TablePaginationWidget
 
         Args:
             default_page_size: Standardanzahl Einträge pro Seite
+            allow_all: Option "Alle" anbieten (für virtualisierte Tabellen)
         """
         super().__init__()
         self._current_page = 1
         self._total_items = 0
+        self._allow_all = allow_all
+        if default_page_size == self.ALL_PAGE_SIZE and not allow_all:
+            default_page_size = 25
         self._page_size = default_page_size
         self._setup_ui()
         self._update_controls()
@@ -56,7 +65,9 @@ class TablePaginationWidget(QWidget):
         # Einträge pro Seite Dropdown
         self._page_size_combo = QComboBox()
         self._page_size_combo.addItems(["10", "25", "50", "100"])
-        self._page_size_combo.setCurrentText(str(self._page_size))
+        if self._allow_all:
+            self._page_size_combo.addItem(self.ALL_TEXT)
+        self._page_size_combo.setCurrentText(self._size_text(self._page_size))
         self._page_size_combo.currentTextChanged.connect(self._on_page_size_changed)
         self._page_size_combo.setStyleSheet("""
             QComboBox {
@@ -142,7 +153,7 @@ class TablePaginationWidget(QWidget):
             text: Neue Seitengröße als String
         """
         try:
-            new_size = int(text)
+            new_size = self.ALL_PAGE_SIZE if text == self.ALL_TEXT else int(text)
             if new_size != self._page_size:
                 self._page_size = new_size
                 # Zurück zu Seite 1 bei Änderung der Seitengröße
@@ -174,7 +185,7 @@ class TablePaginationWidget(QWidget):
         Returns:
             int: Anzahl Seiten
         """
-        if self._total_items == 0:
+        if self._total_items == 0 or self._page_size == self.ALL_PAGE_SIZE:
             return 1
         return (self._total_items + self._page_size - 1) // self._page_size
 
@@ -195,6 +206,8 @@ class TablePaginationWidget(QWidget):
         # Info-Label aktualisieren
         if self._total_items == 0:
             self._info_label.setText("")
+        elif self._page_size == self.ALL_PAGE_SIZE:
+            self._info_label.setText(f"Zeige alle {self._total_items} Einträge")
         else:
             start = (self._current_page - 1) * self._page_size + 1
             end = min(self._current_page * self._page_size, self._total_items)
@@ -240,7 +253,20 @@ class TablePaginationWidget(QWidget):
         Args:
             size: Neue Seitengröße
         """
-        self._page_size_combo.setCurrentText(str(size))
+        self._page_size_combo.setCurrentText(self._size_text(size))
+
+    def is_showing_all(self) -> bool:
+        """
+        Prüft ob "Alle" gewählt ist
+
+        Returns:
+            bool: True wenn keine Pagination aktiv ist
+        """
+        return self._page_size == self.ALL_PAGE_SIZE
+
+    def _size_text(self, size: int) -> str:
+        """Combo-Text einer Seitengröße"""
+        return self.ALL_TEXT if size == self.ALL_PAGE_SIZE else str(size)
 
     def reset_to_first_page(self):
         """Setzt zurück auf erste Seite"""
@@ -2,7 +2,7 @@
 TableSearchWidget - Wiederverwendbare Such-Komponente für QTableWidget
 """
 from PySide6.QtWidgets import QWidget, QHBoxLayout, QLineEdit, QLabel
-from PySide6.QtCore import Signal
+from PySide6.QtCore import Signal, QTimer
 
 
 class TableSearchWidget(QWidget):
@@ -10,7 +10,7 @@ class TableSearchWidget(QWidget):
     Wiederverwendbare Such-Komponente für Tabellen-Widgets
     
     Features:
-    - Live-Suche während Tippen
+    - Live-Suche während Tippen (optional entprellt, debounce_ms)
     - Built-in Clear-Button (X)
     - Treffer-Anzeige
     - Signal-Emission bei Textänderung
@@ -29,15 +29,24 @@ class TableSearchWidget(QWidget):
     
     search_changed = Signal(str)
     
-    def __init__(self, placeholder: str = "🔍 Suchen..."):
+    def __init__(self, placeholder: str = "🔍 Suchen...", debounce_ms: int = 0):
         """
         Initialisiert das Such-Widget
         
         Args:
             placeholder: Platzhalter-Text für Sucheingabe
+            debounce_ms: Wartezeit nach dem letzten Tastendruck vor search_changed
+                (0: sofort bei jeder Änderung)
         """
         super().__init__()
         self._placeholder = placeholder
+        
+        # Entprellung: nur der Text nach einer Tipp-Pause wird gesucht
+        self._debounce_timer = QTimer(self)
+        self._debounce_timer.setSingleShot(True)
+        self._debounce_timer.setInterval(debounce_ms)
+        self._debounce_timer.timeout.connect(self._emit_search)
+        
         self._setup_ui()
     
     def _setup_ui(self):
@@ -82,20 +91,33 @@ class TableSearchWidget(QWidget):
         """
         Handler für Textänderungen im Suchfeld
         
-        Emittiert search_changed Signal mit aktuellem Text.
+        Emittiert search_changed Signal mit aktuellem Text, bei Entprellung
+        erst nach debounce_ms ohne weitere Änderung. Leeren (Clear-Button)
+        wirkt immer sofort.
         
         Args:
             text: Aktueller Suchtext
         """
+        if self._debounce_timer.interval() > 0 and text:
+            self._debounce_timer.start()
+            return
+        self._debounce_timer.stop()
         self.search_changed.emit(text)
     
-    def set_result_count(self, count: int, total: int):
+    def _emit_search(self):
+        """Emittiert search_changed nach Ablauf der Entprellung"""
+        self.search_changed.emit(self._search_input.text())
+    
+    def set_result_count(self, count: int, total: int, capped: bool = False, scope: str = ""):
         """
         Aktualisiert die Treffer-Anzeige
         
         Args:
             count: Anzahl sichtbarer/gefundener Einträge
             total: Gesamtanzahl Einträge
+            capped: Treffer wurden bei count abgeschnitten (Anzeige "count+")
+            scope: Hinweis auf die durchsuchten Felder bei aktiver Suche
+                (z.B. "nur Beschreibung und Projekt")
         """
         search_text = self._search_input.text()
         
@@ -123,7 +145,7 @@ class TableSearchWidget(QWidget):
                     padding: 5px;
                 }
             """)
-        elif count == total:
+        elif count == total and not capped:
             # Alle Einträge passen
             self._result_label.setText(f"{total} Einträge")
             self._result_label.setStyleSheet("""
@@ -135,7 +157,7 @@ class TableSearchWidget(QWidget):
             """)
         else:
             # Gefilterte Treffer
-            self._result_label.setText(f"{count} von {total} Treffern")
+            self._result_label.setText(f"{count}{'+' if capped else ''} von {total} Treffern")
             self._result_label.setStyleSheet("""
                 QLabel {
                     color: #4CAF50;
@@ -144,6 +166,9 @@ class TableSearchWidget(QWidget):
                     padding: 5px;
                 }
             """)
+        
+        if search_text and scope:
+            self._result_label.setText(f"{self._result_label.text()} ({scope})")
     
     def clear(self):
         """Löscht den Suchtext"""
@@ -0,0 +1,110 @@
+"""
+Item Delegates für die Zeitbuchungs-Tabelle
+
+Zeichnen Timer und Löschen-Button direkt in die Zellen, statt pro Zeile
+ein TimerWidget und einen QPushButton per setCellWidget zu erzeugen.
+"""
+from PySide6.QtWidgets import QStyledItemDelegate, QStyleOptionViewItem, QStyle
+from PySide6.QtCore import Qt, QEvent, QRect, QModelIndex, Signal
+from PySide6.QtGui import QColor, QPainter, QFont
+
+from .time_entry_table_model import TIMER_RUNNING_ROLE
+
+
+def _paint_button(painter: QPainter, rect: QRect, text: str, color: QColor, hover: bool):
+    """Zeichnet einen flachen, abgerundeten Button"""
+    painter.save()
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(color.darker(115) if hover else color)
+    painter.drawRoundedRect(rect, 3, 3)
+    painter.setPen(QColor("white"))
+    font = painter.font()
+    font.setBold(True)
+    painter.setFont(font)
+    painter.drawText(rect, Qt.AlignCenter, text)
+    painter.restore()
+
+
+class TimerDelegate(QStyledItemDelegate):
+    """
+    Zeichnet Timer-Zelle: Zeit (HH:MM:SS) und Start/Stop-Button
+    
+    Signals:
+        toggled: Start/Stop-Button wurde geklickt (QModelIndex)
+    """
+    
+    toggled = Signal(QModelIndex)
+    
+    BUTTON_WIDTH = 30
+    MARGIN = 3
+    
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
+        if option.state & QStyle.State_Selected:
+            painter.fillRect(option.rect, option.palette.highlight())
+        
+        text_rect = option.rect.adjusted(5, 0, -(self.BUTTON_WIDTH + 2 * self.MARGIN), 0)
+        painter.save()
+        font = QFont(painter.font())
+        font.setFamily("Courier")  # Monospace für bessere Ausrichtung
+        painter.setFont(font)
+        painter.drawText(text_rect, Qt.AlignVCenter | Qt.AlignLeft, index.data(Qt.DisplayRole))
+        painter.restore()
+        
+        running = bool(index.data(TIMER_RUNNING_ROLE))
+        _paint_button(
+            painter,
+            self._button_rect(option.rect),
+            "■" if running else "▶",
+            QColor("#dc3545") if running else QColor("#28a745"),
+            bool(option.state & QStyle.State_MouseOver)
+        )
+    
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex):
+        size = super().sizeHint(option, index)
+        size.setWidth(int(option.fontMetrics.horizontalAdvance("00:00:00") * 1.3) + self.BUTTON_WIDTH + 20)
+        return size
+    
+    def editorEvent(self, event, model, option: QStyleOptionViewItem, index: QModelIndex) -> bool:
+        if (event.type() == QEvent.MouseButtonRelease
+                and event.button() == Qt.LeftButton
+                and self._button_rect(option.rect).contains(event.position().toPoint())):
+            self.toggled.emit(index)
+            return True
+        return super().editorEvent(event, model, option, index)
+    
+    def _button_rect(self, rect: QRect) -> QRect:
+        return QRect(
+            rect.right() - self.BUTTON_WIDTH - self.MARGIN,
+            rect.top() + self.MARGIN,
+            self.BUTTON_WIDTH,
+            rect.height() - 2 * self.MARGIN
+        )
+
+
+class DeleteButtonDelegate(QStyledItemDelegate):
+    """
+    Zeichnet Löschen-Button über die ganze Zelle
+    
+    Signals:
+        clicked: Button wurde geklickt (QModelIndex)
+    """
+    
+    clicked = Signal(QModelIndex)
+    
+    MARGIN = 3
+    
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
+        _paint_button(
+            painter,
+            option.rect.adjusted(self.MARGIN, self.MARGIN, -self.MARGIN, -self.MARGIN),
+            index.data(Qt.DisplayRole),
+            QColor("#dc3545"),
+            bool(option.state & QStyle.State_MouseOver)
+        )
+    
+    def editorEvent(self, event, model, option: QStyleOptionViewItem, index: QModelIndex) -> bool:
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            self.clicked.emit(index)
+            return True
+        return super().editorEvent(event, model, option, index)
@@ -0,0 +1,361 @@
+"""
+TimeEntryTableModel - Virtualisiertes Tabellenmodell für Zeitbuchungen
+"""
+from typing import Dict, Iterator, List, Optional, Tuple
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, Signal
+
+from ..services.timer_service import TimerService
+
+
+# Spalten der Zeitbuchungs-Tabelle
+COL_DATE = 0
+COL_WORKER = 1
+COL_TYPE = 2
+COL_PROJECT = 3
+COL_CATEGORY = 4
+COL_DESCRIPTION = 5
+COL_DURATION = 6
+COL_TIMER = 7
+COL_ACTION = 8
+
+ENTRY_ID_ROLE = Qt.UserRole
+MINUTES_ROLE = Qt.UserRole + 1
+TIMER_RUNNING_ROLE = Qt.UserRole + 2
+
+
+def split_description(description: Optional[str]) -> Tuple[str, str]:
+    """
+    Trennt Typ-Prefix ("[Urlaub] ...") von der Beschreibung
+    
+    Args:
+        description: Gespeicherte Beschreibung
+    
+    Returns:
+        Tupel (Typ, Beschreibung ohne Prefix)
+    """
+    description = description or ""
+    if description.startswith("["):
+        end_bracket = description.find("]")
+        if end_bracket > 0:
+            return description[1:end_bracket], description[end_bracket + 1:].strip()
+    return "Arbeit", description
+
+
+def split_project(project: Optional[str]) -> Tuple[str, str]:
+    """
+    Trennt gespeichertes Projekt in Projekt und Kategorie ("Projekt - Kategorie")
+    
+    Args:
+        project: Gespeichertes Projekt
+    
+    Returns:
+        Tupel (Projekt, Kategorie)
+    """
+    project = project or ""
+    if " - " in project:
+        project, category = project.split(" - ", 1)
+        return project, category
+    return project, ""
+
+
+def format_seconds(seconds: int) -> str:
+    """Formatiert Sekunden als HH:MM:SS"""
+    return f"{seconds // 3600:02d}:{(seconds % 3600) // 60:02d}:{seconds % 60:02d}"
+
+
+class TimeEntryTableModel(QAbstractTableModel):
+    """
+    Tabellenmodell über einer Liste von TimeEntry-Objekten
+    
+    Pro Zeile werden nur Referenzen auf die Einträge gehalten; alle
+    Zellinhalte berechnet data() beim Zeichnen der sichtbaren Zeilen.
+    Timer und Löschen-Button zeichnen Delegates (time_entry_delegates),
+    es gibt keine Widgets oder QTableWidgetItems pro Zeile.
+    
+    Große Bereiche werden seitenweise nachgeladen: set_entries nimmt
+    optional einen Iterator über weitere Seiten, den die View per
+    canFetchMore/fetchMore beim Scrollen abruft.
+    
+    Bearbeitungen speichert das Modell nicht selbst: setData emittiert
+    cell_edited, der Aufrufer persistiert und meldet den neuen Stand per
+    update_entry zurück (dataChanged nur für diese Zeile).
+    
+    Laufende Timer hält der TimerService; das Modell zeigt nur deren
+    Stand an. Ein Neuladen der Zeilen beendet daher keinen Timer.
+    
+    Signals:
+        cell_edited: Zelle wurde bearbeitet (entry_id, column, text)
+    """
+    
+    cell_edited = Signal(int, int, str)
+    
+    HEADERS = [
+        "Datum", "Worker", "Typ", "Projekt", "Kategorie",
+        "Beschreibung", "Dauer", "Timer", "Aktion"
+    ]
+    EDITABLE_COLUMNS = (COL_PROJECT, COL_CATEGORY, COL_DESCRIPTION, COL_DURATION)
+    
+    def __init__(self, parent=None, timer_service: Optional[TimerService] = None):
+        super().__init__(parent)
+        self.timer_service = timer_service or TimerService.shared()
+        self.timer_service.timer_changed.connect(self._on_timer_changed)
+        self._entries: List = []
+        self._rows_by_id: Dict[int, int] = {}
+        self._worker_names: Dict[int, str] = {}
+        self._pages: Optional[Iterator[List]] = None
+        self._sort: Optional[Tuple[int, Qt.SortOrder]] = None
+    
+    # ===== Daten setzen =====
+    
+    def set_worker_names(self, worker_names: Dict[int, str]):
+        """
+        Setzt Anzeigenamen der Worker
+        
+        Args:
+            worker_names: Dict worker_id -> Name
+        """
+        self._worker_names = dict(worker_names)
+        if self._entries:
+            self.dataChanged.emit(
+                self.index(0, COL_WORKER), self.index(len(self._entries) - 1, COL_WORKER)
+            )
+    
+    def set_entries(self, entries: List, pages: Optional[Iterator[List]] = None):
+        """
+        Ersetzt alle Zeilen
+        
+        Args:
+            entries: Einträge in Anzeigereihenfolge
+            pages: Optional: Iterator über weitere Seiten für fetchMore
+        """
+        self.beginResetModel()
+        self._entries = list(entries)
+        self._pages = pages
+        if self._sort is not None:
+            column, order = self._sort
+            self._entries.sort(key=self._sort_key(column), reverse=order == Qt.DescendingOrder)
+        self._rebuild_row_map()
+        self.endResetModel()
+    
+    def entry_at(self, row: int):
+        """Eintrag einer Zeile"""
+        return self._entries[row]
+    
+    def entries(self) -> List:
+        """Alle geladenen Einträge in Anzeigereihenfolge"""
+        return list(self._entries)
+    
+    def row_of(self, entry_id: int) -> Optional[int]:
+        """Zeile eines Eintrags oder None, wenn nicht geladen"""
+        return self._rows_by_id.get(entry_id)
+    
+    def update_entry(self, entry):
+        """
+        Ersetzt einen geladenen Eintrag und meldet nur dessen Zeile als geändert
+        
+        Args:
+            entry: Gespeicherter TimeEntry
+        """
+        row = self._rows_by_id.get(entry.id)
+        if row is None:
+            return
+        self._entries[row] = entry
+        self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+    
+    def remove_entry(self, entry_id: int):
+        """
+        Entfernt einen Eintrag
+        
+        Args:
+            entry_id: ID des Eintrags
+        """
+        row = self._rows_by_id.get(entry_id)
+        if row is None:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._entries[row]
+        self._rebuild_row_map()
+        self.endRemoveRows()
+    
+    # ===== Timer =====
+    
+    def is_timer_running(self, entry_id: int) -> bool:
+        """True wenn der Timer des Eintrags läuft"""
+        return self.timer_service.is_running(entry_id)
+    
+    def running_timer_ids(self) -> List[int]:
+        """IDs aller Einträge mit laufendem Timer (auch nicht geladene)"""
+        return self.timer_service.running_ids()
+    
+    def start_timer(self, entry_id: int):
+        """
+        Startet Timer ab der aktuell erfassten Dauer
+        
+        Args:
+            entry_id: ID des Eintrags
+        """
+        row = self._rows_by_id.get(entry_id)
+        if row is not None:
+            self.timer_service.start(entry_id, self._entries[row].duration_minutes * 60)
+    
+    def stop_timer(self, entry_id: int) -> Optional[int]:
+        """
+        Stoppt Timer
+        
+        Args:
+            entry_id: ID des Eintrags
+        
+        Returns:
+            Gesamt-Minuten oder None, wenn kein Timer lief
+        """
+        seconds = self.timer_service.stop(entry_id)
+        return None if seconds is None else seconds // 60
+    
+    def refresh_timers(self, first_row: int = 0, last_row: Optional[int] = None):
+        """
+        Meldet die Timer-Zellen laufender Timer als geändert (eine Sekunde weiter)
+        
+        Args:
+            first_row: Erste sichtbare Zeile
+            last_row: Letzte sichtbare Zeile (None: bis zum Ende)
+        """
+        if last_row is None:
+            last_row = len(self._entries) - 1
+        for entry_id in self.timer_service.running_ids():
+            row = self._rows_by_id.get(entry_id)
+            if row is not None and first_row <= row <= last_row:
+                self._emit_timer_changed(row)
+    
+    def _on_timer_changed(self, entry_id: int):
+        """Timer wurde gestartet oder gestoppt (TimerService)"""
+        row = self._rows_by_id.get(entry_id)
+        if row is not None:
+            self._emit_timer_changed(row)
+    
+    def _emit_timer_changed(self, row: int):
+        index = self.index(row, COL_TIMER)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, TIMER_RUNNING_ROLE])
+    
+    # ===== QAbstractTableModel =====
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._entries)
+    
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+    
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        if not index.isValid():
+            return Qt.NoItemFlags
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        if index.column() in self.EDITABLE_COLUMNS:
+            flags |= Qt.ItemIsEditable
+        return flags
+    
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        entry = self._entries[index.row()]
+        column = index.column()
+        
+        if role == Qt.DisplayRole:
+            return self._display_text(entry, column)
+        if role == Qt.EditRole:
+            if column == COL_DURATION:
+                return f"{entry.duration_minutes}m"
+            return self._display_text(entry, column)
+        if role == ENTRY_ID_ROLE:
+            return entry.id
+        if role == MINUTES_ROLE:
+            return entry.duration_minutes
+        if role == TIMER_RUNNING_ROLE:
+            return self.timer_service.is_running(entry.id)
+        return None
+    
+    def setData(self, index: QModelIndex, value, role: int = Qt.EditRole) -> bool:
+        if not index.isValid() or role != Qt.EditRole or index.column() not in self.EDITABLE_COLUMNS:
+            return False
+        
+        text = str(value).strip()
+        if text == self.data(index, Qt.EditRole):
+            return False
+        self.cell_edited.emit(self._entries[index.row()].id, index.column(), text)
+        return True
+    
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        return not parent.isValid() and self._pages is not None
+    
+    def fetchMore(self, parent: QModelIndex = QModelIndex()):
+        if parent.isValid() or self._pages is None:
+            return
+        
+        page = next(self._pages, None)
+        if not page:
+            self._pages = None
+            return
+        
+        first = len(self._entries)
+        self.beginInsertRows(QModelIndex(), first, first + len(page) - 1)
+        self._entries.extend(page)
+        for row in range(first, len(self._entries)):
+            self._rows_by_id[self._entries[row].id] = row
+        self.endInsertRows()
+        
+        # Aktive Sortierung auf nachgeladene Zeilen ausdehnen
+        if self._sort is not None:
+            self.sort(*self._sort)
+    
+    def sort(self, column: int, order: Qt.SortOrder = Qt.AscendingOrder):
+        """Sortiert die geladenen Zeilen (Datum und Dauer nach Wert, sonst nach Text)"""
+        if column < 0 or column in (COL_TIMER, COL_ACTION):
+            return
+        
+        self._sort = (column, order)
+        self.layoutAboutToBeChanged.emit()
+        self._entries.sort(key=self._sort_key(column), reverse=order == Qt.DescendingOrder)
+        self._rebuild_row_map()
+        self.layoutChanged.emit()
+    
+    # ===== Hilfsmethoden =====
+    
+    def _display_text(self, entry, column: int) -> str:
+        """Anzeigetext einer Zelle"""
+        if column == COL_DATE:
+            return entry.date.strftime("%d.%m.%Y")
+        if column == COL_WORKER:
+            return self._worker_names.get(entry.worker_id, f"ID:{entry.worker_id}")
+        if column == COL_TYPE:
+            return split_description(entry.description)[0]
+        if column == COL_PROJECT:
+            return split_project(entry.project)[0]
+        if column == COL_CATEGORY:
+            return split_project(entry.project)[1]
+        if column == COL_DESCRIPTION:
+            return split_description(entry.description)[1]
+        if column == COL_DURATION:
+            return f"{entry.duration_minutes}m ({entry.duration_minutes / 60.0:.2f}h)"
+        if column == COL_TIMER:
+            seconds = self.timer_service.seconds(entry.id)
+            if seconds is None:
+                seconds = entry.duration_minutes * 60
+            return format_seconds(seconds)
+        if column == COL_ACTION:
+            return "🗑️ Löschen"
+        return ""
+    
+    def _sort_key(self, column: int):
+        """Sortierschlüssel einer Spalte"""
+        if column == COL_DATE:
+            return lambda entry: (entry.date, entry.id)
+        if column == COL_DURATION:
+            return lambda entry: entry.duration_minutes
+        return lambda entry: self._display_text(entry, column).lower()
+    
+    def _rebuild_row_map(self):
+        self._rows_by_id = {entry.id: row for row, entry in enumerate(self._entries)}
@@ -6,19 +6,25 @@ from PySide6.QtWidgets import (
     QWidget, QFormLayout, QLineEdit, QDateEdit, 
     QTextEdit, QPushButton, QLabel, QComboBox,
     QVBoxLayout, QHBoxLayout, QMessageBox, QSplitter,
-    QTableWidget, QTableWidgetItem, QHeaderView, QCompleter,
-    QAbstractItemView
+    QTableView, QHeaderView, QCompleter, QAbstractItemView
 )
-from PySide6.QtCore import Qt, QDate, Signal, QSettings
+from PySide6.QtCore import Qt, QDate, Signal, QSettings, QModelIndex
 from PySide6.QtGui import QFont
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Iterator, Tuple
 from datetime import datetime
+from dataclasses import replace
 
 from ..viewmodels.time_entry_viewmodel import TimeEntryViewModel
 from ..repositories.time_entry_repository import TimeEntryRepository
+from ..services.timer_service import TimerService
+from ..utils.search_index import SearchIndex
 from .date_range_widget import DateRangeWidget
-from .timer_widget import TimerWidget
 from .table_search_widget import TableSearchWidget
+from .time_entry_table_model import (
+    TimeEntryTableModel, split_description, split_project,
+    COL_PROJECT, COL_CATEGORY, COL_DESCRIPTION, COL_DURATION, COL_TIMER, COL_ACTION
+)
+from .time_entry_delegates import TimerDelegate, DeleteButtonDelegate
 from .table_pagination_widget import TablePaginationWidget
 
 
@@ -29,24 +35,47 @@ class TimeEntryWidget(QWidget):
     Features:
     - Zweigeteilt: Formular (oben) + Liste (unten)
     - Formular: Worker, Datum, Typ, Projekt, Kategorie, Beschreibung, Dauer
-    - Liste: Alle Zeitbuchungen mit Löschen-Button
+    - Liste: Alle Zeitbuchungen mit Löschen-Button (TimeEntryTableModel,
+      Timer und Button als Delegates; Seitengröße "Alle" lädt beim Scrollen nach)
+    - Laufende Timer liegen im TimerService und überstehen Refresh,
+      Blättern und Tab-Wechsel
     - Automatisches Refresh der Liste
+    - Entprellte Suche über einen SearchIndex des Filterbereichs (einmal pro
+      Laden aufgebaut, bei Anlegen/Bearbeiten/Löschen inkrementell gepflegt);
+      große Bereiche per FTS5-Volltextsuche (TimeEntryRepository.search) über
+      Beschreibung und Projekt, ohne Datum und Worker
     - Live-Validierung der Zeit-Eingabe
     - Autovervollständigung für Projekte
     
     Signals:
         entry_saved: Emittiert nach erfolgreicher Speicherung
         entry_deleted: Emittiert nach erfolgreichem Löschen
+        entry_changed: Emittiert nach Tabellen-Änderung, Timer-Stopp oder Löschen
+            (alter TimeEntry, neuer TimeEntry bzw. None nach Löschen)
     """
     
     entry_saved = Signal(int)  # Emittiert Entry-ID
     entry_deleted = Signal(int)  # Emittiert Entry-ID
+    entry_changed = Signal(object, object)  # Emittiert (alt, neu)
+    
+    # Seitengröße beim Nachladen ohne Pagination (Seitengröße "Alle")
+    FETCH_SIZE = 500
+    
+    # Tipp-Pause vor dem Suchen
+    SEARCH_DEBOUNCE_MS = 150
+    
+    # Größere Bereiche werden per FTS5 in der Datenbank durchsucht statt im Speicher,
+    # dort nur Beschreibung und Projekt (Worker-Namen sind verschlüsselt gespeichert)
+    SEARCH_INDEX_MAX_ENTRIES = 50000
+    FTS_RESULT_LIMIT = 2000
+    FTS_SEARCH_SCOPE = "nur Beschreibung und Projekt"
     
     def __init__(
         self, 
         viewmodel: TimeEntryViewModel,
         time_entry_repository: TimeEntryRepository,
-        parent: Optional[QWidget] = None
+        parent: Optional[QWidget] = None,
+        timer_service: Optional[TimerService] = None
     ):
         """
         Initialisiert TimeEntryWidget
@@ -55,27 +84,29 @@ class TimeEntryWidget(QWidget):
             viewmodel: TimeEntryViewModel-Instanz
             time_entry_repository: Repository für TimeEntry-Zugriff
             parent: Optional parent widget
+            timer_service: Laufende Timer (Standard: TimerService.shared())
         """
         super().__init__(parent)
         self.viewmodel = viewmodel
         self.time_entry_repository = time_entry_repository
+        self.timer_service = timer_service or TimerService.shared()
         self._workers = []
+        self._worker_names: Dict[int, str] = {}
         self._project_completer = None
         
         # Datumsfilter-State (Standard: Heute)
         self._filter_start_date = QDate.currentDate()
         self._filter_end_date = QDate.currentDate()
         
-        # Timer-Widgets Tracking (entry_id -> TimerWidget)
-        self._timer_widgets: Dict[int, TimerWidget] = {}
-        
-        # Entry-ID zu Row-Mapping (für Updates)
-        self._entry_row_map: Dict[int, int] = {}
-        
         # Pagination State
-        self._all_entries = []  # Alle geladenen Einträge (ungefiltert)
+        self._total_entries = 0  # Anzahl Einträge im Filterbereich (COUNT)
+        self._page_cursors: Dict[int, Optional[Tuple[str, int]]] = {1: None}  # Seite -> Keyset-Cursor
         self._filtered_entries = []  # Nach Suche gefilterte Einträge
         
+        # Suchindex über den Filterbereich, erst bei aktiver Suche geladen
+        self._search_index = SearchIndex(self._search_fields, key=lambda e: e.date, reverse=True)
+        self._search_range: Optional[Tuple[str, str]] = None  # Geladener Bereich oder None
+        
         self._setup_ui()
         self._connect_signals()
     
@@ -223,22 +254,28 @@ class TimeEntryWidget(QWidget):
         layout.addWidget(self.date_range_widget)
         
         # Such-Widget
-        self.search_widget = TableSearchWidget("🔍 Datum, Worker, Projekt oder Beschreibung suchen...")
+        self.search_widget = TableSearchWidget(
+            "🔍 Datum, Worker, Projekt oder Beschreibung suchen...",
+            debounce_ms=self.SEARCH_DEBOUNCE_MS
+        )
         self.search_widget.search_changed.connect(self._on_search)
         layout.addWidget(self.search_widget)
         
-        # Tabelle
-        self.entries_table = QTableWidget()
-        self.entries_table.setColumnCount(9)  # Eine Spalte mehr für Timer
-        self.entries_table.setHorizontalHeaderLabels([
-            "Datum", "Worker", "Typ", "Projekt", "Kategorie", 
-            "Beschreibung", "Dauer", "Timer", "Aktion"
-        ])
-        self.entries_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
-        self.entries_table.horizontalHeader().setSectionResizeMode(5, QHeaderView.Stretch)
-        self.entries_table.setSelectionBehavior(QTableWidget.SelectRows)
+        # Tabelle (Model/View, Zellinhalte werden beim Zeichnen berechnet)
+        self.entries_model = TimeEntryTableModel(self, self.timer_service)
+        self.entries_model.cell_edited.connect(self._on_cell_edited)
+        
+        self.entries_table = QTableView()
+        self.entries_table.setModel(self.entries_model)
+        header = self.entries_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        header.setSectionResizeMode(COL_DESCRIPTION, QHeaderView.Stretch)
+        # Feste Zeilenhöhe: kein Messen aller Zeilen bei großen Modellen
+        self.entries_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.entries_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.entries_table.setAlternatingRowColors(True)
         self.entries_table.setSortingEnabled(True)
+        self.entries_table.setMouseTracking(True)
         
         # Editierbar machen (Doppelklick oder F2)
         self.entries_table.setEditTriggers(
@@ -246,15 +283,22 @@ class TimeEntryWidget(QWidget):
             QAbstractItemView.EditKeyPressed
         )
         
-        # Signal für Zell-Änderungen
-        self.entries_table.itemChanged.connect(self._on_table_item_changed)
+        # Timer und Löschen-Button als Delegates statt Widgets pro Zeile
+        self._timer_delegate = TimerDelegate(self.entries_table)
+        self._timer_delegate.toggled.connect(self._on_timer_toggled)
+        self.entries_table.setItemDelegateForColumn(COL_TIMER, self._timer_delegate)
+        self._delete_delegate = DeleteButtonDelegate(self.entries_table)
+        self._delete_delegate.clicked.connect(
+            lambda index: self._on_delete_entry(self.entries_model.entry_at(index.row()).id)
+        )
+        self.entries_table.setItemDelegateForColumn(COL_ACTION, self._delete_delegate)
         
         layout.addWidget(self.entries_table)
         
         # Pagination-Widget
         settings = QSettings()
         default_page_size = settings.value("time_entry_page_size", 25, type=int)
-        self.pagination_widget = TablePaginationWidget(default_page_size)
+        self.pagination_widget = TablePaginationWidget(default_page_size, allow_all=True)
         self.pagination_widget.page_changed.connect(self._on_page_changed)
         self.pagination_widget.page_size_changed.connect(self._on_page_size_changed)
         layout.addWidget(self.pagination_widget)
@@ -280,6 +324,9 @@ class TimeEntryWidget(QWidget):
         
         # Worker-Änderung für Regelarbeitszeit
         self.worker_combo.currentIndexChanged.connect(self._on_worker_changed)
+        
+        # Timer-Anzeige: gemeinsamer Takt des TimerService
+        self.timer_service.ticked.connect(self._on_timer_tick)
     
     def _on_time_input_changed(self, text: str):
         """
@@ -475,7 +522,13 @@ class TimeEntryWidget(QWidget):
         """
         self._show_status(f"✓ Zeiterfassung erfolgreich gespeichert (ID: {entry_id})", "success")
         self._clear_form()
-        self._refresh_entries_list()
+        
+        # Geladenen Suchindex ergänzen statt den ganzen Bereich neu zu lesen
+        if self._search_range is not None:
+            entry = self.time_entry_repository.find_by_id(entry_id)
+            if entry and self._in_search_range(entry):
+                self._search_index.add(entry)
+        self._refresh_entries_list(reload_search=False)
         self.entry_saved.emit(entry_id)
     
     def _on_validation_failed(self, errors: list):
@@ -554,24 +607,26 @@ class TimeEntryWidget(QWidget):
         
         self.time_input.setFocus()
     
-    def _refresh_entries_list(self):
-        """Aktualisiert die Liste der Zeitbuchungen"""
+    def _refresh_entries_list(self, reload_search: bool = True):
+        """
+        Aktualisiert die Liste der Zeitbuchungen
+        
+        Args:
+            reload_search: Suchindex verwerfen (False: Aufrufer hat ihn bereits angepasst)
+        """
         try:
-            # Stopppe alle laufenden Timer vor dem Refresh
-            self._stop_all_timers()
+            # Gestoppte Timer-Dauern schreiben, bevor neu gelesen wird
+            self.timer_service.flush()
             
-            # Verwende Filter-Datumsbereich
-            start_date_str = self._filter_start_date.toString("yyyy-MM-dd")
-            end_date_str = self._filter_end_date.toString("yyyy-MM-dd")
-            
-            # Lade alle Einträge aus DB
-            self._all_entries = self.time_entry_repository.find_by_date_range(
+            # Ohne Suche wird nur gezählt, die Seiten lädt _load_current_page
+            start_date_str, end_date_str = self._filter_range()
+            self._total_entries = self.time_entry_repository.count_by_date_range(
                 start_date_str,
                 end_date_str
             )
-            
-            # Sortiere nach Datum absteigend
-            self._all_entries.sort(key=lambda e: e.date, reverse=True)
+            self._page_cursors = {1: None}
+            if reload_search:
+                self._search_range = None
             
             # Wende aktuelle Suche an (falls vorhanden)
             self._apply_search_filter()
@@ -582,150 +637,157 @@ class TimeEntryWidget(QWidget):
         except Exception as e:
             self._show_status(f"Fehler beim Laden der Einträge: {str(e)}", "error")
     
+    def _filter_range(self) -> Tuple[str, str]:
+        """Aktueller Datumsfilter als (start, end) im Format YYYY-MM-DD"""
+        return (
+            self._filter_start_date.toString("yyyy-MM-dd"),
+            self._filter_end_date.toString("yyyy-MM-dd")
+        )
+    
     def _apply_search_filter(self):
         """Wendet Suchfilter auf alle Einträge an"""
-        search_text = self.search_widget.get_search_text().lower()
+        search_text = self.search_widget.get_search_text()
         
         if not search_text:
-            # Keine Suche - alle Einträge anzeigen
-            self._filtered_entries = self._all_entries[:]
-        else:
-            # Filtere Einträge basierend auf Suchtext
+            # Keine Suche - Seiten kommen direkt aus der Datenbank
             self._filtered_entries = []
-            worker_names = {w.id: w.name for w in self._workers}
-            
-            for entry in self._all_entries:
-                # Extrahiere suchbare Felder
-                date_str = entry.date.strftime("%d.%m.%Y")
-                worker_name = worker_names.get(entry.worker_id, f"ID:{entry.worker_id}")
-                project = entry.project or ""
-                description = entry.description or ""
-                
-                # Prüfe ob Suchtext in einem der Felder vorkommt
-                if (search_text in date_str.lower() or
-                    search_text in worker_name.lower() or
-                    search_text in project.lower() or
-                    search_text in description.lower()):
-                    self._filtered_entries.append(entry)
+            self.search_widget.set_result_count(self._total_entries, self._total_entries)
+            return
+        
+        filter_range = self._filter_range()
+        # Gestoppte Timer-Dauern schreiben, bevor aus der Datenbank gelesen wird
+        self.timer_service.flush()
+        if (self._total_entries > self.SEARCH_INDEX_MAX_ENTRIES
+                and self.time_entry_repository.supports_search()):
+            # Großer Bereich: beste Treffer aus dem Volltextindex statt alle Einträge laden
+            # (nur Beschreibung und Projekt, Worker-Namen sind verschlüsselt gespeichert)
+            self._search_index.build([])
+            self._search_range = None
+            self._filtered_entries = self.time_entry_repository.search(
+                search_text, *filter_range, limit=self.FTS_RESULT_LIMIT
+            )
+            self.search_widget.set_result_count(
+                len(self._filtered_entries),
+                self._total_entries,
+                capped=len(self._filtered_entries) >= self.FTS_RESULT_LIMIT,
+                scope=self.FTS_SEARCH_SCOPE
+            )
+            return
+        
+        # Suche filtert im Klartext (Worker-Namen sind verschlüsselt gespeichert)
+        if self._search_range != filter_range:
+            self._search_index.build(self.time_entry_repository.find_by_date_range(*filter_range))
+            self._search_range = filter_range
+        
+        self._filtered_entries = self._search_index.query(search_text)
         
         # Update Treffer-Anzeige im Search Widget
         self.search_widget.set_result_count(
             len(self._filtered_entries),
-            len(self._all_entries)
+            len(self._search_index)
+        )
+    
+    def _search_fields(self, entry) -> Tuple[str, str, str, str]:
+        """Durchsuchbare Texte eines Eintrags: Datum, Worker, Projekt, Beschreibung"""
+        return (
+            entry.date.strftime("%d.%m.%Y"),
+            self._worker_names.get(entry.worker_id, f"ID:{entry.worker_id}"),
+            entry.project or "",
+            entry.description or ""
         )
     
+    def _in_search_range(self, entry) -> bool:
+        """True wenn der Eintrag im geladenen Suchbereich liegt"""
+        start_date_str, end_date_str = self._search_range
+        return start_date_str <= entry.date.strftime("%Y-%m-%d") <= end_date_str
+    
+    def _load_current_page(self) -> List:
+        """
+        Lädt die aktuelle Seite per Keyset-Pagination
+        
+        Cursor bereits besuchter Seiten werden gemerkt. Für eine noch
+        unbekannte Seite wird ab der nächstniedrigeren bekannten Seite
+        vorwärts geblättert.
+        
+        Returns:
+            Einträge der aktuellen Seite
+        """
+        page = self.pagination_widget.get_current_page()
+        limit = self.pagination_widget.get_limit()
+        start_date_str, end_date_str = self._filter_range()
+        # Gestoppte Timer-Dauern schreiben, bevor aus der Datenbank gelesen wird
+        self.timer_service.flush()
+        
+        known_page = max(p for p in self._page_cursors if p <= page)
+        while True:
+            entries = self.time_entry_repository.find_page_by_date_range(
+                start_date_str,
+                end_date_str,
+                limit,
+                self._page_cursors[known_page]
+            )
+            if len(entries) == limit:
+                self._page_cursors[known_page + 1] = self.time_entry_repository.page_cursor(entries[-1])
+            
+            if known_page == page:
+                return entries
+            if len(entries) < limit:
+                return []
+            known_page += 1
+    
     def _update_paginated_table(self):
         """Aktualisiert Tabelle mit aktueller Seite der gefilterten Einträge"""
-        # Update Pagination Widget mit Gesamtanzahl
-        self.pagination_widget.set_total_items(len(self._filtered_entries))
+        searching = bool(self.search_widget.get_search_text())
         
-        # Tabelle leeren
-        self.entries_table.setRowCount(0)
-        self.entries_table.setSortingEnabled(False)
+        # Update Pagination Widget mit Gesamtanzahl
+        self.pagination_widget.set_total_items(
+            len(self._filtered_entries) if searching else self._total_entries
+        )
         
-        # Clear tracking dicts
-        self._timer_widgets.clear()
-        self._entry_row_map.clear()
+        # Ohne Pagination: Suchtreffer liegen im Speicher, sonst Nachladen beim Scrollen
+        if self.pagination_widget.is_showing_all():
+            if searching:
+                self.entries_model.set_entries(self._filtered_entries)
+            else:
+                self.entries_model.set_entries([], self._iter_pages())
+                self.entries_model.fetchMore(QModelIndex())
+            self.entries_table.resizeColumnsToContents()
+            return
         
         # Berechne welche Einträge angezeigt werden sollen
-        offset = self.pagination_widget.get_offset()
-        limit = self.pagination_widget.get_limit()
-        paginated_entries = self._filtered_entries[offset:offset + limit]
-        
-        # Worker-Namen als Dict für schnellen Zugriff
-        worker_names = {w.id: w.name for w in self._workers}
+        if searching:
+            offset = self.pagination_widget.get_offset()
+            limit = self.pagination_widget.get_limit()
+            paginated_entries = self._filtered_entries[offset:offset + limit]
+        else:
+            paginated_entries = self._load_current_page()
         
-        # Signal temporär trennen für Bulk-Update
-        self.entries_table.itemChanged.disconnect(self._on_table_item_changed)
+        self.entries_model.set_entries(paginated_entries)
+        self.entries_table.resizeColumnsToContents()
+    
+    def _iter_pages(self) -> Iterator[List]:
+        """
+        Liefert den Filterbereich seitenweise per Keyset-Cursor (für fetchMore)
         
-        # Einträge in Tabelle einfügen
-        for entry in paginated_entries:
-            row = self.entries_table.rowCount()
-            self.entries_table.insertRow(row)
-            
-            # Speichere Mapping
-            self._entry_row_map[entry.id] = row
-            
-            # Datum (nicht editierbar)
-            date_item = QTableWidgetItem(entry.date.strftime("%d.%m.%Y"))
-            date_item.setFlags(date_item.flags() & ~Qt.ItemIsEditable)
-            self.entries_table.setItem(row, 0, date_item)
-            
-            # Worker (nicht editierbar)
-            worker_name = worker_names.get(entry.worker_id, f"ID:{entry.worker_id}")
-            worker_item = QTableWidgetItem(worker_name)
-            worker_item.setFlags(worker_item.flags() & ~Qt.ItemIsEditable)
-            self.entries_table.setItem(row, 1, worker_item)
-            
-            # Typ (aus Beschreibung extrahieren, nicht editierbar)
-            entry_type = "Arbeit"
-            description = entry.description
-            if description.startswith("["):
-                end_bracket = description.find("]")
-                if end_bracket > 0:
-                    entry_type = description[1:end_bracket]
-                    description = description[end_bracket+1:].strip()
-            
-            type_item = QTableWidgetItem(entry_type)
-            type_item.setFlags(type_item.flags() & ~Qt.ItemIsEditable)
-            self.entries_table.setItem(row, 2, type_item)
-            
-            # Projekt und Kategorie (editierbar)
-            project = entry.project or ""
-            category = ""
-            if " - " in project:
-                project, category = project.split(" - ", 1)
-            
-            project_item = QTableWidgetItem(project)
-            project_item.setData(Qt.UserRole, entry.id)  # Speichere Entry-ID
-            self.entries_table.setItem(row, 3, project_item)
-            
-            category_item = QTableWidgetItem(category)
-            category_item.setData(Qt.UserRole, entry.id)
-            self.entries_table.setItem(row, 4, category_item)
-            
-            # Beschreibung (editierbar)
-            desc_item = QTableWidgetItem(description)
-            desc_item.setData(Qt.UserRole, entry.id)
-            self.entries_table.setItem(row, 5, desc_item)
-            
-            # Dauer (editierbar)
-            hours = entry.duration_minutes / 60.0
-            duration_str = f"{entry.duration_minutes}m ({hours:.2f}h)"
-            duration_item = QTableWidgetItem(duration_str)
-            duration_item.setData(Qt.UserRole, entry.id)
-            duration_item.setData(Qt.UserRole + 1, entry.duration_minutes)  # Original-Minuten
-            self.entries_table.setItem(row, 6, duration_item)
-            
-            # Timer Widget
-            timer_widget = TimerWidget(entry.id, entry.duration_minutes)
-            timer_widget.timer_stopped.connect(
-                lambda minutes, e_id=entry.id: self._on_timer_stopped(e_id, minutes)
+        Yields:
+            Listen mit bis zu FETCH_SIZE Einträgen
+        """
+        start_date_str, end_date_str = self._filter_range()
+        cursor = None
+        while True:
+            # Seiten werden erst beim Scrollen gelesen - vorher gestoppte Dauern schreiben
+            self.timer_service.flush()
+            entries = self.time_entry_repository.find_page_by_date_range(
+                start_date_str,
+                end_date_str,
+                self.FETCH_SIZE,
+                cursor
             )
-            self._timer_widgets[entry.id] = timer_widget
-            self.entries_table.setCellWidget(row, 7, timer_widget)
-            
-            # Löschen-Button
-            delete_button = QPushButton("🗑️ Löschen")
-            delete_button.clicked.connect(lambda checked, e_id=entry.id: self._on_delete_entry(e_id))
-            delete_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #dc3545;
-                    color: white;
-                    border: none;
-                    padding: 5px 10px;
-                    border-radius: 3px;
-                }
-                QPushButton:hover {
-                    background-color: #c82333;
-                }
-            """)
-            self.entries_table.setCellWidget(row, 8, delete_button)
-        
-        # Signal wieder verbinden
-        self.entries_table.itemChanged.connect(self._on_table_item_changed)
-        
-        self.entries_table.setSortingEnabled(True)
+            if entries:
+                yield entries
+            if len(entries) < self.FETCH_SIZE:
+                return
+            cursor = self.time_entry_repository.page_cursor(entries[-1])
     
     def _on_search(self, search_text: str):
         """
@@ -766,167 +828,148 @@ class TimeEntryWidget(QWidget):
         settings = QSettings()
         settings.setValue("time_entry_page_size", size)
         
+        # Cursor gelten nur für die bisherige Seitengröße
+        self._page_cursors = {1: None}
+        
         # Update Tabelle
         self._update_paginated_table()
     
+    def _on_timer_toggled(self, index: QModelIndex):
+        """
+        Startet oder stoppt den Timer einer Zeile (TimerDelegate)
+        
+        Args:
+            index: Index der Timer-Zelle
+        """
+        entry_id = self.entries_model.entry_at(index.row()).id
+        if self.entries_model.is_timer_running(entry_id):
+            self._on_timer_stopped(entry_id, self.entries_model.stop_timer(entry_id))
+        else:
+            self.entries_model.start_timer(entry_id)
+    
+    def _on_timer_tick(self):
+        """Zeichnet nur die sichtbaren Zeilen mit laufendem Timer neu"""
+        if not self.entries_table.isVisible() or self.entries_model.rowCount() == 0:
+            return
+        
+        viewport = self.entries_table.viewport()
+        first_row = self.entries_table.rowAt(0)
+        if first_row < 0:
+            return
+        last_row = self.entries_table.rowAt(viewport.height() - 1)
+        if last_row < 0:
+            last_row = self.entries_model.rowCount() - 1
+        self.entries_model.refresh_timers(first_row, last_row)
+    
     def _on_timer_stopped(self, entry_id: int, minutes: int):
         """
         Behandelt Timer-Stopp Event
         
+        Mit Timer-Journal steht die Dauer bereits im Journal; der
+        TimerService schreibt sie gebündelt nach time_entries. Ohne
+        Journal wird sofort gespeichert. Die Zeile zeigt die neue Dauer
+        in beiden Fällen direkt an.
+        
         Args:
             entry_id: ID des TimeEntry
             minutes: Erfasste Minuten
         """
         try:
-            # Lade Entry aus DB
-            entry = self.time_entry_repository.find_by_id(entry_id)
-            if not entry:
+            row = self.entries_model.row_of(entry_id)
+            if row is None:
                 self._show_status(f"Fehler: Entry {entry_id} nicht gefunden", "error")
                 return
             
-            # Update Dauer
-            entry.duration_minutes = minutes
-            entry.updated_at = datetime.now()
+            old_entry = self.entries_model.entry_at(row)
+            entry = replace(old_entry, duration_minutes=minutes, updated_at=datetime.now())
             
-            # Speichere in DB
-            success = self.time_entry_repository.update(entry)
-            if success:
-                # Update Tabellen-Zelle
-                row = self._entry_row_map.get(entry_id)
-                if row is not None:
-                    hours = minutes / 60.0
-                    duration_str = f"{minutes}m ({hours:.2f}h)"
-                    
-                    # Temporär Signal trennen für Update
-                    self.entries_table.itemChanged.disconnect(self._on_table_item_changed)
-                    
-                    duration_item = self.entries_table.item(row, 6)
-                    if duration_item:
-                        duration_item.setText(duration_str)
-                        duration_item.setData(Qt.UserRole + 1, minutes)
-                    
-                    # Signal wieder verbinden
-                    self.entries_table.itemChanged.connect(self._on_table_item_changed)
-                
-                self._show_status(f"✓ Timer gestoppt: {minutes} Minuten erfasst", "success")
-            else:
+            if not self.timer_service.has_journal() and not self.time_entry_repository.update(entry):
                 self._show_status("Fehler beim Speichern der Dauer", "error")
+                return
+            
+            # Nur die betroffene Zeile neu zeichnen
+            self.entries_model.update_entry(entry)
+            if entry_id in self._search_index:
+                self._search_index.update(entry)
+            
+            self._show_status(f"✓ Timer gestoppt: {minutes} Minuten erfasst", "success")
+            self.entry_changed.emit(old_entry, entry)
                 
         except Exception as e:
             self._show_status(f"Fehler beim Timer-Stopp: {str(e)}", "error")
     
-    def _on_table_item_changed(self, item: QTableWidgetItem):
+    def _on_cell_edited(self, entry_id: int, column: int, new_value: str):
         """
-        Behandelt Änderungen in der Tabelle
+        Behandelt Änderungen in der Tabelle (TimeEntryTableModel.cell_edited)
         
         Args:
-            item: Geändertes Table Item
+            entry_id: ID des bearbeiteten Eintrags
+            column: Spalte: Projekt, Kategorie, Beschreibung oder Dauer
+            new_value: Eingegebener Text
         """
-        # Hole Entry-ID aus Item
-        entry_id = item.data(Qt.UserRole)
-        if not entry_id:
-            return
-        
-        col = item.column()
-        
-        # Nur editierbare Spalten: Projekt (3), Kategorie (4), Beschreibung (5), Dauer (6)
-        if col not in [3, 4, 5, 6]:
-            return
-        
         try:
+            # Gestoppte Timer-Dauern zuerst schreiben, sonst überschreibt das Update sie
+            self.timer_service.flush()
+            
             # Lade Entry aus DB
             entry = self.time_entry_repository.find_by_id(entry_id)
             if not entry:
                 return
             
-            new_value = item.text().strip()
+            # Zustand vor der Änderung für entry_changed
+            old_entry = replace(entry)
             
             # Update entsprechende Eigenschaft
-            if col == 3:  # Projekt
-                # Kombiniere mit Kategorie
-                row = item.row()
-                category_item = self.entries_table.item(row, 4)
-                category = category_item.text().strip() if category_item else ""
-                
-                if new_value and category:
-                    entry.project = f"{new_value} - {category}"
-                elif new_value:
-                    entry.project = new_value
-                elif category:
-                    entry.project = f" - {category}"
+            if column in (COL_PROJECT, COL_CATEGORY):
+                # Projekt und Kategorie werden kombiniert gespeichert
+                project, category = split_project(entry.project)
+                if column == COL_PROJECT:
+                    project = new_value
                 else:
-                    entry.project = None
-                    
-            elif col == 4:  # Kategorie
-                # Kombiniere mit Projekt
-                row = item.row()
-                project_item = self.entries_table.item(row, 3)
-                project = project_item.text().strip() if project_item else ""
+                    category = new_value
                 
-                if project and new_value:
-                    entry.project = f"{project} - {new_value}"
+                if project and category:
+                    entry.project = f"{project} - {category}"
                 elif project:
                     entry.project = project
-                elif new_value:
-                    entry.project = f" - {new_value}"
+                elif category:
+                    entry.project = f" - {category}"
                 else:
                     entry.project = None
                     
-            elif col == 5:  # Beschreibung
-                # Prüfe ob Typ-Prefix vorhanden
-                row = item.row()
-                type_item = self.entries_table.item(row, 2)
-                entry_type = type_item.text() if type_item else "Arbeit"
-                
+            elif column == COL_DESCRIPTION:
+                # Typ-Prefix erhalten
+                entry_type = split_description(entry.description)[0]
                 if entry_type != "Arbeit":
                     entry.description = f"[{entry_type}] {new_value}"
                 else:
                     entry.description = new_value
                     
-            elif col == 6:  # Dauer
+            elif column == COL_DURATION:
                 # Parse Dauer-Eingabe
                 parsed_minutes = self.viewmodel.parse_time_input(new_value)
-                if parsed_minutes is not None:
-                    entry.duration_minutes = parsed_minutes
-                    
-                    # Update Anzeige
-                    hours = parsed_minutes / 60.0
-                    item.setText(f"{parsed_minutes}m ({hours:.2f}h)")
-                    item.setData(Qt.UserRole + 1, parsed_minutes)
-                    
-                    # Update Timer Widget
-                    timer_widget = self._timer_widgets.get(entry_id)
-                    if timer_widget:
-                        # Nur updaten wenn Timer nicht läuft
-                        if not timer_widget.is_timer_running():
-                            timer_widget.accumulated_seconds = parsed_minutes * 60
-                            timer_widget._update_display()
-                else:
-                    # Ungültige Eingabe - zurücksetzen
-                    orig_minutes = item.data(Qt.UserRole + 1)
-                    if orig_minutes:
-                        hours = orig_minutes / 60.0
-                        item.setText(f"{orig_minutes}m ({hours:.2f}h)")
+                if parsed_minutes is None:
+                    # Ungültige Eingabe - Modell zeigt weiter den alten Wert
                     self._show_status("Ungültige Dauer-Eingabe", "error")
                     return
+                entry.duration_minutes = parsed_minutes
             
             # Speichere in DB
             entry.updated_at = datetime.now()
             success = self.time_entry_repository.update(entry)
             
             if success:
+                self.entries_model.update_entry(entry)
+                if entry_id in self._search_index:
+                    self._search_index.update(entry)
                 self._show_status("✓ Änderung gespeichert", "success")
+                self.entry_changed.emit(old_entry, entry)
             else:
                 self._show_status("Fehler beim Speichern", "error")
                 
         except Exception as e:
             self._show_status(f"Fehler beim Speichern: {str(e)}", "error")
     
-    def _stop_all_timers(self):
-        """Stoppt alle laufenden Timer"""
-        for timer_widget in self._timer_widgets.values():
-            timer_widget.stop_timer_if_running()
-    
     def _on_delete_entry(self, entry_id: int):
         """
         Löscht einen Eintrag
@@ -944,11 +987,16 @@ class TimeEntryWidget(QWidget):
         
         if reply == QMessageBox.Yes:
             try:
+                old_entry = self.time_entry_repository.find_by_id(entry_id)
                 success = self.time_entry_repository.delete(entry_id)
                 if success:
+                    self.timer_service.discard(entry_id)
+                    self._search_index.remove(entry_id)
                     self._show_status(f"✓ Eintrag {entry_id} erfolgreich gelöscht", "success")
-                    self._refresh_entries_list()
+                    self._refresh_entries_list(reload_search=False)
                     self.entry_deleted.emit(entry_id)
+                    if old_entry:
+                        self.entry_changed.emit(old_entry, None)
                 else:
                     self._show_status(f"✗ Eintrag {entry_id} konnte nicht gelöscht werden", "error")
             except Exception as e:
@@ -962,17 +1010,19 @@ class TimeEntryWidget(QWidget):
             end_date = datetime.now()
             start_date = end_date - timedelta(days=365)  # Letzte 12 Monate
             
-            entries = self.time_entry_repository.find_by_date_range(
+            # Zeilen-Tuples streamen statt ein Jahr an TimeEntry-Objekten aufzubauen
+            rows = self.time_entry_repository.iter_by_date_range(
                 start_date.strftime("%Y-%m-%d"),
-                end_date.strftime("%Y-%m-%d")
+                end_date.strftime("%Y-%m-%d"),
+                rows=True
             )
             
             # Einzigartige Projekte extrahieren
             projects = set()
-            for entry in entries:
-                if entry.project:
+            for *_, entry_project in rows:
+                if entry_project:
                     # Nur Projekt-Teil (vor " - ")
-                    project = entry.project.split(" - ")[0] if " - " in entry.project else entry.project
+                    project = entry_project.split(" - ")[0] if " - " in entry_project else entry_project
                     projects.add(project)
             
             # Completer erstellen
@@ -996,6 +1046,8 @@ class TimeEntryWidget(QWidget):
             workers: Liste von Worker-Objekten
         """
         self._workers = workers
+        self._worker_names = {w.id: w.name for w in workers}
+        self.entries_model.set_worker_names(self._worker_names)
         
         # Bestehende Einträge löschen (außer "Wähle Worker...")
         while self.worker_combo.count() > 1:
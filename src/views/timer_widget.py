@@ -4,10 +4,12 @@ Timer Widget für Zeiterfassung in der Tabelle
 Bietet Start/Stop-Funktionalität mit Live-Anzeige der erfassten Zeit
 """
 from PySide6.QtWidgets import QWidget, QHBoxLayout, QPushButton, QLabel
-from PySide6.QtCore import QTimer, Signal, QTime
+from PySide6.QtCore import Signal
 from PySide6.QtGui import QFont
 from typing import Optional
-from datetime import datetime, timedelta
+from datetime import datetime
+
+from ..services.timer_service import TimerService
 
 
 class TimerWidget(QWidget):
@@ -17,7 +19,9 @@ class TimerWidget(QWidget):
     Features:
     - Start/Stop Button
     - Live-Anzeige der laufenden Zeit
-    - Speichert Start-Zeit und akkumulierte Zeit
+    - Laufzustand liegt im TimerService (nach Entry-ID), ein neues
+      Widget für denselben Eintrag zeigt einen laufenden Timer weiter an
+    - Gemeinsamer Sekundentakt aller Widgets statt eines QTimer pro Widget
     - Signal wenn Timer gestoppt wird
     
     Signals:
@@ -32,7 +36,8 @@ class TimerWidget(QWidget):
         self, 
         entry_id: int,
         initial_minutes: int = 0,
-        parent: Optional[QWidget] = None
+        parent: Optional[QWidget] = None,
+        timer_service: Optional[TimerService] = None
     ):
         """
         Initialisiert TimerWidget
@@ -41,20 +46,30 @@ class TimerWidget(QWidget):
             entry_id: ID des TimeEntry
             initial_minutes: Bereits erfasste Minuten
             parent: Optional parent widget
+            timer_service: Laufende Timer (Standard: TimerService.shared())
         """
         super().__init__(parent)
         self.entry_id = entry_id
         self.initial_minutes = initial_minutes
         self.accumulated_seconds = initial_minutes * 60
-        self.start_time: Optional[datetime] = None
-        self.is_running = False
+        self.timer_service = timer_service or TimerService.shared()
         
-        # Timer für Updates (jede Sekunde)
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self._update_display)
+        # Updates über den gemeinsamen Takt (jede Sekunde)
+        self.timer_service.ticked.connect(self._on_tick)
+        self.timer_service.timer_changed.connect(self._on_timer_changed)
         
         self._setup_ui()
     
+    @property
+    def is_running(self) -> bool:
+        """True wenn der Timer dieses Eintrags im TimerService läuft"""
+        return self.timer_service.is_running(self.entry_id)
+    
+    @property
+    def start_time(self) -> Optional[datetime]:
+        """Startzeit des laufenden Timers oder None"""
+        return self.timer_service.started_at(self.entry_id)
+    
     def _setup_ui(self):
         """Erstellt UI-Komponenten"""
         layout = QHBoxLayout(self)
@@ -62,7 +77,7 @@ class TimerWidget(QWidget):
         layout.setSpacing(5)
         
         # Zeit-Anzeige
-        self.time_label = QLabel(self._format_time(self.accumulated_seconds))
+        self.time_label = QLabel(self._format_time(self._get_current_seconds()))
         font = QFont()
         font.setFamily("Courier")  # Monospace für bessere Ausrichtung
         self.time_label.setFont(font)
@@ -70,9 +85,8 @@ class TimerWidget(QWidget):
         layout.addWidget(self.time_label)
         
         # Start/Stop Button
-        self.timer_button = QPushButton("▶")
+        self.timer_button = QPushButton()
         self.timer_button.setMaximumWidth(35)
-        self.timer_button.setToolTip("Timer starten")
         self.timer_button.clicked.connect(self._toggle_timer)
         self._update_button_style()
         layout.addWidget(self.timer_button)
@@ -86,36 +100,33 @@ class TimerWidget(QWidget):
     
     def _start_timer(self):
         """Startet den Timer"""
-        self.is_running = True
-        self.start_time = datetime.now()
-        self.update_timer.start(1000)  # Update jede Sekunde
-        
-        self.timer_button.setText("■")
-        self.timer_button.setToolTip("Timer stoppen")
+        self.timer_service.start(self.entry_id, self.accumulated_seconds)
         self._update_button_style()
     
     def _stop_timer(self):
         """Stoppt den Timer und emittiert Signal"""
-        if not self.is_running:
+        seconds = self.timer_service.stop(self.entry_id)
+        if seconds is None:
             return
         
-        self.is_running = False
-        self.update_timer.stop()
-        
-        # Berechne finale Zeit
-        if self.start_time:
-            elapsed = datetime.now() - self.start_time
-            self.accumulated_seconds += int(elapsed.total_seconds())
-            self.start_time = None
-        
-        self.timer_button.setText("▶")
-        self.timer_button.setToolTip("Timer starten")
+        # Finale Zeit übernehmen
+        self.accumulated_seconds = seconds
         self._update_button_style()
         
         # Emittiere Signals
         minutes = self.get_total_minutes()
         self.timer_stopped.emit(minutes)
     
+    def _on_timer_changed(self, entry_id: int):
+        """Timer wurde woanders gestartet oder gestoppt: Button nachziehen"""
+        if entry_id == self.entry_id:
+            self._update_button_style()
+    
+    def _on_tick(self):
+        """Gemeinsamer Takt: nur laufende Timer aktualisieren"""
+        if self.is_running:
+            self._update_display()
+    
     def _update_display(self):
         """Aktualisiert die Zeit-Anzeige"""
         current_seconds = self._get_current_seconds()
@@ -127,13 +138,8 @@ class TimerWidget(QWidget):
     
     def _get_current_seconds(self) -> int:
         """Berechnet aktuelle Gesamt-Sekunden"""
-        total = self.accumulated_seconds
-        
-        if self.is_running and self.start_time:
-            elapsed = datetime.now() - self.start_time
-            total += int(elapsed.total_seconds())
-        
-        return total
+        seconds = self.timer_service.seconds(self.entry_id)
+        return self.accumulated_seconds if seconds is None else seconds
     
     def _format_time(self, seconds: int) -> str:
         """
@@ -151,8 +157,10 @@ class TimerWidget(QWidget):
         return f"{hours:02d}:{minutes:02d}:{secs:02d}"
     
     def _update_button_style(self):
-        """Aktualisiert Button-Styling basierend auf Status"""
+        """Aktualisiert Button-Text und -Styling basierend auf Status"""
         if self.is_running:
+            self.timer_button.setText("■")
+            self.timer_button.setToolTip("Timer stoppen")
             # Rot für Stop
             self.timer_button.setStyleSheet("""
                 QPushButton {
@@ -168,6 +176,8 @@ class TimerWidget(QWidget):
                 }
             """)
         else:
+            self.timer_button.setText("▶")
+            self.timer_button.setToolTip("Timer starten")
             # Grün für Start
             self.timer_button.setStyleSheet("""
                 QPushButton {
@@ -5,16 +5,24 @@ Testet echte Datenbank-Operationen mit SQLite
 import pytest
 import tempfile
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
+import random
 import uuid
+from PySide6.QtSql import QSqlQuery
 
-from src.services.database_service import DatabaseService
+from src.services.database_service import DatabaseService, PRAGMA_PROFILES
 from src.services.crypto_service import CryptoService
 from src.repositories.worker_repository import WorkerRepository
 from src.repositories.time_entry_repository import TimeEntryRepository
 from src.repositories.capacity_repository import CapacityRepository
+from src.repositories.timer_journal_repository import TimerJournalRepository
+from src.services.analytics_service import AnalyticsService
+from src.services import migrations
+from src.services.migrations import MIGRATIONS, Migration
+from src.services.timer_service import TimerService
 from src.models.worker import Worker
 from src.models.time_entry import TimeEntry
+from src.models.time_entry_batch import TimeEntryBatch
 from src.models.capacity import Capacity
 
 
@@ -150,6 +158,78 @@ class TestWorkerRepositoryIntegration:
         # Not found
         not_found = repo.find_by_email("nonexistent@test.com")
         assert not_found is None
+    
+    def test_duplicate_email_is_rejected(self, temp_db, temp_crypto):
+        """Test: Unique-Index auf Blind-Index verhindert doppelte Emails"""
+        repo = WorkerRepository(temp_db, temp_crypto)
+        worker_id = repo.create(Worker(name="First", email="dup@test.com", team="Team"))
+        
+        assert repo.email_exists("DUP@test.com")
+        assert not repo.email_exists("dup@test.com", exclude_id=worker_id)
+        
+        with pytest.raises(RuntimeError):
+            repo.create(Worker(name="Second", email="dup@test.com", team="Team"))
+    
+    def test_backfill_email_blind_index(self, temp_db, temp_crypto):
+        """Test: Backfill ergänzt Blind-Index für bestehende Zeilen"""
+        repo = WorkerRepository(temp_db, temp_crypto)
+        repo.create(Worker(name="Old", email="old@test.com", team="Team"))
+        temp_db.execute_query("UPDATE workers SET email_bidx = NULL")
+        
+        assert repo.find_by_email("old@test.com") is None
+        assert repo.backfill_email_blind_index() == 1
+        assert repo.backfill_email_blind_index() == 0
+        assert repo.find_by_email("old@test.com").name == "Old"
+
+
+class TestEnvelopeEncryptionIntegration:
+    """Integration Tests für Envelope-Verschlüsselung mit Data-Key"""
+    
+    def test_initialize_data_key_persists_key(self, temp_db, temp_crypto):
+        """Test: Data-Key wird einmal erzeugt und danach aus der DB geladen"""
+        temp_crypto.initialize_data_key(temp_db)
+        encrypted = temp_crypto.encrypt("Persistiert")
+        
+        other = CryptoService(key_directory=temp_crypto.key_directory)
+        other.initialize_keys()
+        other.initialize_data_key(temp_db)
+        
+        assert other.decrypt(encrypted) == "Persistiert"
+    
+    def test_initialize_data_key_not_activated_when_insert_fails(self, temp_db, temp_crypto):
+        """Test: Schlägt das Speichern fehl, bleibt der Envelope-Modus aus"""
+        temp_db.execute_query(
+            "CREATE TRIGGER block_data_keys BEFORE INSERT ON data_keys "
+            "BEGIN SELECT RAISE(ABORT, 'blockiert'); END"
+        )
+        
+        with pytest.raises(RuntimeError):
+            temp_crypto.initialize_data_key(temp_db)
+        
+        assert not temp_crypto.has_data_key()
+        assert not temp_db.in_transaction
+        query = temp_db.execute_query("SELECT COUNT(*) FROM data_keys")
+        assert query.next() and query.value(0) == 0
+    
+    def test_migrate_to_envelope_encryption(self, temp_db, temp_crypto):
+        """Test: Legacy-Worker werden neu verschlüsselt und bleiben lesbar"""
+        repo = WorkerRepository(temp_db, temp_crypto)
+        worker_id = repo.create(Worker(name="Legacy", email="legacy@test.com", team="Team"))
+        
+        temp_crypto.initialize_data_key(temp_db)
+        migrated = repo.migrate_to_envelope_encryption()
+        
+        assert migrated == 1
+        assert repo.migrate_to_envelope_encryption() == 0
+        
+        query = temp_db.execute_query("SELECT name, email FROM workers WHERE id = ?", [worker_id])
+        assert query.next()
+        assert temp_crypto.is_envelope_ciphertext(query.value(0))
+        assert temp_crypto.is_envelope_ciphertext(query.value(1))
+        
+        worker = repo.find_by_id(worker_id)
+        assert worker.name == "Legacy"
+        assert worker.email == "legacy@test.com"
 
 
 class TestTimeEntryRepositoryIntegration:
@@ -261,6 +341,246 @@ class TestTimeEntryRepositoryIntegration:
         assert deleted is None
 
 
+class TestRowMapping:
+    """Integration Tests für projizierte Abfragen und Lazy-Zeitstempel"""
+    
+    def test_timestamps_parsed_on_access(self, temp_db, temp_crypto):
+        """Test: created_at/updated_at bleiben bis zum Zugriff Rohwerte"""
+        worker_id = WorkerRepository(temp_db, temp_crypto).create(
+            Worker(name="Alice", email="alice@test.com", team="Team")
+        )
+        entry_repo = TimeEntryRepository(temp_db)
+        created_at = datetime(2024, 2, 1, 9, 30, 15)
+        entry_id = entry_repo.create(TimeEntry(
+            worker_id=worker_id,
+            date=datetime(2024, 2, 1),
+            duration_minutes=60,
+            description="Test",
+            created_at=created_at,
+            updated_at=created_at
+        ))
+        
+        entry = entry_repo.find_by_date_range("2024-02-01", "2024-02-01")[0]
+        
+        assert entry.id == entry_id
+        assert TimeEntry.created_at.raw(entry) == created_at.isoformat()
+        assert entry.created_at == created_at
+        assert entry.updated_at == created_at
+        assert TimeEntry.created_at.raw(entry) == created_at
+    
+    def test_missing_projected_column_raises(self, temp_db):
+        """Test: Fehlende Spalten im Ergebnis fallen sofort auf"""
+        entry_repo = TimeEntryRepository(temp_db)
+        query = temp_db.execute_query("SELECT id, worker_id FROM time_entries")
+        
+        with pytest.raises(RuntimeError, match="date"):
+            entry_repo._entity_mapper(query)
+
+
+class TestTimeEntryPagination:
+    """Integration Tests für Keyset-Pagination"""
+    
+    def test_pages_cover_range_in_order(self, temp_db, temp_crypto):
+        """Test: Seiten per Cursor ergeben lückenlos die sortierte Gesamtliste"""
+        worker_id = WorkerRepository(temp_db, temp_crypto).create(
+            Worker(name="Alice", email="alice@test.com", team="Team")
+        )
+        entry_repo = TimeEntryRepository(temp_db)
+        # Mehrere Einträge pro Tag: Reihenfolge innerhalb eines Tages über id
+        entry_repo.create_many([
+            TimeEntry(
+                worker_id=worker_id,
+                date=datetime(2024, 3, 1 + i % 7),
+                duration_minutes=30,
+                description=f"Eintrag {i}"
+            )
+            for i in range(23)
+        ])
+        entry_repo.create(TimeEntry(
+            worker_id=worker_id, date=datetime(2024, 4, 1), duration_minutes=30, description="Außerhalb"
+        ))
+        
+        assert entry_repo.count_by_date_range("2024-03-01", "2024-03-31") == 23
+        
+        pages = []
+        cursor = None
+        while True:
+            page = entry_repo.find_page_by_date_range("2024-03-01", "2024-03-31", 5, cursor)
+            if not page:
+                break
+            pages.append(page)
+            cursor = entry_repo.page_cursor(page[-1])
+        
+        assert [len(page) for page in pages] == [5, 5, 5, 5, 3]
+        keys = [(entry.date, entry.id) for page in pages for entry in page]
+        assert keys == sorted(keys, reverse=True)
+        assert len(set(keys)) == 23
+
+
+class TestTimeEntryStreaming:
+    """Integration Tests für iter_by_date_range / iter_by_worker"""
+    
+    @pytest.fixture
+    def seeded(self, temp_db, temp_crypto):
+        worker_repo = WorkerRepository(temp_db, temp_crypto)
+        alice = worker_repo.create(Worker(name="Alice", email="alice@test.com", team="Team"))
+        bob = worker_repo.create(Worker(name="Bob", email="bob@test.com", team="Team"))
+        entry_repo = TimeEntryRepository(temp_db)
+        entry_repo.create_many([
+            TimeEntry(
+                worker_id=alice if i % 2 else bob,
+                date=datetime(2024, 5, 1 + i % 20),
+                duration_minutes=15 + i,
+                description=f"Eintrag {i}",
+                project="Projekt"
+            )
+            for i in range(40)
+        ])
+        return entry_repo, alice
+    
+    def test_iterators_match_find_methods(self, seeded):
+        """Test: Generatoren liefern dieselben Einträge wie die find_*-Methoden"""
+        entry_repo, alice = seeded
+        
+        streamed = list(entry_repo.iter_by_date_range("2024-05-01", "2024-05-10"))
+        assert [e.id for e in streamed] == [
+            e.id for e in entry_repo.find_by_date_range("2024-05-01", "2024-05-10")
+        ]
+        assert len(streamed) == 20
+        
+        by_worker = list(entry_repo.iter_by_worker(alice, datetime(2024, 5, 1), datetime(2024, 5, 31)))
+        assert len(by_worker) == 20
+        assert all(entry.worker_id == alice for entry in by_worker)
+    
+    def test_row_tuples(self, seeded):
+        """Test: rows=True liefert Tuples in ROW_COLUMNS-Reihenfolge"""
+        entry_repo, alice = seeded
+        
+        rows = list(entry_repo.iter_by_worker(alice, rows=True))
+        
+        assert len(rows) == 20
+        assert all(len(row) == len(TimeEntryRepository.ROW_COLUMNS) for row in rows)
+        row = dict(zip(TimeEntryRepository.ROW_COLUMNS, rows[0]))
+        assert row["worker_id"] == alice
+        assert row["date"] == "2024-05-20"
+        assert row["project"] == "Projekt"
+    
+    def test_iterator_is_forward_only_and_finished(self, temp_db, seeded):
+        """Test: Cursor ist Forward-Only, ausgeliehen und wird nach close() zurückgegeben"""
+        entry_repo, _ = seeded
+        
+        def forward_only_statements():
+            return [query for (_, forward_only), query in temp_db._statement_cache.items() if forward_only]
+        
+        iterator = entry_repo.iter_by_date_range("2024-05-01", "2024-05-31")
+        next(iterator)
+        
+        # Während der Iteration gehört das Statement dem Generator
+        assert forward_only_statements() == []
+        
+        # Paralleler Lookup während der Iteration stört den Cursor nicht
+        assert len(entry_repo.find_by_date_range("2024-05-01", "2024-05-31")) == 40
+        assert len(list(iterator)) == 39
+        
+        iterator = entry_repo.iter_by_date_range("2024-05-01", "2024-05-31")
+        next(iterator)
+        iterator.close()
+        statements = forward_only_statements()
+        assert statements and not any(query.isActive() for query in statements)
+
+
+class TestTimeEntryBatch:
+    """Integration Tests für kompakte Entities und spaltenweise Batches"""
+    
+    def test_entities_have_no_instance_dict(self):
+        """Test: Entities nutzen __slots__ statt __dict__"""
+        entry = TimeEntry(worker_id=1, date=datetime(2024, 1, 1), duration_minutes=60, description="x")
+        worker = Worker(name="Alice", email="alice@test.com", team="Team")
+        capacity = Capacity(
+            worker_id=1, start_date=datetime(2024, 1, 1),
+            end_date=datetime(2024, 1, 5), planned_hours=40.0
+        )
+        
+        for entity in (entry, worker, capacity):
+            assert not hasattr(entity, "__dict__")
+        assert isinstance(entry.created_at, datetime)
+    
+    def test_load_batch_matches_entities(self, temp_db, temp_crypto):
+        """Test: load_batch liefert dieselben Werte wie TimeEntry-Objekte"""
+        worker_repo = WorkerRepository(temp_db, temp_crypto)
+        alice = worker_repo.create(Worker(name="Alice", email="alice@test.com", team="Team"))
+        bob = worker_repo.create(Worker(name="Bob", email="bob@test.com", team="Team"))
+        entry_repo = TimeEntryRepository(temp_db)
+        entry_repo.create_many([
+            TimeEntry(
+                worker_id=alice if i % 3 else bob,
+                date=datetime(2024, 3, 1 + i % 20),
+                duration_minutes=15 * (i + 1),
+                description=f"Eintrag {i}",
+                project=(None, "Alpha", "Beta")[i % 3]
+            )
+            for i in range(30)
+        ])
+        
+        batch = entry_repo.load_batch("2024-03-01", "2024-03-31")
+        entries = entry_repo.find_by_date_range("2024-03-01", "2024-03-31")
+        
+        assert len(batch) == 30
+        assert sorted(batch.rows()) == sorted(
+            (entry.id, entry.worker_id, entry.date.date(), entry.duration_minutes, entry.project or None)
+            for entry in entries
+        )
+        # Projektnamen werden nur einmal abgelegt
+        assert sorted(batch.projects[1:]) == ["Alpha", "Beta"]
+        assert batch.minutes_by_worker() == entry_repo.sum_minutes_by_worker()
+        
+        bob_batch = entry_repo.load_batch("2024-03-01", "2024-03-31", worker_ids=[bob])
+        assert set(bob_batch.worker_ids) == {bob}
+        assert len(bob_batch) == 10
+    
+    def test_analytics_accepts_batch(self, temp_db):
+        """Test: AnalyticsService rechnet auf Batch wie auf TimeEntry-Listen"""
+        entries = [
+            TimeEntry(
+                id=i + 1,
+                worker_id=1 + i % 2,
+                date=datetime(2024, 5, 1 + i % 10),
+                duration_minutes=20 + 7 * i,
+                description="x",
+                project="Alpha" if i % 2 else None
+            )
+            for i in range(25)
+        ]
+        batch = TimeEntryBatch.from_entries(entries)
+        analytics = AnalyticsService(temp_db)
+        capacities = [Capacity(
+            worker_id=1, start_date=datetime(2024, 5, 1),
+            end_date=datetime(2024, 5, 31), planned_hours=160.0
+        )]
+        
+        for start, end in [
+            (datetime(2024, 5, 1), datetime(2024, 5, 31)),
+            (datetime(2024, 5, 3, 12, 0), datetime(2024, 5, 7))
+        ]:
+            expected = analytics.calculate_utilization(entries, capacities, start, end)
+            actual = analytics.calculate_utilization(batch, capacities, start, end)
+            assert actual == pytest.approx(expected)
+            
+            expected_days = analytics.calculate_daily_breakdown(entries, start, end)
+            actual_days = analytics.calculate_daily_breakdown(batch, start, end)
+            assert [day for day, _ in actual_days] == [day for day, _ in expected_days]
+            assert [hours for _, hours in actual_days] == pytest.approx([hours for _, hours in expected_days])
+        
+        assert analytics.get_statistics_summary(batch) == pytest.approx(
+            analytics.get_statistics_summary(entries)
+        )
+        assert analytics.get_statistics_summary(TimeEntryBatch())["entry_count"] == 0
+        assert batch.minutes_by_project() == {
+            "Alpha": sum(e.duration_minutes for e in entries if e.project),
+            None: sum(e.duration_minutes for e in entries if not e.project)
+        }
+
+
 class TestCapacityRepositoryIntegration:
     """Integration Tests für CapacityRepository"""
     
@@ -332,9 +652,980 @@ class TestCapacityRepositoryIntegration:
         assert capacities[0].start_date == datetime(2025, 10, 1)
 
 
+class TestCapacityIndex:
+    """Integration Tests für den Intervallindex über Capacities"""
+    
+    # Referenz: anteilige Überlappung direkt in SQL
+    _SQL_HOURS = """
+        SELECT worker_id, SUM(
+            planned_hours
+            * (julianday(MIN(DATE(end_date), DATE(?))) - julianday(MAX(DATE(start_date), DATE(?))) + 1)
+            / (julianday(DATE(end_date)) - julianday(DATE(start_date)) + 1)
+        )
+        FROM capacities
+        WHERE DATE(end_date) >= DATE(?) AND DATE(start_date) <= DATE(?)
+        GROUP BY worker_id
+    """
+    
+    def _sql_hours(self, db_service, start, end):
+        """Anteilige Plan-Stunden pro Worker per SQL"""
+        query = db_service.execute_query(
+            self._SQL_HOURS, [end.isoformat(), start.isoformat(), start.isoformat(), end.isoformat()]
+        )
+        totals = {}
+        while query.next():
+            totals[query.value(0)] = query.value(1)
+        return totals
+    
+    def test_index_matches_sql(self, temp_db, temp_crypto):
+        """Test: Index liefert dieselben Überlappungen wie SQL"""
+        worker_repo = WorkerRepository(temp_db, temp_crypto)
+        workers = [
+            worker_repo.create(Worker(name=f"W{i}", email=f"w{i}@test.com", team="Team"))
+            for i in range(3)
+        ]
+        rng = random.Random(11)
+        capacity_repo = CapacityRepository(temp_db)
+        capacity_repo.create_many([
+            Capacity(
+                worker_id=rng.choice(workers),
+                start_date=datetime(2024, 1, 1) + timedelta(days=start),
+                end_date=datetime(2024, 1, 1) + timedelta(days=start + rng.randrange(0, 60)),
+                planned_hours=rng.uniform(10, 200)
+            )
+            for start in (rng.randrange(0, 700) for _ in range(150))
+        ])
+        capacity_repo.index.clear()
+        
+        for offset, days in [(0, 800), (100, 0), (200, 31), (650, 90)]:
+            start = datetime(2024, 1, 1) + timedelta(days=offset)
+            end = start + timedelta(days=days, hours=23, minutes=59)
+            
+            expected = self._sql_hours(temp_db, start, end)
+            actual = capacity_repo.sum_overlapping_hours_by_worker(start, end)
+            assert actual == pytest.approx(expected)
+            
+            for worker_id in workers:
+                found = capacity_repo.find_by_worker(worker_id, start, end)
+                assert all(c.start_date.date() <= end.date() and c.end_date.date() >= start.date() for c in found)
+                assert sum(1 for c in capacity_repo.find_by_worker(worker_id) if
+                           c.start_date.date() <= end.date() and c.end_date.date() >= start.date()) == len(found)
+                assert [c.start_date for c in found] == sorted((c.start_date for c in found), reverse=True)
+    
+    def test_write_through_without_reload(self, temp_db, temp_crypto):
+        """Test: create/update/delete halten den geladenen Index aktuell"""
+        worker_repo = WorkerRepository(temp_db, temp_crypto)
+        alice = worker_repo.create(Worker(name="Alice", email="alice@test.com", team="Team"))
+        bob = worker_repo.create(Worker(name="Bob", email="bob@test.com", team="Team"))
+        capacity_repo = CapacityRepository(temp_db)
+        start, end = datetime(2025, 10, 1), datetime(2025, 10, 31)
+        
+        assert capacity_repo.sum_overlapping_hours_by_worker(start, end) == {}
+        assert capacity_repo.index.is_loaded
+        
+        capacity = Capacity(worker_id=alice, start_date=start, end_date=end, planned_hours=160.0)
+        capacity.id = capacity_repo.create(capacity)
+        assert capacity_repo.sum_overlapping_hours_by_worker(start, end) == {alice: 160.0}
+        
+        # Worker-Wechsel und neuer Zeitraum
+        capacity.worker_id = bob
+        capacity.end_date = datetime(2025, 11, 30)
+        capacity_repo.update(capacity)
+        assert capacity_repo.sum_overlapping_hours_by_worker(start, end) == pytest.approx({bob: 160.0 * 31 / 61})
+        assert CapacityRepository(temp_db).find_by_worker(alice, start, end) == []
+        
+        capacity_repo.delete(capacity.id)
+        assert capacity_repo.sum_overlapping_hours_by_worker(start, end) == {}
+        assert capacity_repo.index.is_loaded
+    
+    def test_rollback_discards_index(self, temp_db, temp_crypto):
+        """Test: Nach einem Rollback wird der Index neu geladen"""
+        worker_id = WorkerRepository(temp_db, temp_crypto).create(
+            Worker(name="Alice", email="alice@test.com", team="Team")
+        )
+        capacity_repo = CapacityRepository(temp_db)
+        start, end = datetime(2025, 10, 1), datetime(2025, 10, 31)
+        capacity_repo.load_index()
+        
+        with pytest.raises(ValueError):
+            with capacity_repo.unit_of_work():
+                capacity_repo.create(Capacity(worker_id=worker_id, start_date=start, end_date=end, planned_hours=80.0))
+                raise ValueError("Abbruch")
+        
+        assert not capacity_repo.index.is_loaded
+        assert capacity_repo.sum_overlapping_hours_by_worker(start, end) == {}
+
+
+class TestAnalyticsServiceIntegration:
+    """Integration Tests für SQL-Aggregation im AnalyticsService"""
+    
+    def _setup_team(self, temp_db, temp_crypto):
+        """Erstellt zwei Worker mit Zeiterfassungen und Capacities"""
+        worker_repo = WorkerRepository(temp_db, temp_crypto)
+        entry_repo = TimeEntryRepository(temp_db)
+        capacity_repo = CapacityRepository(temp_db)
+        
+        alice = worker_repo.create(Worker(name="Alice", email="alice@test.com", team="Team"))
+        bob = worker_repo.create(Worker(name="Bob", email="bob@test.com", team="Team"))
+        
+        entry_repo.create(TimeEntry(worker_id=alice, date=datetime(2025, 10, 6), duration_minutes=120, description="Arbeit"))
+        entry_repo.create(TimeEntry(worker_id=alice, date=datetime(2025, 10, 7), duration_minutes=90, description="Arbeit"))
+        entry_repo.create(TimeEntry(worker_id=bob, date=datetime(2025, 10, 8), duration_minutes=60, description="Arbeit"))
+        # Außerhalb des Zeitraums
+        entry_repo.create(TimeEntry(worker_id=bob, date=datetime(2025, 11, 3), duration_minutes=480, description="Arbeit"))
+        
+        capacity_repo.create(Capacity(
+            worker_id=alice,
+            start_date=datetime(2025, 10, 1),
+            end_date=datetime(2025, 10, 31),
+            planned_hours=160.0
+        ))
+        
+        return alice, bob
+    
+    def test_team_utilization_single_pass(self, temp_db, temp_crypto):
+        """Test: Team-Auslastung liefert (hours_worked, hours_planned) pro Worker"""
+        alice, bob = self._setup_team(temp_db, temp_crypto)
+        analytics = AnalyticsService(temp_db)
+        
+        team = analytics.calculate_team_utilization(
+            datetime(2025, 10, 1), datetime(2025, 10, 31, 23, 59, 59)
+        )
+        
+        assert team == {alice: (3.5, 160.0), bob: (1.0, 0.0)}
+    
+    def test_team_utilization_includes_requested_workers_without_data(self, temp_db, temp_crypto):
+        """Test: Angefragte Worker ohne Daten erhalten (0.0, 0.0)"""
+        alice, bob = self._setup_team(temp_db, temp_crypto)
+        analytics = AnalyticsService(temp_db)
+        
+        team = analytics.calculate_team_utilization(
+            datetime(2025, 12, 1), datetime(2025, 12, 31, 23, 59, 59), [alice, bob]
+        )
+        
+        assert team == {alice: (0.0, 0.0), bob: (0.0, 0.0)}
+    
+    def test_deleted_worker_drops_out_of_utilization(self, temp_db, temp_crypto):
+        """Test: Per ON DELETE CASCADE gelöschte Capacities verschwinden auch aus dem CapacityIndex"""
+        alice, bob = self._setup_team(temp_db, temp_crypto)
+        analytics = AnalyticsService(temp_db)
+        start, end = datetime(2025, 10, 1), datetime(2025, 10, 31, 23, 59, 59)
+        assert analytics.calculate_team_utilization(start, end)[alice] == (3.5, 160.0)
+        
+        WorkerRepository(temp_db, temp_crypto).delete(alice)
+        
+        assert analytics.calculate_team_utilization(start, end) == {bob: (1.0, 0.0)}
+        assert CapacityRepository(temp_db).sum_overlapping_hours_by_worker(start, end) == {}
+    
+    def test_team_utilization_prorates_capacity_overlap(self, temp_db, temp_crypto):
+        """Test: Plan-Stunden werden anteilig nach Überlappungstagen gezählt"""
+        alice, _ = self._setup_team(temp_db, temp_crypto)
+        CapacityRepository(temp_db).create(Capacity(
+            worker_id=alice,
+            start_date=datetime(2025, 9, 29),
+            end_date=datetime(2025, 10, 8),
+            planned_hours=80.0
+        ))
+        analytics = AnalyticsService(temp_db)
+        start, end = datetime(2025, 10, 6), datetime(2025, 10, 12, 23, 59, 59)
+        
+        team = analytics.calculate_team_utilization(start, end, [alice])
+        
+        # Oktober: 7 von 31 Tagen, zweite Capacity: 3 von 10 Tagen
+        expected = 160.0 * 7 / 31 + 80.0 * 3 / 10
+        assert team[alice][1] == pytest.approx(expected)
+        
+        # Gleiches Ergebnis wie die Python-Berechnung über Capacity-Objekte
+        capacities = CapacityRepository(temp_db).find_by_worker(alice, start, end)
+        python_result = analytics.calculate_utilization([], capacities, start, end)
+        assert team[alice][1] == pytest.approx(python_result["planned_hours"])
+    
+    def test_worker_utilization_wraps_team_utilization(self, temp_db, temp_crypto):
+        """Test: Per-Worker-Berechnung entspricht Team-Berechnung"""
+        alice, _ = self._setup_team(temp_db, temp_crypto)
+        analytics = AnalyticsService(temp_db)
+        
+        utilization = analytics.calculate_worker_utilization(
+            alice, datetime(2025, 10, 1), datetime(2025, 10, 31, 23, 59, 59)
+        )
+        
+        assert utilization["hours_worked"] == 3.5
+        assert utilization["hours_planned"] == 160.0
+        assert utilization["utilization_percent"] == pytest.approx(3.5 / 160.0 * 100)
+
+
+class TestDailyWorkerHoursRollup:
+    """Integration Tests für den Rollup daily_worker_hours"""
+    
+    def _rollup(self, db_service):
+        """Liest Rollup als Dict (worker_id, day) -> (minutes, entry_count)"""
+        query = db_service.execute_query(
+            "SELECT worker_id, day, minutes, entry_count FROM daily_worker_hours"
+        )
+        rows = {}
+        while query.next():
+            rows[(query.value(0), query.value(1))] = (query.value(2), query.value(3))
+        return rows
+    
+    def test_rollup_follows_create_update_delete(self, temp_db, temp_crypto):
+        """Test: Trigger halten Rollup bei create/update/delete aktuell"""
+        worker_id = WorkerRepository(temp_db, temp_crypto).create(
+            Worker(name="Test", email="test@test.com", team="Team")
+        )
+        entry_repo = TimeEntryRepository(temp_db)
+        
+        first_id = entry_repo.create(TimeEntry(
+            worker_id=worker_id, date=datetime(2025, 10, 6), duration_minutes=60, description="A"
+        ))
+        entry_repo.create(TimeEntry(
+            worker_id=worker_id, date=datetime(2025, 10, 6), duration_minutes=30, description="B"
+        ))
+        assert self._rollup(temp_db) == {(worker_id, "2025-10-06"): (90, 2)}
+        
+        # Datum verschieben: Minuten wandern auf den neuen Tag
+        entry = entry_repo.find_by_id(first_id)
+        entry.date = datetime(2025, 10, 7)
+        entry.duration_minutes = 120
+        entry_repo.update(entry)
+        assert self._rollup(temp_db) == {
+            (worker_id, "2025-10-06"): (30, 1),
+            (worker_id, "2025-10-07"): (120, 1)
+        }
+        
+        # Letzten Eintrag eines Tages löschen entfernt die Rollup-Zeile
+        entry_repo.delete(first_id)
+        assert self._rollup(temp_db) == {(worker_id, "2025-10-06"): (30, 1)}
+    
+    def test_rebuild_matches_trigger_state(self, temp_db, temp_crypto):
+        """Test: Rebuild erzeugt denselben Stand wie die Trigger"""
+        worker_id = WorkerRepository(temp_db, temp_crypto).create(
+            Worker(name="Test", email="test@test.com", team="Team")
+        )
+        entry_repo = TimeEntryRepository(temp_db)
+        for day in (6, 6, 7, 9):
+            entry_repo.create(TimeEntry(
+                worker_id=worker_id, date=datetime(2025, 10, day), duration_minutes=45, description="X"
+            ))
+        
+        before = self._rollup(temp_db)
+        temp_db.execute_query("DELETE FROM daily_worker_hours")
+        
+        assert temp_db.rebuild_daily_worker_hours() == 3
+        assert self._rollup(temp_db) == before
+    
+    def test_migration_fills_missing_rollup(self, temp_db, temp_crypto):
+        """Test: Bestehende Datenbank ohne Rollup wird per Migration befüllt"""
+        worker_id = WorkerRepository(temp_db, temp_crypto).create(
+            Worker(name="Test", email="test@test.com", team="Team")
+        )
+        TimeEntryRepository(temp_db).create(TimeEntry(
+            worker_id=worker_id, date=datetime(2025, 10, 6), duration_minutes=60, description="A"
+        ))
+        # Datenbank vor Einführung des Rollups simulieren
+        temp_db.execute_query("DELETE FROM daily_worker_hours")
+        temp_db.execute_query("DELETE FROM schema_version WHERE version >= 4")
+        
+        temp_db._run_migrations()
+        
+        assert self._rollup(temp_db) == {(worker_id, "2025-10-06"): (60, 1)}
+
+
+class TestQueryPlans:
+    """Regressionstests: Repository-Abfragen dürfen keine Full Table Scans auslösen"""
+    
+    def _record_queries(self, db_service, monkeypatch):
+        """Zeichnet alle SELECT-Statements samt Parametern auf"""
+        recorded = []
+        original = db_service.statement
+        
+        def recording_statement(query_text, params=None, forward_only=False):
+            if query_text.lstrip().upper().startswith("SELECT"):
+                recorded.append((query_text, list(params or [])))
+            return original(query_text, params, forward_only)
+        
+        monkeypatch.setattr(db_service, "statement", recording_statement)
+        return recorded, db_service.execute_query
+    
+    def _full_scans(self, execute, query_text, params):
+        """Gibt SCAN-Zeilen aus EXPLAIN QUERY PLAN zurück"""
+        query = execute("EXPLAIN QUERY PLAN " + query_text, params or None)
+        scans = []
+        while query.next():
+            detail = query.value(3)
+            if detail.startswith("SCAN "):
+                scans.append(detail)
+        return scans
+    
+    def test_repository_queries_use_indexes(self, temp_db, temp_crypto, monkeypatch):
+        """Test: Lookups und Bereichsabfragen laufen über Indizes"""
+        worker_repo = WorkerRepository(temp_db, temp_crypto)
+        entry_repo = TimeEntryRepository(temp_db)
+        capacity_repo = CapacityRepository(temp_db)
+        
+        worker_id = worker_repo.create(Worker(name="Test", email="test@test.com", team="Team"))
+        entry_id = entry_repo.create(TimeEntry(
+            worker_id=worker_id, date=datetime(2025, 10, 6), duration_minutes=60, description="A"
+        ))
+        capacity_id = capacity_repo.create(Capacity(
+            worker_id=worker_id,
+            start_date=datetime(2025, 10, 1),
+            end_date=datetime(2025, 10, 31),
+            planned_hours=160.0
+        ))
+        worker_repo.cache.clear()
+        # Der CapacityIndex wird einmalig per Full Scan geladen
+        capacity_repo.load_index()
+        
+        recorded, execute = self._record_queries(temp_db, monkeypatch)
+        start, end = datetime(2025, 10, 1), datetime(2025, 10, 31, 23, 59, 59)
+        
+        # find_all liest bewusst alle Worker und ist daher nicht enthalten
+        worker_repo.find_by_id(worker_id)
+        worker_repo.find_by_email("test@test.com")
+        worker_repo.email_exists("test@test.com", exclude_id=worker_id)
+        entry_repo.find_by_id(entry_id)
+        entry_repo.find_by_worker(worker_id)
+        entry_repo.find_by_worker(worker_id, start, end)
+        entry_repo.find_by_date_range("2025-10-01", "2025-10-31")
+        entry_repo.count_by_date_range("2025-10-01", "2025-10-31")
+        entry_repo.find_page_by_date_range("2025-10-01", "2025-10-31", 25, ("2025-10-06", entry_id))
+        entry_repo.sum_minutes_by_worker(start, end)
+        entry_repo.sum_minutes_by_worker(start, end, [worker_id])
+        capacity_repo.find_by_id(capacity_id)
+        capacity_repo.find_by_worker(worker_id, start, end)
+        capacity_repo.find_by_date_range(start, end)
+        capacity_repo.sum_overlapping_hours_by_worker(start, end)
+        capacity_repo.sum_overlapping_hours_by_worker(start, end, [worker_id])
+        
+        # Überlappungssummen kommen ohne SQL aus dem CapacityIndex
+        assert len(recorded) == 14
+        for query_text, params in recorded:
+            scans = self._full_scans(execute, query_text, params)
+            assert not scans, f"Full Table Scan in: {' '.join(query_text.split())} -> {scans}"
+    
+    def test_time_entry_dates_normalized(self, temp_db, temp_crypto):
+        """Test: Datum wird als YYYY-MM-DD gespeichert, Altbestand wird migriert"""
+        worker_id = WorkerRepository(temp_db, temp_crypto).create(
+            Worker(name="Test", email="test@test.com", team="Team")
+        )
+        entry_repo = TimeEntryRepository(temp_db)
+        entry_repo.create(TimeEntry(
+            worker_id=worker_id, date=datetime(2025, 10, 6, 14, 30), duration_minutes=60, description="A"
+        ))
+        # Altbestand im ISO-Timestamp-Format simulieren
+        temp_db.execute_query(
+            "UPDATE time_entries SET date = '2025-10-07T00:00:00' WHERE worker_id = ?", [worker_id]
+        )
+        temp_db.execute_query("DELETE FROM schema_version WHERE version >= 5")
+        
+        temp_db._run_migrations()
+        
+        query = temp_db.execute_query("SELECT date FROM time_entries")
+        assert query.next()
+        assert query.value(0) == "2025-10-07"
+        assert len(entry_repo.find_by_date_range("2025-10-07", "2025-10-07")) == 1
+
+
+class TestSchemaMigrations:
+    """Integration Tests für den Migrations-Runner"""
+    
+    def _versions(self, db_service):
+        """Liest angewendete Versionen mit Laufzeit"""
+        query = db_service.execute_query(
+            "SELECT version, duration_ms FROM schema_version ORDER BY version"
+        )
+        rows = []
+        while query.next():
+            rows.append((query.value(0), query.value(1)))
+        return rows
+    
+    def test_new_database_reaches_latest_version(self, temp_db):
+        """Test: Neue Datenbank durchläuft alle Migrationen mit Zeitmessung"""
+        latest = max(m.version for m in MIGRATIONS)
+        
+        assert temp_db.get_schema_version() == latest
+        assert [r.version for r in temp_db.applied_migrations] == [m.version for m in MIGRATIONS]
+        assert all(r.duration_ms >= 0 for r in temp_db.applied_migrations)
+        assert [v for v, _ in self._versions(temp_db)] == [m.version for m in MIGRATIONS]
+    
+    def test_rerun_applies_nothing(self, temp_db):
+        """Test: Bereits angewendete Migrationen werden übersprungen"""
+        assert temp_db._run_migrations() == []
+    
+    def test_failed_migration_rolls_back(self, temp_db):
+        """Test: Fehlerhafter Schritt wird komplett zurückgerollt"""
+        version = temp_db.get_schema_version()
+        
+        def broken(db_service):
+            db_service.execute_query("CREATE TABLE migration_probe (id INTEGER)")
+            db_service.execute_query("SELECT * FROM does_not_exist")
+        
+        with pytest.raises(RuntimeError, match="Migration"):
+            temp_db._run_migrations(MIGRATIONS + [Migration(version + 1, "kaputt", broken)])
+        
+        assert temp_db.get_schema_version() == version
+        assert not temp_db._column_exists("migration_probe", "id")
+    
+    def test_unversioned_database_is_migrated(self, temp_db, temp_crypto):
+        """Test: Datenbank ohne schema_version (alte Installation) wird nachgezogen"""
+        worker_repo = WorkerRepository(temp_db, temp_crypto)
+        worker_id = worker_repo.create(Worker(name="Test", email="test@test.com", team="Team"))
+        temp_db.execute_query("DROP TABLE schema_version")
+        
+        temp_db.close()
+        temp_db.initialize()
+        
+        assert temp_db.get_schema_version() == max(m.version for m in MIGRATIONS)
+        assert WorkerRepository(temp_db, temp_crypto).find_by_id(worker_id) is not None
+
+
+class TestPragmaProfiles:
+    """Integration Tests für SQLite-Verbindungsprofile"""
+    
+    def test_desktop_profile_applied_on_open(self, temp_db):
+        """Test: Standardprofil setzt WAL und synchronous NORMAL, Foreign Keys sind aktiv"""
+        report = temp_db.get_pragma_report()
+        
+        assert temp_db.profile == "desktop"
+        assert str(report["journal_mode"]).lower() == "wal"
+        assert report["synchronous"] == 1  # NORMAL
+        assert report["foreign_keys"] == 1
+        assert report["temp_store"] == 2  # MEMORY
+        assert report["cache_size"] == PRAGMA_PROFILES["desktop"]["cache_size"]
+        assert report["busy_timeout"] == PRAGMA_PROFILES["desktop"]["busy_timeout"]
+    
+    def test_switch_to_bulk_import_profile(self, temp_db):
+        """Test: Profilwechsel zur Laufzeit"""
+        temp_db.apply_profile("bulk-import")
+        
+        report = temp_db.get_pragma_report()
+        assert report["synchronous"] == 0  # OFF
+        assert report["cache_size"] == PRAGMA_PROFILES["bulk-import"]["cache_size"]
+        assert "bulk-import" in temp_db.format_pragma_report()
+    
+    def test_foreign_keys_independent_of_profile(self, tmp_path):
+        """Test: Foreign Keys sind auch ohne Profil (SQLite-Defaults) aktiv"""
+        db = DatabaseService(str(tmp_path / "plain.db"), profile=None)
+        db.connection_name = f"test_db_{uuid.uuid4().hex[:8]}"
+        db.initialize()
+        try:
+            assert db.get_pragma_report()["foreign_keys"] == 1
+            assert "default" in db.format_pragma_report()
+        finally:
+            db.close()
+    
+    def test_unknown_profile_rejected(self):
+        """Test: Unbekanntes Profil wird abgelehnt"""
+        with pytest.raises(ValueError):
+            DatabaseService("unused.db", profile="turbo")
+
+
+class TestStatementCache:
+    """Integration Tests für den Prepared-Statement-Cache"""
+    
+    def test_repeated_query_reuses_statement(self, temp_db, temp_crypto):
+        """Test: Wiederholte Lookups treffen den Cache und binden neu"""
+        worker_repo = WorkerRepository(temp_db, temp_crypto)
+        first = worker_repo.create(Worker(name="Alice", email="alice@test.com", team="Team"))
+        second = worker_repo.create(Worker(name="Bob", email="bob@test.com", team="Team"))
+        worker_repo.cache.clear()
+        hits_before = temp_db.statement_cache_stats()["hits"]
+        
+        assert worker_repo.find_by_id(first).name == "Alice"
+        assert worker_repo.find_by_id(second).name == "Bob"
+        assert worker_repo.find_by_id(999) is None
+        
+        assert temp_db.statement_cache_stats()["hits"] - hits_before >= 2
+    
+    def test_statement_in_use_is_not_reset(self, temp_db, temp_crypto):
+        """Test: Verschachtelter Block mit gleichem SQL erhält ein eigenes Statement"""
+        worker_repo = WorkerRepository(temp_db, temp_crypto)
+        for name in ("Alice", "Bob", "Charlie"):
+            worker_repo.create(Worker(name=name, email=f"{name}@test.com", team="Team"))
+        
+        sql = "SELECT id FROM workers ORDER BY id"
+        outer_ids = []
+        with temp_db.statement(sql) as outer:
+            while outer.next():
+                outer_ids.append(outer.value(0))
+                with temp_db.statement(sql) as inner:
+                    assert inner is not outer
+                    assert inner.next()
+        
+        assert len(outer_ids) == 3
+        # Danach liegt genau ein freies Statement für das SQL im Cache
+        assert list(temp_db._statement_cache).count((sql, False)) == 1
+    
+    def test_partially_read_result_releases_lock(self, temp_db):
+        """Test: Nicht zu Ende gelesenes SELECT wird beim Verlassen beendet (keine Tabellensperre)"""
+        temp_db.execute_query("CREATE TABLE lock_probe (id INTEGER)")
+        for value in range(3):
+            temp_db.execute_query("INSERT INTO lock_probe (id) VALUES (?)", [value])
+        
+        with temp_db.statement("SELECT id FROM lock_probe") as query:
+            assert query.next()
+        
+        assert not query.isActive()
+        temp_db.execute_query("DROP TABLE lock_probe")
+    
+    def test_close_finalizes_statements(self, temp_db):
+        """Test: close() leert den Cache"""
+        with temp_db.statement("SELECT COUNT(*) FROM workers") as query:
+            query.next()
+        assert temp_db.statement_cache_stats()["size"] > 0
+        
+        temp_db.close()
+        
+        assert temp_db.statement_cache_stats()["size"] == 0
+
+
+class TestBulkInsert:
+    """Integration Tests für create_many (execBatch)"""
+    
+    def test_time_entries_create_many_returns_ids_in_order(self, temp_db, temp_crypto):
+        """Test: IDs entsprechen der Eingabereihenfolge, auch über Chunk-Grenzen"""
+        worker_id = WorkerRepository(temp_db, temp_crypto).create(
+            Worker(name="Alice", email="alice@test.com", team="Team")
+        )
+        entry_repo = TimeEntryRepository(temp_db)
+        entries = [
+            TimeEntry(
+                worker_id=worker_id,
+                date=datetime(2024, 1, 1 + i % 28),
+                duration_minutes=10 + i,
+                description=f"Eintrag {i}",
+                project=None if i % 2 else "Projekt"
+            )
+            for i in range(25)
+        ]
+        
+        ids = entry_repo.create_many(entries, chunk_size=10)
+        
+        assert len(ids) == 25
+        for entry, entry_id in zip(entries, ids):
+            stored = entry_repo.find_by_id(entry_id)
+            assert stored.duration_minutes == entry.duration_minutes
+            assert stored.description == entry.description
+        
+        # None wird als NULL gebunden, nicht als leerer String
+        query = temp_db.execute_query("SELECT COUNT(*) FROM time_entries WHERE project IS NULL")
+        assert query.next()
+        assert query.value(0) == 12
+        
+        # Rollup-Trigger laufen auch für Batch-Inserts
+        totals = entry_repo.sum_minutes_by_worker()
+        assert totals[worker_id] == sum(entry.duration_minutes for entry in entries)
+    
+    def test_create_many_rolls_back_on_error(self, temp_db, temp_crypto):
+        """Test: Ein Fehler in einem späteren Chunk verwirft alle Zeilen"""
+        worker_id = WorkerRepository(temp_db, temp_crypto).create(
+            Worker(name="Alice", email="alice@test.com", team="Team")
+        )
+        capacity_repo = CapacityRepository(temp_db)
+        capacities = [
+            Capacity(
+                worker_id=worker_id,
+                start_date=datetime(2024, 1, 1),
+                end_date=datetime(2024, 1, 31),
+                planned_hours=160.0
+            )
+            for _ in range(5)
+        ]
+        # Unbekannter Worker verletzt den Foreign Key
+        capacities.append(Capacity(
+            worker_id=99999,
+            start_date=datetime(2024, 1, 1),
+            end_date=datetime(2024, 1, 31),
+            planned_hours=160.0
+        ))
+        
+        with pytest.raises(RuntimeError):
+            capacity_repo.create_many(capacities, chunk_size=2)
+        
+        assert capacity_repo.find_by_worker(worker_id) == []
+    
+    def test_workers_create_many_encrypts_and_caches(self, temp_db, temp_crypto):
+        """Test: Batch-Worker sind verschlüsselt, per Email auffindbar und gecacht"""
+        worker_repo = WorkerRepository(temp_db, temp_crypto)
+        workers = [
+            Worker(name=f"Worker {i}", email=f"worker{i}@test.com", team="Team")
+            for i in range(3)
+        ]
+        
+        ids = worker_repo.create_many(workers)
+        
+        assert worker_repo.cache.get(ids[1]).name == "Worker 1"
+        worker_repo.cache.clear()
+        assert worker_repo.find_by_email("worker2@test.com").id == ids[2]
+        
+        query = temp_db.execute_query("SELECT name FROM workers WHERE id = ?", [ids[0]])
+        assert query.next()
+        assert query.value(0) != "Worker 0"
+    
+    def test_create_many_empty(self, temp_db):
+        """Test: Leere Eingabe erzeugt keine Zeilen"""
+        assert TimeEntryRepository(temp_db).create_many([]) == []
+
+
+class TestUnitOfWork:
+    """Integration Tests für DatabaseService.unit_of_work"""
+    
+    @staticmethod
+    def _entry(worker_id, minutes=60):
+        return TimeEntry(
+            worker_id=worker_id,
+            date=datetime(2024, 1, 15),
+            duration_minutes=minutes,
+            description="Test"
+        )
+    
+    def test_commits_writes_of_all_repositories(self, temp_db, temp_crypto):
+        """Test: Schreiboperationen mehrerer Repositories werden gemeinsam committet"""
+        worker_repo = WorkerRepository(temp_db, temp_crypto)
+        entry_repo = TimeEntryRepository(temp_db)
+        capacity_repo = CapacityRepository(temp_db)
+        
+        with worker_repo.unit_of_work():
+            assert temp_db.in_transaction
+            worker_id = worker_repo.create(Worker(name="Alice", email="alice@test.com", team="Team"))
+            entry_repo.create(self._entry(worker_id))
+            capacity_repo.create(Capacity(
+                worker_id=worker_id,
+                start_date=datetime(2024, 1, 1),
+                end_date=datetime(2024, 1, 31),
+                planned_hours=160.0
+            ))
+        
+        assert not temp_db.in_transaction
+        assert len(entry_repo.find_by_worker(worker_id)) == 1
+        assert len(capacity_repo.find_by_worker(worker_id)) == 1
+    
+    def test_exception_rolls_back_everything(self, temp_db, temp_crypto):
+        """Test: create() committet innerhalb des Blocks nicht selbst"""
+        worker_id = WorkerRepository(temp_db, temp_crypto).create(
+            Worker(name="Alice", email="alice@test.com", team="Team")
+        )
+        entry_repo = TimeEntryRepository(temp_db)
+        
+        with pytest.raises(ValueError):
+            with entry_repo.unit_of_work():
+                entry_repo.create(self._entry(worker_id))
+                entry_repo.create_many([self._entry(worker_id), self._entry(worker_id)])
+                raise ValueError("Abbruch")
+        
+        assert not temp_db.in_transaction
+        assert entry_repo.find_by_worker(worker_id) == []
+        assert entry_repo.sum_minutes_by_worker() == {}
+    
+    def test_journal_append_joins_outer_transaction(self, temp_db, temp_crypto):
+        """Test: Journal-Ereignis und Eintrag werden mit dem äußeren Block zurückgerollt"""
+        worker_id = WorkerRepository(temp_db, temp_crypto).create(
+            Worker(name="Alice", email="alice@test.com", team="Team")
+        )
+        entry_repo = TimeEntryRepository(temp_db)
+        journal_repo = TimerJournalRepository(temp_db)
+        
+        with pytest.raises(ValueError):
+            with entry_repo.unit_of_work():
+                entry_id = entry_repo.create(self._entry(worker_id))
+                journal_repo.append(entry_id, TimerJournalRepository.EVENT_START, datetime.now(), 0)
+                assert temp_db.in_transaction
+                raise ValueError("Abbruch")
+        
+        assert entry_repo.find_by_worker(worker_id) == []
+        assert journal_repo.load() == []
+        assert not hasattr(entry_repo, "begin_transaction")
+    
+    def test_rollback_discards_worker_cache(self, temp_db, temp_crypto):
+        """Test: Im zurückgerollten Block angelegter Worker verschwindet auch aus dem WorkerCache"""
+        worker_repo = WorkerRepository(temp_db, temp_crypto)
+        alice = worker_repo.create(Worker(name="Alice", email="alice@test.com", team="Team"))
+        worker_repo.find_all()
+        
+        with pytest.raises(ValueError):
+            with worker_repo.unit_of_work():
+                bob = worker_repo.create(Worker(name="Bob", email="bob@test.com", team="Team"))
+                raise ValueError("Abbruch")
+        
+        assert worker_repo.find_by_id(bob) is None
+        assert [worker.id for worker in worker_repo.find_all()] == [alice]
+    
+    def test_nested_scope_rolls_back_to_savepoint(self, temp_db, temp_crypto):
+        """Test: Fehler im inneren Block verwirft nur dessen Änderungen"""
+        worker_id = WorkerRepository(temp_db, temp_crypto).create(
+            Worker(name="Alice", email="alice@test.com", team="Team")
+        )
+        entry_repo = TimeEntryRepository(temp_db)
+        
+        with entry_repo.unit_of_work():
+            entry_repo.create(self._entry(worker_id, minutes=30))
+            
+            with pytest.raises(RuntimeError):
+                with entry_repo.unit_of_work():
+                    entry_repo.create(self._entry(worker_id, minutes=45))
+                    # Unbekannter Worker verletzt den Foreign Key
+                    entry_repo.create(self._entry(99999))
+            
+            with entry_repo.unit_of_work():
+                entry_repo.create(self._entry(worker_id, minutes=15))
+        
+        minutes = sorted(entry.duration_minutes for entry in entry_repo.find_by_worker(worker_id))
+        assert minutes == [15, 30]
+
+
+class TestTimerJournal:
+    """Integration Tests für Timer-Journal und gebündeltes Speichern"""
+    
+    @pytest.fixture
+    def entry_ids(self, temp_db, temp_crypto):
+        """Zwei Zeiterfassungen mit 10 bzw. 20 Minuten"""
+        worker_id = WorkerRepository(temp_db, temp_crypto).create(
+            Worker(name="Test", email="test@test.com", team="Team")
+        )
+        return TimeEntryRepository(temp_db).create_many([
+            TimeEntry(worker_id=worker_id, date=datetime(2025, 10, 6), duration_minutes=minutes, description="A")
+            for minutes in (10, 20)
+        ])
+    
+    @staticmethod
+    def _service(temp_db):
+        """TimerService mit angehängtem Journal"""
+        service = TimerService()
+        service.attach_journal(TimerJournalRepository(temp_db), TimeEntryRepository(temp_db))
+        return service
+    
+    @staticmethod
+    def _rewind(service, entry_id, minutes):
+        """Verschiebt Startzeit eines laufenden Timers in die Vergangenheit"""
+        start_time, base_seconds = service._running[entry_id]
+        service._running[entry_id] = (start_time - timedelta(minutes=minutes), base_seconds)
+    
+    def test_stops_are_flushed_in_one_batch(self, qapp, temp_db, entry_ids):
+        """Test: Stopps landen erst im Journal, flush schreibt alle gemeinsam"""
+        service = self._service(temp_db)
+        entry_repo = TimeEntryRepository(temp_db)
+        
+        for entry_id in entry_ids:
+            service.start(entry_id, entry_repo.find_by_id(entry_id).duration_minutes * 60)
+            self._rewind(service, entry_id, 5)
+            service.stop(entry_id)
+        
+        assert [entry_repo.find_by_id(entry_id).duration_minutes for entry_id in entry_ids] == [10, 20]
+        assert len(TimerJournalRepository(temp_db).load()) == 4
+        
+        assert service.flush() == 2
+        assert [entry_repo.find_by_id(entry_id).duration_minutes for entry_id in entry_ids] == [15, 25]
+        assert TimerJournalRepository(temp_db).load() == []
+        assert service.flush() == 0
+    
+    def test_replay_restores_running_and_pending(self, qapp, temp_db, entry_ids):
+        """Test: Neuer Service (nach Absturz) übernimmt laufende Timer und offene Dauern"""
+        crashed = self._service(temp_db)
+        crashed.start(entry_ids[0], 600)
+        started_at = crashed.started_at(entry_ids[0])
+        crashed.start(entry_ids[1], 1200)
+        self._rewind(crashed, entry_ids[1], 3)
+        crashed.stop(entry_ids[1])
+        
+        service = TimerService()
+        restored = service.attach_journal(TimerJournalRepository(temp_db), TimeEntryRepository(temp_db))
+        
+        assert restored == [entry_ids[0]]
+        assert service.started_at(entry_ids[0]) == started_at
+        assert service.pending_minutes(entry_ids[1]) == 23
+        
+        service.flush()
+        assert TimeEntryRepository(temp_db).find_by_id(entry_ids[1]).duration_minutes == 23
+        assert [event[2] for event in TimerJournalRepository(temp_db).load()] == ["start"]
+        service.discard(entry_ids[0])
+    
+    def test_flush_keeps_later_start(self, qapp, temp_db, entry_ids):
+        """Test: Erneuter Start nach dem Stopp bleibt im Journal erhalten"""
+        service = self._service(temp_db)
+        service.start(entry_ids[0], 600)
+        service.stop(entry_ids[0])
+        service.start(entry_ids[0], 600)
+        
+        service.flush()
+        
+        events = TimerJournalRepository(temp_db).load()
+        assert [(event[1], event[2]) for event in events] == [(entry_ids[0], "start")]
+        service.discard(entry_ids[0])
+        assert TimerJournalRepository(temp_db).load() == []
+    
+    def test_restart_continues_from_pending_duration(self, qapp, temp_db, entry_ids):
+        """Test: Neustart vor flush() zählt ab der gestoppten Dauer, nicht ab time_entries"""
+        service = self._service(temp_db)
+        entry_repo = TimeEntryRepository(temp_db)
+        stale_seconds = entry_repo.find_by_id(entry_ids[0]).duration_minutes * 60
+        
+        service.start(entry_ids[0], stale_seconds)
+        self._rewind(service, entry_ids[0], 5)
+        service.stop(entry_ids[0])
+        
+        # Ansicht neu aus der Datenbank geladen: dort stehen noch 10 Minuten
+        service.start(entry_ids[0], stale_seconds)
+        self._rewind(service, entry_ids[0], 2)
+        assert service.stop(entry_ids[0]) // 60 == 17
+        
+        service.flush()
+        assert entry_repo.find_by_id(entry_ids[0]).duration_minutes == 17
+    
+    def test_deleting_entry_removes_journal_rows(self, qapp, temp_db, entry_ids):
+        """Test: Journal-Zeilen hängen per ON DELETE CASCADE am TimeEntry"""
+        service = self._service(temp_db)
+        service.start(entry_ids[0], 0)
+        
+        TimeEntryRepository(temp_db).delete(entry_ids[0])
+        
+        assert TimerJournalRepository(temp_db).load() == []
+        service.discard(entry_ids[0])
+
+
+class TestFullTextSearch:
+    """Integration Tests für die FTS5-Suche über time_entries"""
+    
+    @pytest.fixture
+    def repo(self, temp_db, temp_crypto):
+        """Repository mit Einträgen zweier Worker"""
+        worker_repo = WorkerRepository(temp_db, temp_crypto)
+        worker_ids = [
+            worker_repo.create(Worker(name=name, email=f"{name}@test.com", team="Team"))
+            for name in ("Alice", "Bob")
+        ]
+        repo = TimeEntryRepository(temp_db)
+        repo.create_many([
+            TimeEntry(worker_id=worker_ids[0], date=datetime(2024, 1, 10), duration_minutes=60,
+                      description="Code-Review im Meeting", project="Alpha - Backend"),
+            TimeEntry(worker_id=worker_ids[1], date=datetime(2024, 2, 10), duration_minutes=60,
+                      description="Review Review Übung", project="Beta"),
+            TimeEntry(worker_id=worker_ids[0], date=datetime(2024, 3, 10), duration_minutes=60,
+                      description="Planung", project="Alpha"),
+        ])
+        return repo
+    
+    @staticmethod
+    def _descriptions(entries):
+        return [entry.description for entry in entries]
+    
+    def test_prefix_words_ranked(self, repo):
+        """Test: Wortanfänge, alle Wörter nötig, häufigere Treffer zuerst"""
+        assert repo.supports_search()
+        assert self._descriptions(repo.search("rev")) == ["Review Review Übung", "Code-Review im Meeting"]
+        assert self._descriptions(repo.search("REV meet")) == ["Code-Review im Meeting"]
+        assert self._descriptions(repo.search("ubung")) == ["Review Review Übung"]
+        assert repo.search("view") == []
+    
+    def test_operators_in_input_are_plain_words(self, repo):
+        """Test: Anführungszeichen und FTS5-Operatoren im Suchtext verursachen keinen Fehler"""
+        assert self._descriptions(repo.search('"alpha" -back*')) == ["Code-Review im Meeting"]
+        assert repo.search("alpha OR planung") == []
+        assert repo.search(' "- ') == []
+    
+    def test_date_worker_filter_and_limit(self, repo):
+        """Test: Suche kombiniert sich mit Datumsbereich, Worker-Filter und Limit"""
+        alice = repo.search("planung")[0].worker_id
+        
+        assert self._descriptions(repo.search("alpha", "2024-02-01", "2024-12-31")) == ["Planung"]
+        assert self._descriptions(repo.search("rev", worker_ids=[alice])) == ["Code-Review im Meeting"]
+        assert len(repo.search("alpha", limit=1)) == 1
+    
+    def test_triggers_keep_index_in_sync(self, repo):
+        """Test: Anlegen, Ändern und Löschen aktualisieren den Volltextindex"""
+        entry = repo.search("planung")[0]
+        entry.description = "Retro"
+        repo.update(entry)
+        assert repo.search("planung") == []
+        assert [e.id for e in repo.search("retro")] == [entry.id]
+        
+        repo.delete(entry.id)
+        assert repo.search("retro") == []
+        
+        repo.create(TimeEntry(worker_id=entry.worker_id, date=datetime(2024, 4, 1),
+                              duration_minutes=30, description="Neu", project="Gamma"))
+        assert self._descriptions(repo.search("gam")) == ["Neu"]
+    
+    @staticmethod
+    def _drop_fts(temp_db):
+        for trigger in ("insert", "delete", "update"):
+            temp_db.execute_query(f"DROP TRIGGER trg_time_entries_fts_{trigger}")
+        temp_db.execute_query("DROP TABLE time_entries_fts")
+    
+    def test_migration_indexes_existing_entries(self, temp_db, repo):
+        """Test: Migration übernimmt bereits vorhandene Einträge per rebuild"""
+        self._drop_fts(temp_db)
+        
+        fts_migration = next(m for m in MIGRATIONS if m.version == 8)
+        assert fts_migration.apply(temp_db) is None
+        
+        assert len(repo.search("alpha")) == 2
+    
+    def test_supports_search_creates_missing_index(self, temp_db, repo):
+        """Test: Fehlt der Index trotz Version 8, legt supports_search ihn an"""
+        self._drop_fts(temp_db)
+        
+        assert repo.supports_search()
+        assert len(repo.search("alpha")) == 2
+    
+    def test_without_fts5_search_stays_disabled(self, temp_db, repo, monkeypatch):
+        """Test: Ohne FTS5 meldet die Migration das und supports_search bleibt False"""
+        self._drop_fts(temp_db)
+        monkeypatch.setattr(migrations, "_has_fts5", lambda db_service: False)
+        
+        fts_migration = next(m for m in MIGRATIONS if m.version == 8)
+        assert "FTS5" in fts_migration.apply(temp_db)
+        assert not repo.supports_search()
+        assert not temp_db.in_transaction
+
+
 class TestForeignKeyConstraints:
     """Tests für Foreign Key Constraints"""
     
+    def test_cascade_migration_keeps_orphans(self, temp_db, temp_crypto):
+        """Test: Migration auf ON DELETE CASCADE verschiebt verwaiste Zeilen statt sie zu löschen"""
+        worker_id = WorkerRepository(temp_db, temp_crypto).create(
+            Worker(name="Test", email="test@test.com", team="Team")
+        )
+        entry_repo = TimeEntryRepository(temp_db)
+        entry_repo.create(TimeEntry(
+            worker_id=worker_id, date=datetime(2025, 10, 6), duration_minutes=60, description="A"
+        ))
+        
+        # Altbestand: Zeilen eines bereits gelöschten Workers (ohne Foreign Keys entstanden)
+        QSqlQuery(temp_db.db).exec("PRAGMA foreign_keys = OFF")
+        orphan_id = entry_repo.create(TimeEntry(
+            worker_id=999, date=datetime(2025, 10, 6), duration_minutes=30, description="Waise"
+        ))
+        CapacityRepository(temp_db).create(Capacity(
+            worker_id=999, start_date=datetime(2025, 10, 1), end_date=datetime(2025, 10, 31),
+            planned_hours=80.0
+        ))
+        QSqlQuery(temp_db.db).exec("PRAGMA foreign_keys = ON")
+        temp_db.execute_query("DELETE FROM schema_version WHERE version >= 6")
+        
+        results = temp_db._run_migrations()
+        
+        assert len(entry_repo.find_by_worker(worker_id)) == 1
+        assert entry_repo.find_by_worker(999) == []
+        assert entry_repo.sum_minutes_by_worker() == {worker_id: 60}
+        
+        query = temp_db.execute_query("SELECT id, description FROM orphaned_time_entries")
+        assert query.next() and (query.value(0), query.value(1)) == (orphan_id, "Waise")
+        query = temp_db.execute_query("SELECT worker_id, planned_hours FROM orphaned_capacities")
+        assert query.next() and (query.value(0), query.value(1)) == (999, 80.0)
+        
+        message = next(r.message for r in results if r.version == 6)
+        assert "1 verwaiste Zeilen aus time_entries" in message
+        assert "orphaned_capacities" in message
+    
+    def test_cascade_migration_without_orphans_has_no_message(self, temp_db):
+        """Test: Ohne verwaiste Zeilen entstehen weder Hinweis noch orphaned_*-Tabellen"""
+        assert next(r for r in temp_db.applied_migrations if r.version == 6).message is None
+        query = temp_db.execute_query(
+            "SELECT COUNT(*) FROM sqlite_master WHERE name LIKE 'orphaned_%'"
+        )
+        assert query.next() and query.value(0) == 0
+    
     def test_cascade_delete_worker_deletes_entries(self, temp_db, temp_crypto):
         """Test: Löschen eines Workers sollte seine Zeiterfassungen löschen"""
         # Setup
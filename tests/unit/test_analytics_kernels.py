@@ -0,0 +1,165 @@
+"""
+Unit Tests für Analytics Kernels (Parität NumPy / reines Python)
+"""
+import random
+from array import array
+from datetime import datetime
+import pytest
+from src.services import analytics_kernels
+from src.services.analytics_kernels import PythonKernels, NumpyKernels, HAS_NUMPY, get_kernels
+from src.services.analytics_service import AnalyticsService
+from src.models.time_entry import TimeEntry
+from src.models.time_entry_batch import TimeEntryBatch
+from src.models.capacity import Capacity
+
+requires_numpy = pytest.mark.skipif(not HAS_NUMPY, reason="NumPy nicht installiert")
+
+FIRST_DAY = datetime(2022, 1, 1).toordinal()
+
+
+@pytest.fixture
+def columns():
+    """Zufällige Spalten über ~3 Jahre (fester Seed)"""
+    rng = random.Random(42)
+    size = 5_000
+    return {
+        "days": array("i", (FIRST_DAY + rng.randrange(1100) for _ in range(size))),
+        "minutes": array("i", (rng.randrange(5, 600) for _ in range(size))),
+        "workers": array("i", (rng.randrange(1, 40) for _ in range(size))),
+        "starts": [FIRST_DAY + rng.randrange(1000) for _ in range(200)],
+        "spans": [rng.randrange(1, 120) for _ in range(200)],
+        "hours": [rng.uniform(0, 300) for _ in range(200)]
+    }
+
+
+@requires_numpy
+class TestKernelParity:
+    """Tests: NumpyKernels liefert dieselben Ergebnisse wie PythonKernels"""
+    
+    @pytest.mark.parametrize("first, last", [
+        (FIRST_DAY, FIRST_DAY + 1099),
+        (FIRST_DAY + 300, FIRST_DAY + 330),
+        (FIRST_DAY - 50, FIRST_DAY + 10),
+        (FIRST_DAY + 10, FIRST_DAY + 9)
+    ])
+    def test_daily_minutes(self, columns, first, last):
+        """Test: Tagessummen inklusive Bereichsgrenzen und leerem Bereich"""
+        args = (columns["days"], columns["minutes"], first, last)
+        assert NumpyKernels.daily_minutes(*args) == PythonKernels.daily_minutes(*args)
+    
+    def test_totals_by_key(self, columns):
+        """Test: Summen pro Schlüssel, ganzzahlig bei ganzzahligen Werten"""
+        expected = PythonKernels.totals_by_key(columns["workers"], columns["minutes"])
+        actual = NumpyKernels.totals_by_key(columns["workers"], columns["minutes"])
+        
+        assert actual == expected
+        assert all(isinstance(value, int) for value in actual.values())
+        assert NumpyKernels.totals_by_key(array("i"), array("i")) == {}
+        
+        # Dünn besetzte und negative Schlüssel
+        sparse_keys = [10**9, -5, 10**9, 7]
+        assert NumpyKernels.totals_by_key(sparse_keys, [1, 2, 3, 0]) == \
+            PythonKernels.totals_by_key(sparse_keys, [1, 2, 3, 0]) == {10**9: 4, -5: 2, 7: 0}
+    
+    def test_minute_stats(self, columns):
+        """Test: Anzahl, Summe, Minimum, Maximum"""
+        assert NumpyKernels.minute_stats(columns["minutes"]) == PythonKernels.minute_stats(columns["minutes"])
+        assert NumpyKernels.minute_stats(array("i")) == PythonKernels.minute_stats(array("i")) == (0, 0, 0, 0)
+    
+    @pytest.mark.parametrize("first, last", [
+        (FIRST_DAY, FIRST_DAY + 1200),
+        (FIRST_DAY + 500, FIRST_DAY + 540),
+        (FIRST_DAY + 10, FIRST_DAY + 9)
+    ])
+    def test_capacity_kernels(self, columns, first, last):
+        """Test: Anteilige und tägliche Plan-Stunden"""
+        starts = columns["starts"]
+        ends = [start + span - 1 for start, span in zip(starts, columns["spans"])]
+        # Ungültige Capacity (Ende vor Start) zählt nicht
+        ends[0] = starts[0] - 3
+        args = (starts, ends, columns["hours"], first, last)
+        
+        assert NumpyKernels.prorated_hours(*args) == pytest.approx(PythonKernels.prorated_hours(*args))
+        assert NumpyKernels.daily_capacity_hours(*args) == pytest.approx(
+            PythonKernels.daily_capacity_hours(*args)
+        )
+        
+        # Tägliche Verteilung summiert sich zur anteiligen Summe
+        assert sum(PythonKernels.daily_capacity_hours(*args)) == pytest.approx(
+            sum(PythonKernels.prorated_hours(*args))
+        )
+
+
+class TestAnalyticsServiceKernels:
+    """Tests: AnalyticsService-Ergebnisse unabhängig von der Kernel-Wahl"""
+    
+    @pytest.fixture
+    def entries(self):
+        """Einträge zweier Worker über zwei Wochen"""
+        return [
+            TimeEntry(
+                id=i + 1,
+                worker_id=1 + i % 2,
+                date=datetime(2025, 10, 1 + i % 14),
+                duration_minutes=30 + 15 * i,
+                description="Arbeit",
+                project=("Alpha", "Beta", None)[i % 3]
+            )
+            for i in range(30)
+        ]
+    
+    @pytest.mark.parametrize("use_numpy", [
+        False,
+        pytest.param(True, marks=requires_numpy)
+    ])
+    def test_service_results(self, entries, use_numpy):
+        """Test: Tagesverteilung, Summen und Auslastung"""
+        analytics = AnalyticsService(db_service=None, use_numpy=use_numpy)
+        start, end = datetime(2025, 10, 1), datetime(2025, 10, 7, 23, 59, 59)
+        capacities = [Capacity(
+            worker_id=1, start_date=datetime(2025, 10, 1),
+            end_date=datetime(2025, 10, 10), planned_hours=80.0
+        )]
+        
+        daily = analytics.calculate_daily_breakdown(entries, start, end)
+        assert len(daily) == 7
+        assert daily[0] == (datetime(2025, 10, 1).date(), sum(
+            e.duration_minutes for e in entries if e.date.day == 1
+        ) / 60.0)
+        
+        utilization = analytics.calculate_utilization(entries, capacities, start, end)
+        assert utilization["actual_hours"] == pytest.approx(sum(hours for _, hours in daily))
+        assert utilization["planned_hours"] == pytest.approx(80.0 * 7 / 10)
+        
+        capacity_days = analytics.calculate_daily_capacity(capacities, start, end)
+        assert [hours for _, hours in capacity_days] == pytest.approx([8.0] * 7)
+        
+        assert analytics.calculate_worker_totals(entries) == pytest.approx({
+            1: sum(e.duration_minutes for e in entries if e.worker_id == 1) / 60.0,
+            2: sum(e.duration_minutes for e in entries if e.worker_id == 2) / 60.0
+        })
+        assert analytics.calculate_project_totals(TimeEntryBatch.from_entries(entries)) == pytest.approx({
+            project: sum(e.duration_minutes for e in entries if e.project == project) / 60.0
+            for project in ("Alpha", "Beta", None)
+        })
+        
+        summary = analytics.get_statistics_summary(entries)
+        assert summary["entry_count"] == 30
+        assert summary["min_hours"] == 0.5
+        assert summary["max_hours"] == pytest.approx((30 + 15 * 29) / 60.0)
+    
+    def test_empty_range_and_entries(self):
+        """Test: Leere Eingaben liefern leere Ergebnisse"""
+        analytics = AnalyticsService(db_service=None, use_numpy=False)
+        
+        assert analytics.calculate_daily_breakdown([], datetime(2025, 10, 2), datetime(2025, 10, 1)) == []
+        assert analytics.get_statistics_summary([])["entry_count"] == 0
+        assert analytics.calculate_worker_totals([]) == {}
+    
+    def test_fallback_without_numpy(self, monkeypatch):
+        """Test: Ohne NumPy wird der Python-Fallback gewählt"""
+        monkeypatch.setattr(analytics_kernels, "HAS_NUMPY", False)
+        
+        assert get_kernels() is PythonKernels
+        with pytest.raises(RuntimeError):
+            get_kernels(use_numpy=True)
@@ -96,3 +96,99 @@ class TestCryptoService:
         decrypted = crypto_service.decrypt(encrypted)
         
         assert decrypted == plaintext
+    
+    def test_envelope_encrypt_decrypt_roundtrip(self, crypto_service):
+        """Test: Envelope-Modus sollte Original wiederherstellen"""
+        crypto_service.generate_data_key()
+        plaintext = "Envelope 🔑 äöü"
+        
+        encrypted = crypto_service.encrypt(plaintext)
+        
+        assert encrypted.startswith(CryptoService.ENVELOPE_PREFIX)
+        assert crypto_service.decrypt(encrypted) == plaintext
+    
+    def test_envelope_ciphertext_is_shorter_than_legacy(self, crypto_service):
+        """Test: Envelope-Ciphertext enthält keinen RSA-gewrappten Key mehr"""
+        legacy = crypto_service.encrypt("Test")
+        crypto_service.generate_data_key()
+        envelope = crypto_service.encrypt("Test")
+        
+        assert len(envelope) < len(legacy)
+    
+    def test_envelope_decrypts_legacy_ciphertext(self, crypto_service):
+        """Test: Legacy-Blobs (ohne Header) bleiben im Envelope-Modus lesbar"""
+        legacy = crypto_service.encrypt("Altdaten")
+        crypto_service.generate_data_key()
+        
+        assert not crypto_service.is_envelope_ciphertext(legacy)
+        assert crypto_service.decrypt(legacy) == "Altdaten"
+    
+    def test_load_data_key_restores_wrapped_key(self, crypto_service, temp_key_dir):
+        """Test: Gewrappter Data-Key sollte in neuer Instanz ladbar sein"""
+        wrapped_key = crypto_service.generate_data_key()
+        encrypted = crypto_service.encrypt("Persistiert")
+        
+        service2 = CryptoService(key_directory=temp_key_dir)
+        service2.initialize_keys()
+        service2.load_data_key(wrapped_key)
+        
+        assert service2.has_data_key()
+        assert service2.decrypt(encrypted) == "Persistiert"
+    
+    def test_envelope_decrypt_without_data_key_raises_error(self, crypto_service, temp_key_dir):
+        """Test: Envelope-Ciphertext ohne geladenen Data-Key sollte RuntimeError werfen"""
+        crypto_service.generate_data_key()
+        encrypted = crypto_service.encrypt("Test")
+        
+        service2 = CryptoService(key_directory=temp_key_dir)
+        service2.initialize_keys()
+        
+        with pytest.raises(RuntimeError, match="Data-Key nicht geladen"):
+            service2.decrypt(encrypted)
+    
+    def test_blind_index_is_deterministic_and_normalized(self, crypto_service):
+        """Test: Blind-Index ist deterministisch und unabhängig von Groß-/Kleinschreibung"""
+        bidx1 = crypto_service.blind_index("Max@Example.com ")
+        bidx2 = crypto_service.blind_index("max@example.com")
+        
+        assert bidx1 == bidx2
+        assert bidx1 != crypto_service.blind_index("other@example.com")
+        assert "max" not in bidx1
+    
+    def test_blind_index_depends_on_key(self, crypto_service):
+        """Test: Anderer Schlüssel ergibt anderen Blind-Index"""
+        other_dir = Path(tempfile.mkdtemp())
+        try:
+            other = CryptoService(key_directory=other_dir)
+            other.initialize_keys()
+            
+            assert other.blind_index("a@b.de") != crypto_service.blind_index("a@b.de")
+        finally:
+            shutil.rmtree(other_dir)
+    
+    def test_decrypt_many_mixed_formats_sequential(self, crypto_service):
+        """Test: decrypt_many entschlüsselt Legacy- und Envelope-Werte in Reihenfolge"""
+        legacy = [crypto_service.encrypt(f"legacy {i}") for i in range(3)]
+        crypto_service.generate_data_key()
+        envelope = [crypto_service.encrypt(f"envelope {i}") for i in range(3)]
+        mixed = [legacy[0], envelope[0], legacy[1], envelope[1], legacy[2], envelope[2]]
+        
+        result = crypto_service.decrypt_many(mixed, parallel=False)
+        
+        assert result == [
+            "legacy 0", "envelope 0", "legacy 1", "envelope 1", "legacy 2", "envelope 2"
+        ]
+    
+    def test_decrypt_many_parallel_matches_sequential(self, crypto_service):
+        """Test: Prozess-Pool liefert dieselben Klartexte wie sequentielle Entschlüsselung"""
+        values = [f"Wert {i} äöü" for i in range(12)]
+        encrypted = [crypto_service.encrypt(value) for value in values]
+        crypto_service.PARALLEL_DECRYPT_CHUNK_SIZE = 5
+        
+        result = crypto_service.decrypt_many(encrypted, parallel=True, max_workers=2)
+        
+        assert result == values
+    
+    def test_decrypt_many_empty_list(self, crypto_service):
+        """Test: Leere Eingabe ergibt leere Liste"""
+        assert crypto_service.decrypt_many([]) == []
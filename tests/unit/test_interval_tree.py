@@ -0,0 +1,49 @@
+"""
+Unit Tests für IntervalTree
+"""
+import random
+import pytest
+from src.utils.interval_tree import IntervalTree
+
+
+class TestIntervalTree:
+    """Tests für IntervalTree"""
+    
+    @pytest.fixture
+    def intervals(self):
+        """Zufällige Intervalle inklusive Einzeltagen und ungültiger Intervalle"""
+        rng = random.Random(7)
+        intervals = []
+        for value in range(400):
+            start = rng.randrange(0, 2000)
+            intervals.append((start, start + rng.choice([0, 1, 5, 30, 90, 365]) - (value % 50 == 0) * 400, value))
+        return intervals
+    
+    def test_matches_brute_force(self, intervals):
+        """Test: overlapping liefert genau die schneidenden Intervalle"""
+        tree = IntervalTree(intervals)
+        valid = [interval for interval in intervals if interval[0] <= interval[1]]
+        rng = random.Random(3)
+        
+        for _ in range(300):
+            start = rng.randrange(-100, 2500)
+            end = start + rng.choice([0, 1, 7, 31, 400, 3000])
+            expected = sorted(
+                value for first, last, value in valid if first <= end and last >= start
+            )
+            assert sorted(value for _, _, value in tree.overlapping(start, end)) == expected
+        
+        assert len(tree) == len(valid)
+    
+    def test_boundaries_inclusive(self):
+        """Test: Intervalle, die den Bereich nur an einem Tag berühren, zählen"""
+        tree = IntervalTree([(1, 5, "a"), (6, 10, "b"), (11, 11, "c")])
+        
+        assert sorted(value for _, _, value in tree.overlapping(5, 6)) == ["a", "b"]
+        assert [value for _, _, value in tree.overlapping(11, 20)] == ["c"]
+        assert list(tree.overlapping(12, 20)) == []
+    
+    def test_empty_tree_and_range(self):
+        """Test: Leerer Baum und leerer Bereich liefern nichts"""
+        assert list(IntervalTree().overlapping(0, 100)) == []
+        assert list(IntervalTree([(1, 5, "a")]).overlapping(5, 1)) == []
@@ -0,0 +1,119 @@
+"""
+Unit Tests für SearchIndex
+"""
+import random
+import pytest
+from datetime import datetime, timedelta
+
+from src.utils import search_index
+from src.utils.search_index import SearchIndex, HAS_NUMPY
+from src.models.time_entry import TimeEntry
+
+
+WORDS = ["alpha", "backend", "meeting", "review", "urlaub", "bugfix", "planung"]
+
+
+def fields(entry):
+    """Suchfelder wie in TimeEntryWidget (ohne Worker)"""
+    return (entry.date.strftime("%d.%m.%Y"), entry.project or "", entry.description or "")
+
+
+def make_entry(entry_id, date, description):
+    """Eintrag ohne Projekt"""
+    return TimeEntry(id=entry_id, worker_id=1, date=date, duration_minutes=60, description=description)
+
+
+def brute_force(entries, text):
+    """Erwartete Treffer per Einzelprüfung, absteigend nach Datum"""
+    text = text.lower()
+    matches = [e for e in entries if any(text in value.lower() for value in fields(e))]
+    return [e.id for e in sorted(matches, key=lambda e: e.date, reverse=True)]
+
+
+@pytest.fixture
+def entries():
+    """Zufällige Einträge mit wiederkehrenden Projekten und eindeutigen Beschreibungen"""
+    rng = random.Random(5)
+    return [
+        TimeEntry(
+            id=i + 1,
+            worker_id=1,
+            date=datetime(2024, 1, 1) + timedelta(days=rng.randrange(60)),
+            duration_minutes=60,
+            description=" ".join(rng.choice(WORDS) for _ in range(3)).title() + f" {i}",
+            project=rng.choice([None, "Alpha - Backend", "Beta"])
+        )
+        for i in range(3000)
+    ]
+
+
+@pytest.fixture(params=[True, False] if HAS_NUMPY else [False], ids=["numpy", "python"] if HAS_NUMPY else ["python"])
+def index(request, entries, monkeypatch):
+    """Index über alle Einträge, mit und ohne NumPy"""
+    monkeypatch.setattr(search_index, "HAS_NUMPY", request.param)
+    index = SearchIndex(fields, key=lambda e: e.date, reverse=True)
+    index.build(entries)
+    return index
+
+
+class TestSearchIndex:
+    """Tests für SearchIndex"""
+    
+    def test_matches_brute_force(self, index, entries):
+        """Test: Treffer und Reihenfolge entsprechen der Einzelprüfung"""
+        for text in ["Review", "alpha - b", "01.2024", "2999", "e", "zzz", "meeting bug"]:
+            assert [e.id for e in index.query(text)] == brute_force(entries, text)
+    
+    def test_refining_query(self, index, entries):
+        """Test: Verlängerter Suchtext (Tippen) liefert dieselben Treffer wie neu"""
+        for text in ["r", "re", "rev", "revi", "review", "reviews", "re"]:
+            assert [e.id for e in index.query(text)] == brute_force(entries, text)
+    
+    def test_empty_query_returns_all(self, index, entries):
+        """Test: Leerer Suchtext liefert alle Einträge in Sortierreihenfolge"""
+        assert [e.id for e in index.query("")] == brute_force(entries, "")
+        assert len(index) == len(entries)
+    
+    def test_incremental_changes(self, index, entries):
+        """Test: add/update/remove entsprechen einem Neuaufbau"""
+        index.query("neu")
+        
+        added = make_entry(9001, datetime(2024, 1, 20), "Neu Meeting")
+        index.add(added)
+        entries.append(added)
+        
+        moved = make_entry(5, datetime(2025, 1, 1), "Verschoben")
+        index.update(moved)
+        entries[4] = moved
+        
+        renamed = make_entry(7, entries[6].date, "Neu benannt")
+        index.update(renamed)
+        entries[6] = renamed
+        
+        index.remove(9)
+        index.remove(424242)
+        del entries[8]
+        
+        assert 9 not in index and 9001 in index
+        assert [e.id for e in index.query("")] == brute_force(entries, "")
+        for text in ["neu", "neu m", "verschoben", "review", "2025"]:
+            assert [e.id for e in index.query(text)] == brute_force(entries, text)
+    
+    def test_many_new_values_after_build(self, index, entries):
+        """Test: Viele neue Werte nach dem Aufbau werden weiter gefunden"""
+        index.query("x")
+        for i in range(3000):
+            entry = make_entry(10000 + i, datetime(2024, 2, 1), f"x{i}y")
+            index.add(entry)
+            entries.append(entry)
+        
+        for text in ["x1", "x12y", "9y"]:
+            assert [e.id for e in index.query(text)] == brute_force(entries, text)
+    
+    def test_insertion_order_without_key(self):
+        """Test: Ohne Sortierschlüssel bleibt die Einfügereihenfolge"""
+        index = SearchIndex(lambda e: (e.description,))
+        for entry_id, description in [(3, "b"), (1, "ab"), (2, "c")]:
+            index.add(make_entry(entry_id, datetime(2024, 1, 1), description))
+        
+        assert [e.id for e in index.query("B")] == [3, 1]
@@ -0,0 +1,62 @@
+"""
+Unit Tests für TimerService
+"""
+from datetime import datetime, timedelta
+import pytest
+from src.services.timer_service import TimerService
+
+
+class TestTimerService:
+    """Tests für TimerService"""
+    
+    @pytest.fixture
+    def service(self, qapp):
+        """Eigener TimerService ohne laufende Timer"""
+        return TimerService()
+    
+    def test_start_and_stop(self, service):
+        """Test: Stopp liefert Startstand plus verstrichene Sekunden"""
+        assert service.start(7, 90)
+        assert not service.start(7, 0)
+        assert service.is_running(7) and service.running_ids() == [7]
+        
+        start_time, base_seconds = service._running[7]
+        service._running[7] = (start_time - timedelta(seconds=65), base_seconds)
+        
+        assert service.stop(7) == 155
+        assert not service.is_running(7)
+        assert service.stop(7) is None
+        assert service.seconds(7) is None and service.started_at(7) is None
+    
+    def test_single_tick_only_while_running(self, service, qtbot):
+        """Test: Gemeinsamer Takt läuft nur mit mindestens einem Timer"""
+        assert not service._tick.isActive()
+        
+        service.start(1)
+        service.start(2)
+        assert service._tick.isActive()
+        with qtbot.waitSignal(service.ticked, timeout=2000):
+            pass
+        
+        service.stop(1)
+        assert service._tick.isActive()
+        service.discard(2)
+        assert not service._tick.isActive()
+    
+    def test_timer_changed_on_start_and_discard(self, service, qtbot):
+        """Test: Start und Verwerfen melden die Entry-ID"""
+        with qtbot.waitSignal(service.timer_changed) as blocker:
+            service.start(3)
+        assert blocker.args == [3]
+        assert isinstance(service.started_at(3), datetime)
+        
+        with qtbot.waitSignal(service.timer_changed) as blocker:
+            service.discard(3)
+        assert blocker.args == [3]
+        
+        with qtbot.assertNotEmitted(service.timer_changed):
+            service.discard(3)
+    
+    def test_shared_instance(self, qapp):
+        """Test: shared() liefert immer dieselbe Instanz"""
+        assert TimerService.shared() is TimerService.shared()
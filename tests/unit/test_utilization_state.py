@@ -0,0 +1,99 @@
+"""
+Unit Tests für UtilizationState
+"""
+from datetime import datetime
+import pytest
+from src.services.utilization_state import UtilizationState
+from src.repositories.capacity_index import CapacityIndex
+from src.models.time_entry import TimeEntry
+
+START = datetime(2025, 10, 1)
+END = datetime(2025, 10, 10)
+
+
+def day(value: int) -> int:
+    """Ordinalzahl eines Oktobertags 2025"""
+    return datetime(2025, 10, value).toordinal()
+
+
+def entry(worker_id: int, day_of_month: int, minutes: int) -> TimeEntry:
+    """TimeEntry im Oktober 2025"""
+    return TimeEntry(
+        id=1, worker_id=worker_id, date=datetime(2025, 10, day_of_month),
+        duration_minutes=minutes, description="Arbeit"
+    )
+
+
+class TestUtilizationState:
+    """Tests für UtilizationState"""
+    
+    @pytest.fixture
+    def index(self):
+        """Index mit je einer Capacity für Worker 1 und 2"""
+        index = CapacityIndex()
+        index.fill([
+            (10, 1, day(1), day(10), 80.0),
+            (20, 2, day(6), day(15), 40.0),
+            (30, 2, day(20), day(25), 10.0)
+        ])
+        return index
+    
+    @pytest.fixture
+    def state(self, index):
+        """Geladener Zustand für Worker 1 und 2"""
+        state = UtilizationState(START, END, index)
+        state.load({1: (60.0, 80.0), 2: (10.0, 20.0)})
+        return state
+    
+    def test_load_and_totals(self, state):
+        """Test: Zeilen und Gesamtsummen nach dem Laden"""
+        assert state.row(1)["utilization_percent"] == 75.0
+        assert state.row(2)["utilization_percent"] == 50.0
+        assert state.totals() == (100.0, 70.0, 62.5)
+        assert len(state) == 2 and 1 in state and 3 not in state
+    
+    def test_apply_entry_create_update_delete(self, state):
+        """Test: Anlegen, Ändern und Löschen verschieben nur die Ist-Stunden"""
+        assert state.apply_entry(None, entry(1, 5, 120)) == [1]
+        assert state.row(1)["hours_worked"] == 62.0
+        
+        assert state.apply_entry(entry(1, 5, 120), entry(1, 5, 60)) == [1]
+        assert state.row(1)["hours_worked"] == 61.0
+        
+        assert state.apply_entry(entry(1, 5, 60), None) == [1]
+        assert state.row(1)["hours_worked"] == 60.0
+        assert state.totals() == (100.0, 70.0, 62.5)
+    
+    def test_apply_entry_ignores_outside_range_and_untracked(self, state):
+        """Test: Einträge außerhalb des Zeitraums oder fremder Worker ändern nichts"""
+        assert state.apply_entry(None, entry(1, 11, 600)) == []
+        assert state.apply_entry(None, entry(3, 5, 600)) == []
+        assert state.apply_entry(entry(1, 5, 30), entry(1, 5, 30)) == []
+        
+        # Verschieben aus dem Zeitraum heraus zählt als Abzug
+        assert state.apply_entry(entry(1, 10, 60), entry(1, 11, 60)) == [1]
+        assert state.row(1)["hours_worked"] == 59.0
+    
+    def test_apply_capacity_update_and_worker_change(self, state, index):
+        """Test: Capacity-Wechsel rechnet alten und neuen Worker neu"""
+        index.put(20, 1, day(1), day(10), 20.0)
+        
+        assert state.apply_capacity(20) == [2, 1]
+        assert state.row(1)["hours_planned"] == pytest.approx(100.0)
+        assert state.row(2)["hours_planned"] == 0.0
+        assert state.row(2)["utilization_percent"] == 0.0
+        assert state.totals()[0] == pytest.approx(100.0)
+    
+    def test_apply_capacity_create_and_delete(self, state, index):
+        """Test: Neue und gelöschte Capacities im Zeitraum"""
+        index.put(40, 2, day(1), day(2), 4.0)
+        assert state.apply_capacity(40) == [2]
+        assert state.row(2)["hours_planned"] == pytest.approx(24.0)
+        
+        index.remove(40)
+        assert state.apply_capacity(40) == [2]
+        assert state.row(2)["hours_planned"] == pytest.approx(20.0)
+        
+        # Capacity außerhalb des Zeitraums betrifft keine Zeile
+        index.put(50, 1, day(20), day(21), 8.0)
+        assert state.apply_capacity(50) == []
@@ -2,6 +2,7 @@
 Unit Tests für WorkerRepository
 """
 import pytest
+from contextlib import nullcontext
 from unittest.mock import Mock, MagicMock, patch
 from datetime import datetime
 
@@ -11,6 +12,16 @@ from src.services.database_service import DatabaseService
 from src.services.crypto_service import CryptoService
 
 
+def _mock_row_query(fields):
+    """Query-Mock mit einer Zeile, Zugriff per Index (record().indexOf)"""
+    columns = list(fields)
+    mock_query = Mock()
+    mock_query.next = MagicMock(return_value=True)
+    mock_query.record = MagicMock(return_value=Mock(indexOf=columns.index))
+    mock_query.value = MagicMock(side_effect=lambda index: fields[columns[index]])
+    return mock_query
+
+
 class TestWorkerRepository:
     """Tests für WorkerRepository"""
     
@@ -19,6 +30,10 @@ class TestWorkerRepository:
         """Mock DatabaseService"""
         mock_db = Mock(spec=DatabaseService)
         mock_db.execute_query = MagicMock()
+        # statement() liefert das Ergebnis des execute_query-Mocks als Context Manager
+        mock_db.statement = MagicMock(
+            side_effect=lambda *args, **kwargs: nullcontext(mock_db.execute_query(*args, **kwargs))
+        )
         return mock_db
     
     @pytest.fixture
@@ -27,6 +42,7 @@ class TestWorkerRepository:
         mock_crypto = Mock(spec=CryptoService)
         mock_crypto.encrypt = MagicMock(side_effect=lambda x: f"encrypted_{x}")
         mock_crypto.decrypt = MagicMock(side_effect=lambda x: x.replace("encrypted_", ""))
+        mock_crypto.blind_index = MagicMock(side_effect=lambda x: f"bidx_{x.strip().lower()}")
         return mock_crypto
     
     @pytest.fixture
@@ -88,17 +104,14 @@ class TestWorkerRepository:
     def test_find_by_id_decrypts_data(self, repository, db_service, crypto_service):
         """Test: Gefundener Worker sollte entschlüsselt werden"""
         # Mock Query Result
-        mock_query = Mock()
-        mock_query.next = MagicMock(return_value=True)
-        mock_query.value = MagicMock(side_effect=lambda field: {
+        db_service.execute_query.return_value = _mock_row_query({
             "id": 1,
             "name": "encrypted_John Doe",
             "email": "encrypted_john@example.com",
             "team": "Marketing",
             "active": 1,
             "created_at": "2025-10-06T10:00:00"
-        }[field])
-        db_service.execute_query.return_value = mock_query
+        })
         
         # Act
         worker = repository.find_by_id(1)
@@ -135,7 +148,13 @@ class TestWorkerRepository:
             call_count[0] += 1
             return call_count[0] <= 2  # 2 Workers
         
+        # find_all liest per Index (record().indexOf)
+        columns = ["id", "name", "email", "team", "active", "created_at"]
+        mock_query.record = MagicMock(return_value=Mock(indexOf=columns.index))
+        
         def value_side_effect(field):
+            if isinstance(field, int):
+                field = columns[field]
             if call_count[0] == 1:
                 return {
                     "id": 1,
@@ -237,26 +256,141 @@ class TestWorkerRepository:
         assert params[0] == 1
     
     # Tests für find_by_email
-    def test_find_by_email_searches_encrypted_email(self, repository, db_service, crypto_service):
-        """Test: Suche nach Email sollte verschlüsselte Email verwenden"""
-        mock_query = Mock()
-        mock_query.next = MagicMock(return_value=True)
-        mock_query.value = MagicMock(side_effect=lambda field: {
+    def test_find_by_email_uses_blind_index(self, repository, db_service, crypto_service):
+        """Test: Suche nach Email sollte den Blind-Index verwenden"""
+        db_service.execute_query.return_value = _mock_row_query({
             "id": 1,
             "name": "encrypted_Test User",
             "email": "encrypted_test@example.com",
             "team": "Team",
             "active": 1,
             "created_at": "2025-10-06T10:00:00"
-        }[field])
-        db_service.execute_query.return_value = mock_query
+        })
         
         # Act
         worker = repository.find_by_email("test@example.com")
         
         # Assert
         assert worker is not None
-        crypto_service.encrypt.assert_called_with("test@example.com")
+        assert worker.email == "test@example.com"
+        crypto_service.blind_index.assert_called_with("test@example.com")
+        crypto_service.encrypt.assert_not_called()
         call_args = db_service.execute_query.call_args
+        assert "email_bidx = ?" in call_args[0][0]
         params = call_args[1]["params"] if len(call_args) > 1 and "params" in call_args[1] else call_args[0][1]
-        assert params[0] == "encrypted_test@example.com"
+        assert params[0] == "bidx_test@example.com"
+    
+    def test_create_worker_stores_blind_index(self, repository, db_service):
+        """Test: create sollte den Blind-Index der Email mitspeichern"""
+        mock_query = Mock()
+        mock_query.lastInsertId = MagicMock(return_value=1)
+        db_service.execute_query.return_value = mock_query
+        
+        repository.create(Worker(name="Test", email="Test@Example.com", team="Team"))
+        
+        call_args = db_service.execute_query.call_args
+        params = call_args[1]["params"] if len(call_args) > 1 and "params" in call_args[1] else call_args[0][1]
+        assert "email_bidx" in call_args[0][0]
+        assert params[-1] == "bidx_test@example.com"
+    
+    def test_email_exists_excludes_own_id(self, repository, db_service):
+        """Test: email_exists sollte den eigenen Worker bei Updates ignorieren"""
+        mock_query = Mock()
+        mock_query.next = MagicMock(return_value=False)
+        db_service.execute_query.return_value = mock_query
+        
+        result = repository.email_exists("test@example.com", exclude_id=5)
+        
+        assert result is False
+        call_args = db_service.execute_query.call_args
+        assert "id != ?" in call_args[0][0]
+        params = call_args[1]["params"] if len(call_args) > 1 and "params" in call_args[1] else call_args[0][1]
+        assert params == ["bidx_test@example.com", 5]
+    
+    # Tests für WorkerCache
+    def _mock_single_worker_query(self, db_service):
+        fields = {
+            "id": 1,
+            "name": "encrypted_Cached User",
+            "email": "encrypted_cached@example.com",
+            "team": "Team",
+            "active": 1,
+            "created_at": "2025-10-06T10:00:00"
+        }
+        mock_query = _mock_row_query(fields)
+        mock_query.next = MagicMock(side_effect=[True, False])
+        db_service.execute_query.return_value = mock_query
+    
+    def test_find_by_id_uses_cache_after_first_lookup(self, repository, db_service, crypto_service):
+        """Test: Wiederholte find_by_id-Aufrufe sollten nicht erneut entschlüsseln"""
+        self._mock_single_worker_query(db_service)
+        
+        first = repository.find_by_id(1)
+        second = repository.find_by_id(1)
+        
+        assert first.name == second.name == "Cached User"
+        assert db_service.execute_query.call_count == 1
+        assert crypto_service.decrypt.call_count == 2
+        assert repository.cache.stats()["hits"] == 1
+    
+    def test_find_all_fills_cache_for_find_by_id(self, repository, db_service):
+        """Test: Nach find_all sind alle Worker per Dictionary-Lookup erreichbar"""
+        self._mock_single_worker_query(db_service)
+        
+        repository.find_all()
+        
+        assert repository.find_by_id(1).name == "Cached User"
+        assert repository.find_by_id(2) is None  # Cache vollständig -> kein Query
+        assert repository.find_all()[0].name == "Cached User"
+        assert db_service.execute_query.call_count == 1
+    
+    def test_cache_returns_copies(self, repository, db_service):
+        """Test: Änderungen an zurückgegebenen Workern verändern den Cache nicht"""
+        self._mock_single_worker_query(db_service)
+        
+        worker = repository.find_by_id(1)
+        worker.name = "Changed"
+        
+        assert repository.find_by_id(1).name == "Cached User"
+    
+    def test_update_and_delete_invalidate_cache(self, repository, db_service):
+        """Test: update/delete aktualisieren den Cache direkt"""
+        self._mock_single_worker_query(db_service)
+        repository.find_all()
+        
+        write_query = Mock()
+        write_query.numRowsAffected = MagicMock(return_value=1)
+        db_service.execute_query.return_value = write_query
+        
+        repository.update(Worker(id=1, name="Renamed", email="cached@example.com", team="Team"))
+        renamed = repository.find_by_id(1)
+        assert renamed.name == "Renamed"
+        assert renamed.created_at == datetime(2025, 10, 6, 10, 0, 0)
+        
+        repository.delete(1)
+        assert repository.find_by_id(1) is None
+        assert repository.cache.stats()["size"] == 0
+    
+    def test_cache_is_shared_per_database(self, db_service, crypto_service):
+        """Test: Repositories derselben Datenbank teilen einen Cache"""
+        repo1 = WorkerRepository(db_service, crypto_service)
+        repo2 = WorkerRepository(db_service, crypto_service)
+        
+        assert repo1.cache is repo2.cache
+    
+    def test_find_all_uses_decrypt_many_above_threshold(self, repository, db_service, crypto_service):
+        """Test: Große Ergebnismengen werden per decrypt_many entschlüsselt"""
+        self._mock_single_worker_query(db_service)
+        crypto_service.decrypt_many = MagicMock(
+            side_effect=lambda values: [v.replace("encrypted_", "") for v in values]
+        )
+        repository.BULK_DECRYPT_THRESHOLD = 1
+        
+        workers = repository.find_all()
+        
+        assert workers[0].name == "Cached User"
+        assert workers[0].email == "cached@example.com"
+        crypto_service.decrypt_many.assert_called_once_with(
+            ["encrypted_Cached User", "encrypted_cached@example.com"]
+        )
+        crypto_service.decrypt.assert_not_called()
@@ -12,7 +12,9 @@ from src.services.analytics_service import AnalyticsService
 from src.repositories.worker_repository import WorkerRepository
 from src.repositories.time_entry_repository import TimeEntryRepository
 from src.repositories.capacity_repository import CapacityRepository
+from src.repositories.capacity_index import CapacityIndex
 from src.models.worker import Worker
+from src.models.time_entry import TimeEntry
 
 
 @pytest.fixture
@@ -20,6 +22,7 @@ def mock_analytics_service():
     """Mock AnalyticsService"""
     service = Mock(spec=AnalyticsService)
     service.calculate_worker_utilization = Mock(return_value=None)
+    service.calculate_team_utilization = Mock(return_value={})
     return service
 
 
@@ -42,6 +45,7 @@ def mock_time_entry_repository():
 def mock_capacity_repository():
     """Mock CapacityRepository"""
     repo = Mock(spec=CapacityRepository)
+    repo.load_index = Mock(return_value=CapacityIndex())
     return repo
 
 
@@ -174,16 +178,36 @@ class TestAnalyticsWidgetDataLoading:
     def test_refresh_data_calls_analytics(self, analytics_widget, mock_analytics_service, sample_workers):
         """Test: Refresh ruft AnalyticsService auf"""
         analytics_widget._workers = sample_workers
-        mock_analytics_service.calculate_worker_utilization.return_value = {
-            'worker_id': 1,
-            'hours_planned': 160.0,
-            'hours_worked': 150.0,
-            'utilization_percent': 93.75
+        mock_analytics_service.calculate_team_utilization.return_value = {
+            1: (150.0, 160.0),
+            2: (180.0, 160.0),
+            3: (0.0, 0.0)
         }
+        mock_analytics_service.calculate_team_utilization.reset_mock()
         
         analytics_widget._refresh_data()
         
-        assert mock_analytics_service.calculate_worker_utilization.call_count == 3
+        # Ein Team-Aufruf statt einem Aufruf pro Worker
+        assert mock_analytics_service.calculate_team_utilization.call_count == 1
+        assert mock_analytics_service.calculate_worker_utilization.call_count == 0
+        assert analytics_widget._utilization_data[1]['utilization_percent'] == 93.75
+        assert analytics_widget._utilization_data[3]['utilization_percent'] == 0.0
+    
+    def test_status_filter_uses_team_utilization(self, analytics_widget, mock_analytics_service, sample_workers):
+        """Test: Status-Filter nutzt die bereits berechnete Team-Auslastung"""
+        analytics_widget._workers = sample_workers
+        mock_analytics_service.calculate_team_utilization.return_value = {
+            1: (150.0, 160.0),
+            2: (180.0, 160.0),
+            3: (120.0, 160.0)
+        }
+        
+        analytics_widget._status_filter.setCurrentIndex(analytics_widget._status_filter.findData("over"))
+        mock_analytics_service.calculate_team_utilization.reset_mock()
+        analytics_widget._refresh_data()
+        
+        assert mock_analytics_service.calculate_team_utilization.call_count == 1
+        assert list(analytics_widget._utilization_data.keys()) == [2]
 
 
 class TestAnalyticsWidgetStatistics:
@@ -366,7 +390,7 @@ class TestAnalyticsWidgetErrorHandling:
     
     def test_refresh_data_handles_errors(self, analytics_widget, mock_analytics_service):
         """Test: Fehler beim Refresh werden behandelt"""
-        mock_analytics_service.calculate_worker_utilization.side_effect = Exception("Test Error")
+        mock_analytics_service.calculate_team_utilization.side_effect = Exception("Test Error")
         analytics_widget._workers = [Worker(id=1, name="Test", email="test@test.com", team="A", active=True)]
         
         analytics_widget._refresh_data()
@@ -452,3 +476,88 @@ class TestAnalyticsWidgetFilters:
         new_status = analytics_widget._status_label.text()
         # Status wird von _refresh_data() verändert
         assert new_status != initial_status or "Daten" in new_status or "geladen" in new_status
+
+
+class TestAnalyticsWidgetIncremental:
+    """Tests für inkrementelle Updates nach einzelnen Schreibvorgängen"""
+    
+    @pytest.fixture
+    def loaded_widget(self, analytics_widget, mock_analytics_service, sample_workers):
+        """Widget mit geladener Team-Auslastung"""
+        analytics_widget._workers = sample_workers
+        mock_analytics_service.calculate_team_utilization.return_value = {
+            1: (150.0, 160.0),
+            2: (180.0, 160.0),
+            3: (120.0, 160.0)
+        }
+        analytics_widget._refresh_data()
+        mock_analytics_service.calculate_team_utilization.reset_mock()
+        return analytics_widget
+    
+    def _entry(self, widget, worker_id: int, minutes: int) -> TimeEntry:
+        """Eintrag am letzten Tag des gewählten Zeitraums"""
+        day = widget._end_date_filter.date().toPython()
+        return TimeEntry(
+            id=7, worker_id=worker_id, date=datetime(day.year, day.month, day.day),
+            duration_minutes=minutes, description="Arbeit"
+        )
+    
+    def _row_values(self, widget, worker_id: int):
+        """Texte der Wert-Spalten einer Worker-Zeile"""
+        row = widget._name_items[worker_id].row()
+        return [widget._team_table.item(row, column).text() for column in range(2, 7)]
+    
+    def test_entry_created_updates_row_and_statistics(self, loaded_widget, mock_analytics_service, mock_time_entry_repository):
+        """Test: Neuer Eintrag aktualisiert eine Zeile und die Summen ohne Neuberechnung"""
+        mock_time_entry_repository.find_by_id = Mock(return_value=self._entry(loaded_widget, 3, 480))
+        
+        loaded_widget.on_entry_created(7)
+        
+        assert mock_analytics_service.calculate_team_utilization.call_count == 0
+        assert self._row_values(loaded_widget, 3) == ["160.0", "128.0", "-32.0", "80.0%", "✓ Optimal"]
+        assert loaded_widget._utilization_data[3]['hours_worked'] == 128.0
+        assert loaded_widget._total_worked_label.text() == "458.0 h"
+    
+    def test_entry_changed_and_deleted(self, loaded_widget, mock_analytics_service):
+        """Test: Änderung und Löschen verrechnen die Differenz"""
+        old_entry = self._entry(loaded_widget, 1, 600)
+        new_entry = self._entry(loaded_widget, 1, 60)
+        
+        loaded_widget.on_entry_changed(old_entry, new_entry)
+        assert self._row_values(loaded_widget, 1)[1] == "141.0"
+        
+        loaded_widget.on_entry_changed(new_entry, None)
+        assert self._row_values(loaded_widget, 1)[1] == "140.0"
+        assert loaded_widget._total_worked_label.text() == "440.0 h"
+        assert mock_analytics_service.calculate_team_utilization.call_count == 0
+    
+    def test_entry_outside_range_ignored(self, loaded_widget):
+        """Test: Einträge außerhalb des Zeitraums ändern nichts"""
+        entry = self._entry(loaded_widget, 1, 600)
+        entry.date = entry.date.replace(year=entry.date.year + 1)
+        
+        loaded_widget.on_entry_changed(None, entry)
+        
+        assert self._row_values(loaded_widget, 1)[1] == "150.0"
+    
+    def test_capacity_changed_uses_index(self, loaded_widget, mock_capacity_repository):
+        """Test: Capacity-Änderung rechnet Plan-Stunden des Workers über den Index neu"""
+        day = loaded_widget._end_date_filter.date().toPython().toordinal()
+        index = mock_capacity_repository.load_index.return_value
+        index.fill([(5, 2, day, day, 90.0)])
+        
+        loaded_widget.on_capacity_changed(5)
+        
+        assert self._row_values(loaded_widget, 2)[0] == "90.0"
+        assert loaded_widget._total_planned_label.text() == "410.0 h"
+    
+    def test_status_filter_change_falls_back_to_refresh(self, analytics_widget, mock_analytics_service, sample_workers):
+        """Test: Fällt ein Worker aus dem Status-Filter, wird neu geladen"""
+        analytics_widget._workers = sample_workers
+        mock_analytics_service.calculate_team_utilization.return_value = {1: (180.0, 160.0), 2: (180.0, 160.0)}
+        analytics_widget._status_filter.setCurrentIndex(analytics_widget._status_filter.findData("over"))
+        mock_analytics_service.calculate_team_utilization.reset_mock()
+        
+        analytics_widget.on_entry_changed(self._entry(analytics_widget, 1, 60 * 100), None)
+        
+        assert mock_analytics_service.calculate_team_utilization.call_count == 1
@@ -78,19 +78,11 @@ class TestCapacityWidgetTablePopulation:
     def test_populate_table_makes_cells_readonly(self, capacity_widget, sample_workers, sample_capacities, monkeypatch):
         """Test: Tabellenzellen sind nicht editierbar"""
         # Setup
-        from src.models.time_entry import TimeEntry
-        
         # Mock TimeEntryRepository
         mock_repo = Mock()
-        mock_repo.find_by_worker = Mock(return_value=[
-            TimeEntry(
-                id=1,
-                worker_id=1,
-                date=datetime(2024, 1, 15),
-                duration_minutes=480,  # 8 hours
-                description="Test"
-            )
-        ])
+        mock_repo.sum_minutes_by_worker = Mock(
+            side_effect=lambda start, end, worker_ids: {worker_ids[0]: 480}  # 8 hours
+        )
         
         mock_repo_class = Mock(return_value=mock_repo)
         monkeypatch.setattr('src.repositories.time_entry_repository.TimeEntryRepository', mock_repo_class)
@@ -112,23 +104,12 @@ class TestCapacityWidgetTablePopulation:
     def test_populate_table_displays_utilization(self, capacity_widget, sample_workers, sample_capacities, monkeypatch):
         """Test: Auslastung wird in der Tabelle angezeigt"""
         # Setup
-        from src.models.time_entry import TimeEntry
-        
         # Mock TimeEntryRepository - 150 Stunden gearbeitet bei 160 geplanten
         mock_repo = Mock()
-        mock_time_entries = []
         # 20 Tage à 7.5 Stunden = 150 Stunden
-        for day in range(1, 21):
-            mock_time_entries.append(
-                TimeEntry(
-                    id=day,
-                    worker_id=1,
-                    date=datetime(2024, 1, day),
-                    duration_minutes=450,  # 7.5 Stunden
-                    description="Test"
-                )
-            )
-        mock_repo.find_by_worker = Mock(return_value=mock_time_entries)
+        mock_repo.sum_minutes_by_worker = Mock(
+            side_effect=lambda start, end, worker_ids: {worker_ids[0]: 20 * 450}
+        )
         
         mock_repo_class = Mock(return_value=mock_repo)
         monkeypatch.setattr('src.repositories.time_entry_repository.TimeEntryRepository', mock_repo_class)
@@ -151,8 +132,6 @@ class TestCapacityWidgetTablePopulation:
     def test_calculate_capacity_utilization_with_data(self, capacity_widget, monkeypatch):
         """Test: Auslastungsberechnung mit Daten"""
         # Setup
-        from src.models.time_entry import TimeEntry
-        
         capacity = Capacity(
             id=1,
             worker_id=1,
@@ -161,20 +140,9 @@ class TestCapacityWidgetTablePopulation:
             planned_hours=160.0
         )
         
-        # Mock TimeEntryRepository - 150 Stunden gearbeitet
+        # Mock TimeEntryRepository - 150 Stunden gearbeitet (20 Tage à 7.5h)
         mock_repo = Mock()
-        mock_time_entries = []
-        for day in range(1, 21):
-            mock_time_entries.append(
-                TimeEntry(
-                    id=day,
-                    worker_id=1,
-                    date=datetime(2024, 1, day),
-                    duration_minutes=450,  # 7.5 Stunden
-                    description="Test"
-                )
-            )
-        mock_repo.find_by_worker = Mock(return_value=mock_time_entries)
+        mock_repo.sum_minutes_by_worker = Mock(return_value={1: 20 * 450})
         
         mock_repo_class = Mock(return_value=mock_repo)
         monkeypatch.setattr('src.repositories.time_entry_repository.TimeEntryRepository', mock_repo_class)
@@ -199,7 +167,7 @@ class TestCapacityWidgetTablePopulation:
         
         # Mock TimeEntryRepository - keine Einträge
         mock_repo = Mock()
-        mock_repo.find_by_worker = Mock(return_value=[])
+        mock_repo.sum_minutes_by_worker = Mock(return_value={})
         
         mock_repo_class = Mock(return_value=mock_repo)
         monkeypatch.setattr('src.repositories.time_entry_repository.TimeEntryRepository', mock_repo_class)
@@ -240,22 +208,12 @@ class TestCapacityWidgetUtilizationColors:
     def test_utilization_color_low(self, capacity_widget, sample_workers, sample_capacities, monkeypatch):
         """Test: Niedrige Auslastung (<80%) wird orange dargestellt"""
         # Setup
-        from src.models.time_entry import TimeEntry
-        
         # Mock TimeEntryRepository - 120 Stunden gearbeitet bei 160 geplanten = 75%
         mock_repo = Mock()
-        mock_time_entries = []
-        for day in range(1, 17):  # 16 Tage à 7.5 Stunden = 120 Stunden
-            mock_time_entries.append(
-                TimeEntry(
-                    id=day,
-                    worker_id=1,
-                    date=datetime(2024, 1, day),
-                    duration_minutes=450,  # 7.5 Stunden
-                    description="Test"
-                )
-            )
-        mock_repo.find_by_worker = Mock(return_value=mock_time_entries)
+        # 16 Tage à 7.5 Stunden = 120 Stunden
+        mock_repo.sum_minutes_by_worker = Mock(
+            side_effect=lambda start, end, worker_ids: {worker_ids[0]: 16 * 450}
+        )
         
         mock_repo_class = Mock(return_value=mock_repo)
         monkeypatch.setattr('src.repositories.time_entry_repository.TimeEntryRepository', mock_repo_class)
@@ -272,22 +230,12 @@ class TestCapacityWidgetUtilizationColors:
     def test_utilization_color_normal(self, capacity_widget, sample_workers, sample_capacities, monkeypatch):
         """Test: Normale Auslastung (80-110%) wird grün dargestellt"""
         # Setup
-        from src.models.time_entry import TimeEntry
-        
         # Mock TimeEntryRepository - 150 Stunden gearbeitet bei 160 geplanten = 93.75%
         mock_repo = Mock()
-        mock_time_entries = []
-        for day in range(1, 21):  # 20 Tage à 7.5 Stunden = 150 Stunden
-            mock_time_entries.append(
-                TimeEntry(
-                    id=day,
-                    worker_id=1,
-                    date=datetime(2024, 1, day),
-                    duration_minutes=450,  # 7.5 Stunden
-                    description="Test"
-                )
-            )
-        mock_repo.find_by_worker = Mock(return_value=mock_time_entries)
+        # 20 Tage à 7.5 Stunden = 150 Stunden
+        mock_repo.sum_minutes_by_worker = Mock(
+            side_effect=lambda start, end, worker_ids: {worker_ids[0]: 20 * 450}
+        )
         
         mock_repo_class = Mock(return_value=mock_repo)
         monkeypatch.setattr('src.repositories.time_entry_repository.TimeEntryRepository', mock_repo_class)
@@ -304,22 +252,12 @@ class TestCapacityWidgetUtilizationColors:
     def test_utilization_color_high(self, capacity_widget, sample_workers, sample_capacities, monkeypatch):
         """Test: Hohe Auslastung (>110%) wird rot dargestellt"""
         # Setup
-        from src.models.time_entry import TimeEntry
-        
         # Mock TimeEntryRepository - 180 Stunden gearbeitet bei 160 geplanten = 112.5%
         mock_repo = Mock()
-        mock_time_entries = []
-        for day in range(1, 25):  # 24 Tage à 7.5 Stunden = 180 Stunden
-            mock_time_entries.append(
-                TimeEntry(
-                    id=day,
-                    worker_id=1,
-                    date=datetime(2024, 1, day),
-                    duration_minutes=450,  # 7.5 Stunden
-                    description="Test"
-                )
-            )
-        mock_repo.find_by_worker = Mock(return_value=mock_time_entries)
+        # 24 Tage à 7.5 Stunden = 180 Stunden
+        mock_repo.sum_minutes_by_worker = Mock(
+            side_effect=lambda start, end, worker_ids: {worker_ids[0]: 24 * 450}
+        )
         
         mock_repo_class = Mock(return_value=mock_repo)
         monkeypatch.setattr('src.repositories.time_entry_repository.TimeEntryRepository', mock_repo_class)
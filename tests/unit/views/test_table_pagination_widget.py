@@ -158,3 +158,22 @@ class TestTablePaginationWidget:
         
         # Sollte automatisch auf Seite 1 zurückgehen
         assert widget.get_current_page() == 1
+    
+    def test_all_option(self):
+        """Test: Option "Alle" zeigt eine einzige Seite"""
+        widget = TablePaginationWidget(default_page_size=10, allow_all=True)
+        widget.set_total_items(500)
+        
+        widget.set_page_size(TablePaginationWidget.ALL_PAGE_SIZE)
+        
+        assert widget.is_showing_all()
+        assert widget.get_offset() == 0
+        assert not widget._next_button.isEnabled()
+        assert "500" in widget._info_label.text()
+    
+    def test_all_option_only_when_allowed(self):
+        """Test: Ohne allow_all gibt es keine Option "Alle" """
+        widget = TablePaginationWidget(default_page_size=TablePaginationWidget.ALL_PAGE_SIZE)
+        
+        assert widget.get_page_size() == 25
+        assert widget._page_size_combo.findText(TablePaginationWidget.ALL_TEXT) == -1
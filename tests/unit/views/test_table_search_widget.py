@@ -111,6 +111,17 @@ class TestTableSearchWidgetResultDisplay:
         # Alle 10 passen
         widget.set_result_count(10, 10)
         assert widget._result_label.text() == "10 Einträge"
+    
+    def test_result_count_capped_with_scope(self, qapp):
+        """Abgeschnittene Treffer mit "+" und Hinweis auf die durchsuchten Felder"""
+        widget = TableSearchWidget()
+        widget._search_input.setText("test")  # Aktive Suche
+        
+        widget.set_result_count(10, 10, capped=True, scope="nur Projekt")
+        assert widget._result_label.text() == "10+ von 10 Treffern (nur Projekt)"
+        
+        widget.set_result_count(0, 10, scope="nur Projekt")
+        assert widget._result_label.text() == "Keine Treffer (nur Projekt)"
 
 
 class TestTableSearchWidgetStyling:
@@ -193,3 +204,31 @@ class TestTableSearchWidgetEdgeCases:
             assert True
         except:
             assert False, "set_result_count sollte negative Werte nicht crashen"
+
+
+class TestTableSearchWidgetDebounce:
+    """Tests für entprellte Suche"""
+    
+    def test_debounce_emits_last_text_once(self, qapp, qtbot: QtBot):
+        """Schnelles Tippen emittiert nur den letzten Text"""
+        widget = TableSearchWidget(debounce_ms=20)
+        emitted = []
+        widget.search_changed.connect(emitted.append)
+        
+        for text in ("r", "re", "rev"):
+            widget._search_input.setText(text)
+        assert emitted == []
+        
+        qtbot.waitUntil(lambda: emitted == ["rev"], timeout=1000)
+    
+    def test_debounce_clear_emits_immediately(self, qapp):
+        """Leeren wirkt sofort und verwirft eine ausstehende Suche"""
+        widget = TableSearchWidget(debounce_ms=1000)
+        emitted = []
+        widget.search_changed.connect(emitted.append)
+        
+        widget._search_input.setText("test")
+        widget.clear()
+        
+        assert emitted == [""]
+        assert not widget._debounce_timer.isActive()
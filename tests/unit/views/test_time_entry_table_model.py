@@ -0,0 +1,159 @@
+"""
+Unit Tests für TimeEntryTableModel
+"""
+import pytest
+from datetime import datetime, timedelta
+from PySide6.QtCore import Qt, QModelIndex
+
+from src.views.time_entry_table_model import (
+    TimeEntryTableModel, MINUTES_ROLE, TIMER_RUNNING_ROLE,
+    COL_DATE, COL_WORKER, COL_TYPE, COL_PROJECT, COL_CATEGORY,
+    COL_DESCRIPTION, COL_DURATION, COL_TIMER
+)
+from src.models.time_entry import TimeEntry
+from src.services.timer_service import TimerService
+
+
+def make_entries(count: int, first_id: int = 1):
+    """Einträge absteigend nach Datum"""
+    first_day = datetime(2024, 3, 1)
+    return [
+        TimeEntry(
+            id=first_id + i,
+            worker_id=1 + i % 2,
+            date=first_day - timedelta(days=i),
+            duration_minutes=30 + i,
+            description="[Urlaub] Erholung" if i == 0 else f"Eintrag {first_id + i}",
+            project="Alpha - Backend" if i % 2 == 0 else None
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def model(qapp):
+    """Modell mit drei Einträgen und Worker-Namen"""
+    model = TimeEntryTableModel(timer_service=TimerService())
+    model.set_worker_names({1: "Alice"})
+    model.set_entries(make_entries(3))
+    return model
+
+
+class TestTimeEntryTableModelData:
+    """Tests für Zellinhalte"""
+    
+    def test_display_values(self, model):
+        """Test: Zellinhalte werden aus dem Eintrag berechnet"""
+        row = [model.index(0, column).data() for column in range(COL_TIMER + 1)]
+        
+        assert row == [
+            "01.03.2024", "Alice", "Urlaub", "Alpha", "Backend",
+            "Erholung", "30m (0.50h)", "00:30:00"
+        ]
+        assert model.index(1, COL_WORKER).data() == "ID:2"
+        assert model.index(1, COL_TYPE).data() == "Arbeit"
+        assert model.index(1, COL_PROJECT).data() == ""
+        assert model.index(1, COL_DURATION).data(MINUTES_ROLE) == 31
+    
+    def test_flags_only_text_columns_editable(self, model):
+        """Test: Nur Projekt, Kategorie, Beschreibung und Dauer sind editierbar"""
+        editable = [
+            column for column in range(model.columnCount())
+            if model.flags(model.index(0, column)) & Qt.ItemIsEditable
+        ]
+        assert editable == [COL_PROJECT, COL_CATEGORY, COL_DESCRIPTION, COL_DURATION]
+    
+    def test_set_data_emits_cell_edited(self, model, qtbot):
+        """Test: setData meldet die Änderung statt selbst zu speichern"""
+        with qtbot.waitSignal(model.cell_edited) as blocker:
+            assert model.setData(model.index(0, COL_DURATION), " 2h ")
+        
+        assert blocker.args == [1, COL_DURATION, "2h"]
+        assert model.index(0, COL_DURATION).data(MINUTES_ROLE) == 30
+    
+    def test_update_entry_changes_single_row(self, model, qtbot):
+        """Test: update_entry emittiert dataChanged nur für die Zeile"""
+        entry = model.entry_at(1)
+        entry.duration_minutes = 90
+        
+        with qtbot.waitSignal(model.dataChanged) as blocker:
+            model.update_entry(entry)
+        
+        top_left, bottom_right = blocker.args[:2]
+        assert (top_left.row(), bottom_right.row()) == (1, 1)
+        assert model.index(1, COL_DURATION).data() == "90m (1.50h)"
+    
+    def test_remove_entry(self, model):
+        """Test: Entfernen aktualisiert Zeilen-Zuordnung"""
+        model.remove_entry(2)
+        
+        assert model.rowCount() == 2
+        assert model.row_of(3) == 1
+        assert model.row_of(2) is None
+
+
+class TestTimeEntryTableModelFetching:
+    """Tests für Nachladen und Sortierung"""
+    
+    def test_fetch_more_appends_pages(self, qapp):
+        """Test: Weitere Seiten werden erst per fetchMore geladen"""
+        model = TimeEntryTableModel()
+        model.set_entries([], iter([make_entries(2), make_entries(2, first_id=3)]))
+        
+        assert model.rowCount() == 0 and model.canFetchMore(QModelIndex())
+        model.fetchMore(QModelIndex())
+        model.fetchMore(QModelIndex())
+        assert model.rowCount() == 4 and model.row_of(4) == 3
+        
+        model.fetchMore(QModelIndex())
+        assert not model.canFetchMore(QModelIndex())
+    
+    def test_sort_applies_to_new_entries(self, model):
+        """Test: Sortierung nach Wert bleibt bei neuen Einträgen aktiv"""
+        model.sort(COL_DURATION, Qt.DescendingOrder)
+        assert [model.entry_at(row).id for row in range(3)] == [3, 2, 1]
+        
+        model.sort(COL_DATE, Qt.AscendingOrder)
+        model.set_entries(make_entries(3, first_id=10))
+        assert [model.entry_at(row).id for row in range(3)] == [12, 11, 10]
+        assert model.row_of(12) == 0
+
+
+class TestTimeEntryTableModelTimers:
+    """Tests für Timer-Zustand"""
+    
+    def test_start_and_stop_timer(self, model):
+        """Test: Timer startet bei der erfassten Dauer und liefert Minuten beim Stopp"""
+        model.start_timer(2)
+        
+        assert model.is_timer_running(2)
+        assert model.index(1, COL_TIMER).data(TIMER_RUNNING_ROLE) is True
+        assert model.running_timer_ids() == [2]
+        
+        assert model.stop_timer(2) == 31
+        assert not model.is_timer_running(2)
+        assert model.stop_timer(2) is None
+    
+    def test_timer_survives_reload(self, model):
+        """Test: Neue Zeilen beenden keinen Timer, der Eintrag zeigt ihn wieder an"""
+        model.start_timer(1)
+        
+        model.set_entries(make_entries(2, first_id=5))
+        assert model.is_timer_running(1) and model.row_of(1) is None
+        
+        model.set_entries(make_entries(3))
+        assert model.index(0, COL_TIMER).data(TIMER_RUNNING_ROLE) is True
+        assert model.stop_timer(1) == 30
+    
+    def test_refresh_timers_only_given_rows(self, model, qtbot):
+        """Test: Takt meldet nur Timer-Zellen im sichtbaren Bereich"""
+        model.start_timer(1)
+        model.start_timer(3)
+        
+        changed = []
+        model.dataChanged.connect(lambda top_left, *_: changed.append(top_left.row()))
+        model.refresh_timers(1, 2)
+        assert changed == [2]
+        
+        model.refresh_timers()
+        assert changed == [2, 0, 2]
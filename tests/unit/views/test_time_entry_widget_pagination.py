@@ -0,0 +1,311 @@
+"""
+Unit Tests für TimeEntryWidget - Keyset-Pagination
+"""
+import pytest
+from contextlib import nullcontext
+from dataclasses import replace
+from unittest.mock import Mock, patch
+from PySide6.QtWidgets import QApplication, QMessageBox
+from PySide6.QtCore import QDate
+from datetime import datetime, timedelta
+
+from src.views.time_entry_widget import TimeEntryWidget
+from src.viewmodels.time_entry_viewmodel import TimeEntryViewModel
+from src.repositories.time_entry_repository import TimeEntryRepository
+from src.repositories.timer_journal_repository import TimerJournalRepository
+from src.models.time_entry import TimeEntry
+from src.models.worker import Worker
+from src.services.timer_service import TimerService
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    """Qt Application für GUI-Tests"""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    yield app
+
+
+@pytest.fixture
+def mock_viewmodel():
+    """Mock TimeEntryViewModel"""
+    vm = Mock(spec=TimeEntryViewModel)
+    vm.entry_created = Mock()
+    vm.validation_failed = Mock()
+    vm.error_occurred = Mock()
+    return vm
+
+
+@pytest.fixture
+def entries():
+    """60 Einträge, absteigend nach (date, id) sortiert"""
+    first_day = datetime(2024, 1, 1)
+    result = [
+        TimeEntry(
+            id=i + 1,
+            worker_id=1,
+            date=first_day + timedelta(days=i // 3),
+            duration_minutes=60,
+            description=f"Eintrag {i + 1}",
+            project="Projekt"
+        )
+        for i in range(60)
+    ]
+    result.sort(key=lambda e: (e.date, e.id), reverse=True)
+    return result
+
+
+@pytest.fixture
+def mock_repository(entries):
+    """Repository-Mock, der Keyset-Seiten aus der Liste bedient"""
+    repo = Mock(spec=TimeEntryRepository)
+    
+    def find_page(start, end, limit, after=None):
+        if after is not None:
+            entries_after = [
+                e for e in entries
+                if (e.date.date().isoformat(), e.id) < after
+            ]
+        else:
+            entries_after = entries
+        return entries_after[:limit]
+    
+    repo.count_by_date_range = Mock(return_value=len(entries))
+    repo.find_page_by_date_range = Mock(side_effect=find_page)
+    repo.find_by_date_range = Mock(return_value=list(entries))
+    repo.page_cursor = Mock(side_effect=TimeEntryRepository.page_cursor)
+    return repo
+
+
+@pytest.fixture
+def widget(qapp, mock_viewmodel, mock_repository):
+    """TimeEntryWidget mit 25 Einträgen pro Seite"""
+    widget = TimeEntryWidget(mock_viewmodel, mock_repository, timer_service=TimerService())
+    widget.load_workers([
+        Worker(id=1, name="Alice Test", email="alice@test.com", team="Dev", active=True)
+    ])
+    widget.pagination_widget.set_page_size(25)
+    widget._refresh_entries_list()
+    yield widget
+
+
+def _table_descriptions(widget):
+    """Beschreibungen aller Tabellenzeilen"""
+    model = widget.entries_model
+    return [
+        model.index(row, 5).data()
+        for row in range(model.rowCount())
+    ]
+
+
+class TestKeysetPagination:
+    """Tests für seitenweises Laden aus dem Repository"""
+    
+    def test_first_page_loads_only_page(self, widget, mock_repository, entries):
+        """Ohne Suche wird nur gezählt und die erste Seite geladen"""
+        assert widget.entries_model.rowCount() == 25
+        assert widget.pagination_widget._total_items == 60
+        mock_repository.find_by_date_range.assert_not_called()
+        
+        start, end, limit, after = mock_repository.find_page_by_date_range.call_args[0]
+        assert limit == 25
+        assert after is None
+    
+    def test_next_page_uses_cursor(self, widget, mock_repository, entries):
+        """Folgeseiten werden ab dem Cursor der Vorseite geladen"""
+        widget.pagination_widget._on_next_clicked()
+        
+        after = mock_repository.find_page_by_date_range.call_args[0][3]
+        assert after == TimeEntryRepository.page_cursor(entries[24])
+        assert _table_descriptions(widget) == [e.description for e in entries[25:50]]
+        
+        widget.pagination_widget._on_next_clicked()
+        assert _table_descriptions(widget) == [e.description for e in entries[50:]]
+        
+        widget.pagination_widget._on_prev_clicked()
+        assert _table_descriptions(widget) == [e.description for e in entries[25:50]]
+    
+    def test_unknown_page_walks_forward(self, widget, mock_repository, entries):
+        """Seite ohne gemerkten Cursor wird ab der letzten bekannten Seite erreicht"""
+        widget._page_cursors = {1: None}
+        widget.pagination_widget._current_page = 3
+        
+        widget._update_paginated_table()
+        
+        assert _table_descriptions(widget) == [e.description for e in entries[50:]]
+    
+    def test_search_loads_full_range(self, widget, mock_repository):
+        """Mit Suchtext wird der Bereich geladen und im Speicher gefiltert"""
+        widget.search_widget._search_input.setText("Eintrag 60")
+        widget._on_search("Eintrag 60")
+        
+        mock_repository.find_by_date_range.assert_called_once()
+        assert _table_descriptions(widget) == ["Eintrag 60"]
+    
+    def test_search_index_kept_across_changes(self, widget, mock_repository, entries):
+        """Anlegen, Bearbeiten und Löschen pflegen den Suchindex ohne Neuladen"""
+        widget._on_date_range_changed(QDate(2024, 1, 1), QDate(2024, 1, 31))
+        widget.search_widget._search_input.setText("Eintrag")
+        widget._on_search("Eintrag")
+        
+        created = TimeEntry(
+            id=61, worker_id=1, date=entries[0].date, duration_minutes=15,
+            description="Neu angelegt", project="Projekt"
+        )
+        mock_repository.find_by_id = Mock(return_value=created)
+        widget._on_entry_created(61)
+        assert 61 in widget._search_index
+        
+        mock_repository.find_by_id = Mock(side_effect=lambda entry_id: next(
+            e for e in entries if e.id == entry_id
+        ))
+        mock_repository.update = Mock(return_value=True)
+        widget._on_cell_edited(entries[1].id, 5, "Umbenannt")
+        
+        mock_repository.delete = Mock(return_value=True)
+        with patch.object(QMessageBox, "question", return_value=QMessageBox.Yes):
+            widget._on_delete_entry(entries[2].id)
+        
+        widget.search_widget._search_input.setText("umbenannt")
+        widget._on_search("umbenannt")
+        assert _table_descriptions(widget) == ["Umbenannt"]
+        widget.search_widget._search_input.setText("Eintrag")
+        widget._on_search("Eintrag")
+        assert widget.pagination_widget._total_items == 58
+        mock_repository.find_by_date_range.assert_called_once()
+    
+    def test_search_index_rebuilt_for_new_range(self, widget, mock_repository):
+        """Anderer Datumsbereich baut den Suchindex neu auf"""
+        widget.search_widget._search_input.setText("Eintrag 1")
+        widget._on_search("Eintrag 1")
+        widget._on_date_range_changed(QDate(2024, 1, 1), QDate(2024, 1, 31))
+        
+        assert mock_repository.find_by_date_range.call_count == 2
+    
+    def test_large_range_uses_full_text_search(self, widget, mock_repository, entries):
+        """Große Bereiche werden per Volltextsuche statt im Speicher durchsucht"""
+        widget.SEARCH_INDEX_MAX_ENTRIES = 50
+        mock_repository.supports_search = Mock(return_value=True)
+        mock_repository.search = Mock(return_value=entries[:2])
+        
+        widget.search_widget._search_input.setText("Eintrag")
+        widget._on_search("Eintrag")
+        
+        mock_repository.find_by_date_range.assert_not_called()
+        mock_repository.search.assert_called_once_with(
+            "Eintrag", *widget._filter_range(), limit=widget.FTS_RESULT_LIMIT
+        )
+        assert _table_descriptions(widget) == [e.description for e in entries[:2]]
+        assert widget.search_widget._result_label.text() == "2 von 60 Treffern (nur Beschreibung und Projekt)"
+    
+    def test_full_text_search_marks_capped_results(self, widget, mock_repository, entries):
+        """Erreicht die Volltextsuche das Limit, wird die Trefferzahl als Untergrenze angezeigt"""
+        widget.SEARCH_INDEX_MAX_ENTRIES = 50
+        widget.FTS_RESULT_LIMIT = 3
+        mock_repository.supports_search = Mock(return_value=True)
+        mock_repository.search = Mock(return_value=entries[:3])
+        
+        widget.search_widget._search_input.setText("Eintrag")
+        widget._on_search("Eintrag")
+        
+        assert widget.search_widget._result_label.text() == "3+ von 60 Treffern (nur Beschreibung und Projekt)"
+    
+    def test_show_all_fetches_on_demand(self, widget, mock_repository, entries):
+        """Seitengröße "Alle" lädt Keyset-Seiten erst per fetchMore"""
+        widget.FETCH_SIZE = 25
+        widget.pagination_widget.set_page_size(widget.pagination_widget.ALL_PAGE_SIZE)
+        
+        assert _table_descriptions(widget) == [e.description for e in entries[:25]]
+        
+        while widget.entries_model.canFetchMore():
+            widget.entries_model.fetchMore()
+        
+        assert _table_descriptions(widget) == [e.description for e in entries]
+        mock_repository.find_by_date_range.assert_not_called()
+
+
+class TestTableEditing:
+    """Tests für Bearbeitung über das Tabellenmodell"""
+    
+    def test_duration_edit_updates_row(self, widget, mock_repository, mock_viewmodel, entries):
+        """Geänderte Dauer wird gespeichert und nur in der Zeile aktualisiert"""
+        mock_repository.find_by_id = Mock(side_effect=lambda entry_id: next(
+            e for e in entries if e.id == entry_id
+        ))
+        mock_repository.update = Mock(return_value=True)
+        mock_viewmodel.parse_time_input = Mock(return_value=90)
+        
+        model = widget.entries_model
+        model.setData(model.index(0, 6), "1.5h")
+        
+        saved = mock_repository.update.call_args[0][0]
+        assert saved.id == entries[0].id and saved.duration_minutes == 90
+        assert model.index(0, 6).data() == "90m (1.50h)"
+
+
+class TestTimers:
+    """Tests für Timer über Refresh und Blättern hinweg"""
+    
+    def test_timer_keeps_running_across_pages(self, widget, mock_repository, entries):
+        """Blättern und Refresh stoppen keinen Timer und speichern nichts"""
+        mock_repository.update = Mock(return_value=True)
+        widget.entries_model.start_timer(entries[0].id)
+        
+        widget.pagination_widget._on_next_clicked()
+        widget._refresh_entries_list()
+        widget.pagination_widget._on_prev_clicked()
+        
+        mock_repository.update.assert_not_called()
+        assert widget.timer_service.running_ids() == [entries[0].id]
+        assert widget.entries_model.is_timer_running(widget.entries_model.entry_at(0).id)
+    
+    def test_stop_saves_from_model_without_lookup(self, widget, mock_repository, entries):
+        """Ohne Journal wird beim Stopp direkt gespeichert, ohne find_by_id"""
+        mock_repository.find_by_id = Mock()
+        mock_repository.update = Mock(return_value=True)
+        changed = []
+        widget.entry_changed.connect(lambda old, new: changed.append((old, new)))
+        
+        widget.entries_model.start_timer(entries[0].id)
+        widget._on_timer_toggled(widget.entries_model.index(0, 7))
+        
+        mock_repository.find_by_id.assert_not_called()
+        saved = mock_repository.update.call_args[0][0]
+        assert saved.id == entries[0].id and saved.duration_minutes == entries[0].duration_minutes
+        assert changed == [(entries[0], saved)]
+        assert not widget.timer_service.running_ids()
+    
+    def test_page_reload_flushes_stopped_duration(self, widget, mock_repository, entries):
+        """Mit Journal: Blättern schreibt gestoppte Dauern vor dem Neuladen, Neustart zählt weiter"""
+        journal = Mock(spec=TimerJournalRepository)
+        journal.EVENT_START = TimerJournalRepository.EVENT_START
+        journal.EVENT_STOP = TimerJournalRepository.EVENT_STOP
+        journal.load.return_value = []
+        journal.append.return_value = 1
+        journal.unit_of_work.return_value = nullcontext()
+        
+        def update_durations(minutes_by_id):
+            for index, entry in enumerate(entries):
+                if entry.id in minutes_by_id:
+                    entries[index] = replace(entry, duration_minutes=minutes_by_id[entry.id])
+        
+        mock_repository.update_durations = Mock(side_effect=update_durations)
+        widget.timer_service.attach_journal(journal, mock_repository)
+        entry_id = entries[0].id
+        
+        widget.entries_model.start_timer(entry_id)
+        start_time, base_seconds = widget.timer_service._running[entry_id]
+        widget.timer_service._running[entry_id] = (start_time - timedelta(minutes=5), base_seconds)
+        widget._on_timer_toggled(widget.entries_model.index(0, 7))
+        assert widget.timer_service.pending_minutes(entry_id) == 65
+        
+        widget.pagination_widget._on_next_clicked()
+        
+        mock_repository.update_durations.assert_called_once_with({entry_id: 65})
+        widget.pagination_widget._on_prev_clicked()
+        assert widget.entries_model.entry_at(0).duration_minutes == 65
+        
+        widget.entries_model.start_timer(entry_id)
+        assert widget.timer_service.seconds(entry_id) == 65 * 60
+        widget.timer_service.discard(entry_id)
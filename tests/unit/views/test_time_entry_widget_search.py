@@ -71,6 +71,10 @@ def mock_repository():
     ]
     
     repo.find_by_date_range = Mock(return_value=entries)
+    repo.count_by_date_range = Mock(return_value=len(entries))
+    repo.find_page_by_date_range = Mock(
+        side_effect=lambda start, end, limit, after=None: entries[:limit]
+    )
     return repo
 
 
@@ -119,7 +123,7 @@ class TestTimeEntryWidgetSearchFunctionality:
     def test_search_no_text_shows_all_rows(self, widget):
         """Leerer Suchtext zeigt alle Zeilen"""
         # Initial sollten alle Zeilen sichtbar sein
-        total_rows = widget.entries_table.rowCount()
+        total_rows = widget.entries_model.rowCount()
         
         # Suche mit leerem Text
         widget._on_search("")
@@ -133,7 +137,7 @@ class TestTimeEntryWidgetSearchFunctionality:
     
     def test_search_filters_by_worker(self, widget):
         """Suche nach Worker-Name filtert korrekt"""
-        total_rows = widget.entries_table.rowCount()
+        total_rows = widget.entries_model.rowCount()
         
         if total_rows == 0:
             pytest.skip("Keine Test-Daten in Tabelle")
@@ -153,7 +157,7 @@ class TestTimeEntryWidgetSearchFunctionality:
     
     def test_search_filters_by_project(self, widget):
         """Suche nach Projekt filtert korrekt"""
-        total_rows = widget.entries_table.rowCount()
+        total_rows = widget.entries_model.rowCount()
         
         if total_rows == 0:
             pytest.skip("Keine Test-Daten in Tabelle")
@@ -170,7 +174,7 @@ class TestTimeEntryWidgetSearchFunctionality:
     
     def test_search_filters_by_description(self, widget):
         """Suche nach Beschreibung filtert korrekt"""
-        total_rows = widget.entries_table.rowCount()
+        total_rows = widget.entries_model.rowCount()
         
         if total_rows == 0:
             pytest.skip("Keine Test-Daten in Tabelle")
@@ -187,7 +191,7 @@ class TestTimeEntryWidgetSearchFunctionality:
     
     def test_search_is_case_insensitive(self, widget):
         """Suche ist case-insensitive"""
-        total_rows = widget.entries_table.rowCount()
+        total_rows = widget.entries_model.rowCount()
         
         if total_rows == 0:
             pytest.skip("Keine Test-Daten in Tabelle")
@@ -213,7 +217,7 @@ class TestTimeEntryWidgetSearchFunctionality:
     
     def test_search_substring_matching(self, widget):
         """Suche findet Substrings"""
-        total_rows = widget.entries_table.rowCount()
+        total_rows = widget.entries_model.rowCount()
         
         if total_rows == 0:
             pytest.skip("Keine Test-Daten in Tabelle")
@@ -231,7 +235,7 @@ class TestTimeEntryWidgetSearchFunctionality:
     
     def test_search_no_matches_hides_all(self, widget):
         """Suche ohne Treffer versteckt alle Zeilen"""
-        total_rows = widget.entries_table.rowCount()
+        total_rows = widget.entries_model.rowCount()
         
         if total_rows == 0:
             pytest.skip("Keine Test-Daten in Tabelle")
@@ -253,7 +257,7 @@ class TestSearchResultCount:
     
     def test_result_count_updated_on_search(self, widget):
         """Treffer-Anzeige wird aktualisiert"""
-        total_rows = widget.entries_table.rowCount()
+        total_rows = widget.entries_model.rowCount()
         
         # Leere Suche
         widget._on_search("")
@@ -266,7 +270,7 @@ class TestSearchResultCount:
     
     def test_result_count_shows_filtered(self, widget):
         """Treffer-Anzeige zeigt gefilterte Anzahl"""
-        total_rows = widget.entries_table.rowCount()
+        total_rows = widget.entries_model.rowCount()
         
         if total_rows == 0:
             pytest.skip("Keine Test-Daten in Tabelle")
@@ -288,13 +292,15 @@ class TestSearchEdgeCases:
         """Suche in leerer Tabelle crasht nicht"""
         # Leere Tabelle
         mock_repository.find_by_date_range = Mock(return_value=[])
+        mock_repository.count_by_date_range = Mock(return_value=0)
+        mock_repository.find_page_by_date_range = Mock(return_value=[])
         widget._refresh_entries_list()
         
         # Suche sollte nicht crashen
         widget._on_search("test")
         
         # Keine Zeilen sollten vorhanden sein
-        assert widget.entries_table.rowCount() == 0
+        assert widget.entries_model.rowCount() == 0
     
     def test_search_special_characters(self, widget):
         """Suche mit Sonderzeichen funktioniert"""
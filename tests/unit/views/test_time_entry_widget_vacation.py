@@ -41,6 +41,8 @@ def mock_repository():
     """Mock TimeEntryRepository"""
     repo = Mock(spec=TimeEntryRepository)
     repo.find_by_date_range = Mock(return_value=[])
+    repo.count_by_date_range = Mock(return_value=0)
+    repo.find_page_by_date_range = Mock(return_value=[])
     return repo
 
 